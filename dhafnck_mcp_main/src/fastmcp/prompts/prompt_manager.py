@@ -10,6 +10,7 @@ from fastmcp import settings
 from fastmcp.exceptions import NotFoundError, PromptError
 from fastmcp.prompts.prompt import FunctionPrompt, Prompt, PromptResult
 from fastmcp.settings import DuplicateBehavior
+from fastmcp.utilities.components import component_state_version, components_changed
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -28,6 +29,8 @@ class PromptManager:
     ):
         self._prompts: dict[str, Prompt] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._version = 0
+        self._registry_cache: tuple[tuple[int, int], dict[str, Prompt]] | None = None
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -45,6 +48,38 @@ class PromptManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for prompts."""
         self._mounted_servers.append(server)
+        self._version += 1
+        components_changed()
+
+    @property
+    def version(self) -> int | None:
+        """
+        Version of the unfiltered prompt inventory, or None if it cannot be cached.
+
+        It grows whenever a prompt is added, here or in a mounted server, or a
+        server is mounted, so a change anywhere below shows up in every
+        parent's version.
+        """
+        version = self._version
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._prompt_manager.version
+            if child_version is None:
+                return None
+            version += child_version
+        return version
+
+    async def _registry(self) -> dict[str, Prompt]:
+        """
+        The unfiltered inventory, rebuilt only when the registry version or
+        the enabled state of a component changed. Callers must not mutate it.
+        """
+        version = self.version
+        if version is None:
+            return await self._load_prompts(via_server=False)
+        cache_key = (version, component_state_version())
+        if self._registry_cache is None or self._registry_cache[0] != cache_key:
+            self._registry_cache = (cache_key, await self._load_prompts(via_server=False))
+        return self._registry_cache[1]
 
     async def _load_prompts(self, *, via_server: bool = False) -> dict[str, Prompt]:
         """
@@ -88,12 +123,12 @@ class PromptManager:
 
     async def has_prompt(self, key: str) -> bool:
         """Check if a prompt exists."""
-        prompts = await self.get_prompts()
+        prompts = await self._registry()
         return key in prompts
 
     async def get_prompt(self, key: str) -> Prompt:
         """Get prompt by key."""
-        prompts = await self.get_prompts()
+        prompts = await self._registry()
         if key in prompts:
             return prompts[key]
         raise NotFoundError(f"Unknown prompt: {key}")
@@ -102,7 +137,7 @@ class PromptManager:
         """
         Gets the complete, unfiltered inventory of all prompts.
         """
-        return await self._load_prompts(via_server=False)
+        return dict(await self._registry())
 
     async def list_prompts(self) -> list[Prompt]:
         """
@@ -147,6 +182,8 @@ class PromptManager:
                 return existing
         else:
             self._prompts[prompt.key] = prompt
+        self._version += 1
+        components_changed()
         return prompt
 
     async def render_prompt(
@@ -160,9 +197,7 @@ class PromptManager:
         """
         # 1. Check local prompts first. The server will have already applied its filter.
         if name in self._prompts:
-            prompt = await self.get_prompt(name)
-            if not prompt:
-                raise NotFoundError(f"Unknown prompt: {name}")
+            prompt = self._prompts[name]
 
             try:
                 messages = await prompt.render(arguments)
@@ -12,11 +12,10 @@ from pydantic import AnyUrl
 from fastmcp import settings
 from fastmcp.exceptions import NotFoundError, ResourceError
 from fastmcp.resources.resource import Resource
-from fastmcp.resources.template import (
-    ResourceTemplate,
-    match_uri_template,
-)
+from fastmcp.resources.router import UriRouter
+from fastmcp.resources.template import ResourceTemplate
 from fastmcp.settings import DuplicateBehavior
+from fastmcp.utilities.components import component_state_version, components_changed
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -44,6 +43,21 @@ class ResourceManager:
         self._resources: dict[str, Resource] = {}
         self._templates: dict[str, ResourceTemplate] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._version = 0
+        # (cache key, resources, templates, router over the template keys)
+        self._registry_cache: (
+            tuple[
+                tuple[int, int],
+                dict[str, Resource],
+                dict[str, ResourceTemplate],
+                UriRouter[ResourceTemplate],
+            ]
+            | None
+        ) = None
+        # (version, router over local templates, router over mounted servers)
+        self._local_routes: (
+            tuple[int, UriRouter[ResourceTemplate], UriRouter[MountedServer]] | None
+        ) = None
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -60,14 +74,92 @@ class ResourceManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for resources and templates."""
         self._mounted_servers.append(server)
+        self._version += 1
+        components_changed()
+
+    @property
+    def version(self) -> int | None:
+        """
+        Version of the unfiltered resource inventory, or None if it cannot be cached.
+
+        It grows whenever a resource or template is added, here or in a
+        mounted server, or a server is mounted, so a change anywhere below
+        shows up in every parent's version.
+        """
+        version = self._version
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._resource_manager.version
+            if child_version is None:
+                return None
+            version += child_version
+        return version
 
     async def get_resources(self) -> dict[str, Resource]:
         """Get all registered resources, keyed by URI."""
-        return await self._load_resources(via_server=False)
+        if self.version is None:
+            return await self._load_resources(via_server=False)
+        _, resources, _, _ = await self._registry()
+        return dict(resources)
 
     async def get_resource_templates(self) -> dict[str, ResourceTemplate]:
         """Get all registered templates, keyed by URI template."""
-        return await self._load_resource_templates(via_server=False)
+        if self.version is None:
+            return await self._load_resource_templates(via_server=False)
+        _, _, templates, _ = await self._registry()
+        return dict(templates)
+
+    async def _registry(
+        self,
+    ) -> tuple[
+        tuple[int, int] | None,
+        dict[str, Resource],
+        dict[str, ResourceTemplate],
+        UriRouter[ResourceTemplate],
+    ]:
+        """
+        The unfiltered resources and templates plus a router over the template
+        keys, rebuilt only when the registry version or the enabled state of a
+        component changed. Callers must not mutate them.
+        """
+        version = self.version
+        if version is None:
+            # Unversioned inventories (e.g. proxies) are rebuilt on every lookup
+            resources = await self.get_resources()
+            templates = await self.get_resource_templates()
+            return None, resources, templates, _template_router(templates)
+
+        cache_key = (version, component_state_version())
+        if self._registry_cache is None or self._registry_cache[0] != cache_key:
+            resources = await self._load_resources(via_server=False)
+            templates = await self._load_resource_templates(via_server=False)
+            self._registry_cache = (
+                cache_key,
+                resources,
+                templates,
+                _template_router(templates),
+            )
+        return self._registry_cache
+
+    def _routes(
+        self,
+    ) -> tuple[UriRouter[ResourceTemplate], UriRouter[MountedServer]]:
+        """Routers over this manager's own templates and its mounted servers."""
+        if self._local_routes is None or self._local_routes[0] != self._version:
+            from fastmcp.server.server import resource_prefix_pattern
+
+            mounts: UriRouter[MountedServer] = UriRouter()
+            # Later mounts take precedence
+            for mounted in reversed(self._mounted_servers):
+                literal_prefix, pattern = resource_prefix_pattern(
+                    mounted.prefix, mounted.resource_prefix_format
+                )
+                mounts.add(literal_prefix, pattern, mounted)
+            self._local_routes = (
+                self._version,
+                _template_router(self._templates),
+                mounts,
+            )
+        return self._local_routes[1], self._local_routes[2]
 
     async def _load_resources(self, *, via_server: bool = False) -> dict[str, Resource]:
         """
@@ -287,6 +379,8 @@ class ResourceManager:
             elif self.duplicate_behavior == "ignore":
                 return existing
         self._resources[resource.key] = resource
+        self._version += 1
+        components_changed()
         return resource
 
     def add_template_from_fn(
@@ -340,24 +434,19 @@ class ResourceManager:
             elif self.duplicate_behavior == "ignore":
                 return existing
         self._templates[template.key] = template
+        self._version += 1
+        components_changed()
         return template
 
     async def has_resource(self, uri: AnyUrl | str) -> bool:
         """Check if a resource exists."""
         uri_str = str(uri)
+        _, resources, _, router = await self._registry()
 
-        # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
-        if uri_str in resources:
-            return True
-
-        # Then check templates (local and mounted) only if not found in concrete resources
-        templates = await self.get_resource_templates()
-        for template_key in templates.keys():
-            if match_uri_template(uri_str, template_key):
-                return True
-
-        return False
+        # First check concrete resources (local and mounted), then templates
+        return uri_str in resources or any(
+            params for _, params in router.iter_matches(uri_str)
+        )
 
     async def get_resource(self, uri: AnyUrl | str) -> Resource:
         """Get resource by URI, checking concrete resources first, then templates.
@@ -372,15 +461,14 @@ class ResourceManager:
         logger.debug("Getting resource", extra={"uri": uri_str})
 
         # First check concrete resources (local and mounted)
-        resources = await self.get_resources()
+        _, resources, _, router = await self._registry()
         if resource := resources.get(uri_str):
             return resource
 
-        # Then check templates (local and mounted) - use the utility function to match against storage keys
-        templates = await self.get_resource_templates()
-        for storage_key, template in templates.items():
-            # Try to match against the storage key (which might be a custom key)
-            if params := match_uri_template(uri_str, storage_key):
+        # Then check templates (local and mounted), routed by their storage keys
+        # (which might be custom keys)
+        for template, params in router.iter_matches(uri_str):
+            if params:
                 try:
                     return await template.create_resource(
                         uri_str,
@@ -413,9 +501,7 @@ class ResourceManager:
 
         # 1. Check local resources first. The server will have already applied its filter.
         if uri_str in self._resources:
-            resource = await self.get_resource(uri_str)
-            if not resource:
-                raise NotFoundError(f"Resource {uri_str!r} not found")
+            resource = self._resources[uri_str]
 
             try:
                 return await resource.read()
@@ -438,8 +524,9 @@ class ResourceManager:
                     ) from e
 
         # 1b. Check local templates if not found in concrete resources
-        for key, template in self._templates.items():
-            if params := match_uri_template(uri_str, key):
+        template_router, mount_router = self._routes()
+        for template, params in template_router.iter_matches(uri_str):
+            if params:
                 try:
                     resource = await template.create_resource(uri_str, params=params)
                     return await resource.read()
@@ -462,31 +549,22 @@ class ResourceManager:
                         ) from e
 
         # 2. Check mounted servers using the filtered protocol path.
-        from fastmcp.server.server import has_resource_prefix, remove_resource_prefix
-
-        for mounted in reversed(self._mounted_servers):
-            key = uri_str
+        for mounted, params in mount_router.iter_matches(uri_str):
+            # The key without the mount prefix
+            key = params.get("scheme", "") + params["uri"]
             try:
-                if mounted.prefix:
-                    if has_resource_prefix(
-                        key,
-                        mounted.prefix,
-                        mounted.resource_prefix_format,
-                    ):
-                        key = remove_resource_prefix(
-                            key,
-                            mounted.prefix,
-                            mounted.resource_prefix_format,
-                        )
-                    else:
-                        continue
-
-                try:
-                    result = await mounted.server._read_resource(key)
-                    return result[0].content
-                except NotFoundError:
-                    continue
+                result = await mounted.server._read_resource(key)
+                return result[0].content
             except NotFoundError:
                 continue
 
         raise NotFoundError(f"Resource {uri_str!r} not found.")
+
+
+def _template_router(
+    templates: dict[str, ResourceTemplate],
+) -> UriRouter[ResourceTemplate]:
+    router: UriRouter[ResourceTemplate] = UriRouter()
+    for key, template in templates.items():
+        router.add_template(key, template)
+    return router
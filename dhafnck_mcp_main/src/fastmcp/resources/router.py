@@ -0,0 +1,73 @@
+"""URI routing for resource templates and mounted servers."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from typing import Generic, TypeVar
+from urllib.parse import unquote
+
+from fastmcp.resources.template import build_regex
+
+T = TypeVar("T")
+
+# Trie node: child nodes keyed by character, routes stored under None
+_Node = dict
+
+
+class UriRouter(Generic[T]):
+    """
+    Routes URIs to values by pattern, in insertion order.
+
+    Every route is filed in a character trie under the literal text its URIs
+    must start with (for a template, everything before the first parameter).
+    A lookup walks the URI down the trie once and only tries the patterns
+    collected on the way, so its cost grows with the URI length and the few
+    routes sharing its prefix rather than with the number of routes.
+    Patterns are compiled when the route is added.
+    """
+
+    def __init__(self) -> None:
+        self._root: _Node = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, literal_prefix: str, pattern: re.Pattern[str], value: T, *, unquote_params: bool = False) -> None:
+        """Route URIs starting with literal_prefix and matching pattern to value."""
+        node = self._root
+        for char in literal_prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append((self._size, pattern, value, unquote_params))
+        self._size += 1
+
+    def add_template(self, uri_template: str, value: T) -> None:
+        """Route URIs matching an RFC 6570-style template; parameters are unquoted."""
+        literal_prefix = uri_template.split("{", 1)[0]
+        self.add(literal_prefix, build_regex(uri_template), value, unquote_params=True)
+
+    def iter_matches(self, uri: str) -> Iterator[tuple[T, dict[str, str]]]:
+        """Yield (value, params) for every route matching uri, in insertion order."""
+        candidates = []
+        node = self._root
+        for char in uri:
+            candidates.extend(node.get(None, ()))
+            node = node.get(char)
+            if node is None:
+                break
+        else:
+            candidates.extend(node.get(None, ()))
+
+        candidates.sort(key=lambda route: route[0])
+        for _, pattern, value, unquote_params in candidates:
+            match = pattern.match(uri)
+            if match:
+                params = match.groupdict()
+                if unquote_params:
+                    params = {k: unquote(v) for k, v in params.items()}
+                yield value, params
+
+    def match(self, uri: str) -> tuple[T, dict[str, str]] | None:
+        """The first route matching uri, or None."""
+        return next(self.iter_matches(uri), None)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import re
 from collections.abc import Callable
@@ -25,6 +26,7 @@ from fastmcp.utilities.types import (
 )
 
 
+@functools.lru_cache(maxsize=1024)
 def build_regex(template: str) -> re.Pattern:
     parts = re.split(r"(\{[^}]+\})", template)
     pattern = ""
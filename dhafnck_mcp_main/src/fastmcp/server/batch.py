@@ -0,0 +1,91 @@
+"""A tool that runs several tool calls in one request."""
+
+# No `from __future__ import annotations`: the batch tool's signature is
+# inspected at runtime and refers to local names
+
+from typing import TYPE_CHECKING, Annotated, Any
+
+import anyio
+from pydantic import BaseModel, Field
+
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import FunctionTool, Tool
+
+if TYPE_CHECKING:
+    from fastmcp.server.server import FastMCP
+
+# Name the batch tool is registered under unless another is given
+BATCH_TOOL_NAME = "batch"
+
+# Most calls one batch may hold
+DEFAULT_MAX_BATCH_ITEMS = 50
+
+
+class BatchCall(BaseModel):
+    """One call of a batch."""
+
+    tool: str = Field(description="Name of the tool to call")
+    arguments: dict[str, Any] = Field(
+        default_factory=dict, description="Arguments of the call"
+    )
+
+
+def add_batch_tool(
+    server: "FastMCP",
+    name: str = BATCH_TOOL_NAME,
+    max_items: int = DEFAULT_MAX_BATCH_ITEMS,
+) -> FunctionTool:
+    """
+    Register a tool on server that runs a list of tool calls concurrently.
+
+    The server's middleware runs for the batch request and again for every
+    item, as for a direct call, so middleware that authorizes, caches or
+    measures tool calls sees each item. Items must name tools that exist and
+    are enabled and visible on the server, and run under the tool's own
+    timeout and concurrency limits. Results come back in request order; a
+    failing item reports its error without affecting the others.
+    """
+
+    async def run_item(call: BatchCall) -> dict[str, Any]:
+        try:
+            if call.tool == name:
+                raise ToolError("Batches cannot be nested")
+            content = await server._call_tool(call.tool, call.arguments)
+        except Exception as e:
+            return {"tool": call.tool, "isError": True, "error": str(e)}
+        return {
+            "tool": call.tool,
+            "isError": False,
+            "content": [
+                item.model_dump(mode="json", exclude_none=True) for item in content
+            ],
+        }
+
+    async def batch(
+        calls: Annotated[
+            list[BatchCall],
+            Field(description=f"Tool calls to run concurrently, at most {max_items}"),
+        ],
+    ) -> list[dict[str, Any]]:
+        """Run several independent tool calls in one request.
+
+        The calls run concurrently; results are returned in the same order,
+        each with either the tool's content or the error it raised.
+        """
+        if len(calls) > max_items:
+            raise ToolError(
+                f"A batch holds at most {max_items} calls, got {len(calls)}"
+            )
+        results: list[dict[str, Any]] = [{} for _ in calls]
+
+        async def run_at(index: int, call: BatchCall) -> None:
+            results[index] = await run_item(call)
+
+        async with anyio.create_task_group() as tg:
+            for index, call in enumerate(calls):
+                tg.start_soon(run_at, index, call)
+        return results
+
+    tool = Tool.from_function(batch, name=name, serializer=server._tool_serializer)
+    server.add_tool(tool)
+    return tool
@@ -24,6 +24,7 @@ from starlette.routing import BaseRoute, Mount, Route
 from starlette.types import Lifespan, Receive, Scope, Send
 
 from fastmcp.server.auth.auth import OAuthProvider
+from fastmcp.server.listings import LIST_CHANGED_NOTIFICATIONS
 from fastmcp.utilities.logging import get_logger
 
 if TYPE_CHECKING:
@@ -174,7 +175,9 @@ def create_sse_app(
             await server._mcp_server.run(
                 streams[0],
                 streams[1],
-                server._mcp_server.create_initialization_options(),
+                server._mcp_server.create_initialization_options(
+                    LIST_CHANGED_NOTIFICATIONS
+                ),
             )
         return Response()
 
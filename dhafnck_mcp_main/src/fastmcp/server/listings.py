@@ -0,0 +1,133 @@
+"""Cached component listings and list_changed notifications."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import weakref
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from mcp.server.lowlevel.server import NotificationOptions, request_ctx
+from mcp.server.session import ServerSession
+from pydantic_core import to_json
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Result _meta key holding the hash of a listing
+LISTING_HASH_META_KEY = "fastmcp/listHash"
+# Request _meta key a client sets to the hash it holds; if the listing still
+# has that hash, the result carries no items and NOT_MODIFIED_META_KEY is set
+IF_NONE_MATCH_META_KEY = "fastmcp/ifNoneMatch"
+NOT_MODIFIED_META_KEY = "fastmcp/notModified"
+
+# Capabilities advertised at initialization, so clients know to listen
+LIST_CHANGED_NOTIFICATIONS = NotificationOptions(
+    prompts_changed=True, resources_changed=True, tools_changed=True
+)
+
+
+@dataclass(frozen=True)
+class Listing:
+    """The MCP components of one list method, as served to clients."""
+
+    key: Hashable | None  # Registry state the items were built from
+    items: list[Any]
+    hash: str
+
+
+def listing_hash(items: Sequence[Any]) -> str:
+    """Stable hash of a listing: equal items give equal hashes across restarts."""
+    encoded = to_json(items, by_alias=True, exclude_none=True, fallback=str)
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def current_session() -> ServerSession | None:
+    """The session of the MCP request being handled, if any."""
+    try:
+        return request_ctx.get().session
+    except LookupError:
+        return None
+
+
+def if_none_match(request: Any) -> str | None:
+    """The listing hash a list request says the client already holds."""
+    params = getattr(request, "params", None)
+    meta = getattr(params, "meta", None)
+    if meta is None:
+        return None
+    return (meta.model_extra or {}).get(IF_NONE_MATCH_META_KEY)
+
+
+class ListChangedNotifier:
+    """
+    Remembers which registry state each session was last served for a list
+    kind ("tools", "resources" or "prompts") and sends the matching
+    notifications/*/list_changed once the state moves on. Sessions that
+    never listed a kind are not notified about it.
+
+    ``schedule()`` runs the check on the event loop the sessions were served
+    from, so registry changes made in any thread can be announced.
+    """
+
+    def __init__(self) -> None:
+        self._served: dict[
+            str, weakref.WeakKeyDictionary[ServerSession, Hashable]
+        ] = {
+            kind: weakref.WeakKeyDictionary()
+            for kind in ("tools", "resources", "prompts")
+        }
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._scheduled = False
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def __bool__(self) -> bool:
+        return any(self._served.values())
+
+    def served(self, kind: str, session: ServerSession, key: Hashable) -> None:
+        self._served[kind][session] = key
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop, self._scheduled = loop, False
+
+    def schedule(self, check: Callable[[], Awaitable[None]]) -> None:
+        """
+        Run check() soon on the event loop sessions were served from, unless
+        no session was served a listing. Safe to call from any thread;
+        calls made before check() starts run it once.
+        """
+        loop = self._loop
+        if loop is None or self._scheduled or not self:
+            return
+        self._scheduled = True
+        try:
+            loop.call_soon_threadsafe(self._start, check)
+        except RuntimeError:
+            self._scheduled = False  # The loop is closed
+
+    def _start(self, check: Callable[[], Awaitable[None]]) -> None:
+        self._scheduled = False
+        task = asyncio.ensure_future(check())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def notify(self, kind: str, key: Hashable) -> None:
+        """Notify every session served a different state of kind than key."""
+        served = self._served[kind]
+        for session, seen in list(served.items()):
+            if seen == key:
+                continue
+            served[session] = key
+            try:
+                if kind == "tools":
+                    await session.send_tool_list_changed()
+                elif kind == "resources":
+                    await session.send_resource_list_changed()
+                else:
+                    await session.send_prompt_list_changed()
+            except Exception as e:
+                # The session is gone; it is dropped once collected
+                logger.debug(f"Failed to send {kind} list_changed: {e}")
@@ -0,0 +1,303 @@
+"""Request metrics for FastMCP servers, rendered in Prometheus text format."""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import mcp.types as mt
+from pydantic_core import to_json
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from fastmcp.utilities.worker_pool import worker_pool_stats
+
+if TYPE_CHECKING:
+    from fastmcp.server.server import FastMCP
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Label of calls to tools the server does not have, so client-sent names cannot
+# grow the series without bound
+UNKNOWN_TOOL = "unknown"
+
+# Servers only cache the listings of list methods no middleware handles
+LIST_METHODS = frozenset(
+    {"tools/list", "resources/list", "resources/templates/list", "prompts/list"}
+)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Observations only increment counters, so recording takes no lock: the
+    middleware runs on the event loop, and a scrape reading a bucket between
+    two increments at worst sees a sample that is not in the sum yet.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # Last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """(le label, cumulative count) per bucket, ending with +Inf."""
+        total = 0
+        buckets = []
+        labels = [*map(_format_value, self.bounds), "+Inf"]
+        for bound, count in zip(labels, self.counts):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+
+class RequestSeries:
+    """Counters of one method or tool."""
+
+    __slots__ = ("requests", "errors", "in_flight", "result_bytes", "latency")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.result_bytes = 0
+        self.latency = Histogram(buckets)
+
+
+class MetricsMiddleware(Middleware):
+    """
+    Records request counts, errors, in-flight requests, latency and result
+    sizes per MCP method and per tool.
+
+    ``install()`` adds the middleware to a server together with a
+    ``/metrics`` HTTP route and a resource serving the same Prometheus text;
+    servers install it themselves when ``settings.metrics_enabled`` is set.
+    Result sizes cost a second serialization of every result and are only
+    measured with ``measure_result_bytes``. List requests are only recorded
+    with ``count_list_requests``, which stops the server from caching its
+    listings.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        measure_result_bytes: bool = False,
+        include_worker_pools: bool = True,
+        count_list_requests: bool = False,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.measure_result_bytes = measure_result_bytes
+        self.include_worker_pools = include_worker_pools
+        self.count_list_requests = count_list_requests
+        self.methods_series: dict[str, RequestSeries] = {}
+        self.tools_series: dict[str, RequestSeries] = {}
+
+    def install(
+        self,
+        server: FastMCP[Any],
+        path: str | None = "/metrics",
+        resource_uri: str | None = "metrics://server",
+    ) -> MetricsMiddleware:
+        """Add this middleware to server and expose it at path and resource_uri."""
+        server.add_middleware(self)
+
+        if path is not None:
+
+            @server.custom_route(path, methods=["GET"], include_in_schema=False)
+            async def metrics_endpoint(request: Request) -> PlainTextResponse:
+                return PlainTextResponse(
+                    self.render(), media_type=PROMETHEUS_CONTENT_TYPE
+                )
+
+        if resource_uri is not None:
+
+            @server.resource(
+                resource_uri,
+                name="metrics",
+                description="Server request metrics in Prometheus text format",
+                mime_type="text/plain",
+            )
+            def metrics_resource() -> str:
+                return self.render()
+
+        return self
+
+    def handles(self, method: str | None) -> bool:
+        return self.count_list_requests or method not in LIST_METHODS
+
+    async def on_request(
+        self,
+        context: MiddlewareContext[mt.Request],
+        call_next: CallNext[mt.Request, Any],
+    ) -> Any:
+        method = context.method or "unknown"
+        series = self._series(self.methods_series, method)
+        tool_series = None
+        if method == "tools/call":
+            name = await _tool_label(context)
+            tool_series = self._series(self.tools_series, name)
+            tool_series.in_flight += 1
+        series.in_flight += 1
+
+        start = time.perf_counter()
+        failed = True
+        result_bytes = 0
+        try:
+            result = await call_next(context)
+            failed = False
+            if self.measure_result_bytes:
+                result_bytes = serialized_size(result)
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            for target in (series, tool_series):
+                if target is not None:
+                    target.in_flight -= 1
+                    target.requests += 1
+                    target.errors += failed
+                    target.result_bytes += result_bytes
+                    target.latency.observe(elapsed)
+
+    def _series(self, table: dict[str, RequestSeries], key: str) -> RequestSeries:
+        series = table.get(key)
+        if series is None:
+            series = table[key] = RequestSeries(self.buckets)
+        return series
+
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format."""
+        lines: list[str] = []
+        for prefix, label, table, what in (
+            ("fastmcp_requests", "method", self.methods_series, "MCP requests"),
+            ("fastmcp_tool_calls", "tool", self.tools_series, "tool calls"),
+        ):
+            rows = [
+                (f'{label}="{_escape(key)}"', series)
+                for key, series in sorted(table.items())
+            ]
+            fields = [
+                ("total", "counter", f"Number of {what} handled.", "requests"),
+                ("errors_total", "counter", f"Number of {what} that raised.", "errors"),
+                ("in_flight", "gauge", f"Number of {what} in progress.", "in_flight"),
+            ]
+            if self.measure_result_bytes:
+                fields.append(
+                    (
+                        "result_bytes_total",
+                        "counter",
+                        f"Serialized result bytes of {what}.",
+                        "result_bytes",
+                    )
+                )
+            for suffix, kind, help_text, field in fields:
+                _render_metric(
+                    lines,
+                    f"{prefix}_{suffix}",
+                    help_text,
+                    kind,
+                    [(labels, getattr(series, field)) for labels, series in rows],
+                )
+
+            name = f"{prefix}_duration_seconds"
+            lines.append(f"# HELP {name} Latency of {what} in seconds.")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, series in rows:
+                latency = series.latency
+                for le, count in latency.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {_format_value(latency.sum)}")
+                lines.append(f"{name}_count{{{labels}}} {latency.count}")
+
+        if self.include_worker_pools:
+            pools = sorted(worker_pool_stats().items())
+            for stat, kind, help_text in (
+                ("max_workers", "gauge", "Worker threads of the pool."),
+                ("running", "gauge", "Calls running on the pool."),
+                ("waiting", "gauge", "Calls waiting for a worker."),
+                ("completed", "counter", "Calls the pool finished."),
+                ("failed", "counter", "Calls that raised on the pool."),
+                ("saturated", "counter", "Calls that found every worker busy."),
+                ("total_wait_seconds", "counter", "Seconds calls waited for a worker."),
+            ):
+                _render_metric(
+                    lines,
+                    f"fastmcp_worker_pool_{stat}",
+                    help_text,
+                    kind,
+                    [(f'pool="{_escape(pool)}"', stats[stat]) for pool, stats in pools],
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+async def _tool_label(context: MiddlewareContext[mt.Request]) -> str:
+    """The called tool's name, or UNKNOWN_TOOL if the server has no such tool."""
+    name = getattr(context.message, "name", None)
+    server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+    if not isinstance(name, str) or server is None:
+        return UNKNOWN_TOOL
+    try:
+        await server.get_tool(name)
+    except NotFoundError:
+        return UNKNOWN_TOOL
+    return name
+
+
+def _render_metric(
+    lines: list[str], name: str, help_text: str, kind: str, rows: list[tuple[str, Any]]
+) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for labels, value in rows:
+        lines.append(f"{name}{{{labels}}} {_format_value(value)}")
+
+
+def _format_value(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def serialized_size(result: Any) -> int:
+    """Length of result serialized to JSON; 0 if it cannot be serialized."""
+    try:
+        return len(to_json(result, bytes_mode="base64", fallback=_unserializable))
+    except Exception:
+        return 0
+
+
+def _unserializable(value: Any) -> None:
+    return None
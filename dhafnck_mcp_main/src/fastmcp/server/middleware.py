@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Collection, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     Literal,
     Protocol,
@@ -103,6 +104,27 @@ class MiddlewareContext(Generic[T]):
         return replace(self, **kwargs)
 
 
+# Hook run for messages of each MCP method, inside on_request/on_notification
+METHOD_HOOKS: dict[str, str] = {
+    "tools/call": "on_call_tool",
+    "resources/read": "on_read_resource",
+    "prompts/get": "on_get_prompt",
+    "tools/list": "on_list_tools",
+    "resources/list": "on_list_resources",
+    "resources/templates/list": "on_list_resource_templates",
+    "prompts/list": "on_list_prompts",
+}
+
+# Hook run for each message type, inside on_message
+TYPE_HOOKS: dict[str, str] = {
+    "request": "on_request",
+    "notification": "on_notification",
+}
+
+Hook = Callable[[MiddlewareContext[Any], CallNext[Any, Any]], Awaitable[Any]]
+MiddlewareChain = Callable[[MiddlewareContext[Any], CallNext[Any, Any]], Awaitable[Any]]
+
+
 def make_middleware_wrapper(
     middleware: Middleware, call_next: CallNext[T, R]
 ) -> CallNext[T, R]:
@@ -119,48 +141,60 @@ def make_middleware_wrapper(
 class Middleware:
     """Base class for FastMCP middleware with dispatching hooks."""
 
+    # MCP methods this middleware handles; it is skipped for every other
+    # method. None handles all methods.
+    methods: ClassVar[Collection[str] | None] = None
+
     async def __call__(
         self,
         context: MiddlewareContext[T],
         call_next: CallNext[T, Any],
     ) -> Any:
         """Main entry point that orchestrates the pipeline."""
-        handler_chain = await self._dispatch_handler(
-            context,
-            call_next=call_next,
+        hooks = (
+            self.hooks_for(context.method, context.type)
+            if self.handles(context.method)
+            else []
         )
-        return await handler_chain(context)
+        return await compose_hooks(hooks)(context, call_next)
+
+    def handles(self, method: str | None) -> bool:
+        """Whether this middleware takes part in messages of method."""
+        return self.methods is None or method in self.methods
+
+    def hooks_for(self, method: str | None, message_type: str) -> list[Hook]:
+        """
+        The hooks that handle a message, outermost first.
+
+        Hooks a subclass does not override only pass the message on, so they
+        are left out. A subclass that overrides __call__ or _dispatch_handler
+        is run as a single hook.
+        """
+        cls = type(self)
+        if (
+            cls.__call__ is not Middleware.__call__
+            or cls._dispatch_handler is not Middleware._dispatch_handler
+        ):
+            return [self.__call__]
+        names = ("on_message", TYPE_HOOKS.get(message_type), METHOD_HOOKS.get(method or ""))
+        return [
+            getattr(self, name)
+            for name in names
+            if name is not None and getattr(cls, name) is not getattr(Middleware, name)
+        ]
 
     async def _dispatch_handler(
         self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
     ) -> CallNext[Any, Any]:
         """Builds a chain of handlers for a given message."""
         handler = call_next
-
-        match context.method:
-            case "tools/call":
-                handler = partial(self.on_call_tool, call_next=handler)
-            case "resources/read":
-                handler = partial(self.on_read_resource, call_next=handler)
-            case "prompts/get":
-                handler = partial(self.on_get_prompt, call_next=handler)
-            case "tools/list":
-                handler = partial(self.on_list_tools, call_next=handler)
-            case "resources/list":
-                handler = partial(self.on_list_resources, call_next=handler)
-            case "resources/templates/list":
-                handler = partial(self.on_list_resource_templates, call_next=handler)
-            case "prompts/list":
-                handler = partial(self.on_list_prompts, call_next=handler)
-
-        match context.type:
-            case "request":
-                handler = partial(self.on_request, call_next=handler)
-            case "notification":
-                handler = partial(self.on_notification, call_next=handler)
-
-        handler = partial(self.on_message, call_next=handler)
-
+        for name in (
+            METHOD_HOOKS.get(context.method or ""),
+            TYPE_HOOKS.get(context.type),
+            "on_message",
+        ):
+            if name is not None:
+                handler = partial(getattr(self, name), call_next=handler)
         return handler
 
     async def on_message(
@@ -234,3 +268,43 @@ class Middleware:
         call_next: CallNext[mt.ListPromptsRequest, ListPromptsResult],
     ) -> ListPromptsResult:
         return await call_next(context)
+
+
+async def call_through(
+    context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+) -> Any:
+    """The chain of a method no middleware handles."""
+    return await call_next(context)
+
+
+def _link(hook: Hook, inner: MiddlewareChain | None) -> MiddlewareChain:
+    if inner is None:
+        return hook
+
+    async def link(context: MiddlewareContext[Any], call_next: CallNext[Any, Any]) -> Any:
+        return await hook(context, lambda context: inner(context, call_next))
+
+    return link
+
+
+def compose_hooks(hooks: Sequence[Hook]) -> MiddlewareChain:
+    """Compose hooks, outermost first, into one chain called with
+    (context, call_next), where call_next is the final handler."""
+    chain: MiddlewareChain | None = None
+    for hook in reversed(hooks):
+        chain = _link(hook, chain)
+    return chain or call_through
+
+
+def compose_middleware(
+    middleware: Sequence[Middleware], method: str | None, message_type: str
+) -> MiddlewareChain:
+    """Compose the hooks of every middleware that handles method, in order.
+    Plain callables taking (context, call_next) are run for every method."""
+    hooks: list[Hook] = []
+    for mw in middleware:
+        if not isinstance(mw, Middleware):
+            hooks.append(mw)
+        elif mw.handles(method):
+            hooks.extend(mw.hooks_for(method, message_type))
+    return compose_hooks(hooks)
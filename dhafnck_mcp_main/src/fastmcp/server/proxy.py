@@ -40,10 +40,15 @@ class ProxyToolManager(ToolManager):
         super().__init__(**kwargs)
         self.client = client
 
-    async def get_tools(self) -> dict[str, Tool]:
+    @property
+    def version(self) -> int | None:
+        """Remote tools are not versioned, so the inventory is never cached."""
+        return None
+
+    async def _registry(self) -> dict[str, Tool]:
         """Gets the unfiltered tool inventory including local, mounted, and proxy tools."""
         # First get local and mounted tools from parent
-        all_tools = await super().get_tools()
+        all_tools = dict(await super()._registry())
 
         # Then add proxy tools, but don't overwrite existing ones
         try:
@@ -73,9 +78,16 @@ class ProxyToolManager(ToolManager):
             # First try local and mounted tools
             return await super().call_tool(key, arguments)
         except NotFoundError:
-            # If not found locally, try proxy
-            async with self.client:
-                return await self.client.call_tool(key, arguments)
+            # If not found locally, try proxy, within the default call limits
+            return await self._run_limited(
+                key, lambda: self._call_remote(key, arguments)
+            )
+
+    async def _call_remote(
+        self, key: str, arguments: dict[str, Any]
+    ) -> list[MCPContent]:
+        async with self.client:
+            return await self.client.call_tool(key, arguments)
 
 
 class ProxyResourceManager(ResourceManager):
@@ -85,6 +97,11 @@ class ProxyResourceManager(ResourceManager):
         super().__init__(**kwargs)
         self.client = client
 
+    @property
+    def version(self) -> int | None:
+        """Remote resources are not versioned, so the inventory is never cached."""
+        return None
+
     async def get_resources(self) -> dict[str, Resource]:
         """Gets the unfiltered resource inventory including local, mounted, and proxy resources."""
         # First get local and mounted resources from parent
@@ -163,10 +180,15 @@ class ProxyPromptManager(PromptManager):
         super().__init__(**kwargs)
         self.client = client
 
-    async def get_prompts(self) -> dict[str, Prompt]:
+    @property
+    def version(self) -> int | None:
+        """Remote prompts are not versioned, so the inventory is never cached."""
+        return None
+
+    async def _registry(self) -> dict[str, Prompt]:
         """Gets the unfiltered prompt inventory including local, mounted, and proxy prompts."""
         # First get local and mounted prompts from parent
-        all_prompts = await super().get_prompts()
+        all_prompts = dict(await super()._registry())
 
         # Then add proxy prompts, but don't overwrite existing ones
         try:
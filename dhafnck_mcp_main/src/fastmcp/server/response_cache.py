@@ -0,0 +1,263 @@
+"""Caching of tool call results, with tag-based invalidation."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import mcp.types as mt
+from mcp.server.auth.middleware.auth_context import get_access_token
+
+from fastmcp.exceptions import NotFoundError
+from fastmcp.server.metrics import serialized_size
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+Arguments = dict[str, Any]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How calls of one tool are cached, and which cached results they evict."""
+
+    # Whether a call may be answered from the cache; None caches every call
+    cacheable: Callable[[Arguments], bool] | None = None
+    # Tags of a cached result, in addition to "tool:<name>"
+    tags: Callable[[Arguments], Iterable[str]] | None = None
+    # Tags evicted after an uncached call succeeds
+    invalidates: Callable[[Arguments], Iterable[str]] | None = None
+    # Seconds a result stays fresh; None uses the cache's ttl
+    ttl: float | None = None
+
+
+# Policy of tools annotated with readOnlyHint and not listed in the policies
+READ_ONLY_POLICY = CachePolicy()
+
+
+@dataclass
+class _Entry:
+    result: list[Any]
+    size: int
+    expires_at: float
+    tags: frozenset[str]
+
+
+class ResponseCacheMiddleware(Middleware):
+    """
+    Answers repeated tool calls with identical arguments from an LRU cache.
+
+    Tools are cached when they have a policy or, with ``cache_read_only``,
+    when their annotations set ``readOnlyHint``. Entries are keyed by a
+    canonical hash of the tool name, the arguments and the caller (the
+    authenticated client and its session), so one caller is never answered
+    with another's result. They are bounded by count, total serialized size
+    and age, and tagged so that writes can evict the results they make
+    stale, either through a policy's ``invalidates`` or by calling
+    ``invalidate_tags()``, which writers outside tool calls use as well.
+    """
+
+    methods = frozenset({"tools/call"})
+
+    def __init__(
+        self,
+        policies: Mapping[str, CachePolicy] | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 16 * 1024 * 1024,
+        ttl: float = 60.0,
+        cache_read_only: bool = True,
+    ):
+        self.policies = dict(policies or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.cache_read_only = cache_read_only
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._tagged: dict[str, set[str]] = {}
+        # Bumped by every invalidation; the generation that last evicted each tag
+        self._generation = 0
+        self._invalidated_at: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def on_call_tool(
+        self,
+        context: MiddlewareContext[mt.CallToolRequestParams],
+        call_next: CallNext[mt.CallToolRequestParams, Any],
+    ) -> Any:
+        name = context.message.name
+        arguments = context.message.arguments or {}
+        policy = await self._policy(context, name)
+        if policy is None:
+            return await call_next(context)
+
+        if policy.cacheable is not None and not policy.cacheable(arguments):
+            result = await call_next(context)
+            if policy.invalidates is not None:
+                self.invalidate_tags(*policy.invalidates(arguments))
+            return result
+
+        key = cache_key(name, arguments, caller_scope(context))
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        generation = self._generation
+        result = await call_next(context)
+        tags = {f"tool:{name}", *(policy.tags(arguments) if policy.tags else ())}
+        ttl = self.ttl if policy.ttl is None else policy.ttl
+        self.put(key, result, tags, ttl, since=generation)
+        return result
+
+    async def _policy(
+        self, context: MiddlewareContext[Any], name: str
+    ) -> CachePolicy | None:
+        policy = self.policies.get(name)
+        if policy is not None or not self.cache_read_only:
+            return policy
+        if context.fastmcp_context is None:
+            return None
+        try:
+            tool = await context.fastmcp_context.fastmcp.get_tool(name)
+        except NotFoundError:
+            return None
+        if tool.annotations is not None and tool.annotations.readOnlyHint:
+            return READ_ONLY_POLICY
+        return None
+
+    def get(self, key: str) -> list[Any] | None:
+        """The fresh result cached under key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry.result)
+
+    def put(
+        self,
+        key: str,
+        result: list[Any],
+        tags: Iterable[str],
+        ttl: float,
+        since: int | None = None,
+    ) -> None:
+        """
+        Cache result under key, evicting the least recently used entries.
+
+        A result computed since invalidation generation ``since`` is dropped
+        when one of its tags was invalidated meanwhile, as it may be stale.
+        """
+        size = serialized_size(result)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        entry = _Entry(list(result), size, time.monotonic() + ttl, frozenset(tags))
+        with self._lock:
+            if since is not None and any(
+                self._invalidated_at.get(tag, 0) > since for tag in entry.tags
+            ):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self.total_bytes += size
+            for tag in entry.tags:
+                self._tagged.setdefault(tag, set()).add(key)
+            while (
+                len(self._entries) > self.max_entries
+                or self.total_bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """Evict every entry carrying one of tags; returns how many were evicted."""
+        with self._lock:
+            self._generation += 1
+            for tag in tags:
+                self._invalidated_at[tag] = self._generation
+            keys = set().union(*(self._tagged.get(tag, ()) for tag in tags))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tagged.clear()
+            self.total_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+        for tag in entry.tags:
+            keys = self._tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tagged[tag]
+
+
+def cache_key(
+    name: str, arguments: Arguments, caller: Iterable[str | None] = ()
+) -> str:
+    """Canonical hash of a tool call made by caller: equal arguments give
+    equal keys regardless of dict order."""
+    encoded = json.dumps(
+        [name, arguments, list(caller)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+# Cache scope of each live session without an HTTP session id
+_session_scopes: weakref.WeakKeyDictionary[Any, str] = weakref.WeakKeyDictionary()
+
+
+def caller_scope(context: MiddlewareContext[Any]) -> tuple[str | None, str | None]:
+    """(principal, session) a call is made by: the authenticated client and
+    its scopes, and the MCP session; None where there is none."""
+    token = get_access_token()
+    principal = (
+        None if token is None else f"{token.client_id}:{' '.join(sorted(token.scopes))}"
+    )
+    session_scope = None
+    fastmcp_context = context.fastmcp_context
+    if fastmcp_context is not None:
+        try:
+            session = fastmcp_context.session
+        except ValueError:  # Called outside of an MCP request
+            session = None
+        if session is not None:
+            session_scope = fastmcp_context.session_id or _session_scopes.setdefault(
+                session, uuid.uuid4().hex
+            )
+    return principal, session_scope
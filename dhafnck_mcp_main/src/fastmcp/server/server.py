@@ -22,7 +22,7 @@ import httpx
 import mcp.types
 import uvicorn
 from mcp.server.lowlevel.helper_types import ReadResourceContents
-from mcp.server.lowlevel.server import LifespanResultT, NotificationOptions
+from mcp.server.lowlevel.server import LifespanResultT
 from mcp.server.lowlevel.server import Server as MCPServer
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -30,10 +30,6 @@ from mcp.types import (
     GetPromptResult,
     ToolAnnotations,
 )
-from mcp.types import Prompt as MCPPrompt
-from mcp.types import Resource as MCPResource
-from mcp.types import ResourceTemplate as MCPResourceTemplate
-from mcp.types import Tool as MCPTool
 from pydantic import AnyUrl
 from starlette.middleware import Middleware as ASGIMiddleware
 from starlette.requests import Request
@@ -54,15 +50,38 @@ from fastmcp.server.http_server import (
     create_sse_app,
     create_streamable_http_app,
 )
-from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.server.listings import (
+    LIST_CHANGED_NOTIFICATIONS,
+    LISTING_HASH_META_KEY,
+    NOT_MODIFIED_META_KEY,
+    ListChangedNotifier,
+    Listing,
+    current_session,
+    if_none_match,
+    listing_hash,
+)
+from fastmcp.server.metrics import MetricsMiddleware
+from fastmcp.server.middleware import (
+    CallNext,
+    Middleware,
+    MiddlewareChain,
+    MiddlewareContext,
+    call_through,
+    compose_middleware,
+)
 from fastmcp.settings import Settings
 from fastmcp.tools import ToolManager
 from fastmcp.tools.tool import FunctionTool, Tool
 from fastmcp.utilities.cache import TimedCache
-from fastmcp.utilities.components import FastMCPComponent
+from fastmcp.utilities.components import (
+    FastMCPComponent,
+    add_change_listener,
+    component_state_version,
+)
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.mcp_config import MCPConfig
 from fastmcp.utilities.types import MCPContent
+from fastmcp.utilities.worker_pool import DEFAULT_WORKER_POOL
 
 # Import the consolidated MCP tools
 from fastmcp.task_management.interface.consolidated_mcp_tools import ConsolidatedMCPTools
@@ -76,6 +95,24 @@ if TYPE_CHECKING:
     from fastmcp.server.proxy import FastMCPProxy
 logger = get_logger(__name__)
 
+# Listing kind -> (MCP method, result type, result field)
+_LISTS: dict[str, tuple[str, type[Any], str]] = {
+    "tools": ("tools/list", mcp.types.ListToolsResult, "tools"),
+    "resources": ("resources/list", mcp.types.ListResourcesResult, "resources"),
+    "resource_templates": (
+        "resources/templates/list",
+        mcp.types.ListResourceTemplatesResult,
+        "resourceTemplates",
+    ),
+    "prompts": ("prompts/list", mcp.types.ListPromptsResult, "prompts"),
+}
+
+
+def _notification_kind(kind: str) -> str:
+    """Resources and templates share notifications/resources/list_changed."""
+    return "resources" if kind == "resource_templates" else kind
+
+
 DuplicateBehavior = Literal["warn", "error", "replace", "ignore"]
 
 # Compiled URI parsing regex to split a URI into protocol and path components
@@ -106,6 +143,11 @@ def _lifespan_wrapper(
     @asynccontextmanager
     async def wrap(s: MCPServer[LifespanResultT]) -> AsyncIterator[LifespanResultT]:
         async with AsyncExitStack() as stack:
+            consolidated_tools = app.consolidated_tools
+            if consolidated_tools is not None:
+                await stack.enter_async_context(
+                    consolidated_tools.session_timeout_monitor.running()
+                )
             context = await stack.enter_async_context(lifespan(app))
             yield context
 
@@ -179,6 +221,17 @@ class FastMCP(Generic[LifespanResultT]):
             mask_error_details=mask_error_details,
         )
         self._tool_serializer = tool_serializer
+        # Listings served to clients, by kind, and the sessions they went to
+        self._listings: dict[str, Listing] = {}
+        self._list_changed = ListChangedNotifier()
+        add_change_listener(self._components_changed)
+
+        self.middleware = middleware or []
+        # Middleware chains composed per (method, message type) from the
+        # middleware in _chained_middleware, recomposed once self.middleware
+        # no longer holds the same middleware
+        self._middleware_chains: dict[tuple[str | None, str], MiddlewareChain] = {}
+        self._chained_middleware: tuple[Middleware, ...] = ()
 
         # Initialize task management tools if enabled
         self._consolidated_tools = None
@@ -253,7 +306,11 @@ class FastMCP(Generic[LifespanResultT]):
         self.include_tags = include_tags
         self.exclude_tags = exclude_tags
 
-        self.middleware = middleware or []
+        if fastmcp.settings.metrics_enabled:
+            MetricsMiddleware(
+                measure_result_bytes=fastmcp.settings.metrics_measure_result_bytes
+            ).install(self)
+
 
         # Set up MCP protocol handlers
         self._setup_handlers()
@@ -429,10 +486,13 @@ class FastMCP(Generic[LifespanResultT]):
 
     def _setup_handlers(self) -> None:
         """Set up core MCP protocol handlers."""
-        self._mcp_server.list_tools()(self._mcp_list_tools)
-        self._mcp_server.list_resources()(self._mcp_list_resources)
-        self._mcp_server.list_resource_templates()(self._mcp_list_resource_templates)
-        self._mcp_server.list_prompts()(self._mcp_list_prompts)
+        handlers = self._mcp_server.request_handlers
+        handlers[mcp.types.ListToolsRequest] = self._mcp_list_tools
+        handlers[mcp.types.ListResourcesRequest] = self._mcp_list_resources
+        handlers[mcp.types.ListResourceTemplatesRequest] = (
+            self._mcp_list_resource_templates
+        )
+        handlers[mcp.types.ListPromptsRequest] = self._mcp_list_prompts
         self._mcp_server.call_tool()(self._mcp_call_tool)
         self._mcp_server.read_resource()(self._mcp_read_resource)
         self._mcp_server.get_prompt()(self._mcp_get_prompt)
@@ -440,13 +500,120 @@ class FastMCP(Generic[LifespanResultT]):
     async def _apply_middleware(
         self,
         context: MiddlewareContext[Any],
-        call_next: Callable[[MiddlewareContext[Any]], Awaitable[Any]],
+        call_next: CallNext[Any, Any],
     ) -> Any:
-        """Builds and executes the middleware chain."""
-        chain = call_next
-        for mw in reversed(self.middleware):
-            chain = partial(mw, call_next=chain)
-        return await chain(context)
+        """Executes the middleware chain composed for the context's method."""
+        chain = self._middleware_chain(context.method, context.type)
+        return await chain(context, call_next)
+
+    def _middleware_chain(
+        self, method: str | None, message_type: str
+    ) -> MiddlewareChain:
+        middleware = tuple(self.middleware)
+        if middleware != self._chained_middleware:
+            self._middleware_chains.clear()
+            self._chained_middleware = middleware
+        key = (method, message_type)
+        chain = self._middleware_chains.get(key)
+        if chain is None:
+            chain = self._middleware_chains[key] = compose_middleware(
+                middleware, *key
+            )
+        return chain
+
+    async def _serve_listing(self, kind: str, request: Any) -> mcp.types.ServerResult:
+        """
+        Serve a list request of kind from the cached listing.
+
+        The result's _meta carries the listing hash; a client that sends the
+        hash it holds as _meta["fastmcp/ifNoneMatch"] gets an empty result
+        flagged as not modified while the listing is unchanged.
+        """
+        _, result_type, field = _LISTS[kind]
+        listing = await self._listing(kind)
+        session = current_session()
+        if session is not None and listing.key is not None:
+            self._list_changed.served(
+                _notification_kind(kind), session, listing.key
+            )
+
+        meta: dict[str, Any] = {LISTING_HASH_META_KEY: listing.hash}
+        items = listing.items
+        if if_none_match(request) == listing.hash:
+            items = []
+            meta[NOT_MODIFIED_META_KEY] = True
+        return mcp.types.ServerResult(result_type(**{field: items}, _meta=meta))
+
+    def _listing_key(self, kind: str) -> tuple[Any, ...] | None:
+        """
+        State a listing is derived from: the registry version, enabled
+        flags and tag filters. None if the registry cannot be versioned.
+        """
+        if kind == "tools":
+            version = self._tool_manager.version
+        elif kind == "prompts":
+            version = self._prompt_manager.version
+        else:
+            version = self._resource_manager.version
+        if version is None:
+            return None
+        return (
+            version,
+            component_state_version(),
+            None if self.include_tags is None else frozenset(self.include_tags),
+            None if self.exclude_tags is None else frozenset(self.exclude_tags),
+        )
+
+    async def _listing(self, kind: str) -> Listing:
+        """
+        The MCP components of kind, rebuilt only when its listing key
+        changes. Listings pass through middleware, so they are not cached
+        while any middleware handles the list method.
+        """
+        key = self._listing_key(kind)
+        cached = self._listings.get(kind)
+        if cached is not None and key is not None and cached.key == key:
+            return cached
+
+        with fastmcp.server.context.Context(fastmcp=self):
+            if kind == "tools":
+                items: list[Any] = [
+                    tool.to_mcp_tool(name=tool.key) for tool in await self._list_tools()
+                ]
+            elif kind == "resources":
+                items = [
+                    resource.to_mcp_resource(uri=resource.key)
+                    for resource in await self._list_resources()
+                ]
+            elif kind == "resource_templates":
+                items = [
+                    template.to_mcp_template(uriTemplate=template.key)
+                    for template in await self._list_resource_templates()
+                ]
+            else:
+                items = [
+                    prompt.to_mcp_prompt(name=prompt.key)
+                    for prompt in await self._list_prompts()
+                ]
+
+        listing = Listing(key, items, listing_hash(items))
+        chain = self._middleware_chain(_LISTS[kind][0], "request")
+        if key is not None and chain is call_through:
+            self._listings[kind] = listing
+        return listing
+
+    def _components_changed(self) -> None:
+        """Announce a registry change to the sessions it made stale, from any thread."""
+        self._list_changed.schedule(self._notify_list_changed)
+
+    async def _notify_list_changed(self) -> None:
+        """Send list_changed to the sessions served listings that are now stale."""
+        if not self._list_changed:
+            return
+        for kind in ("tools", "resources", "prompts"):
+            key = self._listing_key(kind)
+            if key is not None:
+                await self._list_changed.notify(kind, key)
 
     def add_middleware(self, middleware: Middleware) -> None:
         self.middleware.append(middleware)
@@ -537,12 +704,12 @@ class FastMCP(Generic[LifespanResultT]):
 
         return decorator
 
-    async def _mcp_list_tools(self) -> list[MCPTool]:
+    async def _mcp_list_tools(
+        self, request: mcp.types.ListToolsRequest
+    ) -> mcp.types.ServerResult:
         logger.debug("Handler called: list_tools")
 
-        with fastmcp.server.context.Context(fastmcp=self):
-            tools = await self._list_tools()
-            return [tool.to_mcp_tool(name=tool.key) for tool in tools]
+        return await self._serve_listing("tools", request)
 
     async def _list_tools(self) -> list[Tool]:
         """
@@ -576,14 +743,12 @@ class FastMCP(Generic[LifespanResultT]):
             # Apply the middleware chain.
             return await self._apply_middleware(mw_context, _handler)
 
-    async def _mcp_list_resources(self) -> list[MCPResource]:
+    async def _mcp_list_resources(
+        self, request: mcp.types.ListResourcesRequest
+    ) -> mcp.types.ServerResult:
         logger.debug("Handler called: list_resources")
 
-        with fastmcp.server.context.Context(fastmcp=self):
-            resources = await self._list_resources()
-            return [
-                resource.to_mcp_resource(uri=resource.key) for resource in resources
-            ]
+        return await self._serve_listing("resources", request)
 
     async def _list_resources(self) -> list[Resource]:
         """
@@ -617,15 +782,12 @@ class FastMCP(Generic[LifespanResultT]):
             # Apply the middleware chain.
             return await self._apply_middleware(mw_context, _handler)
 
-    async def _mcp_list_resource_templates(self) -> list[MCPResourceTemplate]:
+    async def _mcp_list_resource_templates(
+        self, request: mcp.types.ListResourceTemplatesRequest
+    ) -> mcp.types.ServerResult:
         logger.debug("Handler called: list_resource_templates")
 
-        with fastmcp.server.context.Context(fastmcp=self):
-            templates = await self._list_resource_templates()
-            return [
-                template.to_mcp_template(uriTemplate=template.key)
-                for template in templates
-            ]
+        return await self._serve_listing("resource_templates", request)
 
     async def _list_resource_templates(self) -> list[ResourceTemplate]:
         """
@@ -659,12 +821,12 @@ class FastMCP(Generic[LifespanResultT]):
             # Apply the middleware chain.
             return await self._apply_middleware(mw_context, _handler)
 
-    async def _mcp_list_prompts(self) -> list[MCPPrompt]:
+    async def _mcp_list_prompts(
+        self, request: mcp.types.ListPromptsRequest
+    ) -> mcp.types.ServerResult:
         logger.debug("Handler called: list_prompts")
 
-        with fastmcp.server.context.Context(fastmcp=self):
-            prompts = await self._list_prompts()
-            return [prompt.to_mcp_prompt(name=prompt.key) for prompt in prompts]
+        return await self._serve_listing("prompts", request)
 
     async def _list_prompts(self) -> list[Prompt]:
         """
@@ -883,6 +1045,10 @@ class FastMCP(Generic[LifespanResultT]):
         annotations: ToolAnnotations | dict[str, Any] | None = None,
         exclude_args: list[str] | None = None,
         enabled: bool | None = None,
+        worker_pool: str | None = DEFAULT_WORKER_POOL,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        queue_timeout: float | None = None,
     ) -> FunctionTool: ...
 
     @overload
@@ -896,6 +1062,10 @@ class FastMCP(Generic[LifespanResultT]):
         annotations: ToolAnnotations | dict[str, Any] | None = None,
         exclude_args: list[str] | None = None,
         enabled: bool | None = None,
+        worker_pool: str | None = DEFAULT_WORKER_POOL,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        queue_timeout: float | None = None,
     ) -> Callable[[AnyFunction], FunctionTool]: ...
 
     def tool(
@@ -908,6 +1078,10 @@ class FastMCP(Generic[LifespanResultT]):
         annotations: ToolAnnotations | dict[str, Any] | None = None,
         exclude_args: list[str] | None = None,
         enabled: bool | None = None,
+        worker_pool: str | None = DEFAULT_WORKER_POOL,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        queue_timeout: float | None = None,
     ) -> Callable[[AnyFunction], FunctionTool] | FunctionTool:
         """Decorator to register a tool.
 
@@ -930,6 +1104,14 @@ class FastMCP(Generic[LifespanResultT]):
             annotations: Optional annotations about the tool's behavior (e.g. {"is_async": True})
             exclude_args: Optional list of argument names to exclude from the tool schema
             enabled: Optional boolean to enable or disable the tool
+            worker_pool: Worker pool that runs a synchronous function, so blocking
+                work does not stall the event loop. None calls it inline.
+            timeout: Optional seconds a call may run before it fails with a ToolError
+                (defaults to settings.tool_timeout)
+            max_concurrency: Optional number of calls that may run at once; further
+                calls wait (defaults to settings.tool_max_concurrency)
+            queue_timeout: Optional seconds a call waits for a free slot before it
+                fails with a ToolError (defaults to settings.tool_queue_timeout)
 
         Example:
             @server.tool
@@ -983,6 +1165,10 @@ class FastMCP(Generic[LifespanResultT]):
                 exclude_args=exclude_args,
                 serializer=self._tool_serializer,
                 enabled=enabled,
+                worker_pool=worker_pool,
+                timeout=timeout,
+                max_concurrency=max_concurrency,
+                queue_timeout=queue_timeout,
             )
             self.add_tool(tool)
             return tool
@@ -1012,6 +1198,10 @@ class FastMCP(Generic[LifespanResultT]):
             annotations=annotations,
             exclude_args=exclude_args,
             enabled=enabled,
+            worker_pool=worker_pool,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            queue_timeout=queue_timeout,
         )
 
     def add_resource(self, resource: Resource) -> None:
@@ -1361,7 +1551,7 @@ class FastMCP(Generic[LifespanResultT]):
                 read_stream,
                 write_stream,
                 self._mcp_server.create_initialization_options(
-                    NotificationOptions(tools_changed=True)
+                    LIST_CHANGED_NOTIFICATIONS
                 ),
             )
 
@@ -2135,3 +2325,42 @@ def has_resource_prefix(
         return bool(re.match(prefix_pattern, path))
     else:
         raise ValueError(f"Invalid prefix format: {prefix_format}")
+
+
+def resource_prefix_pattern(
+    prefix: str | None, prefix_format: Literal["protocol", "path"] | None = None
+) -> tuple[str, re.Pattern[str]]:
+    """Compile the prefix of a mounted server into a route for URI routers.
+
+    Returns the literal text every prefixed URI starts with and a pattern
+    matching exactly the URIs `has_resource_prefix` accepts. The URI without
+    the prefix is the pattern's ``scheme`` group (if any) followed by its
+    ``uri`` group, as `remove_resource_prefix` would return it.
+
+    Examples:
+        >>> literal, pattern = resource_prefix_pattern("prefix", "path")
+        >>> pattern.match("resource://prefix/path/to/resource").groupdict()
+        {"scheme": "resource://", "uri": "path/to/resource"}
+        >>> literal, pattern = resource_prefix_pattern("prefix", "protocol")
+        >>> literal
+        "prefix+"
+    """
+    if not prefix:
+        return "", re.compile(r"(?P<uri>.*)", re.DOTALL)
+
+    if prefix_format is None:
+        prefix_format = fastmcp.settings.resource_prefix_format
+
+    if prefix_format == "protocol":
+        # Legacy style: prefix+protocol://path
+        legacy_prefix = f"{prefix}+"
+        return legacy_prefix, re.compile(
+            f"{re.escape(legacy_prefix)}(?P<uri>.*)", re.DOTALL
+        )
+    elif prefix_format == "path":
+        # New style: protocol://prefix/path
+        return "", re.compile(
+            f"^(?P<scheme>[^:]+://){re.escape(prefix)}/(?P<uri>.*?)$"
+        )
+    else:
+        raise ValueError(f"Invalid prefix format: {prefix_format}")
@@ -171,6 +171,87 @@ class Settings(BaseSettings):
         ),
     ] = False
 
+    tool_worker_threads: Annotated[
+        int,
+        Field(
+            ge=1,
+            description=inspect.cleandoc(
+                """
+                Number of worker threads that synchronous tools run on. Calls beyond
+                this wait for a free worker instead of blocking the event loop.
+                Tools can opt out (worker_pool=None) or use another named pool.
+                """
+            ),
+        ),
+    ] = 16
+
+    tool_timeout: Annotated[
+        float | None,
+        Field(
+            gt=0,
+            description=inspect.cleandoc(
+                """
+                Default number of seconds a tool call may run before it is cancelled
+                and fails with a ToolError. None lets calls run indefinitely. Tools
+                can set their own timeout.
+                """
+            ),
+        ),
+    ] = None
+
+    tool_max_concurrency: Annotated[
+        int | None,
+        Field(
+            ge=1,
+            description=inspect.cleandoc(
+                """
+                Default number of calls of one tool that may run at once; further
+                calls wait for a free slot. None leaves calls unlimited. Tools can
+                set their own max_concurrency.
+                """
+            ),
+        ),
+    ] = None
+
+    tool_queue_timeout: Annotated[
+        float | None,
+        Field(
+            ge=0,
+            description=inspect.cleandoc(
+                """
+                Default number of seconds a tool call waits for a free slot under
+                max_concurrency before it fails with a ToolError. None waits
+                indefinitely.
+                """
+            ),
+        ),
+    ] = None
+
+    metrics_enabled: Annotated[
+        bool,
+        Field(
+            description=inspect.cleandoc(
+                """
+                If True, every server records request metrics with MetricsMiddleware
+                and serves them in Prometheus text format at /metrics and as the
+                metrics://server resource.
+                """
+            ),
+        ),
+    ] = False
+
+    metrics_measure_result_bytes: Annotated[
+        bool,
+        Field(
+            description=inspect.cleandoc(
+                """
+                If True, the request metrics also count the serialized size of every
+                result, which serializes each result a second time.
+                """
+            ),
+        ),
+    ] = False
+
     client_init_timeout: Annotated[
         float | None,
         Field(
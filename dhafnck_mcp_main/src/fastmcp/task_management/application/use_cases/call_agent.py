@@ -1,7 +1,6 @@
 """Call Agent Use Case"""
 
 import os
-import yaml
 import logging
 import traceback
 from pathlib import Path
@@ -9,6 +8,7 @@ from typing import Dict, Any, Optional
 
 from ...infrastructure.services.agent_doc_generator import generate_docs_for_assignees
 from fastmcp.tools.tool_path import find_project_root
+from fastmcp.utilities.yaml_loader import load_yaml_file as load_cached_yaml_file, thaw
 
 
 class CallAgentUseCase:
@@ -55,8 +55,7 @@ class CallAgentUseCase:
             # Function to safely load YAML file
             def load_yaml_file(file_path):
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        return yaml.safe_load(f) or {}
+                    return load_cached_yaml_file(file_path) or {}
                 except Exception as e:
                     return {"error": f"Error loading file: {str(e)}"}
             
@@ -106,9 +105,10 @@ class CallAgentUseCase:
                 logging.warning(f"Failed to generate agent documentation for {name_agent}: {str(e)}")
                 # Don't fail the entire operation if MDC generation fails
             
+            # The cached parses are frozen and shared, so clients get mutable copies
             return {
                 "success": True,
-                "agent_info": combined_content
+                "agent_info": thaw(combined_content)
             }
             
         except Exception as e:
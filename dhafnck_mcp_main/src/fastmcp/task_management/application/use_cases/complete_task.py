@@ -2,7 +2,6 @@
 
 from typing import Union, Dict, Any
 from ...domain import TaskRepository, TaskId, TaskNotFoundError
-from ...domain.events import TaskUpdated
 
 
 class CompleteTaskUseCase:
@@ -39,13 +38,6 @@ class CompleteTaskUseCase:
         # Save the task
         self._task_repository.save(task)
         
-        # Handle domain events
-        events = task.get_events()
-        for event in events:
-            if isinstance(event, TaskUpdated):
-                # Could trigger notifications, logging, etc.
-                pass
-        
         # Get subtask progress for the response
         progress = task.get_subtask_progress()
         
@@ -2,7 +2,6 @@
 
 from typing import Optional
 from ...domain import Task, TaskRepository, TaskId, TaskStatus, Priority, AutoRuleGenerator
-from ...domain.events import TaskCreated
 from ..dtos.task_dto import CreateTaskRequest, TaskResponse, CreateTaskResponse
 
 
@@ -65,13 +64,6 @@ class CreateTaskUseCase:
                     import logging
                     logging.warning(f"Failed to generate auto rules for task {task.id}: {e}")
             
-            # Handle domain events
-            events = task.get_events()
-            for event in events:
-                if isinstance(event, TaskCreated):
-                    # Could trigger notifications, logging, etc.
-                    pass
-            
             # Convert to response DTO
             task_response = TaskResponse.from_domain(task)
             return CreateTaskResponse.success_response(task_response)
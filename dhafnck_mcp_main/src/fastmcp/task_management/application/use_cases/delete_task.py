@@ -2,7 +2,6 @@
 
 from typing import Union
 from ...domain import TaskRepository, TaskId
-from ...domain.events import TaskDeleted
 
 
 class DeleteTaskUseCase:
@@ -28,14 +27,4 @@ class DeleteTaskUseCase:
         task.mark_as_deleted()
         
         # Delete from repository
-        success = self._task_repository.delete(domain_task_id)
-        
-        if success:
-            # Handle domain events
-            events = task.get_events()
-            for event in events:
-                if isinstance(event, TaskDeleted):
-                    # Could trigger cleanup, notifications, etc.
-                    pass
-        
-        return success 
\ No newline at end of file
+        return self._task_repository.delete(domain_task_id) 
\ No newline at end of file
@@ -4,7 +4,6 @@ from typing import Optional, Union
 
 from ...domain import TaskRepository, TaskId, AutoRuleGenerator
 from ...domain.exceptions.task_exceptions import TaskNotFoundError, AutoRuleGenerationError
-from ...domain.events import TaskRetrieved
 from ..dtos.task_dto import TaskResponse
 from ...infrastructure.services.agent_doc_generator import generate_agent_docs, generate_docs_for_assignees
 from ...infrastructure.services.context_generate import generate_task_context_if_needed
@@ -31,9 +30,6 @@ class GetTaskUseCase:
             raise TaskNotFoundError(task_id)
         
         if generate_rules:
-            # Mark task as retrieved (triggers domain event)
-            task.mark_as_retrieved()
-            
             # Generate context file if it doesn't exist
             try:
                 generate_task_context_if_needed(task)
@@ -42,23 +38,19 @@ class GetTaskUseCase:
                 import logging
                 logging.warning(f"Context file generation failed for task {task.id}: {e}")
             
-            # Handle domain events (auto rule generation)
-            events = task.get_events()
-            for event in events:
-                if isinstance(event, TaskRetrieved):
-                    try:
-                        # Generate auto rules for the retrieved task
-                        self._auto_rule_generator.generate_rules_for_task(
-                            task,
-                            force_full_generation=force_full_generation
-                        )
-                        # Generate agent documentation for all unique assignees
-                        generate_docs_for_assignees(task.assignees, clear_all=False)
-                    except Exception as e:
-                        raise AutoRuleGenerationError(
-                            f"Error during auto rule generation: {e}",
-                            original_exception=e
-                        )
+            try:
+                # Generate auto rules for the retrieved task
+                self._auto_rule_generator.generate_rules_for_task(
+                    task,
+                    force_full_generation=force_full_generation
+                )
+                # Generate agent documentation for all unique assignees
+                generate_docs_for_assignees(task.assignees, clear_all=False)
+            except Exception as e:
+                raise AutoRuleGenerationError(
+                    f"Error during auto rule generation: {e}",
+                    original_exception=e
+                )
         
         # Convert to response DTO
         return TaskResponse.from_domain(task) 
\ No newline at end of file
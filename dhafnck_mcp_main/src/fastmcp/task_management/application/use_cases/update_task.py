@@ -3,7 +3,6 @@
 from typing import Optional, Union
 
 from ...domain import TaskRepository, TaskId, TaskStatus, Priority, TaskNotFoundError, AutoRuleGenerator
-from ...domain.events import TaskUpdated
 from ..dtos.task_dto import UpdateTaskRequest, TaskResponse, UpdateTaskResponse
 
 
@@ -66,13 +65,6 @@ class UpdateTaskUseCase:
                 import logging
                 logging.warning(f"Failed to generate auto rules for task {task.id}: {e}")
         
-        # Handle domain events
-        events = task.get_events()
-        for event in events:
-            if isinstance(event, TaskUpdated):
-                # Could trigger notifications, logging, etc.
-                pass
-        
         # Convert to response DTO
         task_response = TaskResponse.from_domain(task)
         return UpdateTaskResponse.success_response(task_response)
@@ -1,6 +1,8 @@
 """Project Domain Entity"""
 
-from typing import Dict, List, Optional, Set
+import heapq
+import itertools
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
 
@@ -8,6 +10,9 @@ from ..value_objects.task_id import TaskId
 from .task_tree import TaskTree
 from .agent import Agent
 
+# Tie-breaker for sessions sharing a deadline in the timeout heap
+_deadline_sequence = itertools.count()
+
 
 @dataclass
 class Project:
@@ -44,6 +49,9 @@ class Project:
     active_work_sessions: Dict[str, 'WorkSession'] = field(default_factory=dict)
     resource_locks: Dict[str, str] = field(default_factory=dict)  # resource -> agent_id
     
+    # Min-heap of (deadline, sequence, session_id); entries are checked against the session when popped
+    _session_deadlines: List[Tuple[datetime, int, str]] = field(default_factory=list, repr=False, compare=False)
+    
     def create_task_tree(self, tree_id: str, name: str, description: str = "") -> TaskTree:
         """Create a new task tree/branch within the project"""
         if tree_id in self.task_trees:
@@ -147,9 +155,107 @@ class Project:
         )
         
         self.active_work_sessions[session.id] = session
+        self.schedule_session_timeout(session)
+        self.updated_at = datetime.now(timezone.utc)
+        return session
+    
+    def restore_work_session(self, session: 'WorkSession') -> None:
+        """Re-attach a persisted session, e.g. after a restart"""
+        self.active_work_sessions[session.id] = session
+        for resource_id in session.resources_locked:
+            self.resource_locks.setdefault(resource_id, session.agent_id)
+        self.schedule_session_timeout(session)
+    
+    def pause_work_session(self, session_id: str, reason: str = "") -> 'WorkSession':
+        """Pause an active work session; it cannot time out while paused"""
+        session = self.active_work_sessions.get(session_id)
+        if session is None:
+            raise ValueError(f"Work session {session_id} not found")
+        session.pause_session(reason)
+        self.updated_at = datetime.now(timezone.utc)
+        return session
+    
+    def resume_work_session(self, session_id: str) -> 'WorkSession':
+        """Resume a paused work session and schedule its timeout again"""
+        session = self.active_work_sessions.get(session_id)
+        if session is None:
+            raise ValueError(f"Work session {session_id} not found")
+        session.resume_session()
+        self.schedule_session_timeout(session)
+        self.updated_at = datetime.now(timezone.utc)
+        return session
+    
+    def end_work_session(self, session_id: str, success: bool = True) -> 'WorkSession':
+        """Complete a work session and release its resource locks"""
+        session = self.active_work_sessions.pop(session_id, None)
+        if session is None:
+            raise ValueError(f"Work session {session_id} not found")
+        self._release_session_locks(session)
+        session.complete_session(success)
         self.updated_at = datetime.now(timezone.utc)
         return session
     
+    def find_work_session(self, task_id: str) -> Optional['WorkSession']:
+        """Active work session on task_id, if any"""
+        for session in self.active_work_sessions.values():
+            if session.task_id == task_id:
+                return session
+        return None
+    
+    def schedule_session_timeout(self, session: 'WorkSession') -> None:
+        """
+        Track the deadline of session in the timeout heap.
+        
+        Extending a session needs no rescheduling, the entry is pushed back when
+        it comes due; resuming a paused session does, since paused sessions are
+        dropped from the heap, see resume_work_session.
+        """
+        deadline = session.get_deadline()
+        if deadline is not None:
+            heapq.heappush(self._session_deadlines, (deadline, next(_deadline_sequence), session.id))
+    
+    def next_session_deadline(self) -> Optional[datetime]:
+        """Earliest scheduled session deadline (may belong to a session that moved on)"""
+        return self._session_deadlines[0][0] if self._session_deadlines else None
+    
+    def expire_timed_out_sessions(self, now: Optional[datetime] = None) -> List['WorkSession']:
+        """
+        Time out every active session whose deadline passed, in O(log n) per session.
+        
+        Expired sessions are removed from the active sessions and release their
+        resource locks. Returns the expired sessions.
+        """
+        now = now or datetime.now()
+        expired = []
+        while self._session_deadlines and self._session_deadlines[0][0] <= now:
+            scheduled_deadline, _, session_id = heapq.heappop(self._session_deadlines)
+            session = self.active_work_sessions.get(session_id)
+            if session is None:
+                continue
+            deadline = session.get_deadline()
+            if deadline is None:
+                continue
+            if deadline > scheduled_deadline:
+                # Extended since it was scheduled
+                self.schedule_session_timeout(session)
+                continue
+            
+            self._release_session_locks(session)
+            session.timeout_session()
+            del self.active_work_sessions[session_id]
+            expired.append(session)
+        
+        if expired:
+            self.updated_at = datetime.now(timezone.utc)
+        return expired
+    
+    def _release_session_locks(self, session: 'WorkSession') -> None:
+        """Release the resource locks held by session"""
+        for resource_id in session.resources_locked:
+            if self.resource_locks.get(resource_id) == session.agent_id:
+                del self.resource_locks[resource_id]
+        session.unlock_all_resources()
+    
     def _find_task_tree(self, task_id: str) -> Optional[TaskTree]:
         """Find which task tree contains a specific task"""
         for tree in self.task_trees.values():
@@ -190,6 +296,7 @@ class Project:
                     "name": tree.name,
                     "assigned_agent": self.agent_assignments.get(tree_id),
                     "total_tasks": tree.get_task_count(),
+                    "root_tasks": len(tree.root_tasks),
                     "completed_tasks": tree.get_completed_task_count(),
                     "progress": tree.get_progress_percentage()
                 }
@@ -1,6 +1,7 @@
 """Task Domain Entity"""
 
 import logging
+import warnings
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import List, Optional, Dict, Any, Union
@@ -11,7 +12,6 @@ from ..value_objects.priority import Priority
 from ..enums.estimated_effort import EstimatedEffort, EffortLevel
 from ..enums.agent_roles import AgentRole, resolve_legacy_role
 from ..enums.common_labels import CommonLabel, LabelValidator
-from ..events.task_events import TaskCreated, TaskUpdated, TaskDeleted, TaskRetrieved
 
 
 @dataclass
@@ -34,8 +34,8 @@ class Task:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
-    # Domain events
-    _events: List[Any] = field(default_factory=list, init=False)
+    # Change counter, bumped by every mutator and persisted with the task
+    version: int = field(default=0, compare=False, repr=False)
     
     def __post_init__(self):
         """Validate task data after initialization"""
@@ -119,84 +119,44 @@ class Task:
         if not self.status.can_transition_to(new_status.value):
             raise ValueError(f"Cannot transition from {self.status} to {new_status}")
         
-        old_status = self.status
         self.status = new_status
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="status",
-            old_value=str(old_status),
-            new_value=str(new_status),
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_priority(self, new_priority: Priority) -> None:
         """Update task priority"""
-        old_priority = self.priority
         self.priority = new_priority
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="priority",
-            old_value=str(old_priority),
-            new_value=str(new_priority),
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_title(self, title: str) -> None:
         """Update task title"""
         if not title.strip():
             raise ValueError("Task title cannot be empty")
         
-        old_title = self.title
         self.title = title
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="title",
-            old_value=old_title,
-            new_value=title,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_description(self, description: str) -> None:
         """Update task description"""
         if not description.strip():
             raise ValueError("Task description cannot be empty")
         
-        old_description = self.description
         self.description = description
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="description",
-            old_value=old_description,
-            new_value=description,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_details(self, details: str) -> None:
         """Update task details"""
-        old_details = self.details
         self.details = details
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="details",
-            old_value=old_details,
-            new_value=details,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_estimated_effort(self, estimated_effort: str) -> None:
         """Update task estimated effort with enum validation"""
@@ -207,18 +167,10 @@ class Task:
             # Use default if invalid
             estimated_effort = EffortLevel.MEDIUM.label
         
-        old_effort = self.estimated_effort
         self.estimated_effort = estimated_effort
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="estimated_effort",
-            old_value=old_effort,
-            new_value=estimated_effort,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_assignees(self, assignees: List[str]) -> None:
         """Update task assignees"""
@@ -248,17 +200,9 @@ class Task:
                     validated_assignees.append(assignee)
         # Debug: Log validated assignees
         logging.debug(f"[update_assignees] Validated assignees: {validated_assignees}")
-        old_assignees = self.assignees.copy()
         self.assignees = validated_assignees
         self.updated_at = datetime.now(timezone.utc)
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="assignees",
-            old_value=old_assignees,
-            new_value=validated_assignees,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def add_assignee(self, assignee: Union[str, AgentRole]) -> None:
         """Add an assignee to the task"""
@@ -295,14 +239,7 @@ class Task:
             self.assignees.append(validated_assignee)
             self.updated_at = datetime.now(timezone.utc)
             
-            # Raise domain event
-            self._events.append(TaskUpdated(
-                task_id=self.id,
-                field_name="assignees",
-                old_value="assignee_added",
-                new_value=validated_assignee,
-                updated_at=self.updated_at
-            ))
+            self._changed()
     
     def remove_assignee(self, assignee: Union[str, AgentRole]) -> None:
         """Remove an assignee from the task"""
@@ -316,14 +253,7 @@ class Task:
             self.assignees.remove(assignee_str)
             self.updated_at = datetime.now(timezone.utc)
             
-            # Raise domain event
-            self._events.append(TaskUpdated(
-                task_id=self.id,
-                field_name="assignees",
-                old_value="assignee_removed",
-                new_value=assignee_str,
-                updated_at=self.updated_at
-            ))
+            self._changed()
     
     def has_assignee(self, assignee: str) -> bool:
         """Check if task has a specific assignee"""
@@ -395,18 +325,10 @@ class Task:
                 else:
                     validated_labels.append(label)  # Keep original if no suggestions
         
-        old_labels = self.labels.copy()
         self.labels = validated_labels
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="labels",
-            old_value=old_labels,
-            new_value=validated_labels,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def update_due_date(self, due_date: Optional[str]) -> None:
         """Update task due date with validation"""
@@ -417,26 +339,14 @@ class Task:
             except ValueError:
                 raise ValueError(f"Invalid due date format: {due_date}. Expected YYYY-MM-DD.")
 
-        old_due_date = self.due_date
         self.due_date = due_date
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="due_date",
-            old_value=old_due_date,
-            new_value=due_date,
-            updated_at=self.updated_at
-        ))
+        self._changed()
     
     def mark_as_deleted(self) -> None:
-        """Mark task as deleted (triggers domain event)"""
-        self._events.append(TaskDeleted(
-            task_id=self.id,
-            title=self.title,
-            deleted_at=datetime.now(timezone.utc)
-        ))
+        """Mark task as deleted"""
+        self._changed()
 
     def update_details_legacy(self, title: Optional[str] = None, description: Optional[str] = None, 
                       details: Optional[str] = None, assignees: Optional[List[str]] = None) -> None:
@@ -466,15 +376,7 @@ class Task:
         if changes:
             self.updated_at = datetime.now(timezone.utc)
             
-            # Raise domain events for each change
-            for field_name, (old_value, new_value) in changes.items():
-                self._events.append(TaskUpdated(
-                    task_id=self.id,
-                    field_name=field_name,
-                    old_value=old_value,
-                    new_value=new_value,
-                    updated_at=self.updated_at
-                ))
+            self._changed()
     
     def add_dependency(self, dependency_id: TaskId) -> None:
         """Add a task dependency"""
@@ -486,6 +388,7 @@ class Task:
         if dependency_id.value not in existing_deps:
             self.dependencies.append(dependency_id)
             self.updated_at = datetime.now(timezone.utc)
+            self._changed()
     
     def remove_dependency(self, dependency_id: TaskId) -> None:
         """Remove a task dependency"""
@@ -496,6 +399,7 @@ class Task:
             if dep_value == dependency_id.value:
                 self.dependencies.pop(i)
                 self.updated_at = datetime.now(timezone.utc)
+                self._changed()
                 break
     
     def has_dependency(self, dependency_id: TaskId) -> bool:
@@ -513,6 +417,7 @@ class Task:
         if self.dependencies:
             self.dependencies.clear()
             self.updated_at = datetime.now(timezone.utc)
+            self._changed()
     
     def has_circular_dependency(self, new_dependency_id: TaskId) -> bool:
         """Check if adding a dependency would create a circular reference"""
@@ -550,6 +455,7 @@ class Task:
         if valid_label not in self.labels:
             self.labels.append(valid_label)
             self.updated_at = datetime.now(timezone.utc)
+            self._changed()
     
     def remove_label(self, label: Union[str, CommonLabel]) -> None:
         """Remove a label from the task"""
@@ -562,6 +468,7 @@ class Task:
         if label_str in self.labels:
             self.labels.remove(label_str)
             self.updated_at = datetime.now(timezone.utc)
+            self._changed()
     
     def add_subtask(self, subtask_title: str = None, title: str = None, description: str = None, 
                    assignee: str = None, estimated_effort: str = None, **kwargs) -> Dict[str, Any]:
@@ -621,14 +528,7 @@ class Task:
         self.subtasks.append(subtask_data)
         self.updated_at = datetime.now(timezone.utc)
         
-        # Raise domain event
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="subtasks",
-            old_value="subtask_added",
-            new_value=subtask_data,
-            updated_at=self.updated_at
-        ))
+        self._changed()
         
         # Return the subtask dictionary
         return subtask_data
@@ -639,17 +539,10 @@ class Task:
             current_id = subtask.get("id")
             # Normalize comparison - handle both old integer IDs and new hierarchical IDs
             if self._subtask_ids_match(current_id, subtask_id):
-                removed_subtask = self.subtasks.pop(i)
+                self.subtasks.pop(i)
                 self.updated_at = datetime.now(timezone.utc)
                 
-                # Raise domain event
-                self._events.append(TaskUpdated(
-                    task_id=self.id,
-                    field_name="subtasks",
-                    old_value="subtask_removed",
-                    new_value=removed_subtask,
-                    updated_at=self.updated_at
-                ))
+                self._changed()
                 return True
         return False
     
@@ -659,18 +552,10 @@ class Task:
             current_id = subtask.get("id")
             # Normalize comparison - handle both old integer IDs and new hierarchical IDs
             if self._subtask_ids_match(current_id, subtask_id):
-                old_subtask = subtask.copy()
                 subtask.update(updates)
                 self.updated_at = datetime.now(timezone.utc)
                 
-                # Raise domain event
-                self._events.append(TaskUpdated(
-                    task_id=self.id,
-                    field_name="subtasks",
-                    old_value=old_subtask,
-                    new_value=subtask,
-                    updated_at=self.updated_at
-                ))
+                self._changed()
                 return True
         return False
     
@@ -681,6 +566,7 @@ class Task:
             # Treat as index if it's a small integer within range
             self.subtasks[subtask_id]["completed"] = True
             self.updated_at = datetime.now(timezone.utc)
+            self._changed()
             return True
         else:
             # Treat as ID - will raise ValueError if not found via update_subtask
@@ -693,28 +579,9 @@ class Task:
             subtask["completed"] = True
         
         # Update task status to done
-        old_status = self.status
         self.status = TaskStatus.done()
         self.updated_at = datetime.now(timezone.utc)
-        
-        # Raise domain event for task completion
-        self._events.append(TaskUpdated(
-            task_id=self.id,
-            field_name="status",
-            old_value=str(old_status),
-            new_value=str(self.status),
-            updated_at=self.updated_at
-        ))
-        
-        # Raise domain event for subtasks completion if there are any
-        if self.subtasks:
-            self._events.append(TaskUpdated(
-                task_id=self.id,
-                field_name="subtasks",
-                old_value="all_subtasks_completed",
-                new_value=self.subtasks,
-                updated_at=self.updated_at
-            ))
+        self._changed()
     
     def get_subtask(self, subtask_id: Union[int, str]) -> Optional[Dict[str, Any]]:
         """Get a subtask by ID (supports both integer and hierarchical IDs)"""
@@ -853,19 +720,22 @@ class Task:
         """Check if task can be started (no blocking dependencies)"""
         return self.status.is_todo()
     
+    def _changed(self) -> None:
+        """Count a change of this task, see version"""
+        self.version += 1
+    
     def get_events(self) -> List[Any]:
-        """Get and clear domain events"""
-        events = self._events.copy()
-        self._events.clear()
-        return events
+        """Deprecated: tasks no longer record domain events; always returns an empty list"""
+        warnings.warn(
+            "Task.get_events() is deprecated; tasks no longer record domain events, "
+            "compare Task.version to detect changes",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return []
     
     def mark_as_retrieved(self) -> None:
-        """Mark task as retrieved (triggers auto rule generation)"""
-        self._events.append(TaskRetrieved(
-            task_id=self.id,
-            task_data=self.to_dict(),
-            retrieved_at=datetime.now(timezone.utc)
-        ))
+        """Deprecated: reads are no longer recorded on the task; does nothing"""
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary representation"""
@@ -895,7 +765,8 @@ class Task:
             "subtasks": self.subtasks.copy(),
             "dueDate": self.due_date,
             "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "version": self.version
         }
     
     def migrate_subtask_ids(self) -> None:
@@ -935,11 +806,4 @@ class Task:
             **kwargs
         )
         
-        # Raise domain event
-        task._events.append(TaskCreated(
-            task_id=task.id,
-            title=task.title,
-            created_at=task.created_at
-        ))
-        
         return task 
\ No newline at end of file
@@ -1,6 +1,6 @@
 """TaskTree Domain Entity"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass, field
 
@@ -28,6 +28,7 @@ class TaskTree:
     assigned_agent_id: Optional[str] = None
     priority: str = "medium"  # Tree-level priority
     status: str = "active"    # active, paused, completed, archived
+    version: int = 0          # Bumped when tasks are added or the tree changes, see content_version
     
     def add_root_task(self, task: Task) -> None:
         """Add a root-level task to this tree"""
@@ -35,6 +36,7 @@ class TaskTree:
         self.all_tasks[task.id.value] = task
         self._add_subtasks_to_index(task)
         self.updated_at = datetime.now()
+        self.version += 1
     
     def add_task(self, task: Task, parent_task_id: Optional[str] = None) -> None:
         """Add a task to the tree, optionally as a subtask of another task"""
@@ -59,6 +61,14 @@ class TaskTree:
         self.all_tasks[task.id.value] = task
         self._add_subtasks_to_index(task)
         self.updated_at = datetime.now()
+        self.version += 1
+    
+    @property
+    def content_version(self) -> Tuple[int, int]:
+        """Changes whenever the tree or one of its tasks changes; keys data derived from the tree"""
+        # Task versions only grow and the task set only changes with self.version,
+        # so an edit to any task raises the sum
+        return self.version, sum(task.version for task in self.all_tasks.values())
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a specific task from the tree"""
@@ -150,21 +160,25 @@ class TaskTree:
         """Mark the entire tree as completed"""
         self.status = "completed"
         self.updated_at = datetime.now()
+        self.version += 1
     
     def pause_tree(self) -> None:
         """Pause work on this tree"""
         self.status = "paused"
         self.updated_at = datetime.now()
+        self.version += 1
     
     def resume_tree(self) -> None:
         """Resume work on this tree"""
         self.status = "active"
         self.updated_at = datetime.now()
+        self.version += 1
     
     def archive_tree(self) -> None:
         """Archive this tree"""
         self.status = "archived"
         self.updated_at = datetime.now()
+        self.version += 1
     
     def _add_subtasks_to_index(self, task: Task) -> None:
         """Recursively add all subtasks to the flattened index"""
@@ -1,6 +1,6 @@
 """WorkSession Domain Entity"""
 
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
@@ -154,12 +154,16 @@ class WorkSession:
         """Check if the session is currently active"""
         return self.status == SessionStatus.ACTIVE
     
-    def is_timeout_due(self) -> bool:
+    def get_deadline(self) -> Optional[datetime]:
+        """When an active session times out; None if it is not active or has no max duration"""
+        if self.status != SessionStatus.ACTIVE or not self.max_duration:
+            return None
+        return self.started_at + self.max_duration
+    
+    def is_timeout_due(self, now: Optional[datetime] = None) -> bool:
         """Check if the session should be timed out"""
-        if not self.max_duration:
-            return False
-        
-        return self.get_total_duration() > self.max_duration
+        deadline = self.get_deadline()
+        return deadline is not None and (now or datetime.now()) > deadline
     
     def get_session_summary(self) -> Dict:
         """Get a comprehensive summary of the work session"""
@@ -210,6 +214,51 @@ class WorkSession:
             f"Session extended by {additional_duration}"
         )
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the session for persistence"""
+        return {
+            "id": self.id,
+            "agent_id": self.agent_id,
+            "task_id": self.task_id,
+            "tree_id": self.tree_id,
+            "started_at": self.started_at.isoformat(),
+            "status": self.status.value,
+            "ended_at": self.ended_at.isoformat() if self.ended_at else None,
+            "paused_at": self.paused_at.isoformat() if self.paused_at else None,
+            "total_paused_seconds": self.total_paused_duration.total_seconds(),
+            "session_notes": self.session_notes,
+            "progress_updates": self.progress_updates,
+            "resources_locked": self.resources_locked,
+            "max_duration_seconds": self.max_duration.total_seconds() if self.max_duration else None,
+            "auto_save_interval": self.auto_save_interval,
+            "last_activity": self.last_activity.isoformat(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'WorkSession':
+        """Restore a session serialized by to_dict"""
+        def parse(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+        
+        max_duration_seconds = data.get("max_duration_seconds")
+        return cls(
+            id=data["id"],
+            agent_id=data["agent_id"],
+            task_id=data["task_id"],
+            tree_id=data["tree_id"],
+            started_at=parse(data["started_at"]),
+            status=SessionStatus(data.get("status", SessionStatus.ACTIVE.value)),
+            ended_at=parse(data.get("ended_at")),
+            paused_at=parse(data.get("paused_at")),
+            total_paused_duration=timedelta(seconds=data.get("total_paused_seconds", 0)),
+            session_notes=data.get("session_notes", ""),
+            progress_updates=list(data.get("progress_updates", [])),
+            resources_locked=list(data.get("resources_locked", [])),
+            max_duration=timedelta(seconds=max_duration_seconds) if max_duration_seconds is not None else None,
+            auto_save_interval=data.get("auto_save_interval", 300),
+            last_activity=parse(data.get("last_activity")) or datetime.now(),
+        )
+    
     def update_activity(self) -> None:
         """Update the last activity timestamp"""
         self.last_activity = datetime.now()
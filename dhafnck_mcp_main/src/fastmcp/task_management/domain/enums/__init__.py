@@ -3,11 +3,13 @@
 from .agent_roles import AgentRole, get_role_metadata_from_yaml
 from .estimated_effort import EstimatedEffort, EffortLevel
 from .common_labels import CommonLabel, LabelValidator
+from .role_resolution import RoleResolution, RoleResolutionIndex, get_role_resolution_index
 # from .assignee_type import AssigneeType, AssigneeValidator
 
 __all__ = [
     'AgentRole', 'get_role_metadata_from_yaml',
     'EstimatedEffort', 'EffortLevel', 
     'CommonLabel', 'LabelValidator',
+    'RoleResolution', 'RoleResolutionIndex', 'get_role_resolution_index',
     'AssigneeType', 'AssigneeValidator'
 ] 
\ No newline at end of file
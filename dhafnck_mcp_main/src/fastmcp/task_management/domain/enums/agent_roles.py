@@ -12,6 +12,8 @@ from typing import List, Dict, Optional
 import os
 import yaml
 
+from fastmcp.utilities.yaml_loader import load_yaml_file, thaw
+
 
 class AgentRole(Enum):
     """Enumeration of all available agent roles"""
@@ -94,15 +96,14 @@ class AgentRole(Enum):
     @classmethod
     def get_role_by_slug(cls, slug: str) -> Optional['AgentRole']:
         """Get role enum by slug"""
-        for role in cls:
-            if role.value == slug:
-                return role
-        return None
+        if not isinstance(slug, str):
+            return None
+        return cls._value2member_map_.get(slug)
     
     @classmethod
     def is_valid_role(cls, slug: str) -> bool:
         """Check if a slug is a valid role"""
-        return slug in cls.get_all_roles()
+        return cls.get_role_by_slug(slug) is not None
     
     @property
     def folder_name(self) -> str:
@@ -204,8 +205,8 @@ def get_role_metadata_from_yaml(role_input) -> Optional[Dict[str, any]]:
     yaml_path = os.path.join("cursor_agent", "yaml-lib", folder_name, "job_desc.yaml")
     
     try:
-        with open(yaml_path, 'r', encoding='utf-8') as file:
-            yaml_data = yaml.safe_load(file)
+        # Copy the shared cached parse before adding fields to it
+        yaml_data = thaw(load_yaml_file(yaml_path))
             
         if yaml_data:
             # Add folder_name and slug to the metadata
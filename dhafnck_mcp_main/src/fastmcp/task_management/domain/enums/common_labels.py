@@ -1,6 +1,7 @@
 """Common Labels Enum for Task Management"""
 
 from enum import Enum
+from functools import lru_cache
 from typing import List, Set
 
 
@@ -173,16 +174,17 @@ class CommonLabel(Enum):
     @classmethod
     def suggest_labels(cls, text: str) -> List[str]:
         """Suggest relevant labels based on text content"""
-        text_lower = text.lower()
-        suggestions = []
-        
-        # Check each label's keywords for matches
-        for label in cls:
-            keywords = label.get_keywords()
-            if any(keyword in text_lower for keyword in keywords):
-                suggestions.append(label.value)
-        
-        return list(set(suggestions))  # Remove duplicates
+        # Single pass over the text for every label's keywords
+        matched = _label_matcher().match(text)
+        return [label.value for label in cls if label in matched]
+
+
+@lru_cache(maxsize=None)
+def _label_matcher():
+    """Keyword matcher built once from every label's keywords"""
+    # Imported lazily: the services package depends on the entities that import this module
+    from ..services.keyword_matcher import KeywordMatcher
+    return KeywordMatcher({label: label.get_keywords() for label in CommonLabel})
 
 
 class LabelValidator:
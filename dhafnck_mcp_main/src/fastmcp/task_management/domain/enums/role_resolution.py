@@ -0,0 +1,135 @@
+"""
+Role Resolution Index
+
+One immutable lookup table resolving every accepted spelling of an agent role
+(``@coding-agent``, ``Senior Developer``, ``senior_developer``, ``coding_agent``)
+to its current slug and its yaml-lib directory, used to find the directory of
+role names in templates. ``resolve_legacy_role`` and
+``RoleManager.get_role_from_assignee`` keep their own exact mappings.
+"""
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from .agent_roles import AgentRole, LEGACY_ROLE_MAPPINGS
+
+
+# Human-readable assignee names used by older task files and role templates
+DISPLAY_NAME_MAPPINGS: Dict[str, str] = {
+    "Lead Developer": "coding_agent",
+    "Backend Developer": "coding_agent",
+    "Frontend Developer": "coding_agent",
+    "AI Systems Developer": "coding_agent",
+    "Integration Developer": "coding_agent",
+    "Security Developer": "coding_agent",
+    "Senior Full-Stack Developer": "coding_agent",
+    "Systems Analyst": "task_planning_agent",
+    "Senior Task Planning Architect": "task_planning_agent",
+    "QA Lead": "functional_tester_agent",
+    "Performance Engineer": "functional_tester_agent",
+    "Senior QA Engineer & Test Specialist": "functional_tester_agent",
+    "Senior Code Reviewer & Quality Assurance Specialist": "code_reviewer_agent",
+    "System Architect": "system_architect_agent",
+}
+
+_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_role_spelling(name: str) -> str:
+    """Reduce a role spelling to its lookup key: lowercase words joined by underscores"""
+    return _SEPARATORS.sub("_", name.strip().lstrip("@").lower()).strip("_")
+
+
+@dataclass(frozen=True)
+class RoleResolution:
+    """Resolved identity of a role spelling"""
+    slug: Optional[str]  # AgentRole value, None for yaml-lib directories missing from the enum
+    directory: str  # yaml-lib directory name
+
+
+class RoleResolutionIndex:
+    """Immutable spelling -> RoleResolution table with O(1) lookups"""
+
+    def __init__(self, entries: Mapping[str, RoleResolution], agent_directories: Tuple[str, ...] = ()):
+        self._entries = MappingProxyType(dict(entries))
+        self.agent_directories = agent_directories
+
+    @classmethod
+    def build(cls, lib_dir: Optional[Path] = None) -> "RoleResolutionIndex":
+        """Build the index from the AgentRole enum, the legacy tables and the yaml-lib listing"""
+        entries: Dict[str, RoleResolution] = {}
+
+        def add(spelling: str, resolution: RoleResolution) -> None:
+            # Earlier sources take precedence over later ones
+            key = normalize_role_spelling(spelling)
+            if key:
+                entries.setdefault(key, resolution)
+
+        def for_slug(slug: str) -> RoleResolution:
+            return RoleResolution(slug=slug, directory=AgentRole(slug).folder_name)
+
+        for role in AgentRole:
+            add(role.value, for_slug(role.value))
+
+        for legacy_name, slug in LEGACY_ROLE_MAPPINGS.items():
+            if AgentRole.is_valid_role(slug):
+                add(legacy_name, for_slug(slug))
+
+        for display_name, slug in DISPLAY_NAME_MAPPINGS.items():
+            add(display_name, for_slug(slug))
+
+        # Bare names such as "coding" or "Coding" for "coding_agent"
+        for role in AgentRole:
+            if role.value.endswith("_agent"):
+                add(role.value[:-len("_agent")], for_slug(role.value))
+
+        agent_directories: Tuple[str, ...] = ()
+        if lib_dir is not None and lib_dir.is_dir():
+            agent_directories = tuple(sorted(
+                item.name for item in lib_dir.iterdir()
+                if item.is_dir() and not item.name.startswith((".", "_"))
+            ))
+            for directory in agent_directories:
+                slug = directory if AgentRole.is_valid_role(directory) else None
+                add(directory, RoleResolution(slug=slug, directory=directory))
+
+        return cls(entries, agent_directories)
+
+    def resolve(self, name: Union[str, AgentRole, None]) -> Optional[RoleResolution]:
+        """Resolve any spelling of a role, or return None when it is unknown"""
+        if isinstance(name, AgentRole):
+            name = name.value
+        if not name or not isinstance(name, str):
+            return None
+        return self._entries.get(normalize_role_spelling(name))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared indexes by yaml-lib directory, with the directory mtime they were built at
+_indexes: Dict[Optional[str], Tuple[Optional[int], RoleResolutionIndex]] = {}
+
+
+def _directory_stamp(lib_dir: Optional[str]) -> Optional[int]:
+    """mtime of lib_dir; adding or removing an agent directory changes it"""
+    if lib_dir is None:
+        return None
+    try:
+        return os.stat(lib_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_role_resolution_index(lib_dir: Optional[Path] = None) -> RoleResolutionIndex:
+    """Shared index for lib_dir, rebuilt when the directory changes; without lib_dir only the enum and legacy tables are indexed"""
+    key = os.path.abspath(lib_dir) if lib_dir else None
+    stamp = _directory_stamp(key)
+    cached = _indexes.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = _indexes[key] = (stamp, RoleResolutionIndex.build(Path(key) if key else None))
+    return cached[1]
@@ -1,5 +1,7 @@
 """Domain Events"""
 
-from .task_events import DomainEvent, TaskCreated, TaskUpdated, TaskRetrieved, TaskDeleted
+from .task_events import DomainEvent, TaskCreated, TaskUpdated, TaskRetrieved, TaskDeleted, TaskChange, TasksCommitted
+from .event_bus import EventBus, get_event_bus
 
-__all__ = ['DomainEvent', 'TaskCreated', 'TaskUpdated', 'TaskRetrieved', 'TaskDeleted'] 
\ No newline at end of file
+__all__ = ['DomainEvent', 'TaskCreated', 'TaskUpdated', 'TaskRetrieved', 'TaskDeleted', 'TaskChange', 'TasksCommitted',
+           'EventBus', 'get_event_bus']
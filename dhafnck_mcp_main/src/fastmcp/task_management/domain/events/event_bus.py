@@ -0,0 +1,59 @@
+"""In-process Domain Event Bus"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Type
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[Any], None]
+
+
+class EventBus:
+    """
+    Delivers domain events to the handlers subscribed to their type.
+
+    Events are delivered synchronously when published and never queued, so
+    the bus holds no events and memory stays flat however many are
+    published. A failing handler is logged and does not stop the others.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[Type[Any], List[EventHandler]] = {}
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, event_type: Type[Any], handler: EventHandler) -> None:
+        """Call handler with every published event of event_type (or a subclass)"""
+        with self._lock:
+            handlers = self._handlers.setdefault(event_type, [])
+            if handler not in handlers:
+                handlers.append(handler)
+
+    def unsubscribe(self, event_type: Type[Any], handler: EventHandler) -> None:
+        with self._lock:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+            if not handlers:
+                self._handlers.pop(event_type, None)
+
+    def publish(self, event: Any) -> None:
+        """Deliver event to its subscribers, in the order they subscribed"""
+        with self._lock:
+            handlers = [handler for event_type, subscribed in self._handlers.items()
+                        if isinstance(event, event_type) for handler in subscribed]
+            self.published += 1
+        for handler in handlers:
+            try:
+                handler(event)
+            except Exception as e:
+                logger.warning(f"Event handler {handler!r} failed for {type(event).__name__}: {e}")
+
+
+_event_bus = EventBus()
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide domain event bus"""
+    return _event_bus
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from ..value_objects import TaskId
 
@@ -68,4 +68,27 @@ class TaskDeleted:
     
     def __post_init__(self):
         if self.occurred_at is None:
-            object.__setattr__(self, 'occurred_at', datetime.now()) 
\ No newline at end of file
+            object.__setattr__(self, 'occurred_at', datetime.now())
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    """One task as a commit of a task store changed it"""
+    task_id: str
+    version: int
+    before: Optional[Dict[str, Any]]  # Stored form before the commit, None when created
+    after: Optional[Dict[str, Any]]  # Stored form after the commit, None when deleted
+
+
+@dataclass(frozen=True)
+class TasksCommitted:
+    """Event raised once per write of a task store, with every task the write changed"""
+    store: str  # Path of the tasks.json written
+    tasks: Sequence[Any]  # Every stored task after the write
+    changes: Tuple[TaskChange, ...] = ()
+    previous_stamp: Optional[Tuple[int, int]] = None  # (mtime_ns, size) of the store before the write, None when missing
+    occurred_at: datetime = None
+    
+    def __post_init__(self):
+        if self.occurred_at is None:
+            object.__setattr__(self, 'occurred_at', datetime.now())
@@ -1,5 +1,6 @@
 """Domain Services"""
 
 from .auto_rule_generator import AutoRuleGenerator
+from .keyword_matcher import KeywordMatcher
 
-__all__ = ['AutoRuleGenerator'] 
\ No newline at end of file
+__all__ = ['AutoRuleGenerator', 'KeywordMatcher'] 
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""Assignment Solver Domain Service"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional, see the "forecast" extra
+    np = None
+
+INFINITY = float("inf")
+
+# Fewest columns solved with NumPy; every step of the solver scans all columns,
+# and on narrower matrices the per-call overhead of the array operations
+# outweighs vectorizing that scan
+NUMPY_MIN_COLUMNS = 128
+
+
+def solve_assignment(scores: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """
+    Maximum-score one-to-one assignment of rows to columns (Hungarian algorithm).
+
+    The matrix may be rectangular; every row is matched when there are at
+    least as many columns as rows, otherwise every column is. Returns the
+    matched (row, column) pairs sorted by row. Runs in O(n^2 * m) for
+    n = min(rows, columns) and m = max(rows, columns).
+    """
+    rows = len(scores)
+    columns = len(scores[0]) if rows else 0
+    if not rows or not columns:
+        return []
+    if rows > columns:
+        transposed = [[scores[row][column] for row in range(rows)] for column in range(columns)]
+        return sorted((row, column) for column, row in solve_assignment(transposed))
+
+    # Minimize cost = highest score - score, with 1-based potentials as in the
+    # classic shortest augmenting path formulation
+    highest = max(max(row) for row in scores)
+    if np is not None and columns >= NUMPY_MIN_COLUMNS:
+        match = _match_numpy(highest - np.array(scores, dtype=float)).tolist()
+        return sorted((match[column] - 1, column - 1) for column in range(1, columns + 1) if match[column])
+
+    cost = [[highest - score for score in row] for row in scores]
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (columns + 1)
+    match = [0] * (columns + 1)  # match[column] = row assigned to column, 0 for none
+    way = [0] * (columns + 1)
+
+    for row in range(1, rows + 1):
+        match[0] = row
+        column0 = 0
+        min_slack = [INFINITY] * (columns + 1)
+        used = [False] * (columns + 1)
+        while True:
+            used[column0] = True
+            row0 = match[column0]
+            delta = INFINITY
+            column1 = 0
+            row_cost = cost[row0 - 1]
+            for column in range(1, columns + 1):
+                if used[column]:
+                    continue
+                slack = row_cost[column - 1] - u[row0] - v[column]
+                if slack < min_slack[column]:
+                    min_slack[column] = slack
+                    way[column] = column0
+                if min_slack[column] < delta:
+                    delta = min_slack[column]
+                    column1 = column
+            for column in range(columns + 1):
+                if used[column]:
+                    u[match[column]] += delta
+                    v[column] -= delta
+                else:
+                    min_slack[column] -= delta
+            column0 = column1
+            if match[column0] == 0:
+                break
+        while column0:
+            column1 = way[column0]
+            match[column0] = match[column1]
+            column0 = column1
+
+    return sorted((match[column] - 1, column - 1) for column in range(1, columns + 1) if match[column])
+
+
+def _match_numpy(cost: "np.ndarray") -> "np.ndarray":
+    """
+    solve_assignment's augmenting path loop with each scan over the columns
+    done as one array operation; returns match[column] = 1-based row
+    """
+    rows, columns = cost.shape
+    u = np.zeros(rows + 1)
+    v = np.zeros(columns + 1)
+    match = np.zeros(columns + 1, dtype=np.intp)
+    way = np.zeros(columns + 1, dtype=np.intp)
+    slack = np.full(columns + 1, INFINITY)
+
+    for row in range(1, rows + 1):
+        match[0] = row
+        column0 = 0
+        min_slack = np.full(columns + 1, INFINITY)
+        used = np.zeros(columns + 1, dtype=bool)
+        while True:
+            used[column0] = True
+            row0 = match[column0]
+            free = ~used
+            slack[1:] = cost[row0 - 1] - u[row0] - v[1:]
+            lower = free & (slack < min_slack)
+            min_slack[lower] = slack[lower]
+            way[lower] = column0
+            candidates = np.where(free, min_slack, INFINITY)
+            column1 = int(candidates.argmin())
+            delta = candidates[column1]
+            u[match[used]] += delta
+            v[used] -= delta
+            min_slack[free] -= delta
+            column0 = column1
+            if match[column0] == 0:
+                break
+        while column0:
+            column1 = way[column0]
+            match[column0] = match[column1]
+            column0 = column1
+
+    return match
+
+
+def assign_with_capacity(scores: Sequence[Sequence[float]], capacities: Sequence[int],
+                         slot_penalties: Optional[Sequence[float]] = None,
+                         min_score: float = 0.0) -> Dict[int, int]:
+    """
+    Assign every item (row) to at most one worker (column) maximizing the total score.
+
+    Worker ``j`` takes at most ``capacities[j]`` items; its k-th item scores
+    ``k * slot_penalties[j]`` less, which spreads items over workers when
+    scores are close. Pairs scoring ``min_score`` or less are never made.
+    Returns item index -> worker index; items that fit nowhere are left out.
+    """
+    slots: List[Tuple[int, int]] = [
+        (worker, slot) for worker, capacity in enumerate(capacities) for slot in range(max(capacity, 0))
+    ]
+    if not scores or not slots:
+        return {}
+
+    penalties = slot_penalties or [0.0] * len(capacities)
+    slot_scores: List[List[Optional[float]]] = [
+        [
+            item_scores[worker] - slot * penalties[worker] if item_scores[worker] > min_score else None
+            for worker, slot in slots
+        ]
+        for item_scores in scores
+    ]
+
+    # Forbidden pairs score low enough that trading one of them for any
+    # allowed pair always wins, whatever happens to the other items
+    allowed = [score for row in slot_scores for score in row if score is not None]
+    if not allowed:
+        return {}
+    lowest, highest = min(allowed), max(allowed)
+    forbidden = lowest - (highest - lowest + 1.0) * (len(scores) + 1)
+    matrix = [[forbidden if score is None else score for score in row] for row in slot_scores]
+
+    assignment: Dict[int, int] = {}
+    for item, slot_index in solve_assignment(matrix):
+        worker = slots[slot_index][0]
+        if scores[item][worker] > min_score:
+            assignment[item] = worker
+    return assignment
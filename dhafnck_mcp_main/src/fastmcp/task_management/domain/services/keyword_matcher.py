@@ -0,0 +1,87 @@
+"""Keyword Matcher Domain Service"""
+
+import re
+from typing import Dict, FrozenSet, Generic, Hashable, Iterable, Mapping, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class KeywordMatcher(Generic[K]):
+    """
+    Multi-pattern keyword matcher built once from a keyword table.
+
+    The table maps a key (a label, a role indicator group, a capability, ...)
+    to the keywords that suggest it. Matching keeps the substring semantics of
+    ``any(keyword in text for keyword in keywords)`` but scans the text once:
+    the keywords are compiled into a single trie-shaped regex, wrapped in a
+    lookahead, which reports the longest keyword starting at every position.
+    Every keyword contained in such a hit is resolved through a table
+    precomputed at build time.
+    """
+
+    def __init__(self, table: Mapping[K, Iterable[str]]):
+        keys_by_keyword: Dict[str, Set[K]] = {}
+        for key, keywords in table.items():
+            for keyword in keywords:
+                keyword = keyword.lower()
+                if keyword:
+                    keys_by_keyword.setdefault(keyword, set()).add(key)
+
+        # Every keyword occurring inside a hit is implied by that hit
+        self._keywords_for_hit: Dict[str, FrozenSet[str]] = {}
+        self._keys_for_hit: Dict[str, FrozenSet[K]] = {}
+        for hit in keys_by_keyword:
+            contained = frozenset(keyword for keyword in keys_by_keyword if keyword in hit)
+            self._keywords_for_hit[hit] = contained
+            self._keys_for_hit[hit] = frozenset(
+                key for keyword in contained for key in keys_by_keyword[keyword]
+            )
+
+        self._pattern = (
+            re.compile(f"(?=({_trie_pattern(keys_by_keyword)}))") if keys_by_keyword else None
+        )
+
+    def _hits(self, text: str) -> Set[str]:
+        """Longest keyword found at each position of the lowercased text"""
+        if self._pattern is None or not text:
+            return set()
+        return set(self._pattern.findall(text.lower()))
+
+    def find_keywords(self, text: str) -> Set[str]:
+        """Return every keyword occurring in text"""
+        found: Set[str] = set()
+        for hit in self._hits(text):
+            found |= self._keywords_for_hit[hit]
+        return found
+
+    def match(self, text: str) -> Set[K]:
+        """Return every key with at least one keyword occurring in text"""
+        matched: Set[K] = set()
+        for hit in self._hits(text):
+            matched |= self._keys_for_hit[hit]
+        return matched
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex matching the longest of the keywords at a position.
+
+    Keywords sharing a prefix share one branch, so the engine tests each
+    character once per position instead of once per keyword; greedy optional
+    groups make longer keywords win over their prefixes.
+    """
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
@@ -3,6 +3,7 @@
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
+import weakref
 from abc import ABC, abstractmethod
 
 from ..entities.project import Project
@@ -10,6 +11,30 @@ from ..entities.agent import Agent, AgentCapability, AgentStatus
 from ..entities.task_tree import TaskTree
 from ..entities.work_session import WorkSession
 from ..entities.task import Task
+from .assignment_solver import assign_with_capacity
+from .keyword_matcher import KeywordMatcher
+
+
+# Keywords hinting that a task requires a capability, and the languages it brings along
+TREE_CAPABILITY_KEYWORDS: Dict[AgentCapability, List[str]] = {
+    AgentCapability.FRONTEND_DEVELOPMENT: ["frontend", "ui", "react", "vue", "angular"],
+    AgentCapability.BACKEND_DEVELOPMENT: ["backend", "api", "server", "database"],
+    AgentCapability.DEVOPS: ["deploy", "docker", "kubernetes", "ci/cd"],
+    AgentCapability.TESTING: ["test", "testing", "qa", "quality"],
+}
+
+TREE_CAPABILITY_LANGUAGES: Dict[AgentCapability, List[str]] = {
+    AgentCapability.FRONTEND_DEVELOPMENT: ["javascript", "typescript", "html", "css"],
+    AgentCapability.BACKEND_DEVELOPMENT: ["python", "java", "node.js"],
+}
+
+TREE_REQUIREMENTS_MATCHER = KeywordMatcher(TREE_CAPABILITY_KEYWORDS)
+
+# Narrower hints used when checking whether an agent can take over a single task
+_TASK_HANDLING_MATCHER = KeywordMatcher({
+    AgentCapability.FRONTEND_DEVELOPMENT: ["frontend", "ui", "react"],
+    AgentCapability.BACKEND_DEVELOPMENT: ["backend", "api", "server"],
+})
 
 
 class OrchestrationStrategy(ABC):
@@ -22,21 +47,36 @@ class OrchestrationStrategy(ABC):
 
 
 class CapabilityBasedStrategy(OrchestrationStrategy):
-    """Orchestration strategy based on agent capabilities"""
+    """
+    Orchestration strategy based on agent capabilities
+
+    Unassigned trees are matched to agents globally: every tree is scored
+    against every available agent once, and the assignment maximizing the
+    total score is solved with each agent taking at most as many trees as it
+    has free slots (``max_concurrent_tasks - current_workload``).
+    """
+    
+    def __init__(self):
+        # id(tree) -> (weak reference to the tree, tree content version, requirements)
+        self._requirements_cache: Dict[int, Tuple[weakref.ref, Tuple[int, int], Dict]] = {}
     
     def assign_work(self, project: Project, available_agents: List[Agent]) -> Dict[str, str]:
-        assignments = {}
-        
-        for tree_id, tree in project.task_trees.items():
-            if tree_id in project.agent_assignments:
-                continue  # Already assigned
-            
-            # Find best agent for this tree
-            best_agent = self._find_best_agent_for_tree(tree, available_agents)
-            if best_agent:
-                assignments[tree_id] = best_agent.id
-        
-        return assignments
+        trees = [tree for tree_id, tree in project.task_trees.items()
+                 if tree_id not in project.agent_assignments]  # Skip already assigned trees
+        agents = [agent for agent in available_agents if agent.is_available()]
+        if not trees or not agents:
+            return {}
+        
+        scores = [
+            [self._score_requirements(agent, requirements) for agent in agents]
+            for requirements in (self._analyze_tree_requirements(tree) for tree in trees)
+        ]
+        capacities = [agent.max_concurrent_tasks - agent.current_workload for agent in agents]
+        # Each extra tree lowers the workload factor of the score as starting a task would
+        slot_penalties = [10.0 / agent.max_concurrent_tasks for agent in agents]
+        
+        solution = assign_with_capacity(scores, capacities, slot_penalties)
+        return {trees[tree_index].id: agents[agent_index].id for tree_index, agent_index in solution.items()}
     
     def _find_best_agent_for_tree(self, tree: TaskTree, agents: List[Agent]) -> Optional[Agent]:
         """Find the best agent for a specific task tree"""
@@ -45,23 +85,18 @@ class CapabilityBasedStrategy(OrchestrationStrategy):
         if not available_agents:
             return None
         
-        # Score agents based on tree requirements
-        agent_scores = []
-        for agent in available_agents:
-            score = self._calculate_agent_tree_score(agent, tree)
-            agent_scores.append((agent, score))
-        
-        # Sort by score and return best agent
-        agent_scores.sort(key=lambda x: x[1], reverse=True)
-        return agent_scores[0][0] if agent_scores[0][1] > 0 else None
+        requirements = self._analyze_tree_requirements(tree)
+        best_agent = max(available_agents, key=lambda agent: self._score_requirements(agent, requirements))
+        return best_agent if self._score_requirements(best_agent, requirements) > 0 else None
     
     def _calculate_agent_tree_score(self, agent: Agent, tree: TaskTree) -> float:
         """Calculate how suitable an agent is for a task tree"""
+        return self._score_requirements(agent, self._analyze_tree_requirements(tree))
+    
+    def _score_requirements(self, agent: Agent, tree_requirements: Dict) -> float:
+        """Calculate how suitable an agent is for a tree with the given requirements"""
         base_score = 50.0
         
-        # Get tree requirements from tasks
-        tree_requirements = self._analyze_tree_requirements(tree)
-        
         # Check capability match
         required_capabilities = tree_requirements.get("capabilities", [])
         capability_match = sum(1 for cap in required_capabilities if agent.has_capability(cap))
@@ -78,31 +113,35 @@ class CapabilityBasedStrategy(OrchestrationStrategy):
         return base_score + capability_score + language_score + workload_score
     
     def _analyze_tree_requirements(self, tree: TaskTree) -> Dict:
+        """Capability requirements of a task tree, computed once per tree content version"""
+        version = tree.content_version
+        cached = self._requirements_cache.get(id(tree))
+        if cached is not None and cached[0]() is tree and cached[1] == version:
+            return cached[2]
+        
+        requirements = self._scan_tree_requirements(tree)
+        if len(self._requirements_cache) >= 1024:
+            # Forget trees that no longer exist (copied first: projects orchestrated
+            # on other worker threads may be adding entries meanwhile)
+            self._requirements_cache = {
+                key: entry for key, entry in list(self._requirements_cache.items()) if entry[0]() is not None
+            }
+        self._requirements_cache[id(tree)] = (weakref.ref(tree), version, requirements)
+        return requirements
+    
+    def _scan_tree_requirements(self, tree: TaskTree) -> Dict:
         """Analyze task tree to determine capability requirements"""
         capabilities = set()
         languages = set()
         
-        # Analyze task titles and descriptions for hints
-        for task in tree.all_tasks.values():
-            task_text = f"{task.title} {task.description}".lower()
-            
-            # Detect frontend work
-            if any(keyword in task_text for keyword in ["frontend", "ui", "react", "vue", "angular"]):
-                capabilities.add(AgentCapability.FRONTEND_DEVELOPMENT)
-                languages.update(["javascript", "typescript", "html", "css"])
-            
-            # Detect backend work
-            if any(keyword in task_text for keyword in ["backend", "api", "server", "database"]):
-                capabilities.add(AgentCapability.BACKEND_DEVELOPMENT)
-                languages.update(["python", "java", "node.js"])
-            
-            # Detect DevOps work
-            if any(keyword in task_text for keyword in ["deploy", "docker", "kubernetes", "ci/cd"]):
-                capabilities.add(AgentCapability.DEVOPS)
-            
-            # Detect testing work
-            if any(keyword in task_text for keyword in ["test", "testing", "qa", "quality"]):
-                capabilities.add(AgentCapability.TESTING)
+        # Analyze task titles and descriptions for hints in a single pass;
+        # newlines never occur inside a keyword, so hits cannot span two tasks
+        tree_text = "\n".join(
+            f"{task.title} {task.description}" for task in tree.all_tasks.values()
+        )
+        for capability in TREE_REQUIREMENTS_MATCHER.match(tree_text):
+            capabilities.add(capability)
+            languages.update(TREE_CAPABILITY_LANGUAGES.get(capability, []))
         
         return {
             "capabilities": list(capabilities),
@@ -249,21 +288,13 @@ class Orchestrator:
     
     def _handle_timeout_sessions(self, project: Project) -> None:
         """Handle sessions that have timed out"""
-        current_time = datetime.now()
-        
-        for session_id, session in list(project.active_work_sessions.items()):
-            if session.is_timeout_due():
-                session.timeout_session()
-                
-                # Remove from active sessions
-                del project.active_work_sessions[session_id]
-                
-                # Update agent status
-                agent = project.registered_agents.get(session.agent_id)
-                if agent:
-                    agent.complete_task(session.task_id, success=False)
-                
-                self.logger.warning(f"Session {session_id} timed out")
+        for session in project.expire_timed_out_sessions():
+            # Update agent status
+            agent = project.registered_agents.get(session.agent_id)
+            if agent and session.task_id in agent.active_tasks:
+                agent.complete_task(session.task_id, success=False)
+            
+            self.logger.warning(f"Session {session.id} timed out")
     
     def _detect_conflicts(self, project: Project) -> List[Dict]:
         """Detect conflicts in the project"""
@@ -348,14 +379,14 @@ class Orchestrator:
     def _can_agent_handle_task(self, agent: Agent, task: Task) -> bool:
         """Check if an agent can handle a specific task"""
         # Basic capability check
-        task_text = f"{task.title} {task.description}".lower()
+        matched = _TASK_HANDLING_MATCHER.match(f"{task.title} {task.description}")
         
         # Frontend tasks
-        if any(keyword in task_text for keyword in ["frontend", "ui", "react"]):
+        if AgentCapability.FRONTEND_DEVELOPMENT in matched:
             return agent.has_capability(AgentCapability.FRONTEND_DEVELOPMENT)
         
         # Backend tasks
-        if any(keyword in task_text for keyword in ["backend", "api", "server"]):
+        if AgentCapability.BACKEND_DEVELOPMENT in matched:
             return agent.has_capability(AgentCapability.BACKEND_DEVELOPMENT)
         
         # Default: agent can handle general tasks
@@ -1,8 +1,19 @@
 """Infrastructure Repositories"""
 
 from .json_task_repository import JsonTaskRepository, InMemoryTaskRepository
+from .project_store import JsonProjectStore
+from .task_change_log import TaskChangeLog, get_task_change_log
+from .task_stats import TaskStatsView, TreeStats, get_task_stats_view
+from .work_session_store import JsonWorkSessionStore
 
 __all__ = [
     "JsonTaskRepository",
-    "InMemoryTaskRepository"
-] 
\ No newline at end of file
+    "InMemoryTaskRepository",
+    "JsonProjectStore",
+    "TaskStatsView",
+    "TreeStats",
+    "get_task_stats_view",
+    "TaskChangeLog",
+    "get_task_change_log",
+    "JsonWorkSessionStore"
+] 
@@ -2,14 +2,17 @@
 
 import json
 import os
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from datetime import datetime
 from pathlib import Path
 import logging
 
 from ...domain import Task, TaskRepository, TaskId, TaskStatus, Priority
+from ...domain.events import TaskChange, TasksCommitted, get_event_bus
 from ...domain.exceptions import TaskNotFoundError
 from fastmcp.tools.tool_path import find_project_root
+from fastmcp.utilities.files import atomic_write_text, file_stamp
+from .task_change_log import get_task_change_log
 
 
 class InMemoryTaskRepository(TaskRepository):
@@ -257,10 +260,25 @@ class JsonTaskRepository(TaskRepository):
         except (FileNotFoundError, json.JSONDecodeError):
             return {"tasks": []}
     
-    def _save_data(self, data: Dict[str, Any]):
-        """Save data to JSON file"""
-        with open(self._file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _save_data(self, data: Dict[str, Any], changes: Sequence[TaskChange] = ()):
+        """
+        Save data to JSON file and publish the write as a TasksCommitted event
+
+        The tree's statistics view and change log subscribe to the event.
+        """
+        try:
+            previous_stamp = file_stamp(self._file_path)
+        except FileNotFoundError:
+            previous_stamp = None
+        atomic_write_text(self._file_path, json.dumps(data, indent=2, ensure_ascii=False))
+        get_event_bus().publish(TasksCommitted(
+            store=os.path.abspath(self._file_path), tasks=data.get("tasks", []), changes=tuple(changes),
+            previous_stamp=previous_stamp
+        ))
+
+    def changes_since(self, since: int = 0) -> Dict[str, Any]:
+        """Tasks created, updated or deleted after change sequence since"""
+        return get_task_change_log().changes_since(self._file_path, since)
     
     def _task_dict_to_domain(self, task_dict: Dict[str, Any]) -> Task:
         """Convert a dictionary to a Task domain object"""
@@ -314,7 +332,8 @@ class JsonTaskRepository(TaskRepository):
             subtasks=task_dict.get("subtasks", []),
             due_date=task_dict.get("dueDate"),
             created_at=created_at,
-            updated_at=updated_at
+            updated_at=updated_at,
+            version=task_dict.get("version", 0)
         )
 
     def _domain_to_task_dict(self, task: Task) -> Dict[str, Any]:
@@ -366,29 +385,28 @@ class JsonTaskRepository(TaskRepository):
         
         task_dict = self._domain_to_task_dict(task)
         
-        found = False
+        before = None
         for i, existing_task in enumerate(tasks):
             if existing_task["id"] == task_dict["id"]:
+                before = existing_task
                 tasks[i] = task_dict
-                found = True
                 break
         
-        if not found:
+        if before is None:
             tasks.append(task_dict)
         
         data["tasks"] = tasks
-        self._save_data(data)
+        self._save_data(data, [TaskChange(task_dict["id"], task.version, before, task_dict)])
 
     def delete(self, task_id: TaskId) -> bool:
         data = self._load_data()
         tasks = data.get("tasks", [])
         
-        initial_len = len(tasks)
-        tasks = [t for t in tasks if t["id"] != str(task_id)]
+        removed = [t for t in tasks if t["id"] == str(task_id)]
         
-        if len(tasks) < initial_len:
-            data["tasks"] = tasks
-            self._save_data(data)
+        if removed:
+            data["tasks"] = [t for t in tasks if t["id"] != str(task_id)]
+            self._save_data(data, [TaskChange(t["id"], t.get("version", 0), t, None) for t in removed])
             return True
         return False
 
@@ -0,0 +1,378 @@
+"""JSON Project Store Implementation"""
+
+import atexit
+import json
+import logging
+import os
+import re
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from fastmcp.utilities.files import atomic_write_text, file_lock, file_stamp
+
+logger = logging.getLogger(__name__)
+
+# Mutations within this many seconds of each other are committed together
+DEFAULT_FLUSH_DELAY = 0.2
+
+Stamp = Optional[Tuple[int, int]]
+
+# Project ids name files in per-project mode, so nothing that could leave the directory
+PROJECT_ID_PATTERN = re.compile(r"[A-Za-z0-9_][A-Za-z0-9_.-]{0,127}")
+
+
+def is_valid_project_id(project_id: Any) -> bool:
+    """True if project_id is safe to use as a file name"""
+    return isinstance(project_id, str) and PROJECT_ID_PATTERN.fullmatch(project_id) is not None
+
+
+class JsonProjectStore:
+    """
+    File-backed store for the projects managed by ProjectManager.
+
+    Mutations only mark projects dirty; dirty projects are committed together
+    ``flush_delay`` seconds after the first mutation, so a burst of
+    registrations or assignments costs one write. Every commit writes a
+    temporary file and renames it over the target. The (mtime, size) of the
+    files is tracked so changes made by other processes are reloaded on the
+    next ``refresh()``; local pending changes are never overwritten by a reload.
+
+    Hold ``project_lock(project_id)`` while changing a project. ``mark_dirty``
+    serializes the project under that lock, so commits never read data that
+    another thread is changing. Changes of other processes are reloaded when
+    a project lock is taken while no other is held, never under a holder. Commits hold a lock file next to the projects
+    file, and in single-file mode they merge the dirty projects into the file
+    as it is on disk, keeping the projects other processes committed since.
+
+    By default every project lives in a single ``projects.json``. With
+    ``per_project_files`` each project is stored in its own
+    ``<projects_file stem>/<project_id>.json`` and only dirty projects are
+    rewritten; ids must then match ``PROJECT_ID_PATTERN``. A single
+    ``projects.json`` found next to an empty per-project directory is
+    migrated on first flush.
+    """
+
+    def __init__(self, projects_file: Union[str, Path], per_project_files: bool = False,
+                 flush_delay: float = DEFAULT_FLUSH_DELAY):
+        self.projects_file = Path(projects_file)
+        self.projects_dir = self.projects_file.with_suffix("")
+        self.per_project_files = per_project_files
+        self.flush_delay = flush_delay
+        self.projects: Dict[str, Any] = {}
+        self.writes = 0
+        # Bumped on every reload and on every change of one project, see version()
+        self.generation = 0
+        self._versions: Dict[str, int] = {}
+
+        # Guards the bookkeeping below; never held while waiting for a project lock
+        self.lock = threading.RLock()
+        self._project_locks: Dict[str, "ProjectLock"] = {}
+        # Project locks currently held, counting reentrant acquisitions
+        self._holders = 0
+        self._flush_lock = threading.Lock()
+        self._lock_file = self.projects_file.with_name(f".{self.projects_file.name}.lock")
+        # JSON text of each dirty project, None for removed projects
+        self._pending: Dict[str, Optional[str]] = {}
+        # The next commit writes exactly the pending projects instead of merging
+        self._replace = False
+        self._timer: Optional[threading.Timer] = None
+        self._stamps: Dict[str, Stamp] = {}
+
+        self.load()
+        _open_stores.add(self)
+
+    # ── Loading ────────────────────────────────────────────────────────────
+
+    def load(self) -> Dict[str, Any]:
+        """(Re)load every project from disk, discarding unflushed changes"""
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending = {}
+            self._replace = False
+
+            stamps = self._current_stamps()
+            migrate = False
+            if self.per_project_files and stamps:
+                projects = {}
+                for project_id in stamps:
+                    data = self._read_json(self._project_path(project_id))
+                    if data is not None:
+                        projects[project_id] = data
+            elif self.per_project_files and self.projects_file.exists():
+                projects = self._read_json(self.projects_file) or {}
+                for project_id in [pid for pid in projects if not is_valid_project_id(pid)]:
+                    logger.warning(f"Not migrating project with invalid id {project_id!r}")
+                    del projects[project_id]
+                migrate = bool(projects)
+            else:
+                projects = self._read_json(self.projects_file) or {}
+
+            self.projects = projects
+            self._stamps = stamps
+            self.generation += 1
+            if migrate:
+                self._pending = {project_id: _dumps(project) for project_id, project in projects.items()}
+                self._schedule()
+            return self.projects
+
+    def refresh(self) -> bool:
+        """
+        Reload when another writer changed the files; returns True if reloaded
+
+        Nothing is reloaded while a project lock is held, since its holder may
+        be changing the current projects.
+        """
+        with self.lock:
+            if self._pending or self._replace or self._holders:
+                return False
+            if self._current_stamps() == self._stamps:
+                return False
+            self.load()
+            return True
+
+    # ── Writing ────────────────────────────────────────────────────────────
+
+    def project_lock(self, project_id: str) -> "ProjectLock":
+        """Lock to hold while reading or changing the data of project_id"""
+        with self.lock:
+            lock = self._project_locks.get(project_id)
+            if lock is None:
+                lock = self._project_locks[project_id] = ProjectLock(self)
+            return lock
+
+    def mark_dirty(self, project_id: Optional[str] = None) -> None:
+        """
+        Schedule project_id, or every project when omitted, to be committed
+
+        The project is serialized now, under its project lock; a project that
+        cannot be serialized raises here instead of failing the commit.
+        """
+        if project_id is None:
+            texts = {pid: self._serialize(pid) for pid in list(self.projects)}
+            for pid in texts:
+                self._check_id(pid)
+            with self.lock:
+                removed = set(self._stamps) if self.per_project_files else set()
+                self._pending = {pid: None for pid in removed - set(texts)}
+                self._pending.update(texts)
+                self._replace = True
+                self.generation += 1
+        else:
+            self._check_id(project_id)
+            text = self._serialize(project_id)
+            with self.lock:
+                self._pending[project_id] = text
+                self._versions[project_id] = self._versions.get(project_id, 0) + 1
+        with self.lock:
+            if self.flush_delay > 0:
+                self._schedule()
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Commit every dirty project now"""
+        with self._flush_lock:
+            with self.lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not (self._pending or self._replace):
+                    return
+                pending, replace = self._pending, self._replace
+                self._pending, self._replace = {}, False
+            try:
+                self.projects_file.parent.mkdir(parents=True, exist_ok=True)
+                with file_lock(self._lock_file):
+                    if self.per_project_files:
+                        stamps = self._write_projects(pending)
+                    else:
+                        stamps = self._write_projects_file(pending, replace)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Failed to save projects to {self.projects_file}: {e}")
+                with self.lock:
+                    # Keep the changes pending, behind any made since
+                    pending.update(self._pending)
+                    self._pending = pending
+                    self._replace = self._replace or replace
+                return
+            with self.lock:
+                self._stamps.update(stamps)
+                for project_id, stamp in stamps.items():
+                    if stamp is None:
+                        del self._stamps[project_id]
+
+    def version(self, project_id: str) -> Tuple[int, int]:
+        """Changes whenever project_id is marked dirty or the projects are reloaded"""
+        with self.lock:
+            return self.generation, self._versions.get(project_id, 0)
+
+    def close(self) -> None:
+        """Flush pending changes"""
+        self.flush()
+        _open_stores.discard(self)
+
+    def _schedule(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _serialize(self, project_id: str) -> Optional[str]:
+        # The bare lock: serializing must not reload the projects being committed
+        with self.project_lock(project_id).rlock:
+            project = self.projects.get(project_id)
+            return None if project is None else _dumps(project)
+
+    def _write_projects(self, pending: Dict[str, Optional[str]]) -> Dict[str, Stamp]:
+        """Write one file per pending project; returns the new stamps of the written files"""
+        self.projects_dir.mkdir(parents=True, exist_ok=True)
+        stamps: Dict[str, Stamp] = {}
+        for project_id, text in pending.items():
+            path = self._project_path(project_id)
+            if text is not None:
+                atomic_write_text(path, text)
+                self.writes += 1
+                stamps[project_id] = file_stamp(path)
+            else:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                stamps[project_id] = None
+        return stamps
+
+    def _write_projects_file(self, pending: Dict[str, Optional[str]], replace: bool) -> Dict[str, Stamp]:
+        """Merge the pending projects into projects.json; returns its new stamp"""
+        name = self.projects_file.name
+        try:
+            stamp_before: Stamp = file_stamp(self.projects_file)
+        except FileNotFoundError:
+            stamp_before = None
+        texts: Dict[str, str] = {}
+        if not replace and stamp_before is not None:
+            on_disk = self._read_json(self.projects_file)
+            if isinstance(on_disk, dict):
+                texts = {project_id: _dumps(project) for project_id, project in on_disk.items()}
+        for project_id, text in pending.items():
+            if text is None:
+                texts.pop(project_id, None)
+            else:
+                texts[project_id] = text
+        atomic_write_text(self.projects_file, _dumps_projects(texts))
+        self.writes += 1
+        if stamp_before != self._stamps.get(name):
+            # Another process committed since we last read the file: keep the
+            # old stamp so the next refresh() loads the merged projects
+            return {}
+        return {name: file_stamp(self.projects_file)}
+
+    # ── Helpers ────────────────────────────────────────────────────────────
+
+    def _project_path(self, project_id: str) -> Path:
+        if not is_valid_project_id(project_id):
+            raise ValueError(f"Invalid project id: {project_id!r}")
+        return self.projects_dir / f"{project_id}.json"
+
+    def _check_id(self, project_id: str) -> None:
+        """Raise ValueError if project_id cannot name a project file"""
+        if self.per_project_files:
+            self._project_path(project_id)
+
+    def _current_stamps(self) -> Dict[str, Stamp]:
+        """(mtime, size) per project file, or of projects.json keyed by its name"""
+        if not self.per_project_files:
+            try:
+                return {self.projects_file.name: file_stamp(self.projects_file)}
+            except FileNotFoundError:
+                return {}
+
+        stamps: Dict[str, Stamp] = {}
+        try:
+            entries = os.scandir(self.projects_dir)
+        except FileNotFoundError:
+            return stamps
+        with entries:
+            for entry in entries:
+                project_id = entry.name[:-len(".json")]
+                if entry.name.endswith(".json") and is_valid_project_id(project_id):
+                    stat = entry.stat()
+                    stamps[project_id] = (stat.st_mtime_ns, stat.st_size)
+        return stamps
+
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Any]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+            return json.loads(content) if content else None
+        except FileNotFoundError:
+            return None
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to load projects file {path}: {e}")
+            return None
+
+
+class ProjectLock:
+    """
+    Reentrant lock of one project of a JsonProjectStore
+
+    Taking it while no other project lock is held first reloads the projects
+    other processes changed, so a holder always works on current data and no
+    reload replaces the projects under another holder.
+    """
+
+    def __init__(self, store: JsonProjectStore):
+        self.store = store
+        self.rlock = threading.RLock()
+
+    def __enter__(self) -> "ProjectLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if not self.rlock.acquire(blocking, timeout):
+            return False
+        try:
+            with self.store.lock:
+                self.store.refresh()
+                self.store._holders += 1
+        except BaseException:
+            self.rlock.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        with self.store.lock:
+            self.store._holders -= 1
+        self.rlock.release()
+
+
+def _dumps(project: Any) -> str:
+    return json.dumps(project, indent=2)
+
+
+def _dumps_projects(texts: Dict[str, str]) -> str:
+    """The JSON text of {project_id: project}, built from each project's _dumps text"""
+    if not texts:
+        return "{}"
+    # Equal to json.dumps(projects, indent=2): nested lines gain one indent level
+    # (JSON strings cannot hold a raw newline)
+    items = (f"  {json.dumps(project_id)}: {text.replace(chr(10), chr(10) + '  ')}"
+             for project_id, text in texts.items())
+    return "{\n" + ",\n".join(items) + "\n}"
+
+
+_open_stores: "weakref.WeakSet[JsonProjectStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_stores() -> None:
+    for store in list(_open_stores):
+        store.flush()
@@ -0,0 +1,264 @@
+"""Task Change Feed"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from fastmcp.utilities.files import atomic_write_text, file_lock, file_stamp
+
+from ...domain.events import TasksCommitted, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+# Sidecar written next to every tasks.json
+CHANGES_FILE_NAME = "tasks.changes.json"
+
+# Deleted task ids remembered per tree; older deletions force a full resync
+MAX_TOMBSTONES = 1000
+
+# Attempts to read a tasks.json that is not rewritten while being read
+MAX_READ_ATTEMPTS = 3
+
+Stamp = Optional[Tuple[int, int]]
+
+
+@dataclass
+class TreeChanges:
+    """Change sequence of one tree's tasks.json, valid while the file keeps the recorded stamp"""
+    stamp: Optional[Tuple[int, int]] = None  # (mtime_ns, size) of tasks.json, None when missing
+    sequence: int = 0  # Bumped once per write that changed at least one task
+    compacted_through: int = 0  # Deletions up to this sequence were forgotten
+    tasks: Dict[str, List[Any]] = field(default_factory=dict)  # task_id -> [sequence, content hash]
+    tombstones: Dict[str, int] = field(default_factory=dict)  # deleted task_id -> sequence
+
+    def apply(self, tasks: List[Any], stamp: Optional[Tuple[int, int]]) -> bool:
+        """Assign the next sequence to every created, updated or deleted task; True if any changed"""
+        sequence = self.sequence + 1
+        seen = set()
+        changed = False
+        for task in tasks:
+            if not isinstance(task, dict) or not task.get("id"):
+                continue
+            task_id = str(task["id"])
+            seen.add(task_id)
+            digest = _content_hash(task)
+            entry = self.tasks.get(task_id)
+            if entry is None or entry[1] != digest:
+                self.tasks[task_id] = [sequence, digest]
+                self.tombstones.pop(task_id, None)
+                changed = True
+
+        for task_id in [task_id for task_id in self.tasks if task_id not in seen]:
+            del self.tasks[task_id]
+            self.tombstones[task_id] = sequence
+            changed = True
+
+        if len(self.tombstones) > MAX_TOMBSTONES:
+            oldest = sorted(self.tombstones.items(), key=lambda item: item[1])
+            for task_id, deleted_at in oldest[:len(self.tombstones) - MAX_TOMBSTONES]:
+                del self.tombstones[task_id]
+                self.compacted_through = max(self.compacted_through, deleted_at)
+
+        if changed:
+            self.sequence = sequence
+        self.stamp = stamp
+        return changed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TreeChanges":
+        stamp = data.get("stamp")
+        return cls(**{**data, "stamp": tuple(stamp) if stamp else None})
+
+
+class TaskChangeLog:
+    """
+    Monotonic per-tree change sequence for delta sync.
+
+    Every write a repository publishes as a ``TasksCommitted`` event is
+    passed to ``record()``; each write that created, updated or deleted tasks
+    bumps the tree's sequence and stamps the affected task ids with it, kept
+    in a ``tasks.changes.json`` sidecar so the sequence survives restarts. ``changes_since()`` returns only the tasks
+    stamped after a client's last seen sequence plus tombstones for deleted
+    ids. A tasks.json edited outside a repository is diffed on the next read.
+
+    Sequences are allocated while holding a lock file next to the sidecar, and
+    the sidecar is re-read under it whenever another process rewrote it, so
+    processes sharing a tree never hand out the same sequence twice.
+    """
+
+    def __init__(self):
+        # tasks.json path -> (changes, stamp of the sidecar they were read from or written to)
+        self._changes: Dict[str, Tuple[TreeChanges, Stamp]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, tasks_file: Union[str, Path], data: Dict[str, Any]) -> int:
+        """Stamp the tasks of data, which was just written to tasks_file; returns the tree's sequence"""
+        key = os.path.abspath(tasks_file)
+        with self._locked(key):
+            changes = self._load(key)
+            if changes.apply(data.get("tasks", []), file_stamp(key)):
+                self._persist(key, changes)
+            return changes.sequence
+
+    def on_tasks_committed(self, event: TasksCommitted) -> None:
+        """Event bus handler recording every write of a tasks.json"""
+        self.record(event.store, {"tasks": event.tasks})
+
+    def current_sequence(self, tasks_file: Union[str, Path]) -> int:
+        """Latest sequence of tasks_file"""
+        key = os.path.abspath(tasks_file)
+        with self._locked(key):
+            changes, _ = self._synced(key)
+            return changes.sequence
+
+    def changes_since(self, tasks_file: Union[str, Path], since: int = 0) -> Dict[str, Any]:
+        """
+        Tasks created or updated and task ids deleted after sequence since.
+
+        When since predates the oldest remembered deletion, or comes from a
+        sequence this log never issued, every task is returned with
+        ``reset`` set and the client should replace its copy.
+        """
+        key = os.path.abspath(tasks_file)
+        requested = since
+        with self._locked(key):
+            changes, tasks = self._synced(key)
+            for attempt in range(MAX_READ_ATTEMPTS):
+                since = requested
+                reset = since < 0 or since > changes.sequence or since < changes.compacted_through
+                if reset:
+                    since = 0
+                changed_ids = {task_id for task_id, (sequence, _) in changes.tasks.items() if sequence > since}
+                if tasks is not None or not changed_ids:
+                    break
+                # Read the tasks the sequences were assigned from; a write that
+                # lands meanwhile is diffed and the read retried
+                tasks = _read_tasks(key)
+                if tasks is not None and _stamp_of(key) == changes.stamp or attempt == MAX_READ_ATTEMPTS - 1:
+                    break
+                changes, tasks = self._synced(key)
+            deleted = [
+                {"id": task_id, "sequence": sequence}
+                for task_id, sequence in changes.tombstones.items()
+                if sequence > since and not reset
+            ]
+            sequence = changes.sequence
+
+        changed = [task for task in tasks or [] if isinstance(task, dict) and str(task.get("id")) in changed_ids]
+        return {
+            "sequence": sequence,
+            "since": since,
+            "reset": reset,
+            "changed": changed,
+            "deleted": sorted(deleted, key=lambda item: item["sequence"]),
+        }
+
+    def invalidate(self, tasks_file: Union[str, Path, None] = None) -> None:
+        """Forget the in-memory sequences of one file, or of every file"""
+        with self._lock:
+            if tasks_file is None:
+                self._changes.clear()
+            else:
+                self._changes.pop(os.path.abspath(tasks_file), None)
+
+    @contextmanager
+    def _locked(self, key: str) -> Iterator[None]:
+        """Hold the in-process lock and the tree's lock file shared with other processes"""
+        with self._lock:
+            if not os.path.isdir(os.path.dirname(key)):
+                yield
+                return
+            with file_lock(_lock_path(key)):
+                yield
+
+    def _synced(self, key: str) -> Tuple[TreeChanges, Optional[List[Any]]]:
+        """
+        Changes of key, diffed against tasks.json first if it was edited elsewhere
+
+        A tasks.json that cannot be read is not diffed: the old stamp is kept,
+        so the next call tries again instead of deleting every task.
+        """
+        changes = self._load(key)
+        stamp = _stamp_of(key)
+        if changes.stamp == stamp:
+            return changes, None
+        tasks = _read_tasks(key) if stamp is not None else []
+        if tasks is None:
+            return changes, None
+        changes.apply(tasks, stamp)
+        self._persist(key, changes)
+        return changes, tasks
+
+    def _load(self, key: str) -> TreeChanges:
+        """Changes of key, re-read from the sidecar when another process rewrote it"""
+        sidecar = _sidecar_path(key)
+        sidecar_stamp = _stamp_of(sidecar)
+        cached = self._changes.get(key)
+        if cached is not None and cached[1] == sidecar_stamp:
+            return cached[0]
+        try:
+            with open(sidecar, 'r', encoding='utf-8') as f:
+                changes = TreeChanges.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            changes = TreeChanges()
+        self._changes[key] = (changes, sidecar_stamp)
+        return changes
+
+    def _persist(self, key: str, changes: TreeChanges) -> None:
+        if changes.stamp is None:
+            return
+        sidecar = _sidecar_path(key)
+        try:
+            atomic_write_text(sidecar, json.dumps(changes.to_dict()))
+            self._changes[key] = (changes, _stamp_of(sidecar))
+        except OSError as e:
+            logger.warning(f"Failed to persist task change log for {key}: {e}")
+
+
+def _content_hash(task: Dict[str, Any]) -> str:
+    encoded = json.dumps(task, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=12).hexdigest()
+
+
+def _read_tasks(key: str) -> Optional[List[Any]]:
+    """The tasks in tasks.json, None if it cannot be read or parsed"""
+    try:
+        with open(key, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Failed to read tasks file {key}: {e}")
+        return None
+    return data if isinstance(data, list) else data.get("tasks", [])
+
+
+def _sidecar_path(tasks_file: str) -> str:
+    return os.path.join(os.path.dirname(tasks_file), CHANGES_FILE_NAME)
+
+
+def _lock_path(tasks_file: str) -> str:
+    return os.path.join(os.path.dirname(tasks_file), f".{CHANGES_FILE_NAME}.lock")
+
+
+def _stamp_of(path: str) -> Stamp:
+    try:
+        return file_stamp(path)
+    except FileNotFoundError:
+        return None
+
+
+_task_change_log = TaskChangeLog()
+get_event_bus().subscribe(TasksCommitted, _task_change_log.on_tasks_committed)
+
+
+def get_task_change_log() -> TaskChangeLog:
+    """Return the process-wide task change log"""
+    return _task_change_log
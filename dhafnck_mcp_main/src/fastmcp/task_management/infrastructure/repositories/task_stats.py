@@ -0,0 +1,300 @@
+"""Materialized Task Tree Statistics"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from fastmcp.utilities.files import atomic_write_text, file_stamp
+
+from ...domain.events import TaskChange, TasksCommitted, get_event_bus
+
+logger = logging.getLogger(__name__)
+
+# Sidecar written next to every tasks.json
+STATS_FILE_NAME = "tasks.stats.json"
+
+HIGH_PRIORITIES = ("urgent", "critical", "high")
+CLOSED_STATUSES = ("done", "cancelled")
+
+
+@dataclass
+class TreeStats:
+    """Summary of one tree's tasks.json, valid while the file keeps the recorded stamp"""
+    stamp: Optional[Tuple[int, int]] = None  # (mtime_ns, size) of tasks.json, None when missing
+    total_tasks: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    todo_high_priority: int = 0
+    open_due_dates: List[str] = field(default_factory=list)  # Due dates of tasks not done or cancelled
+    schema_violations: List[str] = field(default_factory=list)
+    orphaned_dependencies: List[Dict[str, str]] = field(default_factory=list)
+    assignee_workloads: Dict[str, int] = field(default_factory=dict)  # Open tasks per assignee
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Any], stamp: Optional[Tuple[int, int]] = None) -> "TreeStats":
+        """Summarize the raw task dictionaries of a tasks.json file"""
+        stats = cls(stamp=stamp)
+        task_ids = set()
+        dependencies: List[Tuple[str, str]] = []
+
+        for index, task in enumerate(tasks):
+            stats.total_tasks += 1
+            if not isinstance(task, dict):
+                stats.schema_violations.append(f"Task {index} is not a valid object")
+                continue
+            if not task.get("id"):
+                stats.schema_violations.append(f"Task {index} missing required 'id' field")
+            elif not task.get("title"):
+                stats.schema_violations.append(f"Task {task.get('id', index)} missing required 'title' field")
+
+            task_id = str(task.get("id", index))
+            task_ids.add(task_id)
+            status = task.get("status") or "todo"
+            stats.status_counts[status] = stats.status_counts.get(status, 0) + 1
+            if status == "todo" and task.get("priority") in HIGH_PRIORITIES:
+                stats.todo_high_priority += 1
+
+            if status not in CLOSED_STATUSES:
+                due_date = task.get("dueDate") or task.get("due_date")
+                if due_date:
+                    stats.open_due_dates.append(str(due_date))
+                for assignee in task.get("assignees") or []:
+                    stats.assignee_workloads[assignee] = stats.assignee_workloads.get(assignee, 0) + 1
+
+            for dependency_id in task.get("dependencies") or []:
+                dependencies.append((task_id, str(dependency_id)))
+
+        stats.orphaned_dependencies = [
+            {"task_id": task_id, "dependency_id": dependency_id}
+            for task_id, dependency_id in dependencies
+            if dependency_id not in task_ids
+        ]
+        return stats
+
+    def updated(self, changes: Sequence[TaskChange], tasks: Sequence[Any],
+                stamp: Optional[Tuple[int, int]]) -> Optional["TreeStats"]:
+        """
+        These statistics after changes, or None when only from_tasks() is exact.
+
+        Each change moves the counts of its task from its before to its after
+        form. tasks, every task after the changes, is only scanned again when a
+        dependency may have become orphaned or resolved.
+        """
+        if self.schema_violations:
+            return None  # Violations are reported by position
+        stats = TreeStats(
+            stamp=stamp,
+            total_tasks=self.total_tasks,
+            status_counts=dict(self.status_counts),
+            todo_high_priority=self.todo_high_priority,
+            open_due_dates=list(self.open_due_dates),
+            orphaned_dependencies=list(self.orphaned_dependencies),
+            assignee_workloads=dict(self.assignee_workloads),
+        )
+        rescan = False
+        for change in changes:
+            for task in (change.before, change.after):
+                if task is not None and not (isinstance(task, dict) and task.get("id") and task.get("title")):
+                    return None
+            if change.before is not None and not stats._add(change.before, -1):
+                return None
+            if change.after is not None:
+                stats._add(change.after, 1)
+
+            if change.after is None:
+                rescan = True  # Tasks may depend on the deleted one
+            elif change.before is None:
+                rescan = rescan or bool(change.after.get("dependencies")) or any(
+                    orphan["dependency_id"] == change.task_id for orphan in self.orphaned_dependencies
+                )
+            elif (change.before.get("dependencies") or []) != (change.after.get("dependencies") or []):
+                rescan = True
+
+        if rescan:
+            task_ids = {str(task.get("id")) for task in tasks if isinstance(task, dict)}
+            stats.orphaned_dependencies = [
+                {"task_id": str(task.get("id")), "dependency_id": str(dependency_id)}
+                for task in tasks if isinstance(task, dict)
+                for dependency_id in task.get("dependencies") or []
+                if str(dependency_id) not in task_ids
+            ]
+        return stats
+
+    def _add(self, task: Dict[str, Any], sign: int) -> bool:
+        """Add (sign 1) or remove (sign -1) the counts of task; False if removing finds them missing"""
+        status = task.get("status") or "todo"
+        open_task = status not in CLOSED_STATUSES
+        due_date = (task.get("dueDate") or task.get("due_date")) if open_task else None
+        assignees = (task.get("assignees") or []) if open_task else []
+        if sign < 0 and (
+            self.status_counts.get(status, 0) < 1
+            or (due_date and str(due_date) not in self.open_due_dates)
+            or any(self.assignee_workloads.get(assignee, 0) < assignees.count(assignee) for assignee in assignees)
+        ):
+            return False
+
+        self.total_tasks += sign
+        _bump(self.status_counts, status, sign)
+        if status == "todo" and task.get("priority") in HIGH_PRIORITIES:
+            self.todo_high_priority += sign
+        if due_date:
+            if sign > 0:
+                self.open_due_dates.append(str(due_date))
+            else:
+                self.open_due_dates.remove(str(due_date))
+        for assignee in assignees:
+            _bump(self.assignee_workloads, assignee, sign)
+        return True
+
+    def count(self, status: str) -> int:
+        """Number of tasks with status"""
+        return self.status_counts.get(status, 0)
+
+    def overdue_tasks(self, now: Optional[datetime] = None) -> int:
+        """Number of open tasks whose due date has passed"""
+        now = now or datetime.now(timezone.utc)
+        overdue = 0
+        for due_date in self.open_due_dates:
+            try:
+                due = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
+            except ValueError:
+                continue  # Invalid date format
+            if due.tzinfo is None:
+                due = due.replace(tzinfo=timezone.utc)
+            if due < now:
+                overdue += 1
+        return overdue
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TreeStats":
+        stamp = data.get("stamp")
+        return cls(**{**data, "stamp": tuple(stamp) if stamp else None})
+
+
+class TaskStatsView:
+    """
+    Per-tree statistics materialized from tasks.json files.
+
+    Every write a repository publishes as a ``TasksCommitted`` event updates
+    the summary from the tasks it changed, and the summary is persisted in a
+    ``tasks.stats.json`` sidecar. Readers get it in O(1) per tree as long as
+    the stamp of tasks.json still matches; a tasks.json edited outside a
+    repository is re-summarized on the next read, and ``deep=True`` always
+    re-reads it.
+    """
+
+    def __init__(self):
+        self._stats: Dict[str, TreeStats] = {}
+        self._lock = threading.Lock()
+        self.recomputes = 0
+
+    def get(self, tasks_file: Union[str, Path], deep: bool = False) -> TreeStats:
+        """Statistics for tasks_file, recomputed only when stale or when deep is set"""
+        key = os.path.abspath(tasks_file)
+        try:
+            stamp = file_stamp(key)
+        except FileNotFoundError:
+            stamp = None
+
+        if not deep:
+            cached = self._cached(key)
+            if cached is not None and cached.stamp == stamp:
+                return cached
+
+        tasks: List[Any] = []
+        if stamp is not None:
+            try:
+                with open(key, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                tasks = data if isinstance(data, list) else data.get("tasks", [])
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to summarize tasks file {key}: {e}")
+        stats = TreeStats.from_tasks(tasks, stamp)
+        self.recomputes += 1
+        self._store(key, stats)
+        return stats
+
+    def record(self, tasks_file: Union[str, Path], data: Dict[str, Any]) -> TreeStats:
+        """Update the statistics of tasks_file from data that was just written to it"""
+        key = os.path.abspath(tasks_file)
+        stats = TreeStats.from_tasks(data.get("tasks", []), file_stamp(key))
+        self._store(key, stats)
+        return stats
+
+    def on_tasks_committed(self, event: TasksCommitted) -> None:
+        """
+        Event bus handler recording every write of a tasks.json
+
+        When the cached statistics match the file the write replaced, only the
+        changed tasks are applied to them; otherwise every task is summarized.
+        """
+        key = os.path.abspath(event.store)
+        cached = self._cached(key) if event.changes else None
+        stats = None
+        if cached is not None and cached.stamp == event.previous_stamp:
+            stats = cached.updated(event.changes, event.tasks, file_stamp(key))
+        if stats is None:
+            self.record(key, {"tasks": event.tasks})
+        else:
+            self._store(key, stats)
+
+    def invalidate(self, tasks_file: Union[str, Path, None] = None) -> None:
+        """Forget the in-memory statistics of one file, or of every file"""
+        with self._lock:
+            if tasks_file is None:
+                self._stats.clear()
+            else:
+                self._stats.pop(os.path.abspath(tasks_file), None)
+
+    def _cached(self, key: str) -> Optional[TreeStats]:
+        with self._lock:
+            stats = self._stats.get(key)
+        if stats is not None:
+            return stats
+        try:
+            with open(_sidecar_path(key), 'r', encoding='utf-8') as f:
+                stats = TreeStats.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        with self._lock:
+            self._stats[key] = stats
+        return stats
+
+    def _store(self, key: str, stats: TreeStats) -> None:
+        with self._lock:
+            self._stats[key] = stats
+        if stats.stamp is None:
+            return
+        try:
+            atomic_write_text(_sidecar_path(key), json.dumps(stats.to_dict()))
+        except OSError as e:
+            logger.warning(f"Failed to persist task statistics for {key}: {e}")
+
+
+def _bump(counts: Dict[str, int], key: str, delta: int) -> None:
+    """Add delta to counts[key], dropping the key when it reaches zero"""
+    value = counts.get(key, 0) + delta
+    if value:
+        counts[key] = value
+    else:
+        counts.pop(key, None)
+
+
+def _sidecar_path(tasks_file: str) -> str:
+    return os.path.join(os.path.dirname(tasks_file), STATS_FILE_NAME)
+
+
+_task_stats_view = TaskStatsView()
+get_event_bus().subscribe(TasksCommitted, _task_stats_view.on_tasks_committed)
+
+
+def get_task_stats_view() -> TaskStatsView:
+    """Return the process-wide task statistics view"""
+    return _task_stats_view
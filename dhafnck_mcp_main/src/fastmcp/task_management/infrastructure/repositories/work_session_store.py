@@ -0,0 +1,71 @@
+"""JSON Work Session Store Implementation"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+from fastmcp.utilities.files import atomic_write_text
+
+from ...domain.entities.work_session import WorkSession
+
+logger = logging.getLogger(__name__)
+
+
+class JsonWorkSessionStore:
+    """
+    Persists the active work sessions of every project in one JSON file.
+
+    Sessions are stored as ``{project_id: {session_id: session}}`` and the file
+    is replaced atomically on every save, so session deadlines survive a
+    server restart.
+    """
+
+    def __init__(self, sessions_file: Union[str, Path]):
+        self.sessions_file = Path(sessions_file)
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, Dict[str, Any]] = self._read()
+
+    def project_ids(self) -> List[str]:
+        """Projects that have persisted sessions"""
+        with self._lock:
+            return [project_id for project_id, sessions in self._sessions.items() if sessions]
+
+    def load(self, project_id: str) -> List[WorkSession]:
+        """Persisted sessions of project_id; unreadable entries are skipped"""
+        with self._lock:
+            entries = list(self._sessions.get(project_id, {}).values())
+        sessions = []
+        for entry in entries:
+            try:
+                sessions.append(WorkSession.from_dict(entry))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid work session in {self.sessions_file}: {e}")
+        return sessions
+
+    def save(self, project_id: str, sessions: Iterable[WorkSession]) -> None:
+        """Replace the persisted sessions of project_id"""
+        serialized = {session.id: session.to_dict() for session in sessions}
+        with self._lock:
+            if self._sessions.get(project_id, {}) == serialized:
+                return
+            if serialized:
+                self._sessions[project_id] = serialized
+            else:
+                self._sessions.pop(project_id, None)
+            try:
+                atomic_write_text(self.sessions_file, json.dumps(self._sessions, indent=2))
+            except OSError as e:
+                logger.warning(f"Failed to save work sessions to {self.sessions_file}: {e}")
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.sessions_file, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+            return json.loads(content) if content else {}
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to load work sessions file {self.sessions_file}: {e}")
+            return {}
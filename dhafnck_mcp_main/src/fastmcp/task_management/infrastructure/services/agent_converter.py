@@ -3,9 +3,11 @@
 from typing import Dict, List, Optional, Set
 from datetime import datetime
 import logging
+import re
 
 from ...domain.entities.agent import Agent, AgentCapability, AgentStatus
 from ...domain.enums.agent_roles import AgentRole
+from ...domain.services.orchestrator import TREE_CAPABILITY_KEYWORDS, TREE_CAPABILITY_LANGUAGES
 
 
 class AgentConverter:
@@ -85,12 +87,8 @@ class AgentConverter:
             }
         }
         
-        # Get mapping for this agent type or use defaults
-        mapping = agent_mappings.get(agent_name, {
-            'capabilities': [AgentCapability.BACKEND_DEVELOPMENT],
-            'specializations': ['general_development'],
-            'languages': ['python']
-        })
+        # Get mapping for this agent type, infer it from the agent name or use defaults
+        mapping = agent_mappings.get(agent_name) or self._infer_agent_mapping(agent_name)
         
         capabilities = set(mapping.get('capabilities', []))
         specializations = mapping.get('specializations', [])
@@ -98,6 +96,26 @@ class AgentConverter:
         
         return capabilities, specializations, preferred_languages
     
+    def _infer_agent_mapping(self, agent_name: str) -> Dict:
+        """Infer capabilities for an unmapped agent from the whole words in its name"""
+        # Substring matching would read "ui" into "build_agent" or "guide_agent"
+        words = set(re.split(r'[_-]+', agent_name.lower()))
+        capabilities = [
+            capability for capability in AgentCapability
+            if words.intersection(TREE_CAPABILITY_KEYWORDS.get(capability, []))
+        ]
+        languages = []
+        for capability in capabilities:
+            for language in TREE_CAPABILITY_LANGUAGES.get(capability, []):
+                if language not in languages:
+                    languages.append(language)
+        
+        return {
+            'capabilities': capabilities or [AgentCapability.BACKEND_DEVELOPMENT],
+            'specializations': ['general_development'],
+            'languages': languages or ['python']
+        }
+    
     def convert_project_agents_to_entities(self, project_data: Dict) -> Dict[str, Agent]:
         """Convert all agents in a project to Agent entities"""
         project_id = project_data.get("id")
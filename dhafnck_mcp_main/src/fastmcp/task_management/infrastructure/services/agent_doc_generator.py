@@ -6,6 +6,8 @@ import argparse
 import subprocess
 from typing import Optional, List
 from fastmcp.tools.tool_path import find_project_root
+from fastmcp.utilities.yaml_loader import load_yaml_file, thaw
+from .rule_files import rule_files_locked
 
 
 class AgentDocGenerator:
@@ -49,6 +51,7 @@ class AgentDocGenerator:
         self.project_root = project_root
         self.convert_script = self.agent_yaml_lib / "convert_yaml_to_mdc_format.py"
     
+    @rule_files_locked
     def clear_agents_output_dir(self):
         """Clear all files in the agents output directory"""
         if self.agents_output_dir.exists() and self.agents_output_dir.is_dir():
@@ -59,12 +62,11 @@ class AgentDocGenerator:
     def convert_yaml_to_mdc(self, yaml_file: Path) -> str:
         """Convert a YAML file to MDC format by loading and dumping it."""
         try:
-            with open(yaml_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-            return yaml.dump(data)
+            return yaml.dump(thaw(load_yaml_file(yaml_file)))
         except Exception as e:
             return f"(Error converting {yaml_file.name} to MDC: {e})"
     
+    @rule_files_locked
     def generate_agent_docs(self, agent_name: Optional[str] = None, clear_all: bool = False):
         """Generate agent documentation for specified agent or all agents"""
         self.agents_output_dir.mkdir(parents=True, exist_ok=True)
@@ -93,8 +95,7 @@ class AgentDocGenerator:
             return
         
         try:
-            with open(job_desc_file, 'r', encoding='utf-8') as f:
-                job_desc = yaml.safe_load(f)
+            job_desc = load_yaml_file(job_desc_file)
         except Exception as e:
             return
         
@@ -128,6 +129,7 @@ class AgentDocGenerator:
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write('\n'.join(md_lines))
     
+    @rule_files_locked
     def generate_docs_for_assignees(self, assignees: Optional[List[str]], clear_all: bool = False):
         """Generate agent docs for all unique assignees in the list."""
         if not assignees:
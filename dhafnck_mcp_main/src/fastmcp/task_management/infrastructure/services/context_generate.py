@@ -1,19 +1,164 @@
 """Context file generation service for tasks"""
 
+import atexit
+import logging
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 from datetime import datetime
 
 from ...domain.entities.task import Task
 from ....tools.tool_path import find_project_root
+from ....utilities.files import atomic_write_text, file_stamp
+
+logger = logging.getLogger(__name__)
+
+# Writes queued within this many seconds of each other are flushed together
+DEFAULT_FLUSH_DELAY = 0.25
+DEFAULT_CONTENT_CACHE_SIZE = 1024
+
+
+class ContextFileStore:
+    """
+    Write-behind store for task context files.
+
+    Writes to the same file within ``flush_delay`` seconds are coalesced into
+    a single write, content identical to what is already on disk is never
+    rewritten, and every write goes to a temporary file in the target
+    directory that is then renamed over the original, so readers never see a
+    partially written context file. Directories are created once per process
+    and remembered. A ``flush_delay`` of zero writes through immediately, and
+    ``flush(path)`` writes one file now for callers that hand it to a reader.
+
+    The file I/O happens outside the lock guarding the queue, so reads and
+    new writes never wait for the disk; flushes are serialized so writes to
+    a file land in the order they were queued.
+    """
+
+    def __init__(self, flush_delay: float = DEFAULT_FLUSH_DELAY,
+                 max_cached_files: int = DEFAULT_CONTENT_CACHE_SIZE):
+        self.flush_delay = flush_delay
+        self.max_cached_files = max_cached_files
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[Path, str] = {}
+        # Content taken off the queue by a flush that is still writing it
+        self._writing: Dict[Path, str] = {}
+        # Last content seen on disk, validated by (mtime_ns, size)
+        self._contents: "OrderedDict[Path, Tuple[Tuple[int, int], str]]" = OrderedDict()
+        self._known_dirs: Set[Path] = set()
+        self._timer: Optional[threading.Timer] = None
+        self.writes = 0
+        self.skipped_writes = 0
+
+    def exists(self, path: Path) -> bool:
+        """Whether path exists on disk or has a write pending"""
+        with self._lock:
+            if path in self._pending or path in self._writing:
+                return True
+        return path.exists()
+
+    def read(self, path: Path) -> Optional[str]:
+        """Current content of path including pending writes, or None if it does not exist"""
+        with self._lock:
+            if path in self._pending:
+                return self._pending[path]
+            if path in self._writing:
+                return self._writing[path]
+        try:
+            stamp = file_stamp(path)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            cached = self._contents.get(path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._remember(path, stamp, content)
+        return content
+
+    def write(self, path: Path, content: str) -> bool:
+        """
+        Queue content for path
+
+        Returns:
+            bool: True if a write was queued, False if path already holds content
+        """
+        if self.read(path) == content:
+            with self._lock:
+                self.skipped_writes += 1
+            return False
+
+        with self._lock:
+            self._pending[path] = content
+            if self.flush_delay > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.flush_delay, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return True
+        self.flush()
+        return True
+
+    def flush(self, *paths: Path) -> None:
+        """Write the pending writes of paths now, or every pending write without paths"""
+        with self._flush_lock:
+            with self._lock:
+                if paths:
+                    batch = {path: self._pending.pop(path) for path in paths if path in self._pending}
+                else:
+                    if self._timer is not None:
+                        self._timer.cancel()
+                        self._timer = None
+                    batch, self._pending = self._pending, {}
+                self._writing.update(batch)
+            for path, content in batch.items():
+                try:
+                    self._write_atomic(path, content)
+                except OSError as e:
+                    logger.warning(f"Failed to write context file {path}: {e}")
+                finally:
+                    with self._lock:
+                        del self._writing[path]
+
+    def _write_atomic(self, path: Path, content: str) -> None:
+        directory = path.parent
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+        try:
+            atomic_write_text(path, content)
+        except FileNotFoundError:
+            # Directory removed since it was cached
+            directory.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(path, content)
+        self.writes += 1
+        self._remember(path, file_stamp(path), content)
+
+    def _remember(self, path: Path, stamp: Tuple[int, int], content: str) -> None:
+        with self._lock:
+            self._contents[path] = (stamp, content)
+            self._contents.move_to_end(path)
+            while len(self._contents) > self.max_cached_files:
+                self._contents.popitem(last=False)
+
+_context_store = ContextFileStore()
+atexit.register(_context_store.flush)
+
+
+def get_context_store() -> ContextFileStore:
+    """Return the process-wide context file store"""
+    return _context_store
 
 
 class ContextGenerator:
     """Service for generating and managing task context files"""
     
-    def __init__(self, context_root_path: Optional[str] = None):
-        """Initialize context generator with optional custom root path"""
+    def __init__(self, context_root_path: Optional[str] = None, store: Optional[ContextFileStore] = None):
+        """Initialize context generator with optional custom root path and file store"""
         if context_root_path:
             self.context_root_path = Path(context_root_path)
         else:
@@ -21,6 +166,7 @@ class ContextGenerator:
             # Use find_project_root to get the correct workspace root
             project_root = find_project_root()
             self.context_root_path = project_root / ".cursor" / "rules" / "contexts"
+        self.store = store or get_context_store()
     
     def generate_context_file_if_not_exists(self, task: Task, user_id: str = "default_id") -> bool:
         """
@@ -35,25 +181,22 @@ class ContextGenerator:
         """
         context_file_path = self._get_context_file_path(task, user_id)
         
-        # Check if file already exists
-        if context_file_path.exists():
+        # Check if file already exists (or is about to be written)
+        if self.store.exists(context_file_path):
             return False
         
-        # Create directory structure if it doesn't exist
-        context_file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Generate context content
+        # Queue the context file; the store creates missing directories
         context_content = self._generate_context_content(task)
-        
-        # Write context file
-        with open(context_file_path, 'w', encoding='utf-8') as f:
-            f.write(context_content)
+        self.store.write(context_file_path, context_content)
         
         return True
     
     def update_context_file(self, task: Task, user_id: str = "default_id") -> bool:
         """
         Update existing context file with current task information
+
+        Updates arriving within the store's flush delay are coalesced into
+        one write.
         
         Args:
             task: Task entity to update context for
@@ -64,19 +207,14 @@ class ContextGenerator:
         """
         context_file_path = self._get_context_file_path(task, user_id)
         
-        if not context_file_path.exists():
+        # Existing content, including updates that are not flushed yet
+        existing_content = self.store.read(context_file_path)
+        if existing_content is None:
             return False
         
-        # Read existing content
-        with open(context_file_path, 'r', encoding='utf-8') as f:
-            existing_content = f.read()
-        
-        # Update the metadata section
+        # Update the metadata section; unchanged content is not rewritten
         updated_content = self._update_context_metadata(existing_content, task)
-        
-        # Write updated content
-        with open(context_file_path, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        self.store.write(context_file_path, updated_content)
         
         return True
     
@@ -91,6 +229,10 @@ class ContextGenerator:
                 task.project_id / 
                 f"context_{task.id.value}.md")
     
+    def flush(self, task: Task, user_id: str = "default_id") -> None:
+        """Write any queued update of the task's context file now"""
+        self.store.flush(self._get_context_file_path(task, user_id))
+    
     def _generate_context_content(self, task: Task) -> str:
         """Generate the full context file content based on template"""
         assignee = task.assignees[0] if task.assignees else "unassigned"
@@ -287,6 +429,9 @@ class ContextGenerator:
 def generate_task_context_if_needed(task: Task, user_id: str = "default_id") -> bool:
     """
     Convenience function to generate task context file if it doesn't exist
+
+    A created file is on disk when this returns, as the caller's response
+    points agents to it.
     
     Args:
         task: Task entity to generate context for
@@ -296,12 +441,18 @@ def generate_task_context_if_needed(task: Task, user_id: str = "default_id") ->
         bool: True if file was created, False if it already existed
     """
     generator = ContextGenerator()
-    return generator.generate_context_file_if_not_exists(task, user_id)
+    created = generator.generate_context_file_if_not_exists(task, user_id)
+    if created:
+        generator.flush(task, user_id)
+    return created
 
 
 def update_task_context(task: Task, user_id: str = "default_id") -> bool:
     """
     Convenience function to update existing task context file
+
+    The update is queued, so updates arriving within the store's flush delay
+    are coalesced into one write.
     
     Args:
         task: Task entity to update context for
@@ -9,8 +9,10 @@ from datetime import datetime
 
 from ...domain import Task, AutoRuleGenerator
 from .legacy.rules_generator import RulesGenerator
+from .rule_files import rule_files_locked
 from ...domain.enums.agent_roles import get_supported_roles as get_all_supported_roles
 from fastmcp.tools.tool_path import find_project_root
+from fastmcp.utilities.files import atomic_write_text
 
 
 def _get_project_root() -> Path:
@@ -71,6 +73,7 @@ class FileAutoRuleGenerator(AutoRuleGenerator):
             import tempfile
             self._output_path = os.path.join(tempfile.gettempdir(), f"auto_rule_{os.getpid()}.mdc")
     
+    @rule_files_locked
     def generate_rules_for_task(self, task: Task, force_full_generation: bool = False) -> bool:
         """Generate auto rules for the given task."""
         if not force_full_generation:
@@ -183,9 +186,7 @@ class FileAutoRuleGenerator(AutoRuleGenerator):
         rules_generator = RulesGenerator(project_root / "dhafnck_mcp_main" / "yaml-lib")
         generated_rules = rules_generator.build_rules_content(task_context, agent_role, project_context)
         
-        # Write to file
-        with open(self._output_path, 'w', encoding='utf-8') as f:
-            f.write(generated_rules)
+        atomic_write_text(self._output_path, generated_rules)
         
         logging.info(f"Successfully generated comprehensive rules for task {task_dict['id']}")
         return True
@@ -233,8 +234,7 @@ class FileAutoRuleGenerator(AutoRuleGenerator):
 ### --- END OF GENERATED RULES --- ###
 """
         try:
-            with open(self._output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            atomic_write_text(self._output_path, content)
         except PermissionError:
             logging.warning(f"Permission denied for {self._output_path}. Falling back to temp directory.")
             try:
@@ -0,0 +1,166 @@
+"""Git branch reader that resolves branches from the .git directory without spawning git"""
+
+import logging
+import os
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HEADS_PREFIX = "refs/heads/"
+
+
+@dataclass(frozen=True)
+class GitBranchState:
+    """Local branches of a repository and the branch HEAD points to"""
+    current_branch: str  # Empty when HEAD is detached, like `git branch --show-current`
+    branches: FrozenSet[str]
+
+
+class GitBranchReader:
+    """
+    Reads local branches from ``.git/HEAD``, ``refs/heads/**`` and ``packed-refs``.
+
+    Results are cached per repository and reused while the mtimes of HEAD,
+    packed-refs and every directory below refs/heads are unchanged; creating,
+    renaming or deleting a branch touches one of them. Layouts this reader
+    does not parse (linked worktrees, submodules with a ``.git`` file, the
+    reftable backend) fall back to the git CLI.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._git_dirs: Dict[str, Optional[Path]] = {}
+        self._cache: Dict[Path, Tuple[tuple, GitBranchState]] = {}
+        self.cli_calls = 0
+
+    def read(self, cwd: Optional[str] = None) -> Optional[GitBranchState]:
+        """Branch state of the repository containing cwd, or None outside a git repository"""
+        cwd = os.path.abspath(cwd or os.getcwd())
+        git_path = self._find_git_path(cwd)
+        if git_path is None:
+            return None
+        if not self._is_plain_git_dir(git_path):
+            return self._read_with_cli(cwd)
+
+        stamp = self._stamp(git_path)
+        with self._lock:
+            cached = self._cache.get(git_path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+        try:
+            state = GitBranchState(
+                current_branch=self._read_current_branch(git_path),
+                branches=frozenset(self._read_loose_branches(git_path) | self._read_packed_branches(git_path)),
+            )
+        except OSError as e:
+            logger.debug(f"Falling back to git CLI for {git_path}: {e}")
+            return self._read_with_cli(cwd)
+
+        with self._lock:
+            self._cache[git_path] = (stamp, state)
+        return state
+
+    def _find_git_path(self, cwd: str) -> Optional[Path]:
+        with self._lock:
+            if cwd in self._git_dirs:
+                return self._git_dirs[cwd]
+        git_path = None
+        for directory in (Path(cwd), *Path(cwd).parents):
+            candidate = directory / ".git"
+            if candidate.exists():
+                git_path = candidate
+                break
+        with self._lock:
+            self._git_dirs[cwd] = git_path
+        return git_path
+
+    @staticmethod
+    def _is_plain_git_dir(git_path: Path) -> bool:
+        # A .git file points elsewhere (worktree or submodule); commondir marks a
+        # linked worktree and a reftable directory replaces loose and packed refs
+        return (
+            git_path.is_dir()
+            and (git_path / "HEAD").is_file()
+            and not (git_path / "commondir").exists()
+            and not (git_path / "reftable").exists()
+        )
+
+    @staticmethod
+    def _stamp(git_path: Path) -> tuple:
+        stamps = []
+        for name in ("HEAD", "packed-refs"):
+            try:
+                stamps.append(os.stat(git_path / name).st_mtime_ns)
+            except FileNotFoundError:
+                stamps.append(None)
+        for root, dirs, _ in os.walk(git_path / "refs" / "heads"):
+            dirs.sort()
+            stamps.append((root, os.stat(root).st_mtime_ns))
+        return tuple(stamps)
+
+    @staticmethod
+    def _read_current_branch(git_path: Path) -> str:
+        head = (git_path / "HEAD").read_text(encoding="utf-8").strip()
+        if head.startswith("ref: " + HEADS_PREFIX):
+            return head[len("ref: " + HEADS_PREFIX):]
+        return ""  # Detached HEAD
+
+    @staticmethod
+    def _read_loose_branches(git_path: Path) -> set:
+        heads_dir = git_path / "refs" / "heads"
+        branches = set()
+        for root, _, files in os.walk(heads_dir):
+            relative_root = Path(root).relative_to(heads_dir)
+            for name in files:
+                if not name.endswith(".lock"):
+                    branches.add((relative_root / name).as_posix())
+        return branches
+
+    @staticmethod
+    def _read_packed_branches(git_path: Path) -> set:
+        try:
+            with open(git_path / "packed-refs", "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            return set()
+        branches = set()
+        for line in lines:
+            if line.startswith(("#", "^")):
+                continue
+            _, _, ref = line.partition(" ")
+            if ref.startswith(HEADS_PREFIX):
+                branches.add(ref[len(HEADS_PREFIX):])
+        return branches
+
+    def _read_with_cli(self, cwd: str) -> Optional[GitBranchState]:
+        self.cli_calls += 1
+        try:
+            current = subprocess.run(
+                ["git", "branch", "--show-current"], capture_output=True, text=True, cwd=cwd
+            )
+            listing = subprocess.run(
+                ["git", "branch", "--format=%(refname:short)"], capture_output=True, text=True, cwd=cwd
+            )
+        except OSError as e:
+            logger.debug(f"git CLI unavailable: {e}")
+            return None
+        if current.returncode != 0 or listing.returncode != 0:
+            return None
+        branches = {line.strip() for line in listing.stdout.splitlines()}
+        return GitBranchState(
+            current_branch=current.stdout.strip(),
+            branches=frozenset(branch for branch in branches if branch and not branch.startswith("(")),
+        )
+
+
+_git_branch_reader = GitBranchReader()
+
+
+def get_git_branch_reader() -> GitBranchReader:
+    """Return the process-wide git branch reader"""
+    return _git_branch_reader
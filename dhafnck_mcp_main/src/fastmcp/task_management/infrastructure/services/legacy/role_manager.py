@@ -3,13 +3,95 @@ Role management functionality for the Cursor Agent system.
 Handles loading, analyzing, and managing agent roles.
 """
 
-import yaml
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any
 
+from fastmcp.utilities.yaml_loader import load_yaml, load_yaml_file
+
 from .models import AgentRole
 from ....domain.enums import AgentRole as AgentRoleEnum
-from ....domain.enums.agent_roles import resolve_legacy_role, get_role_metadata_from_yaml
+from ....domain.enums.agent_roles import resolve_legacy_role, get_role_metadata_from_yaml, LEGACY_ROLE_MAPPINGS
+from ....domain.services.keyword_matcher import KeywordMatcher
+
+
+# Indicator keywords used to infer which roles a task needs
+_TASK_INDICATOR_MATCHER = KeywordMatcher({
+    # Always include task_planner for complex tasks
+    "complexity": [
+        "complex", "multiple", "system", "architecture", "integration",
+        "full", "complete", "comprehensive", "large", "enterprise"
+    ],
+    "simple": [
+        "fix", "bug", "small", "quick", "simple", "minor", "patch"
+    ],
+    "planning": [
+        "plan", "design", "architecture", "strategy", "roadmap",
+        "breakdown", "analyze", "requirements"
+    ],
+    "coding": [
+        "implement", "code", "develop", "build", "create", "function",
+        "class", "module", "api", "feature"
+    ],
+    "testing": [
+        "test", "testing", "validation", "verify", "quality", "qa"
+    ],
+    "review": [
+        "review", "audit", "optimize", "refactor", "improve", "security"
+    ],
+})
+
+
+def _build_assignee_roles() -> Dict[str, str]:
+    """Role name reported for each assignee spelling by get_role_from_assignee"""
+    mapping: Dict[str, str] = {}
+    
+    # Legacy role names report themselves
+    for legacy_role in LEGACY_ROLE_MAPPINGS:
+        mapping[legacy_role] = legacy_role
+    
+    # Display names of the legacy roles
+    display_name_mapping = {
+        'QA Engineer': 'qa_engineer',
+        'Senior Developer': 'senior_developer',
+        'Lead Developer': 'senior_developer',
+        'Task Planner': 'task_planner',
+        'Code Reviewer': 'code_reviewer'
+    }
+    for assignee, role in display_name_mapping.items():
+        mapping.setdefault(assignee, role)
+    
+    # Common assignee titles, in either case, report the agent they are handled by
+    role_mappings = {
+        AgentRoleEnum.CODING: [
+            "Lead Developer", "Backend Developer", "Frontend Developer",
+            "AI Systems Developer", "Integration Developer", "Security Developer",
+            "Platform Engineer", "Senior Developer", "DevOps Engineer"
+        ],
+        AgentRoleEnum.TASK_PLANNING: [
+            "Systems Analyst", "Technical Writer", "Task Planner"
+        ],
+        AgentRoleEnum.FUNCTIONAL_TESTER: [
+            "QA Engineer", "QA Lead", "Performance Engineer"
+        ],
+        AgentRoleEnum.CODE_REVIEWER: [
+            "Code Reviewer"
+        ]
+    }
+    for role_enum, assignees in role_mappings.items():
+        for assignee in assignees:
+            mapping.setdefault(assignee, role_enum.value)
+            mapping.setdefault(assignee.lower(), role_enum.value)
+    
+    # Current role slugs report themselves
+    for role_enum in AgentRoleEnum:
+        mapping.setdefault(role_enum.value, role_enum.value)
+    
+    return mapping
+
+
+# Exact spellings only, in the precedence of the tables get_role_from_assignee always used
+_ASSIGNEE_ROLES = MappingProxyType(_build_assignee_roles())
 
 
 class RoleManager:
@@ -18,43 +100,10 @@ class RoleManager:
     def __init__(self, lib_dir: Path):
         self.lib_dir = lib_dir
         self.roles = {}
-        
-        # Use the new AgentRole enum for role mappings
-        self.assignee_to_role_mapping = self._build_assignee_mapping()
     
-    def _build_assignee_mapping(self) -> Dict[str, str]:
-        """Build assignee to role mapping using AgentRole enum"""
-        mapping = {}
-        
-        # Common role mappings
-        role_mappings = {
-            AgentRoleEnum.CODING: [
-                "Lead Developer", "Backend Developer", "Frontend Developer",
-                "AI Systems Developer", "Integration Developer", "Security Developer",
-                "Platform Engineer", "Senior Developer", "DevOps Engineer"
-            ],
-            AgentRoleEnum.TASK_PLANNING: [
-                "Systems Analyst", "Technical Writer", "Task Planner"
-            ],
-            AgentRoleEnum.FUNCTIONAL_TESTER: [
-                "QA Engineer", "QA Lead", "Performance Engineer"
-            ],
-            AgentRoleEnum.CODE_REVIEWER: [
-                "Code Reviewer"
-            ]
-        }
-        
-        # Build the mapping
-        for role_enum, assignees in role_mappings.items():
-            role_value = role_enum.value
-            for assignee in assignees:
-                mapping[assignee] = role_value
-                mapping[assignee.lower()] = role_value  # Add lowercase mapping
-            
-            # Add the role value itself
-            mapping[role_value] = role_value
-        
-        return mapping
+    def _role_directory_name(self, role_name: str) -> str:
+        """yaml-lib directory of a legacy role name, or the name itself"""
+        return LEGACY_ROLE_MAPPINGS.get(role_name, role_name)
     
     def get_available_roles(self) -> List[str]:
         """Get list of all available role names - scans directory or returns fallback"""
@@ -64,41 +113,13 @@ class RoleManager:
         
         # Return all supported legacy role names
         # These map to actual directories, but we want to expose all legacy names
-        supported_legacy_roles = [
-            'cache_engineer',      # maps to efficiency_optimization_agent
-            'cli_engineer',        # maps to coding_agent
-            'code_reviewer',       # maps to code_reviewer_agent
-            'context_engineer',    # maps to core_concept_agent
-            'devops_engineer',     # maps to devops_agent
-            'metrics_engineer',    # maps to analytics_setup_agent
-            'platform_engineer',   # maps to devops_agent (same as devops_engineer)
-            'qa_engineer',         # maps to functional_tester_agent
-            'security_engineer',   # maps to security_auditor_agent
-            'senior_developer',    # maps to coding_agent
-            'task_planner',        # maps to task_planning_agent
-            'technical_writer'     # maps to documentation_agent
-        ]
+        supported_legacy_roles = sorted(LEGACY_ROLE_MAPPINGS)
         
         # Filter to only include roles where the underlying directory exists
         available_roles = []
-        legacy_to_directory_mapping = {
-            'qa_engineer': 'functional_tester_agent',
-            'senior_developer': 'coding_agent', 
-            'task_planner': 'task_planning_agent',
-            'code_reviewer': 'code_reviewer_agent',
-            'cache_engineer': 'efficiency_optimization_agent',
-            'context_engineer': 'core_concept_agent',
-            'devops_engineer': 'devops_agent',
-            'security_engineer': 'security_auditor_agent',
-            'technical_writer': 'documentation_agent',
-            'platform_engineer': 'devops_agent',
-            'metrics_engineer': 'analytics_setup_agent',
-            'cli_engineer': 'coding_agent'
-        }
         
         for legacy_role in supported_legacy_roles:
-            directory_name = legacy_to_directory_mapping.get(legacy_role, legacy_role)
-            role_dir = self.lib_dir / directory_name
+            role_dir = self.lib_dir / self._role_directory_name(legacy_role)
             
             # Check if mapped directory exists OR if legacy name directory exists (for tests)
             legacy_dir = self.lib_dir / legacy_role
@@ -127,25 +148,8 @@ class RoleManager:
             # Clean up role name
             role_name = role_name.lstrip('@')
 
-            # Map legacy role names to actual directory names
-            legacy_to_directory_mapping = {
-                'qa_engineer': 'functional_tester_agent',
-                'senior_developer': 'coding_agent', 
-                'task_planner': 'task_planning_agent',
-                'code_reviewer': 'code_reviewer_agent',
-                'cache_engineer': 'efficiency_optimization_agent',
-                'context_engineer': 'core_concept_agent',
-                'devops_engineer': 'devops_agent',
-                'security_engineer': 'security_auditor_agent',
-                'technical_writer': 'documentation_agent',
-                'platform_engineer': 'devops_agent',
-                'metrics_engineer': 'analytics_setup_agent',
-                'cli_engineer': 'coding_agent'
-            }
-            
             # Try both the mapped directory name and the original role name
-            directory_name = legacy_to_directory_mapping.get(role_name, role_name)
-            role_dir = self.lib_dir / directory_name
+            role_dir = self.lib_dir / self._role_directory_name(role_name)
             
             # If mapped directory doesn't exist, try the legacy name directly (for tests)
             if not role_dir.exists():
@@ -174,50 +178,16 @@ class RoleManager:
         """Analyze task to determine which roles are needed"""
         required_roles = []
         
-        # Convert to lowercase for analysis
-        text_to_analyze = f"{title} {description} {' '.join(requirements)}".lower()
+        # Scan the task text once for every indicator group
+        text_to_analyze = f"{title} {description} {' '.join(requirements)}"
+        found = _TASK_INDICATOR_MATCHER.match(text_to_analyze)
         
-        # Always include task_planner for complex tasks
-        complexity_indicators = [
-            "complex", "multiple", "system", "architecture", "integration", 
-            "full", "complete", "comprehensive", "large", "enterprise"
-        ]
-        
-        simple_indicators = [
-            "fix", "bug", "small", "quick", "simple", "minor", "patch"
-        ]
-        
-        # Determine if this is a complex task
-        is_complex = any(indicator in text_to_analyze for indicator in complexity_indicators)
-        is_simple = any(indicator in text_to_analyze for indicator in simple_indicators)
-        
-        # Planning indicators
-        planning_indicators = [
-            "plan", "design", "architecture", "strategy", "roadmap", 
-            "breakdown", "analyze", "requirements"
-        ]
-        
-        # Coding indicators  
-        coding_indicators = [
-            "implement", "code", "develop", "build", "create", "function",
-            "class", "module", "api", "feature"
-        ]
-        
-        # Testing indicators
-        testing_indicators = [
-            "test", "testing", "validation", "verify", "quality", "qa"
-        ]
-        
-        # Review indicators
-        review_indicators = [
-            "review", "audit", "optimize", "refactor", "improve", "security"
-        ]
-        
-        # Determine required roles based on content analysis
-        needs_planning = any(indicator in text_to_analyze for indicator in planning_indicators)
-        needs_coding = any(indicator in text_to_analyze for indicator in coding_indicators)
-        needs_testing = any(indicator in text_to_analyze for indicator in testing_indicators)
-        needs_review = any(indicator in text_to_analyze for indicator in review_indicators)
+        is_complex = "complexity" in found
+        is_simple = "simple" in found
+        needs_planning = "planning" in found
+        needs_coding = "coding" in found
+        needs_testing = "testing" in found
+        needs_review = "review" in found
         
         # Role assignment logic
         if is_simple and needs_coding and not (needs_planning or needs_testing):
@@ -257,61 +227,7 @@ class RoleManager:
     
     def get_role_from_assignee(self, assignee: str) -> Optional[str]:
         """Get role directory name from assignee - returns legacy names for backward compatibility"""
-        # Legacy role mapping - return legacy names directly when requested
-        legacy_roles = {
-            'qa_engineer': 'qa_engineer',
-            'senior_developer': 'senior_developer', 
-            'task_planner': 'task_planner',
-            'code_reviewer': 'code_reviewer',
-            'cache_engineer': 'cache_engineer',
-            'context_engineer': 'context_engineer',
-            'devops_engineer': 'devops_engineer',
-            'security_engineer': 'security_engineer',
-            'technical_writer': 'technical_writer',
-            'platform_engineer': 'platform_engineer',
-            'metrics_engineer': 'metrics_engineer',
-            'cli_engineer': 'cli_engineer'
-        }
-        
-        # Return legacy role if it exists
-        if assignee in legacy_roles:
-            return legacy_roles[assignee]
-            
-        # Handle display names to legacy mapping
-        display_name_mapping = {
-            'QA Engineer': 'qa_engineer',
-            'Senior Developer': 'senior_developer',
-            'Lead Developer': 'senior_developer',
-            'Task Planner': 'task_planner',
-            'Code Reviewer': 'code_reviewer'
-        }
-        
-        if assignee in display_name_mapping:
-            return display_name_mapping[assignee]
-        
-        # First try direct mapping from the assignee mapping
-        role = self.assignee_to_role_mapping.get(assignee)
-        if role:
-            # Convert back to legacy name if it's a new enum value
-            reverse_legacy_mapping = {
-                'functional-tester-agent': 'qa_engineer',
-                'coding-agent': 'senior_developer',
-                'task-planning-agent': 'task_planner',
-                'code-reviewer-agent': 'code_reviewer',
-                'efficiency-optimization-agent': 'cache_engineer',
-                'core-concept-agent': 'context_engineer',
-                'devops-agent': 'devops_engineer',
-                'security-auditor-agent': 'security_engineer',
-                'documentation-agent': 'technical_writer',
-                'analytics-setup-agent': 'metrics_engineer'
-            }
-            return reverse_legacy_mapping.get(role, role)
-            
-        # Try to find a close match using AgentRole enum
-        if AgentRoleEnum.is_valid_role(assignee):
-            return assignee
-            
-        return None
+        return _ASSIGNEE_ROLES.get(assignee)
     
     def load_role_for_assignee(self, assignee: str) -> bool:
         """Load the appropriate role for an assignee"""
@@ -440,8 +356,7 @@ class RoleManager:
     def _read_yaml_file(self, file_path: Path) -> Dict:
         """Read and parse YAML file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml_file(file_path) or {}
         except Exception as e:
             print(f"⚠️  Failed to read YAML file {file_path}: {e}")
             return {}
@@ -1062,8 +977,7 @@ class RoleManager:
         Extracts name, category, description and formats nested content properly.
         """
         try:
-            import yaml
-            data = yaml.safe_load(content)
+            data = load_yaml(content)
             
             if not isinstance(data, dict):
                 return [f"**File**: {file_path}\n**Content**: {content}"]
@@ -3,70 +3,160 @@ Rules generation functionality for the Cursor Agent system.
 Handles generating and formatting .cursor/rules files based on task context.
 """
 
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from threading import Lock
+from typing import Dict, Hashable, List, Optional, Any, Tuple, Union
 import re
-import yaml
 import glob
 
+from fastmcp.utilities.yaml_loader import load_yaml, load_yaml_file
+
 from .models import TaskContext, AgentRole
+from ....domain.enums.role_resolution import RoleResolutionIndex, get_role_resolution_index
+
+
+VARIABLE_PATTERN = re.compile(r'\{\{(\w+)\}\}')
+
+
+class CompiledTemplate:
+    """Template pre-split into literal and variable segments"""
+    
+    __slots__ = ('source', 'literals', 'variable_names')
+    
+    def __init__(self, source: str):
+        self.source = source
+        # re.split with a capture group alternates literal, variable, literal, ...
+        parts = VARIABLE_PATTERN.split(source)
+        self.literals: Tuple[str, ...] = tuple(parts[0::2])
+        self.variable_names: Tuple[str, ...] = tuple(parts[1::2])
+    
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Join the segments, leaving unknown variables as placeholders"""
+        pieces = [self.literals[0]]
+        for var_name, literal in zip(self.variable_names, self.literals[1:]):
+            pieces.append(str(variables[var_name]) if var_name in variables else f'{{{{{var_name}}}}}')
+            pieces.append(literal)
+        return ''.join(pieces)
+
+
+class TemplateCache:
+    """Bounded LRU cache of compiled templates, validated by a caller-supplied stamp"""
+    
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[Any, CompiledTemplate]]" = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, key: Hashable, stamp: Any = None) -> Optional[CompiledTemplate]:
+        """Return the cached template if it was stored with the same stamp"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != stamp:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def put(self, key: Hashable, template: CompiledTemplate, stamp: Any = None) -> CompiledTemplate:
+        """Store a compiled template, evicting the least recently used entries"""
+        with self._lock:
+            self._entries[key] = (stamp, template)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return template
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Shared by every engine: rules generation often builds a fresh engine per task
+_TEMPLATE_CACHE = TemplateCache()
 
 
 class TemplateEngine:
     """Template engine for dynamic content generation"""
     
-    def __init__(self, lib_dir: Path):
+    def __init__(self, lib_dir: Path, template_cache: Optional[TemplateCache] = None):
         self.lib_dir = lib_dir
-        self.template_cache = {}
-        self.variable_pattern = re.compile(r'\{\{(\w+)\}\}')
+        self.template_cache = template_cache or _TEMPLATE_CACHE
+        self.variable_pattern = VARIABLE_PATTERN
         self._agent_cache = {}
+        self._agent_dirs_cache: Optional[Tuple[int, List[str]]] = None
+        self._directory_name_cache: Dict[str, str] = {}
+        self._directory_names_index: Optional[RoleResolutionIndex] = None
+    
+    @property
+    def role_index(self) -> RoleResolutionIndex:
+        """Shared index resolving every role spelling, current with the yaml-lib listing"""
+        return get_role_resolution_index(self.lib_dir)
+    
+    def compile_template(self, template_content: str) -> CompiledTemplate:
+        """Compile template text once; identical text reuses the cached segments"""
+        key = ('content', template_content)
+        compiled = self.template_cache.get(key)
+        if compiled is None:
+            compiled = self.template_cache.put(key, CompiledTemplate(template_content))
+        return compiled
     
-    def render_template(self, template_content: str, variables: Dict[str, Any]) -> str:
+    def render_template(self, template_content: Union[str, CompiledTemplate], variables: Dict[str, Any]) -> str:
         """Render template with variable substitution"""
-        def replace_var(match):
-            var_name = match.group(1)
-            return str(variables.get(var_name, f'{{{{{var_name}}}}}'))
-        
-        return self.variable_pattern.sub(replace_var, template_content)
+        if not isinstance(template_content, CompiledTemplate):
+            template_content = self.compile_template(template_content)
+        return template_content.render(variables)
+    
+    def render_many(self, template_content: Union[str, CompiledTemplate], variables_list: List[Dict[str, Any]]) -> List[str]:
+        """Render the same template once per variables mapping"""
+        if not isinstance(template_content, CompiledTemplate):
+            template_content = self.compile_template(template_content)
+        return [template_content.render(variables) for variables in variables_list]
     
     def _discover_agent_directories(self) -> List[str]:
         """Dynamically discover all agent directories in yaml-lib"""
-        if not self.lib_dir.exists():
+        try:
+            lib_mtime = self.lib_dir.stat().st_mtime_ns
+        except OSError:
             return []
         
+        # Adding or removing an agent directory bumps the yaml-lib mtime
+        if self._agent_dirs_cache and self._agent_dirs_cache[0] == lib_mtime:
+            return self._agent_dirs_cache[1]
+        
         agent_dirs = []
         for item in self.lib_dir.iterdir():
             if item.is_dir() and item.name.endswith('_agent'):
                 agent_dirs.append(item.name)
         
-        return sorted(agent_dirs)
+        agent_dirs.sort()
+        self._agent_dirs_cache = (lib_mtime, agent_dirs)
+        return agent_dirs
     
     def _normalize_role_name_to_directory(self, role_name: str) -> str:
         """Convert role name to expected directory name"""
-        # Handle various role name formats and convert to directory format
-        
-        # Common mappings for legacy role names
-        legacy_mappings = {
-            'Senior Full-Stack Developer': 'coding_agent',
-            'senior_developer': 'coding_agent',
-            'Senior Task Planning Architect': 'task_planning_agent', 
-            'Senior QA Engineer & Test Specialist': 'functional_tester_agent',
-            'Senior Code Reviewer & Quality Assurance Specialist': 'code_reviewer_agent',
-            'Task Planning Agent': 'task_planning_agent',
-            'Coding Agent': 'coding_agent',
-            'QA Engineer': 'functional_tester_agent',
-            'Code Reviewer': 'code_reviewer_agent',
-            'Documentation Agent': 'documentation_agent',
-            'DevOps Agent': 'devops_agent',
-            'Security Engineer': 'security_auditor_agent',
-            'System Architect': 'system_architect_agent'
-        }
-        
-        # Check legacy mappings first
-        if role_name in legacy_mappings:
-            return legacy_mappings[role_name]
-        
+        # Any known spelling (slug, legacy name, display name, directory) resolves in O(1)
+        role_index = self.role_index
+        resolution = role_index.resolve(role_name)
+        if resolution:
+            return resolution.directory
+        
+        # Unknown spellings fall back to matching; remember the outcome until
+        # the yaml-lib listing, and with it the index, changes
+        if role_index is not self._directory_names_index:
+            self._directory_name_cache = {}
+            self._directory_names_index = role_index
+        if role_name in self._directory_name_cache:
+            return self._directory_name_cache[role_name]
+        directory = self._match_role_name_to_directory(role_name)
+        self._directory_name_cache[role_name] = directory
+        return directory
+    
+    def _match_role_name_to_directory(self, role_name: str) -> str:
+        """Match a free-form role name such as a YAML display name against agent directories"""
         # Try to find by partial name match
         role_lower = role_name.lower()
         agent_dirs = self._discover_agent_directories()
@@ -89,17 +179,34 @@ class TemplateEngine:
     
     def load_role_template(self, role_name: str) -> Optional[str]:
         """Load template for a specific role"""
+        compiled = self.load_compiled_role_template(role_name)
+        return compiled.source if compiled else None
+    
+    def load_compiled_role_template(self, role_name: str) -> Optional[CompiledTemplate]:
+        """Load the compiled template for a role, re-reading it only when the file changed"""
         role_dir_name = self._normalize_role_name_to_directory(role_name)
         template_file = self.lib_dir / role_dir_name / "template.md"
         
-        if template_file.exists():
-            try:
-                with open(template_file, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception:
-                pass
+        try:
+            stat = template_file.stat()
+        except OSError:
+            return None
+        
+        key = ('file', str(template_file))
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        compiled = self.template_cache.get(key, stamp)
+        if compiled is not None:
+            return compiled
         
-        return None
+        try:
+            with open(template_file, 'r', encoding='utf-8') as f:
+                return self.template_cache.put(key, CompiledTemplate(f.read()), stamp)
+        except Exception:
+            return None
+    
+    def get_compiled_default_template(self) -> CompiledTemplate:
+        """Get the default template structure, compiled"""
+        return self.compile_template(self.get_default_template())
     
     def load_agent_data(self, role_name: str) -> Dict[str, Any]:
         """Load comprehensive agent data from YAML files"""
@@ -131,8 +238,7 @@ class TemplateEngine:
         job_desc_file = agent_dir / "job_desc.yaml"
         if job_desc_file.exists():
             try:
-                with open(job_desc_file, 'r', encoding='utf-8') as f:
-                    agent_data['job_desc'] = yaml.safe_load(f) or {}
+                agent_data['job_desc'] = load_yaml_file(job_desc_file) or {}
             except Exception as e:
                 print(f"Error loading job_desc.yaml for {role_dir_name}: {e}")
         
@@ -141,9 +247,8 @@ class TemplateEngine:
         if contexts_dir.exists():
             for context_file in contexts_dir.glob("*.yaml"):
                 try:
-                    with open(context_file, 'r', encoding='utf-8') as f:
-                        context_data = yaml.safe_load(f) or {}
-                        agent_data['contexts'][context_file.stem] = context_data
+                    context_data = load_yaml_file(context_file) or {}
+                    agent_data['contexts'][context_file.stem] = context_data
                 except Exception as e:
                     print(f"Error loading context file {context_file}: {e}")
         
@@ -152,9 +257,8 @@ class TemplateEngine:
         if rules_dir.exists():
             for rule_file in rules_dir.glob("*.yaml"):
                 try:
-                    with open(rule_file, 'r', encoding='utf-8') as f:
-                        rule_data = yaml.safe_load(f) or {}
-                        agent_data['rules'][rule_file.stem] = rule_data
+                    rule_data = load_yaml_file(rule_file) or {}
+                    agent_data['rules'][rule_file.stem] = rule_data
                 except Exception as e:
                     print(f"Error loading rule file {rule_file}: {e}")
         
@@ -163,9 +267,8 @@ class TemplateEngine:
         if tools_dir.exists():
             for tool_file in tools_dir.glob("*.yaml"):
                 try:
-                    with open(tool_file, 'r', encoding='utf-8') as f:
-                        tool_data = yaml.safe_load(f) or {}
-                        agent_data['tools'][tool_file.stem] = tool_data
+                    tool_data = load_yaml_file(tool_file) or {}
+                    agent_data['tools'][tool_file.stem] = tool_data
                 except Exception as e:
                     print(f"Error loading tool file {tool_file}: {e}")
         
@@ -174,9 +277,8 @@ class TemplateEngine:
         if output_dir.exists():
             for output_file in output_dir.glob("*.yaml"):
                 try:
-                    with open(output_file, 'r', encoding='utf-8') as f:
-                        output_data = yaml.safe_load(f) or {}
-                        agent_data['output_format'][output_file.stem] = output_data
+                    output_data = load_yaml_file(output_file) or {}
+                    agent_data['output_format'][output_file.stem] = output_data
                 except Exception as e:
                     print(f"Error loading output format file {output_file}: {e}")
         
@@ -262,19 +364,30 @@ class RulesTemplateSystem:
     def generate_rules_content(self, task: TaskContext, role: AgentRole, project_context: Dict) -> str:
         """Generate complete rules content using template system"""
         
+        return self.generate_rules_content_batch([task], role, project_context)[0]
+    
+    def generate_rules_content_batch(self, tasks: List[TaskContext], role: AgentRole, project_context: Dict) -> List[str]:
+        """Generate rules content for many tasks sharing a role, loading its template and data once"""
+        
         # Try to load role-specific template, fallback to default
-        template_content = self.template_engine.load_role_template(role.name)
-        if not template_content:
-            template_content = self.template_engine.get_default_template()
+        template = self._load_template_for_role(role)
         
         # Load comprehensive agent data from YAML files
         agent_data = self.template_engine.load_agent_data(role.name)
         
-        # Build template variables
-        variables = self._build_template_variables(task, role, project_context, agent_data)
-        
-        # Render template with variables
-        return self.template_engine.render_template(template_content, variables)
+        # Build template variables for each task and render them all
+        variables_list = [
+            self._build_template_variables(task, role, project_context, agent_data)
+            for task in tasks
+        ]
+        return self.template_engine.render_many(template, variables_list)
+    
+    def _load_template_for_role(self, role: AgentRole) -> CompiledTemplate:
+        """Compiled role-specific template, or the default one when the role has none"""
+        template = self.template_engine.load_compiled_role_template(role.name)
+        if template is None or not template.source:
+            template = self.template_engine.get_compiled_default_template()
+        return template
     
     def _build_template_variables(self, task: TaskContext, role: AgentRole, project_context: Dict, agent_data: Dict) -> Dict[str, Any]:
         """Build all template variables for rendering"""
@@ -652,7 +765,7 @@ class RulesTemplateSystem:
         """Format structured YAML content with proper hierarchy"""
         try:
             # Parse YAML content
-            yaml_data = yaml.safe_load(content)
+            yaml_data = load_yaml(content)
             if not yaml_data:
                 return self._format_yaml_content_lines(content)
             
@@ -1389,6 +1502,10 @@ class RulesGenerator:
         """Build the complete rules file content with proper Cursor rules structure"""
         return self.template_system.generate_rules_content(task, role, project_context)
     
+    def build_rules_content_batch(self, tasks: List[TaskContext], role: AgentRole, project_context: Dict) -> List[str]:
+        """Build rules file content for many tasks with the same role in one go"""
+        return self.template_system.generate_rules_content_batch(tasks, role, project_context)
+    
     def get_primary_role_for_phase(self, phase: str, assigned_roles: List[str]) -> str:
         """Get the primary role for the current phase"""
         phase_role_mapping = {
@@ -0,0 +1,17 @@
+"""Serialization of the writers of the generated files under .cursor/rules"""
+
+import threading
+from functools import wraps
+
+# auto_rule.mdc, the agent docs and the rule backups are shared by every
+# project, while task tools of different projects run on parallel threads
+RULE_FILES_LOCK = threading.RLock()
+
+
+def rule_files_locked(fn):
+    """Run fn holding RULE_FILES_LOCK"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        with RULE_FILES_LOCK:
+            return fn(*args, **kwargs)
+    return wrapper
@@ -0,0 +1,79 @@
+"""Background task that times out work sessions at their deadlines"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from fastmcp.utilities.worker_pool import get_worker_pool
+
+if TYPE_CHECKING:
+    from fastmcp.task_management.interface.consolidated_mcp_tools import ProjectManager
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on one sleep, so sessions started meanwhile with an earlier deadline are not missed
+DEFAULT_MAX_SLEEP = 30.0
+
+
+class SessionTimeoutMonitor:
+    """
+    Sleeps until the earliest work session deadline and expires due sessions.
+
+    ``running()`` is entered from the server lifespan. The lifespan may run
+    once per client session, so the background task is shared and only
+    cancelled when the last user exits. With a worker_pool the check runs on
+    that pool, serialized with the tools that touch the same projects;
+    without one it runs on the event loop.
+    """
+
+    def __init__(
+        self,
+        project_manager: "ProjectManager",
+        max_sleep: float = DEFAULT_MAX_SLEEP,
+        worker_pool: Optional[str] = None,
+    ):
+        self.project_manager = project_manager
+        self.max_sleep = max_sleep
+        self.worker_pool = worker_pool
+        self._task: Optional[asyncio.Task] = None
+        self._users = 0
+
+    @asynccontextmanager
+    async def running(self) -> AsyncIterator["SessionTimeoutMonitor"]:
+        """Run the monitor for the duration of the context"""
+        self._users += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        try:
+            yield self
+        finally:
+            self._users -= 1
+            if self._users == 0 and self._task is not None:
+                task, self._task = self._task, None
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+
+    async def run(self) -> None:
+        """Expire due sessions until cancelled"""
+        while True:
+            try:
+                if self.worker_pool is None:
+                    next_deadline = self.project_manager.expire_work_sessions()
+                else:
+                    next_deadline = await get_worker_pool(self.worker_pool).run_sync(
+                        self.project_manager.expire_work_sessions
+                    )
+            except Exception as e:
+                logger.warning(f"Work session timeout check failed: {e}")
+                next_deadline = None
+            await asyncio.sleep(self._delay_until(next_deadline))
+
+    def _delay_until(self, deadline: Optional[datetime]) -> float:
+        if deadline is None:
+            return self.max_sleep
+        return min(self.max_sleep, max(0.0, (deadline - datetime.now()).total_seconds()))
@@ -1,13 +1,20 @@
 """Consolidated MCP Tools v2 - Clean and Maintainable Architecture"""
 
 import os
+import copy
 import json
+import inspect
+import random
+import asyncio
 import logging
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Annotated
+from typing import Optional, List, Dict, Any, Annotated, Awaitable, Callable, Tuple
 from dataclasses import asdict
+import anyio.from_thread
 from pydantic import Field
 
 from typing import TYPE_CHECKING
@@ -45,13 +52,27 @@ from fastmcp.task_management.application.dtos import (
 # Infrastructure layer imports
 from fastmcp.task_management.infrastructure import JsonTaskRepository, FileAutoRuleGenerator, InMemoryTaskRepository
 from fastmcp.task_management.infrastructure.repositories.task_repository_factory import TaskRepositoryFactory
+from fastmcp.task_management.infrastructure.repositories.project_store import (
+    JsonProjectStore,
+    is_valid_project_id,
+)
+from fastmcp.task_management.infrastructure.repositories.task_stats import TreeStats, get_task_stats_view
+from fastmcp.task_management.infrastructure.repositories.work_session_store import JsonWorkSessionStore
 from fastmcp.task_management.infrastructure.services.agent_converter import AgentConverter
+from fastmcp.task_management.infrastructure.services.git_branch_reader import get_git_branch_reader
+from fastmcp.task_management.infrastructure.services.rule_files import rule_files_locked
+from fastmcp.task_management.infrastructure.services.session_timeout_monitor import SessionTimeoutMonitor
+from fastmcp.utilities.files import file_stamp
+from fastmcp.utilities.worker_pool import configure_worker_pool, raise_if_abandoned
+from fastmcp.server.batch import BATCH_TOOL_NAME, add_batch_tool
+from fastmcp.server.response_cache import CachePolicy, ResponseCacheMiddleware
 
 # Interface layer imports
 from fastmcp.task_management.interface.cursor_rules_tools import CursorRulesTools
 
 # Domain layer imports
 from fastmcp.task_management.domain.enums import CommonLabel, EstimatedEffort, AgentRole, LabelValidator
+from fastmcp.task_management.domain.enums.estimated_effort import EffortLevel
 from fastmcp.task_management.domain.enums.agent_roles import resolve_legacy_role
 from fastmcp.task_management.domain.exceptions import TaskNotFoundError, AutoRuleGenerationError
 from fastmcp.task_management.domain.repositories.task_repository import TaskRepository
@@ -60,6 +81,14 @@ from fastmcp.task_management.domain.entities.project import Project as ProjectEn
 from fastmcp.task_management.domain.entities.task_tree import TaskTree as TaskTreeEntity
 from fastmcp.task_management.domain.entities.task import Task
 from fastmcp.task_management.domain.services.orchestrator import Orchestrator
+from fastmcp.task_management.domain.services.assignment_solver import assign_with_capacity
+from fastmcp.task_management.domain.services.completion_forecast import (
+    REMAINING_FRACTION,
+    ForecastTask,
+    max_simulations,
+    simulate_completion_hours,
+    summarize_completion,
+)
 
 # ═══════════════════════════════════════════════════════════════════
 # 🛠️ CONFIGURATION AND PATH MANAGEMENT
@@ -136,6 +165,65 @@ class PathResolver:
         return self._resolve_path(cursor_agent_path)
 
 
+# Rebalancing keeps an agent on its tree unless capacity forces a move
+KEEP_ASSIGNMENT_BONUS = 100.0
+
+# Trees an agent can take during rebalancing when its registration sets no max_concurrent_tasks
+DEFAULT_AGENT_CAPACITY = 3
+
+# Threads reading tree statistics concurrently for dashboard_summary
+DASHBOARD_MAX_WORKERS = 8
+
+# Worker pool running the task management tools; calls for the same project are
+# serialized by its project lock, calls for different projects run in parallel,
+# and writers of the files every project shares hold RULE_FILES_LOCK. A call that
+# times out or is cancelled is waited for unless it has not started yet, so a
+# client is never told a write failed while it is still running
+TASK_MANAGEMENT_WORKER_POOL = "task_management"
+
+# Worker threads of that pool, overridable with DHAFNCK_TASK_WORKER_THREADS
+TASK_MANAGEMENT_WORKER_THREADS = 4
+
+# Seconds a cached task management read is served before it is recomputed
+RESPONSE_CACHE_TTL = 30.0
+
+# Simulated schedules per forecast, and the most a caller may ask for
+DEFAULT_FORECAST_SIMULATIONS = 2000
+MAX_FORECAST_SIMULATIONS = 20000
+
+# Hours a work session started by moving a task to in_progress may run before it times out
+WORK_SESSION_MAX_HOURS = 8.0
+
+
+def _project_locked(method):
+    """
+    Run a ProjectManager method holding the store lock of its project_id argument
+
+    The result is copied before the lock is released, so callers never share
+    project data that another worker thread may be changing. A call abandoned
+    by its caller while waiting for the lock stops once it gets it.
+    """
+    @wraps(method)
+    def wrapper(self, project_id, *args, **kwargs):
+        with self._project_store.project_lock(project_id):
+            raise_if_abandoned()
+            return copy.deepcopy(method(self, project_id, *args, **kwargs))
+    return wrapper
+
+
+def _task_project_locked(method):
+    """Run a TaskOperationHandler method holding the project lock of its project_id argument"""
+    signature = inspect.signature(method)
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        project_id = signature.bind(self, *args, **kwargs).arguments.get("project_id") or "default_project"
+        with self._project_manager.project_lock(project_id):
+            raise_if_abandoned()
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class ProjectManager:
     """Manages project lifecycle and multi-agent coordination"""
     
@@ -149,40 +237,73 @@ class ProjectManager:
             self._brain_dir = path_resolver.brain_dir
             self._projects_file = path_resolver.projects_file
         
-        self._projects = {}
-        self._load_projects()
+        self._ensure_brain_dir()
+        self._project_store = JsonProjectStore(
+            self._projects_file,
+            per_project_files=os.environ.get("DHAFNCK_PROJECTS_PER_FILE", "false").lower() == "true",
+        )
+        self._session_store = JsonWorkSessionStore(Path(self._brain_dir) / "work_sessions.json")
         
         # Initialize advanced features
         self._agent_converter = AgentConverter()
         self._orchestrator = Orchestrator()
+        self._git_reader = get_git_branch_reader()
+        
+        # project_id -> (project store version, Project aggregate, tree_id -> tasks.json stamp)
+        self._project_entities: Dict[str, Any] = {}
+        # Called with the response cache tags of every change, see add_change_listener
+        self._change_listeners: List[Callable[..., Any]] = []
+    
+    @property
+    def _projects(self) -> Dict[str, Any]:
+        """Projects data; taking a project lock reloads changes of other processes"""
+        return self._project_store.projects
+    
+    @_projects.setter
+    def _projects(self, projects: Dict[str, Any]) -> None:
+        self._project_store.projects = projects
+        self._project_store.mark_dirty()
+        self._publish_change()
     
     def _ensure_brain_dir(self):
         """Ensure the brain directory exists"""
         self.path_resolver.ensure_brain_dir()
     
-    def _save_projects(self):
-        self._ensure_brain_dir()
-        with open(self._projects_file, 'w') as f:
-            json.dump(self._projects, f, indent=2)
+    def _save_projects(self, project_id: Optional[str] = None):
+        """Schedule project_id (or every project) to be committed by the project store"""
+        self._project_store.mark_dirty(project_id)
+        self._publish_change(project_id)
+    
+    def add_change_listener(self, listener: Callable[..., Any]) -> None:
+        """Call listener(*tags) with the response cache tags of every project change"""
+        self._change_listeners.append(listener)
+    
+    def _publish_change(self, project_id: Optional[str] = None) -> None:
+        """Tell the listeners that project_id (or every project) changed"""
+        project_ids = [project_id] if project_id else list(self._project_store.projects)
+        tags = ["projects", *map(_project_cache_tag, project_ids)]
+        for listener in list(self._change_listeners):
+            listener(*tags)
 
     def _load_projects(self):
-        self._ensure_brain_dir()
-        if os.path.exists(self._projects_file):
-            try:
-                with open(self._projects_file, 'r') as f:
-                    content = f.read().strip()
-                    if content:
-                        self._projects = json.loads(content)
-                    else:
-                        self._projects = {}
-            except (json.JSONDecodeError, FileNotFoundError) as e:
-                logging.warning(f"Failed to load projects file {self._projects_file}: {e}")
-                self._projects = {}
-        else:
-            self._projects = {}
+        """Reload projects from disk, discarding unsaved changes"""
+        self._project_store.load()
+    
+    def project_lock(self, project_id: str):
+        """Lock serializing every read and change of project_id across worker threads"""
+        return self._project_store.project_lock(project_id)
     
+    def _snapshot(self, project_id: str) -> Optional[Dict[str, Any]]:
+        """Copy of the data of project_id taken under its lock, None if it does not exist"""
+        with self.project_lock(project_id):
+            project = self._projects.get(project_id)
+            return None if project is None else copy.deepcopy(project)
+    
+    @_project_locked
     def create_project(self, project_id: str, name: str, description: str = "") -> Dict[str, Any]:
         """Create a new project"""
+        if not is_valid_project_id(project_id):
+            return {"success": False, "error": f"Invalid project id {project_id!r}: use letters, digits, '_', '-' and '.'"}
         project = {
             "id": project_id,
             "name": name,
@@ -193,9 +314,10 @@ class ProjectManager:
             "created_at": "2025-01-01T00:00:00Z"
         }
         self._projects[project_id] = project
-        self._save_projects()
+        self._save_projects(project_id)
         return {"success": True, "project": project}
     
+    @_project_locked
     def get_project(self, project_id: str) -> Dict[str, Any]:
         """Get project details"""
         if project_id not in self._projects:
@@ -204,8 +326,11 @@ class ProjectManager:
     
     def list_projects(self) -> Dict[str, Any]:
         """List all projects"""
-        return {"success": True, "projects": list(self._projects.values()), "count": len(self._projects)}
+        self._project_store.refresh()
+        projects = [project for project in map(self._snapshot, list(self._projects)) if project is not None]
+        return {"success": True, "projects": projects, "count": len(projects)}
     
+    @_project_locked
     def update_project(self, project_id: str, name: str = None, description: str = None) -> Dict[str, Any]:
         """Update an existing project"""
         if project_id not in self._projects:
@@ -229,7 +354,7 @@ class ProjectManager:
         from datetime import datetime
         project["updated_at"] = datetime.now().isoformat()
         
-        self._save_projects()
+        self._save_projects(project_id)
         return {
             "success": True, 
             "project": project,
@@ -237,6 +362,7 @@ class ProjectManager:
             "message": f"Project {project_id} updated successfully"
         }
     
+    @_project_locked
     def create_task_tree(self, project_id: str, tree_id: str, tree_name: str, tree_description: str = "") -> Dict[str, Any]:
         """Create a new task tree in project"""
         if project_id not in self._projects:
@@ -244,9 +370,10 @@ class ProjectManager:
         
         tree = {"id": tree_id, "name": tree_name, "description": tree_description}
         self._projects[project_id]["task_trees"][tree_id] = tree
-        self._save_projects()
+        self._save_projects(project_id)
         return {"success": True, "tree": tree}
     
+    @_project_locked
     def get_task_tree_status(self, project_id: str, tree_id: str) -> Dict[str, Any]:
         """Get task tree status"""
         if project_id not in self._projects:
@@ -258,6 +385,7 @@ class ProjectManager:
         
         return {"success": True, "tree": tree, "status": "active", "progress": "0%"}
     
+    @_project_locked
     def orchestrate_project(self, project_id: str) -> Dict[str, Any]:
         """Orchestrate project workload using domain entities"""
         if project_id not in self._projects:
@@ -280,11 +408,14 @@ class ProjectManager:
             }
         except Exception as e:
             logging.error(f"Orchestration failed for project {project_id}: {str(e)}")
+            # The cached aggregate may be half-updated
+            self._project_entities.pop(project_id, None)
             return {
                 "success": False, 
                 "error": f"Orchestration failed: {str(e)}"
             }
     
+    @_project_locked
     def get_orchestration_dashboard(self, project_id: str) -> Dict[str, Any]:
         """Get orchestration dashboard with detailed agent information"""
         if project_id not in self._projects:
@@ -314,7 +445,158 @@ class ProjectManager:
                 }
             }
 
-    def project_health_check(self, project_id: str) -> Dict[str, Any]:
+    def _tree_stats(self, project_id: str, tree_id: str, deep: bool = False) -> TreeStats:
+        """Materialized statistics of a tree's tasks.json; deep forces a re-read of the file"""
+        tasks_file = self.path_resolver.get_tasks_json_path(project_id, tree_id, "default_id")
+        return get_task_stats_view().get(tasks_file, deep=deep)
+    
+    async def dashboard_summary(
+        self,
+        deep: bool = False,
+        report_progress: Optional[Callable[[float, Optional[float], Optional[str]], Awaitable[None]]] = None,
+        max_workers: int = DASHBOARD_MAX_WORKERS,
+    ) -> Dict[str, Any]:
+        """
+        Per-tree statistics of every project in one payload.
+        
+        Tree statistics are read on a bounded thread pool; report_progress is
+        awaited after every tree with (trees done, total trees, message).
+        """
+        self._project_store.refresh()
+        projects = {project_id: self._snapshot(project_id) for project_id in list(self._projects)}
+        projects = {project_id: project for project_id, project in projects.items() if project is not None}
+        tree_agents: Dict[Tuple[str, str], List[str]] = {}
+        jobs = []
+        for project_id, project in projects.items():
+            for agent_id, tree_ids in project.get("agent_assignments", {}).items():
+                for tree_id in tree_ids if isinstance(tree_ids, list) else [tree_ids]:
+                    tree_agents.setdefault((project_id, tree_id), []).append(agent_id)
+            for tree_id in project.get("task_trees", {}):
+                jobs.append((project_id, tree_id))
+        
+        def summarize_tree(project_id: str, tree_id: str) -> Dict[str, Any]:
+            try:
+                stats = self._tree_stats(project_id, tree_id, deep)
+            except Exception as e:
+                return {"error": str(e)}
+            completed = stats.count("done")
+            return {
+                "total_tasks": stats.total_tasks,
+                "completed_tasks": completed,
+                "status_counts": stats.status_counts,
+                "todo_high_priority": stats.todo_high_priority,
+                "overdue_tasks": stats.overdue_tasks(),
+                "completion_rate": round(completed / stats.total_tasks * 100, 1) if stats.total_tasks else 0.0,
+            }
+        
+        loop = asyncio.get_running_loop()
+        tree_summaries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="dashboard-summary")
+        try:
+            async def run_job(job: Tuple[str, str]) -> Tuple[Tuple[str, str], Dict[str, Any]]:
+                return job, await loop.run_in_executor(executor, summarize_tree, *job)
+            
+            for done, pending in enumerate(asyncio.as_completed([run_job(job) for job in jobs]), 1):
+                (project_id, tree_id), summary = await pending
+                tree_summaries[(project_id, tree_id)] = summary
+                if report_progress is not None:
+                    await report_progress(done, len(jobs), f"{project_id}/{tree_id}")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        totals = {"projects": len(projects), "trees": len(jobs), "total_tasks": 0, "completed_tasks": 0, "overdue_tasks": 0}
+        summary_projects = {}
+        for project_id, project in projects.items():
+            trees = {}
+            project_totals = {"total_tasks": 0, "completed_tasks": 0, "overdue_tasks": 0}
+            for tree_id, tree_data in project.get("task_trees", {}).items():
+                tree_summary = tree_summaries[(project_id, tree_id)]
+                trees[tree_id] = {
+                    "name": tree_data.get("name", tree_id),
+                    "assigned_agents": tree_agents.get((project_id, tree_id), []),
+                    **tree_summary,
+                }
+                for key in project_totals:
+                    project_totals[key] += tree_summary.get(key, 0)
+            for key in project_totals:
+                totals[key] += project_totals[key]
+            summary_projects[project_id] = {
+                "name": project.get("name", project_id),
+                "registered_agents": len(project.get("registered_agents", {})),
+                **project_totals,
+                "completion_rate": round(project_totals["completed_tasks"] / project_totals["total_tasks"] * 100, 1)
+                if project_totals["total_tasks"] else 0.0,
+                "trees": trees,
+            }
+        
+        return {
+            "success": True,
+            "generated_at": datetime.now().isoformat(),
+            "totals": totals,
+            "projects": summary_projects,
+        }
+    
+    @_project_locked
+    def forecast(self, project_id: str, simulations: int = DEFAULT_FORECAST_SIMULATIONS,
+                 seed: Optional[int] = None) -> Dict[str, Any]:
+        """Monte-Carlo P50/P90 completion of every tree and of the whole project"""
+        if project_id not in self._projects:
+            return {"success": False, "error": f"Project {project_id} not found"}
+        
+        simulations = max(1, min(int(simulations), MAX_FORECAST_SIMULATIONS))
+        rng = random.Random(seed)
+        start = datetime.now()
+        project_entity = self._convert_to_project_entity(project_id)
+        
+        tree_inputs = {}
+        for tree_id, tree in project_entity.task_trees.items():
+            forecast_tasks = []
+            assignees = set()
+            for task in tree.root_tasks.values():
+                remaining = REMAINING_FRACTION.get(task.status.value, 1.0)
+                try:
+                    hours = EstimatedEffort(task.estimated_effort).get_hours() if task.estimated_effort else None
+                except ValueError:
+                    hours = None
+                if remaining > 0:
+                    assignees.update(task.assignees)
+                forecast_tasks.append(ForecastTask(
+                    id=task.id.value,
+                    hours=(hours or EffortLevel.MEDIUM.hours) * remaining,
+                    dependencies=tuple(dependency.value for dependency in task.dependencies),
+                ))
+            
+            agent = project_entity.registered_agents.get(project_entity.agent_assignments.get(tree_id))
+            parallelism = max(1, agent.max_concurrent_tasks if agent else 1, len(assignees))
+            tree_inputs[tree_id] = (forecast_tasks, parallelism)
+        
+        # Without NumPy large projects get fewer simulations, see max_simulations
+        simulations = max_simulations(sum(len(tasks) for tasks, _ in tree_inputs.values()), simulations)
+        trees = {}
+        tree_completions = []
+        for tree_id, (forecast_tasks, parallelism) in tree_inputs.items():
+            completion = simulate_completion_hours(forecast_tasks, parallelism, simulations, rng)
+            tree_completions.append(completion)
+            trees[tree_id] = {
+                "open_tasks": sum(1 for task in forecast_tasks if task.hours > 0),
+                "estimated_hours": round(sum(task.hours for task in forecast_tasks), 1),
+                "parallelism": parallelism,
+                **summarize_completion(completion, start),
+            }
+        
+        # Trees are worked on side by side, the project is done with its last tree
+        project_completion = list(map(max, [0.0] * simulations, *tree_completions))
+        return {
+            "success": True,
+            "project_id": project_id,
+            "simulations": simulations,
+            "generated_at": start.isoformat(),
+            "project": summarize_completion(project_completion, start),
+            "trees": trees,
+        }
+    
+    @_project_locked
+    def project_health_check(self, project_id: str, deep: bool = False) -> Dict[str, Any]:
         """Comprehensive project health analysis with data integrity and workflow validation"""
         if project_id not in self._projects:
             return {"success": False, "error": f"Project {project_id} not found"}
@@ -335,51 +617,33 @@ class ProjectManager:
         
         try:
             # 1. CHECK GIT SYNCHRONIZATION
-            import subprocess
-            import os
-            
-            # Try to get current git branch
             try:
-                result = subprocess.run(['git', 'branch', '--show-current'], 
-                                      capture_output=True, text=True, cwd=os.getcwd())
-                if result.returncode == 0:
-                    current_branch = result.stdout.strip()
+                git_state = self._git_reader.read()
+                if git_state is not None:
+                    # Check for obsolete task trees
+                    task_trees = set(project.get("task_trees", {}).keys())
+                    git_branches = set(git_state.branches) | {'main'}  # Always include main
                     
-                    # Get all git branches
-                    result = subprocess.run(['git', 'branch', '-a'], 
-                                          capture_output=True, text=True, cwd=os.getcwd())
-                    if result.returncode == 0:
-                        all_branches = [line.strip().replace('*', '').strip() 
-                                      for line in result.stdout.split('\n') 
-                                      if line.strip() and not line.startswith('remotes/')]
-                        
-                        # Check for obsolete task trees
-                        task_trees = set(project.get("task_trees", {}).keys())
-                        git_branches = set(all_branches + ['main'])  # Always include main
-                        
-                        obsolete_trees = task_trees - git_branches
-                        missing_trees = git_branches - task_trees
-                        
-                        if obsolete_trees:
-                            health_issues.append({
-                                "type": "OBSOLETE_BRANCHES",
-                                "severity": "MEDIUM",
-                                "description": f"Task trees exist for non-existent git branches: {list(obsolete_trees)}",
-                                "impact": "Wasted resources and agent assignments to non-existent work"
-                            })
-                            git_sync_status = "❌ OUT_OF_SYNC"
-                            health_score -= 15
-                            recommendations.append("Run sync_with_git to align project with repository state")
-                        
-                        if missing_trees:
-                            warnings.append(f"Git branches without task trees: {list(missing_trees)}")
-                            recommendations.append("Consider creating task trees for active git branches")
-                        
-                        if not obsolete_trees and not missing_trees:
-                            git_sync_status = "✅ SYNCHRONIZED"
-                    else:
-                        git_sync_status = "⚠️ GIT_ERROR"
-                        warnings.append("Could not read git branches")
+                    obsolete_trees = task_trees - git_branches
+                    missing_trees = git_branches - task_trees
+                    
+                    if obsolete_trees:
+                        health_issues.append({
+                            "type": "OBSOLETE_BRANCHES",
+                            "severity": "MEDIUM",
+                            "description": f"Task trees exist for non-existent git branches: {list(obsolete_trees)}",
+                            "impact": "Wasted resources and agent assignments to non-existent work"
+                        })
+                        git_sync_status = "❌ OUT_OF_SYNC"
+                        health_score -= 15
+                        recommendations.append("Run sync_with_git to align project with repository state")
+                    
+                    if missing_trees:
+                        warnings.append(f"Git branches without task trees: {list(missing_trees)}")
+                        recommendations.append("Consider creating task trees for active git branches")
+                    
+                    if not obsolete_trees and not missing_trees:
+                        git_sync_status = "✅ SYNCHRONIZED"
                 else:
                     git_sync_status = "⚠️ NOT_GIT_REPO"
                     warnings.append("Not in a git repository")
@@ -398,23 +662,13 @@ class ProjectManager:
                     trees_data = dashboard_data.get("trees", {})
                     
                     for tree_id, tree_info in trees_data.items():
-                        dashboard_count = tree_info.get("total_tasks", 0)
+                        # The stats count the top-level tasks of tasks.json, so compare them with
+                        # root_tasks; the dashboard's total_tasks also counts subtasks
+                        dashboard_count = tree_info.get("root_tasks", 0)
                         
-                        # Get actual task count from task repository
+                        # Get actual task count from the tree's materialized statistics
                         try:
-                            from ..domain.services.task_repository_factory import TaskRepositoryFactory
-                            from ..application.task_application_service import TaskApplicationService
-                            
-                            repository_factory = TaskRepositoryFactory(self.path_resolver)
-                            repository = repository_factory.create_repository(project_id, tree_id, "default_id")
-                            
-                            # Count actual tasks
-                            tasks_file = repository._tasks_file
-                            actual_count = 0
-                            if os.path.exists(tasks_file):
-                                with open(tasks_file, 'r') as f:
-                                    tasks_data = json.load(f)
-                                    actual_count = len(tasks_data.get("tasks", []))
+                            actual_count = self._tree_stats(project_id, tree_id, deep).total_tasks
                             
                             if dashboard_count != actual_count:
                                 task_count_issues.append({
@@ -476,42 +730,28 @@ class ProjectManager:
             completed_tasks = 0
             blocked_tasks = 0
             overdue_tasks = 0
+            orphaned_dependencies = 0
+            assignee_workloads: Dict[str, int] = {}
             
             try:
                 for tree_id in task_trees:
                     try:
-                        from ..domain.services.task_repository_factory import TaskRepositoryFactory
-                        repository_factory = TaskRepositoryFactory(self.path_resolver)
-                        repository = repository_factory.create_repository(project_id, tree_id, "default_id")
-                        
-                        tasks_file = repository._tasks_file
-                        if os.path.exists(tasks_file):
-                            with open(tasks_file, 'r') as f:
-                                tasks_data = json.load(f)
-                                tasks = tasks_data.get("tasks", [])
-                                
-                                for task in tasks:
-                                    total_tasks += 1
-                                    status = task.get("status", "todo")
-                                    if status == "done":
-                                        completed_tasks += 1
-                                    elif status == "blocked":
-                                        blocked_tasks += 1
-                                    
-                                    # Check for overdue tasks (simplified check)
-                                    due_date = task.get("due_date")
-                                    if due_date and status not in ["done", "cancelled"]:
-                                        try:
-                                            due = datetime.fromisoformat(due_date.replace('Z', '+00:00'))
-                                            if due < datetime.now():
-                                                overdue_tasks += 1
-                                        except:
-                                            pass  # Invalid date format
+                        stats = self._tree_stats(project_id, tree_id, deep)
+                        total_tasks += stats.total_tasks
+                        completed_tasks += stats.count("done")
+                        blocked_tasks += stats.count("blocked")
+                        overdue_tasks += stats.overdue_tasks()
+                        orphaned_dependencies += len(stats.orphaned_dependencies)
+                        for assignee, open_tasks in stats.assignee_workloads.items():
+                            assignee_workloads[assignee] = assignee_workloads.get(assignee, 0) + open_tasks
                     except Exception as e:
                         warnings.append(f"Could not analyze tasks in tree {tree_id}: {str(e)}")
             except Exception as e:
                 warnings.append(f"Task analysis failed: {str(e)}")
             
+            if orphaned_dependencies:
+                warnings.append(f"{orphaned_dependencies} task dependencies reference tasks missing from their tree")
+            
             # Calculate completion rate
             completion_rate = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 100
             
@@ -549,7 +789,9 @@ class ProjectManager:
                     "completed_tasks": completed_tasks,
                     "completion_rate": f"{completion_rate:.1f}%",
                     "blocked_tasks": blocked_tasks,
-                    "overdue_tasks": overdue_tasks
+                    "overdue_tasks": overdue_tasks,
+                    "orphaned_dependencies": orphaned_dependencies,
+                    "assignee_workloads": assignee_workloads
                 },
                 "recommendations": recommendations,
                 "timestamp": datetime.now().isoformat()
@@ -564,6 +806,7 @@ class ProjectManager:
                 "overall_health": "❌ CHECK_FAILED"
             }
     
+    @_project_locked
     def register_agent(self, project_id: str, agent_id: str, name: str, call_agent: str = None) -> Dict[str, Any]:
         """Register an agent to project using simplified format"""
         if project_id not in self._projects:
@@ -576,9 +819,49 @@ class ProjectManager:
             "call_agent": call_agent or f"@{agent_id.replace('_', '-')}-agent"
         }
         self._projects[project_id]["registered_agents"][agent_id] = agent
-        self._save_projects()
+        self._save_projects(project_id)
         return {"success": True, "agent": agent}
     
+    @_project_locked
+    def update_agent(self, project_id: str, agent_id: str, name: str = None, call_agent: str = None) -> Dict[str, Any]:
+        """Change the name and/or call_agent of a registered agent"""
+        if project_id not in self._projects:
+            return {"success": False, "error": f"Project {project_id} not found"}
+        
+        agents = self._projects[project_id].get("registered_agents", {})
+        if agent_id not in agents:
+            return {"success": False, "error": f"Agent {agent_id} not found in project {project_id}"}
+        
+        agent_data = agents[agent_id]
+        if name:
+            agent_data["name"] = name
+        if call_agent:
+            agent_data["call_agent"] = call_agent
+        
+        self._save_projects(project_id)
+        return {"success": True, "agent": agent_data}
+    
+    @_project_locked
+    def unregister_agent(self, project_id: str, agent_id: str) -> Dict[str, Any]:
+        """Remove a registered agent from project"""
+        if project_id not in self._projects:
+            return {"success": False, "error": f"Project {project_id} not found"}
+        
+        project_data = self._projects[project_id]
+        agents = project_data.get("registered_agents", {})
+        if agent_id not in agents:
+            return {"success": False, "error": f"Agent {agent_id} not found in project {project_id}"}
+        
+        removed_agent = agents.pop(agent_id)
+        
+        assignments = project_data.get("agent_assignments", {})
+        assignments = {k: v for k, v in assignments.items() if v != agent_id}
+        project_data["agent_assignments"] = assignments
+        
+        self._save_projects(project_id)
+        return {"success": True, "message": f"Agent {agent_id} unregistered", "removed_agent": removed_agent}
+    
+    @_project_locked
     def assign_agent_to_tree(self, project_id: str, agent_id: str, tree_id: str) -> Dict[str, Any]:
         """Assign agent to task tree"""
         if project_id not in self._projects:
@@ -596,12 +879,54 @@ class ProjectManager:
         
         if tree_id not in project["agent_assignments"][agent_id]:
             project["agent_assignments"][agent_id].append(tree_id)
-        self._save_projects()
+        self._save_projects(project_id)
         return {"success": True, "message": f"Agent {agent_id} assigned to tree {tree_id}"}
     
     def _convert_to_project_entity(self, project_id: str) -> ProjectEntity:
-        """Convert simplified project data to domain Project entity"""
+        """
+        Domain Project entity for project_id, with its task trees hydrated from tasks.json.
+        
+        The aggregate is cached and only rebuilt when the project store reports
+        a change to the project; each tree is re-hydrated on access when the
+        (mtime, size) of its tasks.json changed since it was last loaded.
+        """
         project_data = self._projects[project_id]
+        version = self._project_store.version(project_id)
+        cached = self._project_entities.get(project_id)
+        if cached is None or cached[0] != version:
+            cached = (version, self._build_project_entity(project_id, project_data), {})
+            self._project_entities[project_id] = cached
+        
+        _, project_entity, tree_stamps = cached
+        for tree_id, tree_entity in project_entity.task_trees.items():
+            tasks_file = self.path_resolver.get_tasks_json_path(project_id, tree_id, "default_id")
+            try:
+                stamp = file_stamp(tasks_file)
+            except FileNotFoundError:
+                stamp = None
+            if tree_id not in tree_stamps or tree_stamps[tree_id] != stamp:
+                self._hydrate_tree(tree_entity, tasks_file if stamp is not None else None)
+                tree_stamps[tree_id] = stamp
+        return project_entity
+    
+    def _hydrate_tree(self, tree_entity: TaskTreeEntity, tasks_file: Optional[Path]) -> None:
+        """Replace the tasks of tree_entity with those stored in tasks_file"""
+        tasks = JsonTaskRepository(file_path=str(tasks_file)).find_all() if tasks_file else []
+        tree_entity.root_tasks.clear()
+        tree_entity.all_tasks.clear()
+        for task in tasks:
+            try:
+                tree_entity.add_root_task(task)
+            except ValueError as e:
+                # Subtasks that are not valid domain tasks are left out of the index
+                logger.debug(f"Skipping subtasks of task {task.id} in tree {tree_entity.id}: {e}")
+                tree_entity.root_tasks[task.id.value] = task
+                tree_entity.all_tasks[task.id.value] = task
+        tree_entity.updated_at = datetime.now()
+        tree_entity.version += 1
+    
+    def _build_project_entity(self, project_id: str, project_data: Dict[str, Any]) -> ProjectEntity:
+        """Convert simplified project data to a domain Project entity with empty task trees"""
         
         # Parse created_at datetime safely
         created_at_str = project_data.get("created_at", "2025-01-01T00:00:00+00:00")
@@ -654,6 +979,10 @@ class ProjectManager:
             )
             project_entity.task_trees[tree_id] = tree_entity
         
+        # Re-attach persisted work sessions so their timeouts survive restarts
+        for session in self._session_store.load(project_id):
+            project_entity.restore_work_session(session)
+        
         return project_entity
     
     def _update_project_from_entity(self, project_id: str, project_entity: ProjectEntity) -> None:
@@ -665,43 +994,98 @@ class ProjectManager:
                 agent_assignments[agent_id] = []
             agent_assignments[agent_id].append(tree_id)
         
-        self._projects[project_id]["agent_assignments"] = agent_assignments
-        self._save_projects()
-
+        project = self._projects[project_id]
+        if project.get("agent_assignments") != agent_assignments:
+            project["agent_assignments"] = agent_assignments
+            self._save_projects(project_id)
+            cached = self._project_entities.get(project_id)
+            if cached is not None and cached[1] is project_entity:
+                # The cached aggregate made this change, so it stays current
+                self._project_entities[project_id] = (self._project_store.version(project_id),) + cached[1:]
+        self._session_store.save(project_id, project_entity.active_work_sessions.values())
+    
+    def expire_work_sessions(self, now: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        Time out every work session past its deadline and persist the result.
+        
+        Returns the earliest remaining deadline across projects, or None.
+        """
+        next_deadline = None
+        for project_id in self._session_store.project_ids():
+            with self._project_store.project_lock(project_id):
+                if project_id not in self._projects:
+                    self._session_store.save(project_id, [])
+                    continue
+                project_entity = self._convert_to_project_entity(project_id)
+                expired = project_entity.expire_timed_out_sessions(now)
+                for session in expired:
+                    agent = project_entity.registered_agents.get(session.agent_id)
+                    if agent and session.task_id in agent.active_tasks:
+                        agent.complete_task(session.task_id, success=False)
+                    logger.warning(f"Work session {session.id} in project {project_id} timed out")
+                if expired:
+                    self._session_store.save(project_id, project_entity.active_work_sessions.values())
+                    self._publish_change(project_id)
+                
+                deadline = project_entity.next_session_deadline()
+            if deadline is not None and (next_deadline is None or deadline < next_deadline):
+                next_deadline = deadline
+        return next_deadline
+    
+    def track_work_session(self, project_id: str, tree_id: str, task_id: str, status: Optional[str]) -> None:
+        """
+        Start or end the work session on task_id after its status changed to status.
+        
+        Moving a task to in_progress starts a session for the agent assigned to
+        its tree, which the SessionTimeoutMonitor then times out; done ends it,
+        cancelled ends it unsuccessfully. Trees without an agent get no sessions.
+        """
+        if status not in ("in_progress", "done", "cancelled"):
+            return
+        with self._project_store.project_lock(project_id):
+            if project_id not in self._projects:
+                return
+            project_entity = self._convert_to_project_entity(project_id)
+            session = project_entity.find_work_session(task_id)
+            agent_id = session.agent_id if session else project_entity.agent_assignments.get(tree_id)
+            agent = project_entity.registered_agents.get(agent_id)
+            if status == "in_progress":
+                if session is not None or agent is None:
+                    return
+                try:
+                    project_entity.start_work_session(agent_id, task_id, WORK_SESSION_MAX_HOURS)
+                except ValueError as e:
+                    logger.debug(f"No work session for task {task_id} in project {project_id}: {e}")
+                    return
+                if agent.is_available() and task_id not in agent.active_tasks:
+                    agent.start_task(task_id)
+            else:
+                if session is None:
+                    return
+                project_entity.end_work_session(session.id, success=status == "done")
+                if agent and task_id in agent.active_tasks:
+                    agent.complete_task(task_id, success=status == "done")
+            self._session_store.save(project_id, project_entity.active_work_sessions.values())
+            self._publish_change(project_id)
+
+    @_project_locked
     def sync_with_git(self, project_id: str) -> Dict[str, Any]:
         """Synchronize project task trees with actual git branches"""
         if project_id not in self._projects:
             return {"success": False, "error": f"Project {project_id} not found"}
         
-        import subprocess
-        import os
         from datetime import datetime
         
         try:
-            # Get current git branch
-            result = subprocess.run(['git', 'branch', '--show-current'], 
-                                  capture_output=True, text=True, cwd=os.getcwd())
-            if result.returncode != 0:
+            # Read current and local git branches
+            git_state = self._git_reader.read()
+            if git_state is None:
                 return {"success": False, "error": "Not in a git repository or git command failed"}
             
-            current_branch = result.stdout.strip()
-            
-            # Get all git branches (local only)
-            result = subprocess.run(['git', 'branch'], 
-                                  capture_output=True, text=True, cwd=os.getcwd())
-            if result.returncode != 0:
-                return {"success": False, "error": "Failed to get git branches"}
-            
-            # Parse git branches
-            git_branches = set()
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    branch = line.strip().replace('*', '').strip()
-                    if branch and not branch.startswith('('):  # Skip detached HEAD states
-                        git_branches.add(branch)
+            current_branch = git_state.current_branch
             
             # Always include 'main' as a valid branch
-            git_branches.add('main')
+            git_branches = set(git_state.branches) | {'main'}
             
             project = self._projects[project_id]
             task_trees = set(project.get("task_trees", {}).keys())
@@ -748,7 +1132,7 @@ class ProjectManager:
             project["current_branch"] = current_branch
             
             # Save changes
-            self._save_projects()
+            self._save_projects(project_id)
             
             return {
                 "success": True,
@@ -762,19 +1146,16 @@ class ProjectManager:
                 "message": f"Git sync completed. {len(sync_actions)} actions performed."
             }
             
-        except subprocess.CalledProcessError as e:
-            return {"success": False, "error": f"Git command failed: {e}"}
         except Exception as e:
             logging.error(f"Git sync failed for project {project_id}: {str(e)}")
             return {"success": False, "error": f"Git sync failed: {str(e)}"}
 
+    @_project_locked
     def cleanup_obsolete(self, project_id: str) -> Dict[str, Any]:
         """Clean up obsolete branches and orphaned data from project management system"""
         if project_id not in self._projects:
             return {"success": False, "error": f"Project {project_id} not found"}
         
-        import subprocess
-        import os
         from datetime import datetime
         
         try:
@@ -783,15 +1164,9 @@ class ProjectManager:
             
             # Get current git branches for reference
             try:
-                result = subprocess.run(['git', 'branch'], capture_output=True, text=True, cwd=os.getcwd())
-                if result.returncode == 0:
-                    git_branches = set()
-                    for line in result.stdout.split('\n'):
-                        if line.strip():
-                            branch = line.strip().replace('*', '').strip()
-                            if branch and not branch.startswith('('):
-                                git_branches.add(branch)
-                    git_branches.add('main')  # Always include main
+                git_state = self._git_reader.read()
+                if git_state is not None:
+                    git_branches = set(git_state.branches) | {'main'}  # Always include main
                 else:
                     # If git fails, assume only main exists
                     git_branches = {'main'}
@@ -881,7 +1256,7 @@ class ProjectManager:
             project["last_cleanup"] = datetime.now().isoformat()
             
             # Save changes
-            self._save_projects()
+            self._save_projects(project_id)
             
             # Calculate cleanup statistics
             cleanup_stats = {
@@ -908,16 +1283,14 @@ class ProjectManager:
             logging.error(f"Cleanup failed for project {project_id}: {str(e)}")
             return {"success": False, "error": f"Cleanup failed: {str(e)}"}
 
-    def rebalance_agents(self, project_id: str) -> Dict[str, Any]:
+    @_project_locked
+    def rebalance_agents(self, project_id: str, deep: bool = False) -> Dict[str, Any]:
         """Automatically redistribute agent assignments optimally across active task trees"""
         if project_id not in self._projects:
             return {"success": False, "error": f"Project {project_id} not found"}
         
-        import subprocess
-        import os
         import json
         from datetime import datetime
-        from collections import defaultdict
         
         try:
             project = self._projects[project_id]
@@ -926,15 +1299,9 @@ class ProjectManager:
             
             # 1. Get current git branches to identify active task trees
             try:
-                result = subprocess.run(['git', 'branch'], capture_output=True, text=True, cwd=os.getcwd())
-                if result.returncode == 0:
-                    git_branches = set()
-                    for line in result.stdout.split('\n'):
-                        if line.strip():
-                            branch = line.strip().replace('*', '').strip()
-                            if branch and not branch.startswith('('):
-                                git_branches.add(branch)
-                    git_branches.add('main')  # Always include main
+                git_state = self._git_reader.read()
+                if git_state is not None:
+                    git_branches = set(git_state.branches) | {'main'}  # Always include main
                 else:
                     git_branches = {'main'}
                     warnings.append("Git command failed - assuming only 'main' branch exists")
@@ -957,28 +1324,18 @@ class ProjectManager:
             
             for tree_id in active_trees:
                 try:
-                    tasks_file_path = self.path_resolver.get_tasks_json_path(project_id, tree_id, "default_id")
+                    # Count tasks by status and priority from the tree's materialized statistics
+                    stats = self._tree_stats(project_id, tree_id, deep)
+                    high_priority = stats.todo_high_priority
+                    total_todo = stats.count("todo")
                     
-                    if os.path.exists(tasks_file_path):
-                        with open(tasks_file_path, 'r') as f:
-                            tasks_data = json.load(f)
-                            tasks = tasks_data.get("tasks", [])
-                            
-                            # Count tasks by status and priority
-                            todo_tasks = [t for t in tasks if t.get("status") == "todo"]
-                            high_priority = len([t for t in todo_tasks if t.get("priority") in ["urgent", "critical", "high"]])
-                            total_todo = len(todo_tasks)
-                            
-                            tree_task_counts[tree_id] = total_todo
-                            tree_workloads[tree_id] = {
-                                "total_tasks": len(tasks),
-                                "todo_tasks": total_todo,
-                                "high_priority_tasks": high_priority,
-                                "workload_score": high_priority * 3 + total_todo  # Weight high priority more
-                            }
-                    else:
-                        tree_task_counts[tree_id] = 0
-                        tree_workloads[tree_id] = {"total_tasks": 0, "todo_tasks": 0, "high_priority_tasks": 0, "workload_score": 0}
+                    tree_task_counts[tree_id] = total_todo
+                    tree_workloads[tree_id] = {
+                        "total_tasks": stats.total_tasks,
+                        "todo_tasks": total_todo,
+                        "high_priority_tasks": high_priority,
+                        "workload_score": high_priority * 3 + total_todo  # Weight high priority more
+                    }
                 except Exception as e:
                     warnings.append(f"Could not analyze tasks in tree {tree_id}: {str(e)}")
                     tree_task_counts[tree_id] = 0
@@ -1023,108 +1380,85 @@ class ProjectManager:
                     agents_reassigned.append(f"Agent {agent_id} removed from inactive tree: {assigned_trees}")
                     rebalancing_actions.append(f"Removed agent {agent_id} from inactive tree: {assigned_trees}")
             
-            # 7. Calculate optimal agent distribution
+            # 7. Solve the agent distribution over trees with work globally
             total_workload = sum(w["workload_score"] for w in tree_workloads.values())
             available_agents = list(registered_agents.keys())
+            reassignment_moves = []
             
             if total_workload > 0 and available_agents:
-                # Calculate target assignments based on workload
-                optimal_assignments = defaultdict(list)
-                
-                # Sort trees by workload (descending)
-                sorted_trees = sorted(tree_workloads.items(), key=lambda x: x[1]["workload_score"], reverse=True)
+                # Busiest trees first, so ties are broken in their favour
+                trees_with_work = [
+                    tree_id for tree_id, workload_data in
+                    sorted(tree_workloads.items(), key=lambda x: x[1]["workload_score"], reverse=True)
+                    if workload_data["workload_score"] > 0
+                ]
+                current_holders = {
+                    tree_id: [
+                        agent_id for agent_id, trees in current_assignments.items()
+                        if (tree_id in trees if isinstance(trees, list) else trees == tree_id)
+                    ]
+                    for tree_id in trees_with_work
+                }
                 
-                # Assign agents to trees based on workload and expertise
-                agent_index = 0
-                for tree_id, workload_data in sorted_trees:
-                    if workload_data["workload_score"] > 0:  # Only assign to trees with work
-                        # Find best matching agent based on expertise
-                        best_agent = None
-                        best_score = -1
+                scores = []
+                for tree_id in trees_with_work:
+                    row = []
+                    for agent_id in available_agents:
+                        expertise = agent_expertise.get(agent_id, ["general"])
                         
-                        for agent_id in available_agents:
-                            # Calculate matching score
-                            expertise = agent_expertise.get(agent_id, ["general"])
-                            
-                            # Tree-specific expertise matching
-                            tree_score = 0
-                            if "main" in tree_id.lower():
-                                tree_score += 2  # Main branch gets priority
-                            if any(exp in ["coding", "development"] for exp in expertise):
-                                tree_score += 3  # Coding agents are versatile
-                            if any(exp in ["management", "orchestrator"] for exp in expertise):
-                                tree_score += 2  # Management agents can handle coordination
-                            
-                            # Consider current workload
-                            current_trees = current_assignments.get(agent_id, [])
-                            current_load = len(current_trees) if isinstance(current_trees, list) else (1 if current_trees else 0)
-                            load_penalty = current_load * 0.5  # Prefer less loaded agents
-                            
-                            final_score = tree_score - load_penalty
-                            
-                            if final_score > best_score:
-                                best_score = final_score
-                                best_agent = agent_id
-                        
-                        # Assign best matching agent
-                        if best_agent:
-                            optimal_assignments[best_agent].append(tree_id)
+                        # Tree-specific expertise matching
+                        tree_score = 1.0
+                        if "main" in tree_id.lower():
+                            tree_score += 2  # Main branch gets priority
+                        if "coding" in expertise:
+                            tree_score += 3  # Coding agents are versatile
+                        if "management" in expertise:
+                            tree_score += 2  # Management agents can handle coordination
+                        if agent_id in current_holders[tree_id]:
+                            tree_score += KEEP_ASSIGNMENT_BONUS  # Only move agents when needed
+                        row.append(tree_score)
+                    scores.append(row)
+                
+                # Every tree gets an agent, even when that exceeds an agent's usual capacity
+                min_capacity = -(-len(trees_with_work) // len(available_agents))
+                capacities = [
+                    max(registered_agents[agent_id].get("max_concurrent_tasks", DEFAULT_AGENT_CAPACITY), min_capacity)
+                    if isinstance(registered_agents[agent_id], dict) else min_capacity
+                    for agent_id in available_agents
+                ]
+                solution = assign_with_capacity(scores, capacities, [0.5] * len(available_agents))  # Prefer less loaded agents
                 
-                # 8. Apply optimal assignments
-                assignment_changes = []
-                for agent_id in available_agents:
+                # 8. Apply the moves that differ from the current assignments
+                for tree_index, agent_index in solution.items():
+                    tree_id = trees_with_work[tree_index]
+                    agent_id = available_agents[agent_index]
+                    previous_agents = current_holders[tree_id]
+                    if agent_id in previous_agents:
+                        continue
+                    
+                    for previous_agent in previous_agents:
+                        trees = current_assignments[previous_agent]
+                        remaining = [tree for tree in trees if tree != tree_id] if isinstance(trees, list) else []
+                        if remaining:
+                            current_assignments[previous_agent] = remaining
+                        else:
+                            del current_assignments[previous_agent]
+                    
                     current_trees = current_assignments.get(agent_id, [])
                     if not isinstance(current_trees, list):
                         current_trees = [current_trees] if current_trees else []
+                    current_assignments[agent_id] = current_trees + [tree_id]
                     
-                    optimal_trees = optimal_assignments.get(agent_id, [])
-                    
-                    # Add missing assignments
-                    for tree_id in optimal_trees:
-                        if tree_id not in current_trees:
-                            current_trees.append(tree_id)
-                            assignment_changes.append(f"Assigned agent {agent_id} to tree {tree_id}")
-                            rebalancing_actions.append(f"Assigned agent {agent_id} to tree {tree_id} (workload: {tree_workloads[tree_id]['workload_score']})")
-                    
-                    # Update assignments
-                    if current_trees:
-                        current_assignments[agent_id] = current_trees
-                    elif agent_id in current_assignments:
-                        del current_assignments[agent_id]
-                
-                # Ensure every active tree has at least one agent
-                unassigned_trees = []
-                for tree_id in active_trees:
-                    assigned = False
-                    for agent_id, trees in current_assignments.items():
-                        if isinstance(trees, list) and tree_id in trees:
-                            assigned = True
-                            break
-                        elif trees == tree_id:
-                            assigned = True
-                            break
-                    
-                    if not assigned and tree_workloads[tree_id]["workload_score"] > 0:
-                        # Assign to least loaded agent
-                        min_load = float('inf')
-                        best_agent = None
-                        for agent_id in available_agents:
-                            current_trees = current_assignments.get(agent_id, [])
-                            load = len(current_trees) if isinstance(current_trees, list) else (1 if current_trees else 0)
-                            if load < min_load:
-                                min_load = load
-                                best_agent = agent_id
-                        
-                        if best_agent:
-                            if best_agent not in current_assignments:
-                                current_assignments[best_agent] = []
-                            if isinstance(current_assignments[best_agent], list):
-                                current_assignments[best_agent].append(tree_id)
-                            else:
-                                current_assignments[best_agent] = [current_assignments[best_agent], tree_id]
-                            
-                            unassigned_trees.append(tree_id)
-                            rebalancing_actions.append(f"Assigned agent {best_agent} to unassigned tree {tree_id}")
+                    reassignment_moves.append({
+                        "tree_id": tree_id,
+                        "from_agents": previous_agents,
+                        "to_agent": agent_id
+                    })
+                    replaced = f", replacing {previous_agents}" if previous_agents else ""
+                    rebalancing_actions.append(
+                        f"Assigned agent {agent_id} to tree {tree_id} "
+                        f"(workload: {tree_workloads[tree_id]['workload_score']}){replaced}"
+                    )
             
             # 9. Update project data
             project["agent_assignments"] = current_assignments
@@ -1132,7 +1466,7 @@ class ProjectManager:
             project["last_rebalance"] = datetime.now().isoformat()
             
             # Save changes
-            self._save_projects()
+            self._save_projects(project_id)
             
             # 10. Generate rebalancing report
             final_assignments = {}
@@ -1171,6 +1505,7 @@ class ProjectManager:
                     "average_trees_per_agent": sum(len(trees) for trees in final_assignments.values()) / len(registered_agents) if registered_agents else 0
                 },
                 "rebalancing_actions": rebalancing_actions,
+                "reassignment_moves": reassignment_moves,
                 "final_assignments": final_assignments,
                 "warnings": warnings,
                 "recommendations": [
@@ -1186,7 +1521,8 @@ class ProjectManager:
             logging.error(f"Agent rebalancing failed for project {project_id}: {str(e)}")
             return {"success": False, "error": f"Agent rebalancing failed: {str(e)}"}
 
-    def validate_integrity(self, project_id: str) -> Dict[str, Any]:
+    @_project_locked
+    def validate_integrity(self, project_id: str, deep: bool = False) -> Dict[str, Any]:
         """Validate and fix data consistency issues between dashboard metrics and actual task data"""
         if project_id not in self._projects:
             return {"success": False, "error": f"Project {project_id} not found"}
@@ -1211,19 +1547,16 @@ class ProjectManager:
                     tasks_file_path = self.path_resolver.get_tasks_json_path(project_id, tree_id, "default_id")
                     
                     if os.path.exists(tasks_file_path):
-                        with open(tasks_file_path, 'r') as f:
-                            tasks_data = json.load(f)
-                            tasks = tasks_data.get("tasks", [])
-                            actual_task_counts[tree_id] = len(tasks)
-                            
-                            # Validate task data structure
-                            for i, task in enumerate(tasks):
-                                if not isinstance(task, dict):
-                                    validation_issues.append(f"Tree {tree_id}: Task {i} is not a valid object")
-                                elif not task.get("id"):
-                                    validation_issues.append(f"Tree {tree_id}: Task {i} missing required 'id' field")
-                                elif not task.get("title"):
-                                    validation_issues.append(f"Tree {tree_id}: Task {task.get('id', i)} missing required 'title' field")
+                        stats = get_task_stats_view().get(tasks_file_path, deep=deep)
+                        actual_task_counts[tree_id] = stats.total_tasks
+                        
+                        # Validate task data structure and dependencies
+                        for violation in stats.schema_violations:
+                            validation_issues.append(f"Tree {tree_id}: {violation}")
+                        for orphan in stats.orphaned_dependencies:
+                            validation_issues.append(
+                                f"Tree {tree_id}: Task {orphan['task_id']} depends on missing task {orphan['dependency_id']}"
+                            )
                     else:
                         actual_task_counts[tree_id] = 0
                         warnings.append(f"Task file not found for tree {tree_id}, creating empty structure")
@@ -1256,7 +1589,8 @@ class ProjectManager:
                     dashboard_trees = dashboard_data.get("trees", {})
                     
                     for tree_id, actual_count in actual_task_counts.items():
-                        dashboard_count = dashboard_trees.get(tree_id, {}).get("total_tasks", 0)
+                        # Top-level tasks on both sides, see project_health_check
+                        dashboard_count = dashboard_trees.get(tree_id, {}).get("root_tasks", 0)
                         
                         if dashboard_count != actual_count:
                             validation_issues.append(
@@ -1377,7 +1711,7 @@ class ProjectManager:
             
             # Save changes if any fixes were applied
             if fixes_applied:
-                self._save_projects()
+                self._save_projects(project_id)
             
             # Calculate integrity score
             total_checks = len(task_trees) + len(registered_agents) + len(agent_assignments) + 5  # +5 for metadata checks
@@ -1445,7 +1779,8 @@ class ToolConfig:
             "update_auto_rule": False,
             "validate_rules": False, 
             "regenerate_auto_rule": False, 
-            "validate_tasks_json": False
+            "validate_tasks_json": False,
+            "batch": True
         },
         "debug_mode": False, 
         "tool_logging": False
@@ -1500,6 +1835,7 @@ class TaskOperationHandler:
         self._auto_rule_generator = auto_rule_generator
         self._project_manager = project_manager
     
+    @_task_project_locked
     def handle_core_operations(self, action, project_id, task_tree_id, user_id, task_id, title, description, status, priority, details, estimated_effort, assignees, labels, due_date, force_full_generation=False):
         """Handle core CRUD operations for tasks with hierarchical storage"""
         logger.debug(f"Handling task action '{action}' with task_id '{task_id}' in project '{project_id}' tree '{task_tree_id}'")
@@ -1525,7 +1861,10 @@ class TaskOperationHandler:
             if action == "create":
                 return self._create_task(task_app_service, title, description, project_id, status, priority, details, estimated_effort, assignees, labels, due_date)
             elif action == "update":
-                return self._update_task(task_app_service, task_id, title, description, status, priority, details, estimated_effort, assignees, labels, due_date)
+                result = self._update_task(task_app_service, task_id, title, description, status, priority, details, estimated_effort, assignees, labels, due_date)
+                if result.get("success") and status:
+                    self._project_manager.track_work_session(project_id, task_tree_id, str(task_id), status)
+                return result
             elif action == "get":
                 task_response = task_app_service.get_task(task_id, generate_rules=True, force_full_generation=force_full_generation)
                 if task_response:
@@ -1539,7 +1878,10 @@ class TaskOperationHandler:
                 else:
                     return {"success": False, "action": "delete", "error": f"Task with ID {task_id} not found."}
             elif action == "complete":
-                return self._complete_task(task_app_service, task_id)
+                result = self._complete_task(task_app_service, task_id)
+                if result.get("success"):
+                    self._project_manager.track_work_session(project_id, task_tree_id, str(task_id), "done")
+                return result
             else:
                 return {"success": False, "error": f"Invalid core action: {action}"}
         except TaskNotFoundError as e:
@@ -1563,6 +1905,7 @@ class TaskOperationHandler:
         task_trees = project.get("task_trees", {})
         return task_tree_id in task_trees
     
+    @_task_project_locked
     def handle_list_search_next(self, action, project_id, task_tree_id, user_id, status, priority, assignees, labels, limit, query):
         """Handle list, search, and next actions with hierarchical storage"""
         # Validate project and task tree exist
@@ -1585,6 +1928,28 @@ class TaskOperationHandler:
         else:
             return {"success": False, "error": "Invalid action for list/search/next"}
     
+    @_task_project_locked
+    def handle_changes_since(self, project_id, task_tree_id, user_id, since=0):
+        """Handle delta sync: tasks created, updated or deleted after change sequence since"""
+        # Validate project and task tree exist
+        if not self._validate_project_tree(project_id, task_tree_id):
+            return {"success": False, "error": f"Project '{project_id}' or task tree '{task_tree_id}' not found"}
+
+        try:
+            repository = self._repository_factory.create_repository(project_id, task_tree_id, user_id)
+            changes = repository.changes_since(int(since or 0))
+        except Exception as e:
+            return {"success": False, "error": f"Failed to read task changes: {str(e)}"}
+
+        return {
+            "success": True,
+            "action": "changes_since",
+            "project_id": project_id,
+            "task_tree_id": task_tree_id,
+            **changes,
+        }
+
+    @_task_project_locked
     def handle_dependency_operations(self, action, task_id, project_id, task_tree_id, user_id, dependency_data=None):
         """Handle dependency operations (add, remove, get, clear, get_blocking) with hierarchical storage"""
         if not task_id:
@@ -1628,6 +1993,7 @@ class TaskOperationHandler:
         except Exception as e:
             return {"success": False, "error": f"Dependency operation failed: {str(e)}"}
     
+    @_task_project_locked
     def handle_subtask_operations(self, action, task_id, subtask_data=None, project_id=None, task_tree_id="main", user_id="default_id"):
         """Handle subtask operations"""
         logging.info(f"Subtask operation action: {action}, task_id: {task_id}, subtask_data: {subtask_data}")
@@ -1891,6 +2257,7 @@ class ToolRegistrationOrchestrator:
         self._register_task_tools(mcp)
         self._register_agent_tools(mcp)
         self._register_cursor_tools(mcp)
+        self._register_batch_tool(mcp)
         
         logger.info("Finished registering all tools.")
     
@@ -1905,18 +2272,28 @@ class ToolRegistrationOrchestrator:
             status = "ENABLED" if enabled else "DISABLED"
             logger.info(f"  - {tool_name}: {status}")
     
+    def _register_batch_tool(self, mcp: "FastMCP"):
+        """Register the batch tool, which runs several tool calls in one request"""
+        if self._config.is_enabled(BATCH_TOOL_NAME):
+            add_batch_tool(mcp)
+    
     def _register_project_tools(self, mcp: "FastMCP"):
         """Register project management tools"""
         if self._config.is_enabled("manage_project"):
-            @mcp.tool()
+            from fastmcp.server.context import Context
+            
+            @mcp.tool(worker_pool=TASK_MANAGEMENT_WORKER_POOL)
             def manage_project(
-                action: Annotated[str, Field(description="Project action to perform. Available: create, get, list, update, create_tree, get_tree_status, orchestrate, dashboard, project_health_check, sync_with_git, cleanup_obsolete, validate_integrity, rebalance_agents")],
+                action: Annotated[str, Field(description="Project action to perform. Available: create, get, list, update, create_tree, get_tree_status, orchestrate, dashboard, dashboard_summary, forecast, project_health_check, sync_with_git, cleanup_obsolete, validate_integrity, rebalance_agents")],
                 project_id: Annotated[str, Field(description="Unique project identifier")] = None,
                 name: Annotated[str, Field(description="Project name (required for create action, optional for update action)")] = None,
                 description: Annotated[str, Field(description="Project description (optional for create and update actions)")] = None,
                 tree_id: Annotated[str, Field(description="Task tree identifier (required for tree operations)")] = None,
                 tree_name: Annotated[str, Field(description="Task tree name (required for create_tree action)")] = None,
-                tree_description: Annotated[str, Field(description="Task tree description (optional for create_tree action)")] = None
+                tree_description: Annotated[str, Field(description="Task tree description (optional for create_tree action)")] = None,
+                deep: Annotated[bool, Field(description="Re-read every tasks.json instead of using the materialized statistics (dashboard_summary, project_health_check, validate_integrity, rebalance_agents)")] = False,
+                simulations: Annotated[int, Field(description="Number of simulated schedules (forecast action)")] = None,
+                ctx: Context = None
             ) -> Dict[str, Any]:
                 """🚀 PROJECT LIFECYCLE MANAGER - Multi-agent project orchestration and management
 
@@ -1932,6 +2309,8 @@ class ToolRegistrationOrchestrator:
 • get_tree_status: Check task tree completion status
 • orchestrate: Execute multi-agent project workflow
 • dashboard: View comprehensive project analytics
+• dashboard_summary: Task statistics of every tree in every project, with progress notifications
+• forecast: P50/P90 completion dates per tree and for the project from simulated schedules
 • project_health_check: Comprehensive project health analysis with data integrity validation
 • sync_with_git: Synchronize task trees with actual git branches (removes obsolete, adds missing)
 • cleanup_obsolete: Clean up orphaned data and remove obsolete references from project
@@ -1942,10 +2321,12 @@ class ToolRegistrationOrchestrator:
 • manage_project("create", project_id="web_app", name="E-commerce Website")
 • manage_project("orchestrate", project_id="web_app")
 • manage_project("dashboard", project_id="web_app")
+• manage_project("dashboard_summary")
+• manage_project("forecast", project_id="web_app", simulations=5000)
 • manage_project("project_health_check", project_id="web_app")
 • manage_project("sync_with_git", project_id="web_app")
 • manage_project("cleanup_obsolete", project_id="web_app")
-• manage_project("validate_integrity", project_id="web_app")
+• manage_project("validate_integrity", project_id="web_app", deep=True)
 • manage_project("rebalance_agents", project_id="web_app")
 
 🔧 INTEGRATION: Coordinates with task management and agent assignment systems
@@ -1989,10 +2370,22 @@ class ToolRegistrationOrchestrator:
                         return {"success": False, "error": "project_id is required"}
                     return self._project_manager.get_orchestration_dashboard(project_id)
                     
+                elif action == "dashboard_summary":
+                    # Runs in a pool worker; the summary itself awaits on the event loop
+                    return anyio.from_thread.run(partial(
+                        self._project_manager.dashboard_summary,
+                        deep=bool(deep), report_progress=ctx.report_progress if ctx else None,
+                    ))
+                    
+                elif action == "forecast":
+                    if not project_id:
+                        return {"success": False, "error": "project_id is required"}
+                    return self._project_manager.forecast(project_id, simulations or DEFAULT_FORECAST_SIMULATIONS)
+                    
                 elif action == "project_health_check":
                     if not project_id:
                         return {"success": False, "error": "project_id is required"}
-                    return self._project_manager.project_health_check(project_id)
+                    return self._project_manager.project_health_check(project_id, deep=bool(deep))
                     
                 elif action == "sync_with_git":
                     if not project_id:
@@ -2007,15 +2400,15 @@ class ToolRegistrationOrchestrator:
                 elif action == "validate_integrity":
                     if not project_id:
                         return {"success": False, "error": "project_id is required"}
-                    return self._project_manager.validate_integrity(project_id)
+                    return self._project_manager.validate_integrity(project_id, deep=bool(deep))
                     
                 elif action == "rebalance_agents":
                     if not project_id:
                         return {"success": False, "error": "project_id is required"}
-                    return self._project_manager.rebalance_agents(project_id)
+                    return self._project_manager.rebalance_agents(project_id, deep=bool(deep))
                     
                 else:
-                    return {"success": False, "error": f"Unknown action: {action}. Available: create, get, list, update, create_tree, get_tree_status, orchestrate, dashboard, project_health_check, sync_with_git, cleanup_obsolete, validate_integrity, rebalance_agents"}
+                    return {"success": False, "error": f"Unknown action: {action}. Available: create, get, list, update, create_tree, get_tree_status, orchestrate, dashboard, dashboard_summary, forecast, project_health_check, sync_with_git, cleanup_obsolete, validate_integrity, rebalance_agents"}
 
             logger.info("Registered manage_project tool")
         else:
@@ -2024,9 +2417,9 @@ class ToolRegistrationOrchestrator:
     def _register_task_tools(self, mcp: "FastMCP"):
         """Register task management tools"""
         if self._config.is_enabled("manage_task"):
-            @mcp.tool()
+            @mcp.tool(worker_pool=TASK_MANAGEMENT_WORKER_POOL)
             def manage_task(
-                action: Annotated[str, Field(description="Task action to perform. Available: create, get, update, delete, complete, list, search, next, add_dependency, remove_dependency")],
+                action: Annotated[str, Field(description="Task action to perform. Available: create, get, update, delete, complete, list, search, next, changes_since, add_dependency, remove_dependency")],
                 project_id: Annotated[str, Field(description="Project identifier (REQUIRED for all operations)")] = None,
                 task_tree_id: Annotated[str, Field(description="Task tree identifier (defaults to 'main')")] = "main",
                 user_id: Annotated[str, Field(description="User identifier (defaults to 'default_id')")] = "default_id",
@@ -2043,6 +2436,7 @@ class ToolRegistrationOrchestrator:
                 dependency_data: Annotated[Dict[str, Any], Field(description="Dependency data containing 'dependency_id' for dependency operations")] = None,
                 query: Annotated[str, Field(description="Search query string for search action")] = None,
                 limit: Annotated[int, Field(description="Maximum number of results to return for list/search actions")] = None,
+                since: Annotated[int, Field(description="Last change sequence seen by the client for changes_since action (0 for a full snapshot)")] = 0,
                 force_full_generation: Annotated[bool, Field(description="Force full auto-rule generation even if task context exists")] = False
             ) -> Dict[str, Any]:
                 """📝 UNIFIED TASK MANAGER - Complete task lifecycle and dependency management
@@ -2059,6 +2453,7 @@ class ToolRegistrationOrchestrator:
 • list: Show tasks with filtering options
 • search: Find tasks by content/keywords
 • next: Get next priority task to work on
+• changes_since: Tasks created/updated/deleted after a change sequence (delta sync)
 • add_dependency: Link task dependencies
 • remove_dependency: Remove task dependencies
 
@@ -2067,6 +2462,7 @@ class ToolRegistrationOrchestrator:
 • manage_task("update", project_id="my_project", task_id="123", status="in_progress")
 • manage_task("list", project_id="my_project") - List tasks in project
 • manage_task("next", project_id="my_project") - Get next task to work on
+• manage_task("changes_since", project_id="my_project", since=42) - Sync only what changed
 
 🔧 INTEGRATION: Auto-generates context rules and coordinates with agent assignment
 📋 HIERARCHICAL STORAGE: Tasks stored at .cursor/rules/tasks/{user_id}/{project_id}/{task_tree_id}/tasks.json
@@ -2098,6 +2494,11 @@ class ToolRegistrationOrchestrator:
                         labels=labels, limit=limit, query=query
                     )
 
+                elif action == "changes_since":
+                    return self._task_handler.handle_changes_since(
+                        project_id=project_id, task_tree_id=task_tree_id, user_id=user_id, since=since
+                    )
+
                 elif action in dependency_actions:
                     return self._task_handler.handle_dependency_operations(
                         action=action, task_id=task_id, project_id=project_id, 
@@ -2112,7 +2513,7 @@ class ToolRegistrationOrchestrator:
             logger.info("Skipped manage_task tool (disabled)")
 
         if self._config.is_enabled("manage_subtask"):
-            @mcp.tool()
+            @mcp.tool(worker_pool=TASK_MANAGEMENT_WORKER_POOL)
             def manage_subtask(
                 action: Annotated[str, Field(description="Subtask action to perform. Available: add, complete, list, update, remove")],
                 task_id: Annotated[str, Field(description="Parent task identifier (required for all subtask operations)")] = None,
@@ -2160,7 +2561,7 @@ class ToolRegistrationOrchestrator:
     def _register_agent_tools(self, mcp: "FastMCP"):
         """Register agent management tools"""
         if self._config.is_enabled("manage_agent"):
-            @mcp.tool()
+            @mcp.tool(worker_pool=TASK_MANAGEMENT_WORKER_POOL)
             def manage_agent(
                 action: Annotated[str, Field(description="Agent action to perform. Available: register, assign, get, list, get_assignments, unassign, update, unregister, rebalance")],
                 project_id: Annotated[str, Field(description="Project identifier (required for most agent operations)")] = None,
@@ -2258,45 +2659,13 @@ class ToolRegistrationOrchestrator:
                     if not project_id or not agent_id:
                         return {"success": False, "error": "project_id and agent_id are required"}
                     
-                    project_response = self._project_manager.get_project(project_id)
-                    if not project_response.get("success"):
-                        return project_response
-                    
-                    agents = project_response.get("project", {}).get("registered_agents", {})
-                    if agent_id not in agents:
-                        return {"success": False, "error": f"Agent {agent_id} not found in project {project_id}"}
-                    
-                    agent_data = agents[agent_id]
-                    if name:
-                        agent_data["name"] = name
-                    if call_agent:
-                        agent_data["call_agent"] = call_agent
-                    
-                    self._project_manager._save_projects()
-                    return {"success": True, "agent": agent_data}
+                    return self._project_manager.update_agent(project_id, agent_id, name=name, call_agent=call_agent)
                     
                 elif action == "unregister":
                     if not project_id or not agent_id:
                         return {"success": False, "error": "project_id and agent_id are required"}
                     
-                    project_response = self._project_manager.get_project(project_id)
-                    if not project_response.get("success"):
-                        return project_response
-                    
-                    project_data = project_response.get("project", {})
-                    agents = project_data.get("registered_agents", {})
-                    
-                    if agent_id not in agents:
-                        return {"success": False, "error": f"Agent {agent_id} not found in project {project_id}"}
-                    
-                    removed_agent = agents.pop(agent_id)
-                    
-                    assignments = project_data.get("agent_assignments", {})
-                    assignments = {k: v for k, v in assignments.items() if v != agent_id}
-                    project_data["agent_assignments"] = assignments
-                    
-                    self._project_manager._save_projects()
-                    return {"success": True, "message": f"Agent {agent_id} unregistered", "removed_agent": removed_agent}
+                    return self._project_manager.unregister_agent(project_id, agent_id)
                     
                 elif action == "rebalance":
                     if not project_id:
@@ -2311,7 +2680,7 @@ class ToolRegistrationOrchestrator:
             logger.info("Skipped manage_agent tool (disabled)")
 
         if self._config.is_enabled("call_agent"):
-            @mcp.tool()
+            @mcp.tool(worker_pool=TASK_MANAGEMENT_WORKER_POOL)
             def call_agent(
                 name_agent: Annotated[str, Field(description="Agent name with '_agent' suffix (e.g., 'coding_agent', 'devops_agent', 'system_architect_agent'). Use exact agent directory name from yaml-lib folder.")]
             ) -> Dict[str, Any]:
@@ -2410,7 +2779,8 @@ expertise, behavioral rules, and specialized knowledge for optimal task performa
     
     def _register_manage_rule_tool(self, mcp: "FastMCP", cursor_tools):
         """Register only the manage_rule tool"""
-        @mcp.tool()
+        @mcp.tool(worker_pool=TASK_MANAGEMENT_WORKER_POOL)
+        @rule_files_locked
         def manage_rule(
             action: str,
             target: Optional[str] = None,
@@ -2509,6 +2879,61 @@ expertise, behavioral rules, and specialized knowledge for optimal task performa
 # 🏗️ MAIN CONSOLIDATED TOOLS CLASS
 # ═══════════════════════════════════════════════════════════════════
 
+# Tool actions that only read; any other action is treated as a write.
+# manage_task "get" is not cached because it regenerates auto_rule.mdc.
+TASK_READ_ACTIONS = {"get", "list", "search", "next", "changes_since"}
+TASK_CACHED_ACTIONS = {"list", "search"}
+SUBTASK_READ_ACTIONS = {"list"}
+PROJECT_READ_ACTIONS = {"get", "list", "get_tree_status", "dashboard", "dashboard_summary", "forecast", "project_health_check", "validate_integrity"}
+PROJECT_CACHED_ACTIONS = {"get", "list"}
+AGENT_READ_ACTIONS = {"get", "list", "get_assignments"}
+
+
+def _project_cache_tag(project_id: Optional[str]) -> str:
+    """Response cache tag of every read of one project's data, its task trees included"""
+    return f"project:{project_id}"
+
+
+def _tree_cache_tag(arguments: Dict[str, Any], default_project: Optional[str] = None) -> str:
+    """Response cache tag of the task tree a call reads or writes"""
+    user_id = arguments.get("user_id") or "default_id"
+    project_id = arguments.get("project_id") or default_project
+    return f"tasks:{user_id}/{project_id}/{arguments.get('task_tree_id') or 'main'}"
+
+
+def task_management_cache_policies() -> Dict[str, CachePolicy]:
+    """
+    Response cache policies of the task management tools.
+
+    Task reads are tagged with their tree and project, project reads with
+    "projects"; a write evicts the tags it can make stale. ProjectManager
+    publishes the tags of changes made outside these tools, such as timed
+    out work sessions. Agent definitions only change on disk, so call_agent
+    results simply expire.
+    """
+    return {
+        "manage_task": CachePolicy(
+            cacheable=lambda args: args.get("action") in TASK_CACHED_ACTIONS,
+            tags=lambda args: [_tree_cache_tag(args), _project_cache_tag(args.get("project_id"))],
+            invalidates=lambda args: [] if args.get("action") in TASK_READ_ACTIONS else [_tree_cache_tag(args), "projects"],
+        ),
+        "manage_subtask": CachePolicy(
+            cacheable=lambda args: False,
+            invalidates=lambda args: [] if args.get("action") in SUBTASK_READ_ACTIONS else [_tree_cache_tag(args, "default_project"), "projects"],
+        ),
+        "manage_project": CachePolicy(
+            cacheable=lambda args: args.get("action") in PROJECT_CACHED_ACTIONS,
+            tags=lambda args: ["projects"],
+            invalidates=lambda args: [] if args.get("action") in PROJECT_READ_ACTIONS else ["projects"],
+        ),
+        "manage_agent": CachePolicy(
+            cacheable=lambda args: False,
+            invalidates=lambda args: [] if args.get("action") in AGENT_READ_ACTIONS else ["projects"],
+        ),
+        "call_agent": CachePolicy(tags=lambda args: ["agents"]),
+    }
+
+
 class ConsolidatedMCPTools:
     """Main MCP tools interface with clean architecture and separated concerns"""
     
@@ -2540,12 +2965,26 @@ class ConsolidatedMCPTools:
         self._tool_orchestrator = ToolRegistrationOrchestrator(
             self._config, self._task_handler, self._project_manager, self._call_agent_use_case
         )
+        configure_worker_pool(
+            TASK_MANAGEMENT_WORKER_POOL,
+            int(os.environ.get("DHAFNCK_TASK_WORKER_THREADS", TASK_MANAGEMENT_WORKER_THREADS)),
+            abandon_on_cancel=False,
+        )
+        self.response_cache = ResponseCacheMiddleware(
+            policies=task_management_cache_policies(), ttl=RESPONSE_CACHE_TTL
+        )
+        self._project_manager.add_change_listener(self.response_cache.invalidate_tags)
+        self.session_timeout_monitor = SessionTimeoutMonitor(
+            self._project_manager, worker_pool=TASK_MANAGEMENT_WORKER_POOL
+        )
         
         logger.info("ConsolidatedMCPTools initialized successfully with hierarchical storage.")
     
     def register_tools(self, mcp: "FastMCP"):
         """Register all consolidated MCP tools using the orchestrator"""
         self._tool_orchestrator.register_all_tools(mcp)
+        if self.response_cache not in mcp.middleware:
+            mcp.add_middleware(self.response_cache)
     
     def manage_subtask(self, action: str, task_id: str, subtask_data: Dict[str, Any] = None, project_id: str = None, task_tree_id: str = "main", user_id: str = "default_id") -> Dict[str, Any]:
         """Manage subtask operations - delegates to task handler"""
@@ -2674,30 +3113,31 @@ class SimpleMultiAgentTools:
     
     def orchestrate_project(self, project_id: str) -> Dict[str, Any]:
         """Orchestrate project workload"""
-        # Check if project exists first
-        if project_id not in self._projects:
-            return {"success": False, "error": f"Project {project_id} not found"}
+        with self._project_manager._project_store.project_lock(project_id):
+            # Check if project exists first
+            if project_id not in self._projects:
+                return {"success": False, "error": f"Project {project_id} not found"}
         
-        try:
-            # Convert simplified project data to domain entities
-            project_entity = self._project_manager._convert_to_project_entity(project_id)
+            try:
+                # Convert simplified project data to domain entities
+                project_entity = self._project_manager._convert_to_project_entity(project_id)
             
-            # Run orchestration using project manager's orchestrator (for test mocking)
-            orchestration_result = self._project_manager._orchestrator.orchestrate_project(project_entity)
+                # Run orchestration using project manager's orchestrator (for test mocking)
+                orchestration_result = self._project_manager._orchestrator.orchestrate_project(project_entity)
             
-            # Update the simplified project data with any new assignments
-            self._project_manager._update_project_from_entity(project_id, project_entity)
+                # Update the simplified project data with any new assignments
+                self._project_manager._update_project_from_entity(project_id, project_entity)
             
-            return {
-                "success": True, 
-                "message": "Project orchestration completed",
-                "orchestration_result": orchestration_result
-            }
-        except Exception as e:
-            return {
-                "success": False, 
-                "error": f"Orchestration failed: {str(e)}"
-            }
+                return {
+                    "success": True, 
+                    "message": "Project orchestration completed",
+                    "orchestration_result": orchestration_result
+                }
+            except Exception as e:
+                return {
+                    "success": False, 
+                    "error": f"Orchestration failed: {str(e)}"
+                }
     
     def get_orchestration_dashboard(self, project_id: str) -> Dict[str, Any]:
         """Get orchestration dashboard"""
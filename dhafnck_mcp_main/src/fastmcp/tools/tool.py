@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 import pydantic_core
 from mcp.types import TextContent, ToolAnnotations
 from mcp.types import Tool as MCPTool
-from pydantic import Field
+from pydantic import Field, PrivateAttr, TypeAdapter
 
 import fastmcp
 from fastmcp.server.dependencies import get_context
@@ -24,6 +24,7 @@ from fastmcp.utilities.types import (
     find_kwarg_by_type,
     get_cached_typeadapter,
 )
+from fastmcp.utilities.worker_pool import DEFAULT_WORKER_POOL, get_worker_pool
 
 if TYPE_CHECKING:
     from fastmcp.tools.tool_transform import ArgTransform, TransformedTool
@@ -45,6 +46,23 @@ class Tool(FastMCPComponent):
     serializer: Callable[[Any], str] | None = Field(
         default=None, description="Optional custom serializer for tool results"
     )
+    timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Seconds a call may run; None uses settings.tool_timeout",
+    )
+    max_concurrency: int | None = Field(
+        default=None,
+        ge=1,
+        description="Calls that may run at once; None uses settings.tool_max_concurrency",
+    )
+    queue_timeout: float | None = Field(
+        default=None,
+        ge=0,
+        description=(
+            "Seconds a call waits for a free slot; None uses settings.tool_queue_timeout"
+        ),
+    )
 
     def to_mcp_tool(self, **overrides: Any) -> MCPTool:
         kwargs = {
@@ -65,6 +83,10 @@ class Tool(FastMCPComponent):
         exclude_args: list[str] | None = None,
         serializer: Callable[[Any], str] | None = None,
         enabled: bool | None = None,
+        worker_pool: str | None = DEFAULT_WORKER_POOL,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        queue_timeout: float | None = None,
     ) -> FunctionTool:
         """Create a Tool from a function."""
         return FunctionTool.from_function(
@@ -76,6 +98,10 @@ class Tool(FastMCPComponent):
             exclude_args=exclude_args,
             serializer=serializer,
             enabled=enabled,
+            worker_pool=worker_pool,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            queue_timeout=queue_timeout,
         )
 
     async def run(self, arguments: dict[str, Any]) -> list[MCPContent]:
@@ -110,8 +136,39 @@ class Tool(FastMCPComponent):
         )
 
 
+# Annotations whose string arguments are never JSON-decoded
+_NON_JSON_ANNOTATIONS = (int, float, bool)
+
+
 class FunctionTool(Tool):
     fn: Callable[..., Any]
+    worker_pool: str | None = Field(
+        default=DEFAULT_WORKER_POOL,
+        description="Worker pool a synchronous fn runs on; None runs it on the event loop",
+    )
+
+    # Call plan, derived from fn once at construction so that run() only
+    # has to validate, call and serialize
+    _context_kwarg: str | None = PrivateAttr(default=None)
+    _json_params: frozenset[str] = PrivateAttr(default=frozenset())
+    _type_adapter: TypeAdapter[Any] = PrivateAttr()
+    _is_coroutine: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        from fastmcp.server.context import Context
+
+        self._context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
+        # Parameters whose string arguments may hold JSON, see run()
+        signature = inspect.signature(self.fn)
+        self._json_params = frozenset(
+            param_name
+            for param_name in self.parameters.get("properties", {})
+            if param_name in signature.parameters
+            and signature.parameters[param_name].annotation
+            not in _NON_JSON_ANNOTATIONS
+        )
+        self._type_adapter = get_cached_typeadapter(self.fn)
+        self._is_coroutine = inspect.iscoroutinefunction(self.fn)
 
     @classmethod
     def from_function(
@@ -124,8 +181,17 @@ class FunctionTool(Tool):
         exclude_args: list[str] | None = None,
         serializer: Callable[[Any], str] | None = None,
         enabled: bool | None = None,
+        worker_pool: str | None = DEFAULT_WORKER_POOL,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        queue_timeout: float | None = None,
     ) -> FunctionTool:
-        """Create a Tool from a function."""
+        """Create a Tool from a function.
+
+        Synchronous functions run on the named worker pool so that blocking
+        work does not stall the event loop; pass worker_pool=None for cheap
+        functions that are better called inline.
+        """
 
         parsed_fn = ParsedFunction.from_function(fn, exclude_args=exclude_args)
 
@@ -141,49 +207,50 @@ class FunctionTool(Tool):
             annotations=annotations,
             serializer=serializer,
             enabled=enabled if enabled is not None else True,
+            worker_pool=worker_pool,
+            timeout=timeout,
+            max_concurrency=max_concurrency,
+            queue_timeout=queue_timeout,
         )
 
     async def run(self, arguments: dict[str, Any]) -> list[MCPContent]:
         """Run the tool with arguments."""
-        from fastmcp.server.context import Context
-
-        arguments = arguments.copy()
-
-        context_kwarg = find_kwarg_by_type(self.fn, kwarg_type=Context)
+        # The caller's arguments are copied only when something is added or decoded
+        context_kwarg = self._context_kwarg
         if context_kwarg and context_kwarg not in arguments:
-            arguments[context_kwarg] = get_context()
+            arguments = {**arguments, context_kwarg: get_context()}
 
-        if fastmcp.settings.tool_attempt_parse_json_args:
+        if self._json_params and fastmcp.settings.tool_attempt_parse_json_args:
             # Pre-parse data from JSON in order to handle cases like `["a", "b", "c"]`
             # being passed in as JSON inside a string rather than an actual list.
             #
             # Claude desktop is prone to this - in fact it seems incapable of NOT doing
             # this. For sub-models, it tends to pass dicts (JSON objects) as JSON strings,
-            # which can be pre-parsed here.
-            signature = inspect.signature(self.fn)
-            for param_name in self.parameters["properties"]:
+            # which can be pre-parsed here. Parameters annotated as int, float or bool
+            # were left out of _json_params when the tool was created.
+            decoded = {}
+            for param_name in self._json_params:
                 arg = arguments.get(param_name, None)
-                # if not in signature, we won't have annotations, so skip logic
-                if param_name not in signature.parameters:
-                    continue
                 # if not a string, we won't have a JSON to parse, so skip logic
                 if not isinstance(arg, str):
                     continue
-                # skip if the type is a simple type (int, float, bool)
-                if signature.parameters[param_name].annotation in (
-                    int,
-                    float,
-                    bool,
-                ):
-                    continue
                 try:
-                    arguments[param_name] = json.loads(arg)
-
+                    decoded[param_name] = json.loads(arg)
                 except json.JSONDecodeError:
                     pass
+            if decoded:
+                arguments = {**arguments, **decoded}
 
-        type_adapter = get_cached_typeadapter(self.fn)
-        result = type_adapter.validate_python(arguments)
+        if self.worker_pool is None or self._is_coroutine:
+            result = self._type_adapter.validate_python(arguments)
+        else:
+            # Only tools that just read may be abandoned on cancellation
+            read_only = bool(self.annotations and self.annotations.readOnlyHint)
+            result = await get_worker_pool(self.worker_pool).run_sync(
+                self._type_adapter.validate_python,
+                arguments,
+                abandon_on_cancel=read_only or None,
+            )
         if inspect.isawaitable(result):
             result = await result
 
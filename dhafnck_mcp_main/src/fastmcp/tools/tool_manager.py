@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 
+import anyio
 from mcp.types import ToolAnnotations
 
 from fastmcp import settings
 from fastmcp.exceptions import NotFoundError, ToolError
 from fastmcp.settings import DuplicateBehavior
 from fastmcp.tools.tool import Tool
+from fastmcp.utilities.components import component_state_version, components_changed
 from fastmcp.utilities.logging import get_logger
 from fastmcp.utilities.types import MCPContent
+from fastmcp.utilities.worker_pool import release_after_threads
 
 if TYPE_CHECKING:
     from fastmcp.server.server import MountedServer
@@ -29,6 +32,10 @@ class ToolManager:
     ):
         self._tools: dict[str, Tool] = {}
         self._mounted_servers: list[MountedServer] = []
+        self._version = 0
+        self._registry_cache: tuple[tuple[int, int], dict[str, Tool]] | None = None
+        # Per-tool concurrency slots, with the limit they were created for
+        self._call_slots: dict[str, tuple[int, anyio.Semaphore]] = {}
         self.mask_error_details = mask_error_details or settings.mask_error_details
 
         # Default to "warn" if None is provided
@@ -46,6 +53,38 @@ class ToolManager:
     def mount(self, server: MountedServer) -> None:
         """Adds a mounted server as a source for tools."""
         self._mounted_servers.append(server)
+        self._version += 1
+        components_changed()
+
+    @property
+    def version(self) -> int | None:
+        """
+        Version of the unfiltered tool inventory, or None if it cannot be cached.
+
+        It grows whenever a tool is added or removed, here or in a mounted
+        server, or a server is mounted, so a change anywhere below shows up
+        in every parent's version.
+        """
+        version = self._version
+        for mounted in self._mounted_servers:
+            child_version = mounted.server._tool_manager.version
+            if child_version is None:
+                return None
+            version += child_version
+        return version
+
+    async def _registry(self) -> dict[str, Tool]:
+        """
+        The unfiltered inventory, rebuilt only when the registry version or
+        the enabled state of a component changed. Callers must not mutate it.
+        """
+        version = self.version
+        if version is None:
+            return await self._load_tools(via_server=False)
+        cache_key = (version, component_state_version())
+        if self._registry_cache is None or self._registry_cache[0] != cache_key:
+            self._registry_cache = (cache_key, await self._load_tools(via_server=False))
+        return self._registry_cache[1]
 
     async def _load_tools(self, *, via_server: bool = False) -> dict[str, Tool]:
         """
@@ -87,12 +126,12 @@ class ToolManager:
 
     async def has_tool(self, key: str) -> bool:
         """Check if a tool exists."""
-        tools = await self.get_tools()
+        tools = await self._registry()
         return key in tools
 
     async def get_tool(self, key: str) -> Tool:
         """Get tool by key."""
-        tools = await self.get_tools()
+        tools = await self._registry()
         if key in tools:
             return tools[key]
         raise NotFoundError(f"Tool {key!r} not found")
@@ -101,7 +140,7 @@ class ToolManager:
         """
         Gets the complete, unfiltered inventory of all tools.
         """
-        return await self._load_tools(via_server=False)
+        return dict(await self._registry())
 
     async def list_tools(self) -> list[Tool]:
         """
@@ -154,6 +193,8 @@ class ToolManager:
                 return existing
         else:
             self._tools[tool.key] = tool
+        self._version += 1
+        components_changed()
         return tool
 
     def remove_tool(self, key: str) -> None:
@@ -167,6 +208,8 @@ class ToolManager:
         """
         if key in self._tools:
             del self._tools[key]
+            self._version += 1
+            components_changed()
         else:
             raise NotFoundError(f"Tool {key!r} not found")
 
@@ -177,12 +220,10 @@ class ToolManager:
         """
         # 1. Check local tools first. The server will have already applied its filter.
         if key in self._tools:
-            tool = await self.get_tool(key)
-            if not tool:
-                raise NotFoundError(f"Tool {key!r} not found")
+            tool = self._tools[key]
 
             try:
-                return await tool.run(arguments)
+                return await self._run_limited(key, lambda: tool.run(arguments), tool)
 
             # raise ToolErrors as-is
             except ToolError as e:
@@ -213,3 +254,63 @@ class ToolManager:
                 continue
 
         raise NotFoundError(f"Tool {key!r} not found.")
+
+    async def _run_limited(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[list[MCPContent]]],
+        tool: Tool | None = None,
+    ) -> list[MCPContent]:
+        """
+        Run a call of tool key within its concurrency limit and timeout.
+
+        Limits not set on the tool come from the settings. Waiting for a slot
+        and running are both cancellable, so a call the client cancels
+        releases its slot right away, unless the call was a blocking function
+        whose thread is still running: its slot is released when it finishes.
+        """
+        max_concurrency = (
+            tool and tool.max_concurrency
+        ) or settings.tool_max_concurrency
+        if max_concurrency is None:
+            return await self._run_with_timeout(key, run, tool)
+
+        slot = self._call_slots.get(key)
+        if slot is None or slot[0] != max_concurrency:
+            slot = self._call_slots[key] = (
+                max_concurrency,
+                anyio.Semaphore(max_concurrency),
+            )
+        semaphore = slot[1]
+
+        queue_timeout = (
+            tool.queue_timeout
+            if tool is not None and tool.queue_timeout is not None
+            else settings.tool_queue_timeout
+        )
+        with anyio.move_on_after(queue_timeout) as scope:
+            await semaphore.acquire()
+        if scope.cancelled_caught:
+            raise ToolError(
+                f"Tool {key!r} is busy: {max_concurrency} calls already running "
+                f"and no slot freed up within {queue_timeout}s"
+            )
+        with release_after_threads(semaphore.release):
+            return await self._run_with_timeout(key, run, tool)
+
+    async def _run_with_timeout(
+        self,
+        key: str,
+        run: Callable[[], Awaitable[list[MCPContent]]],
+        tool: Tool | None = None,
+    ) -> list[MCPContent]:
+        timeout = (
+            tool.timeout
+            if tool is not None and tool.timeout is not None
+            else settings.tool_timeout
+        )
+        if timeout is None:
+            return await run()
+        with anyio.move_on_after(timeout):
+            return await run()
+        raise ToolError(f"Tool {key!r} timed out after {timeout}s")
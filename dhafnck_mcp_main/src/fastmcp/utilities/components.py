@@ -1,4 +1,5 @@
-from collections.abc import Sequence
+import weakref
+from collections.abc import Callable, Sequence
 from typing import Annotated, Any, TypeVar
 
 from pydantic import BeforeValidator, Field, PrivateAttr
@@ -8,6 +9,41 @@ from fastmcp.utilities.types import FastMCPBaseModel
 
 T = TypeVar("T")
 
+# Bumped whenever any component is enabled or disabled. Registries that cache
+# (prefixed copies of) components fold it into their cache key.
+_state_version = 0
+
+
+def component_state_version() -> int:
+    """Return the process-wide enable/disable counter."""
+    return _state_version
+
+
+# Called after any registry version or enabled state changes; held weakly
+_change_listeners: list[weakref.WeakMethod[Callable[[], None]]] = []
+
+
+def add_change_listener(listener: Callable[[], None]) -> None:
+    """
+    Call the bound method listener after every change of a registry or of a
+    component's enabled state, in the thread that made the change. The
+    listener is dropped once its object is collected.
+    """
+    _change_listeners.append(weakref.WeakMethod(listener))  # type: ignore[arg-type]
+
+
+def components_changed() -> None:
+    """Tell the change listeners that a registry or enabled state changed."""
+    for ref in list(_change_listeners):
+        listener = ref()
+        if listener is None:
+            try:
+                _change_listeners.remove(ref)
+            except ValueError:
+                pass
+        else:
+            listener()
+
 
 def _convert_set_default_none(maybe_set: set[T] | Sequence[T] | None) -> set[T]:
     """Convert a sequence to a set, defaulting to an empty set if None."""
@@ -68,8 +104,14 @@ class FastMCPComponent(FastMCPBaseModel):
 
     def enable(self) -> None:
         """Enable the component."""
+        global _state_version
         self.enabled = True
+        _state_version += 1
+        components_changed()
 
     def disable(self) -> None:
         """Disable the component."""
+        global _state_version
         self.enabled = False
+        _state_version += 1
+        components_changed()
@@ -0,0 +1,81 @@
+"""File helpers shared by the file-backed stores."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import stat
+import sys
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+# The umask can only be read by setting it, which would race with files other
+# threads create, so it is read once on import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def atomic_write_text(path: str | os.PathLike[str], content: str, encoding: str = "utf-8") -> None:
+    """Replace path with content so readers see either the old or the new file.
+
+    The content is written to a temporary file in the same directory and then
+    renamed over path. The parent directory must exist. The file keeps the mode
+    of the file it replaces; a new file gets the mode ``open()`` would give it.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding=encoding) as f:
+            f.write(content)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(tmp_path, _replaced_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _replaced_mode(path: Path) -> int:
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def file_stamp(path: str | os.PathLike[str]) -> tuple[int, int]:
+    """Return (mtime_ns, size) of path, used to detect changes made by other writers."""
+    result = os.stat(path)
+    return result.st_mtime_ns, result.st_size
+
+
+@contextlib.contextmanager
+def file_lock(path: str | os.PathLike[str]) -> Iterator[None]:
+    """Hold an exclusive advisory lock on path, created if missing, across processes.
+
+    Only writers that take the same lock are excluded; readers are not blocked.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if sys.platform == "win32":
+            import msvcrt
+
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
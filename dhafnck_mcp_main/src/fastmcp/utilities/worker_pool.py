@@ -0,0 +1,286 @@
+"""Bounded worker thread pools for blocking tool functions."""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+
+import anyio
+import anyio.lowlevel
+import anyio.to_thread
+
+import fastmcp
+
+T = TypeVar("T")
+
+# Pool used by synchronous tools unless they name another one
+DEFAULT_WORKER_POOL = "default"
+
+# Threads anyio may start for the pools; each pool bounds its own calls
+_threads = anyio.CapacityLimiter(math.inf)
+
+
+class CallAbandoned(Exception):
+    """Raised in a worker thread whose caller has already given up on it."""
+
+
+class _Lease:
+    """
+    A release deferred until every worker call abandoned while it was held
+    has finished, so limits guarding those calls keep counting their threads.
+
+    Only used from the event loop thread.
+    """
+
+    def __init__(self, release: Callable[[], Any]):
+        self._release = release
+        self._abandoned = 0
+        self._exited = False
+
+    def abandoned(self) -> None:
+        self._abandoned += 1
+
+    def thread_finished(self) -> None:
+        self._abandoned -= 1
+        self._release_if_done()
+
+    def exit(self) -> None:
+        self._exited = True
+        self._release_if_done()
+
+    def _release_if_done(self) -> None:
+        if self._exited and self._abandoned == 0:
+            self._release()
+
+
+_leases: ContextVar[tuple[_Lease, ...]] = ContextVar("worker_pool_leases", default=())
+# Set in a worker thread while its call runs: whether the caller gave up on it
+_abandoned: ContextVar[Callable[[], bool] | None] = ContextVar(
+    "worker_pool_abandoned", default=None
+)
+
+
+@contextmanager
+def release_after_threads(release: Callable[[], Any]) -> Iterator[None]:
+    """
+    Call release when the block exits or, if a worker call made in it was
+    abandoned while running, once that call's thread has finished.
+    """
+    lease = _Lease(release)
+    token = _leases.set((*_leases.get(), lease))
+    try:
+        yield
+    finally:
+        _leases.reset(token)
+        lease.exit()
+
+
+def _call_soon(token: object, fn: Callable[..., Any], *args: Any) -> None:
+    """Schedule fn(*args) on the event loop of token without waiting for it."""
+    # asyncio tokens are the loop itself, trio tokens are TrioTokens
+    run_soon = getattr(token, "run_sync_soon", None) or token.call_soon_threadsafe  # type: ignore[attr-defined]
+    try:
+        run_soon(fn, *args)
+    except RuntimeError:
+        pass  # The event loop is gone
+
+
+def raise_if_abandoned() -> None:
+    """
+    Raise CallAbandoned if the worker call running this code was abandoned.
+
+    Long or blocking functions run on a pool call this at points where they
+    can stop without leaving partial changes behind.
+    """
+    abandoned = _abandoned.get()
+    if abandoned is not None and abandoned():
+        raise CallAbandoned("The caller gave up on this call")
+
+
+class WorkerPool:
+    """
+    A named pool of worker threads, bounded by an anyio capacity limiter.
+
+    Calls beyond ``max_workers`` wait for a free worker. The pool keeps
+    saturation metrics: how many calls are running and waiting, how many
+    found every worker busy, and how long calls waited before starting.
+
+    A cancelled or timed-out call that has not started yet is dropped. One
+    that is running is waited for, so the caller never hears back while the
+    function is still changing state. With ``abandon_on_cancel``, which only
+    suits functions that just read, the call returns at once while its thread
+    finishes in the background; the thread keeps its worker slot until it
+    finishes, so abandoned calls never push the pool past ``max_workers``, and
+    functions can stop early with ``raise_if_abandoned()``.
+    """
+
+    def __init__(self, name: str, max_workers: int, abandon_on_cancel: bool = False):
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self.name = name
+        self.abandon_on_cancel = abandon_on_cancel
+        self._limiter = anyio.CapacityLimiter(max_workers)
+        self._lock = threading.Lock()
+        self.running = 0
+        self.waiting = 0
+        self.peak_running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.abandoned = 0  # Calls still running after their caller gave up
+        self.saturated = 0  # Calls that found every worker busy
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @property
+    def max_workers(self) -> int:
+        return int(self._limiter.total_tokens)
+
+    @max_workers.setter
+    def max_workers(self, value: int) -> None:
+        if value < 1:
+            raise ValueError(f"max_workers must be at least 1, got {value}")
+        self._limiter.total_tokens = value
+
+    async def run_sync(
+        self, fn: Callable[..., T], *args: Any, abandon_on_cancel: bool | None = None
+    ) -> T:
+        """
+        Run fn(*args) in a worker thread once one is free.
+
+        abandon_on_cancel overrides the pool's policy for this call.
+        """
+        if abandon_on_cancel is None:
+            abandon_on_cancel = self.abandon_on_cancel
+        queued_at = time.perf_counter()
+        started = finished = abandoned = False
+        borrower = object()
+        leases = _leases.get()
+        loop_token = anyio.lowlevel.current_token()
+
+        def call() -> T:
+            nonlocal started, finished
+            wait = time.perf_counter() - queued_at
+            with self._lock:
+                if abandoned:
+                    return None  # type: ignore[return-value]
+                started = True
+                self.running += 1
+                self.peak_running = max(self.peak_running, self.running)
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+            _abandoned.set(lambda: abandoned)
+            try:
+                return fn(*args)
+            except BaseException:
+                with self._lock:
+                    self.failed += 1
+                raise
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+                    finished = True
+                    orphaned = abandoned
+                if orphaned:
+                    _call_soon(loop_token, self._thread_finished, borrower, leases)
+
+        with self._lock:
+            self.submitted += 1
+            self.waiting += 1
+            if self.running + self.waiting > self.max_workers:
+                self.saturated += 1
+        try:
+            await self._limiter.acquire_on_behalf_of(borrower)
+        except BaseException:
+            with self._lock:
+                self.waiting -= 1
+            raise
+        with self._lock:
+            self.waiting -= 1
+
+        try:
+            return await anyio.to_thread.run_sync(
+                call, limiter=_threads, abandon_on_cancel=abandon_on_cancel
+            )
+        finally:
+            with self._lock:
+                abandoned = not finished
+                orphaned = started and not finished
+                if orphaned:
+                    self.abandoned += 1
+            if orphaned:
+                # The thread keeps the worker slot and the leases until it ends
+                for lease in leases:
+                    lease.abandoned()
+            else:
+                self._limiter.release_on_behalf_of(borrower)
+
+    def _thread_finished(self, borrower: object, leases: tuple[_Lease, ...]) -> None:
+        """Free the slot and leases of an abandoned call whose thread ended."""
+        with self._lock:
+            self.abandoned -= 1
+        self._limiter.release_on_behalf_of(borrower)
+        for lease in leases:
+            lease.thread_finished()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the pool's saturation metrics."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "running": self.running,
+                "waiting": self.waiting,
+                "peak_running": self.peak_running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "abandoned": self.abandoned,
+                "saturated": self.saturated,
+                "total_wait_seconds": self.total_wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+
+_pools: dict[str, WorkerPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_worker_pool(name: str = DEFAULT_WORKER_POOL) -> WorkerPool:
+    """Return the named pool, creating it with the default size on first use."""
+    pool = _pools.get(name)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(name)
+            if pool is None:
+                pool = _pools[name] = WorkerPool(
+                    name, fastmcp.settings.tool_worker_threads
+                )
+    return pool
+
+
+def configure_worker_pool(
+    name: str, max_workers: int, abandon_on_cancel: bool | None = None
+) -> WorkerPool:
+    """
+    Create or resize the named pool; abandon_on_cancel=None keeps the current policy.
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = _pools[name] = WorkerPool(name, max_workers)
+        else:
+            pool.max_workers = max_workers
+        if abandon_on_cancel is not None:
+            pool.abandon_on_cancel = abandon_on_cancel
+    return pool
+
+
+def worker_pool_stats() -> dict[str, dict[str, Any]]:
+    """Saturation metrics of every pool, keyed by pool name."""
+    return {name: pool.stats() for name, pool in list(_pools.items())}
@@ -0,0 +1,154 @@
+"""Shared YAML loading with the libyaml C loader and a process-wide parse cache."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NoReturn
+
+import yaml
+
+from fastmcp.utilities.logging import get_logger
+
+logger = get_logger(__name__)
+
+# CSafeLoader is only present when PyYAML was built against libyaml
+SafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+HAS_LIBYAML: bool = SafeLoader is not yaml.SafeLoader
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is read-only; use thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """A dict that refuses mutation, so cached YAML can be shared safely."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> Any:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """A list that refuses mutation, so cached YAML can be shared safely."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> Any:
+        return thaw(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into their read-only counterparts."""
+    if isinstance(value, dict) and not isinstance(value, FrozenDict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list) and not isinstance(value, FrozenList):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Recursively convert (frozen) dicts and lists into plain mutable copies."""
+    if isinstance(value, dict):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [thaw(item) for item in value]
+    return value
+
+
+def load_yaml(stream: str | bytes | Any) -> Any:
+    """Parse YAML text or a file object with the fastest available safe loader."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+class YAMLFileCache:
+    """Bounded cache of parsed YAML files keyed by path and validated by mtime and size."""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[tuple[int, int], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: str | os.PathLike[str]) -> Any:
+        """Return the deep-frozen parse of path, re-parsing only when the file changed.
+
+        Raises OSError or yaml.YAMLError like a direct safe_load would.
+        """
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        with open(key, encoding="utf-8") as f:
+            data = freeze(load_yaml(f))
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (stamp, data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def invalidate(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Drop one path, or everything when no path is given."""
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(path), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_file_cache = YAMLFileCache()
+
+
+def load_yaml_file(path: str | Path) -> Any:
+    """Load a YAML file through the process-wide parse cache.
+
+    The result is shared between callers and deep-frozen; use thaw() when a
+    mutable copy is needed.
+    """
+    return _file_cache.load(path)
+
+
+def get_yaml_file_cache() -> YAMLFileCache:
+    """Return the process-wide YAML parse cache."""
+    return _file_cache
+
+
+if not HAS_LIBYAML:
+    logger.debug("libyaml is not available, falling back to the pure-Python YAML loader")
@@ -123,6 +123,23 @@ def test_auto_rule_file(isolated_test_env):
     return str(isolated_test_env.get_test_file_path("auto_rule"))
 
 
+@pytest.fixture
+def tmp_project_manager(tmp_path):
+    """
+    Fixture providing a ProjectManager with no projects, rooted at tmp_path
+    
+    Returns:
+        ProjectManager: Manager keeping brain/projects.json and the task files under tmp_path
+    """
+    from fastmcp.task_management.interface.consolidated_mcp_tools import PathResolver, ProjectManager
+    
+    resolver = PathResolver.__new__(PathResolver)
+    resolver.project_root = tmp_path
+    resolver.brain_dir = tmp_path / "brain"
+    resolver.projects_file = resolver.brain_dir / "projects.json"
+    return ProjectManager(resolver)
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers and settings"""
     config.addinivalue_line(
@@ -138,7 +155,12 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add automatic markers"""
+    skip_performance = pytest.mark.skip(reason="benchmark; use --run-performance to run")
     for item in items:
+        # Wall-clock benchmarks only run on request
+        if "performance" in item.keywords and not config.getoption("--run-performance"):
+            item.add_marker(skip_performance)
+
         # Add isolated marker to tests that use isolated fixtures
         if "isolated_test_env" in item.fixturenames:
             item.add_marker(pytest.mark.isolated)
@@ -212,6 +234,12 @@ def pytest_addoption(parser):
         default=False,
         help="Enable verbose output for test data isolation"
     )
+    parser.addoption(
+        "--run-performance",
+        action="store_true",
+        default=False,
+        help="Run the wall-clock benchmarks marked performance (add -s to see timings)"
+    )
 
 
 @pytest.fixture(scope="session")
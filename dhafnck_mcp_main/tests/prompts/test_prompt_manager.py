@@ -0,0 +1,17 @@
+"""Tests for the versioned prompt registry"""
+
+from fastmcp import FastMCP
+from fastmcp.prompts.prompt import Prompt
+
+
+async def test_prompt_registry_follows_mounted_servers():
+    parent, child = FastMCP("parent", enable_task_management=False), FastMCP("child", enable_task_management=False)
+    parent.mount(child, prefix="c")
+
+    def greet() -> str:
+        return "hello"
+
+    assert not await parent._prompt_manager.has_prompt("c_greet")
+    child.add_prompt(Prompt.from_function(greet))
+    prompt = await parent._prompt_manager.get_prompt("c_greet")
+    assert await parent._prompt_manager.get_prompt("c_greet") is prompt
@@ -0,0 +1,48 @@
+"""Tests for URI routing of resource templates and mounted servers"""
+
+import re
+
+from fastmcp import FastMCP
+from fastmcp.resources.router import UriRouter
+
+
+class TestUriRouter:
+    """Routes are tried in insertion order among those sharing the URI's prefix"""
+
+    def test_templates_and_order(self):
+        router = UriRouter()
+        router.add_template("data://{kind}/{id}", "generic")
+        router.add_template("data://users/{id}", "users")
+        router.add_template("files://{path*}", "files")
+        router.add("", re.compile(r"(?P<uri>.*)"), "fallback")
+
+        assert router.match("data://users/a%20b") == ("generic", {"kind": "users", "id": "a b"})
+        assert [value for value, _ in router.iter_matches("data://users/1")] == ["generic", "users", "fallback"]
+        assert router.match("files://a/b.txt") == ("files", {"path": "a/b.txt"})
+        assert router.match("other://x") == ("fallback", {"uri": "other://x"})
+        assert len(router) == 4
+
+
+async def test_manager_routes_templates_and_mounts():
+    parent = FastMCP("parent", enable_task_management=False)
+    child = FastMCP("child", enable_task_management=False)
+
+    @child.resource("data://{id}")
+    def item(id: str) -> str:
+        return f"item {id}"
+
+    parent.mount(child, prefix="c")
+    manager = parent._resource_manager
+
+    resource = await manager.get_resource("data://c/7")
+    assert await resource.read() == "item 7"
+    assert await manager.has_resource("data://c/7")
+    assert not await manager.has_resource("data://7")
+    contents = await parent._mcp_read_resource("data://c/8")
+    assert contents[0].content == "item 8"
+
+    @child.resource("data://static")
+    def static() -> str:
+        return "static"
+
+    assert "data://c/static" in await manager.get_resources()
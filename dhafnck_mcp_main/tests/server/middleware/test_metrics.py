@@ -0,0 +1,98 @@
+import pytest
+from mcp.types import ListToolsRequest
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import NotFoundError, ToolError
+from fastmcp.server.metrics import UNKNOWN_TOOL, Histogram, MetricsMiddleware
+from fastmcp.utilities.tests import temporary_settings
+
+
+@pytest.fixture
+def server() -> FastMCP:
+    mcp = FastMCP("test", enable_task_management=False)
+
+    @mcp.tool()
+    def echo(text: str) -> str:
+        return text
+
+    @mcp.tool()
+    def fail() -> str:
+        raise ValueError("boom")
+
+    return mcp
+
+
+class TestMetricsMiddleware:
+    async def test_counts_per_method_and_tool(self, server: FastMCP):
+        metrics = MetricsMiddleware(
+            measure_result_bytes=True, include_worker_pools=False
+        ).install(server)
+
+        await server._mcp_call_tool("echo", {"text": "hello"})
+        with pytest.raises(ToolError):
+            await server._mcp_call_tool("fail", {})
+        await server._mcp_list_tools(ListToolsRequest(method="tools/list"))
+
+        calls = metrics.methods_series["tools/call"]
+        assert (calls.requests, calls.errors, calls.in_flight) == (2, 1, 0)
+        assert calls.latency.count == 2
+        assert metrics.tools_series["echo"].result_bytes > len("hello")
+        assert metrics.tools_series["fail"].errors == 1
+        assert "tools/list" not in metrics.methods_series
+
+    async def test_listings_stay_cached_unless_list_requests_are_counted(
+        self, server: FastMCP
+    ):
+        MetricsMiddleware(include_worker_pools=False).install(server)
+        await server._mcp_list_tools(ListToolsRequest(method="tools/list"))
+        assert "tools" in server._listings
+
+        server._listings.clear()
+        metrics = MetricsMiddleware(
+            include_worker_pools=False, count_list_requests=True
+        ).install(server)
+        await server._mcp_list_tools(ListToolsRequest(method="tools/list"))
+        assert metrics.methods_series["tools/list"].requests == 1
+        assert "tools" not in server._listings
+
+    async def test_unknown_tool_names_share_one_series(self, server: FastMCP):
+        metrics = MetricsMiddleware(include_worker_pools=False).install(server)
+
+        for name in ("nope-1", "nope-2"):
+            with pytest.raises(NotFoundError):
+                await server._mcp_call_tool(name, {})
+
+        assert set(metrics.tools_series) == {UNKNOWN_TOOL}
+        assert metrics.tools_series[UNKNOWN_TOOL].requests == 2
+
+    async def test_prometheus_route_and_resource(self, server: FastMCP):
+        MetricsMiddleware().install(server)
+        await server._mcp_call_tool("echo", {"text": "hello"})
+
+        [route] = server._additional_http_routes
+        response = await route.endpoint(None)  # type: ignore[attr-defined]
+        text = response.body.decode()
+        assert 'fastmcp_tool_calls_total{tool="echo"} 1' in text
+        assert 'fastmcp_tool_calls_duration_seconds_bucket{tool="echo",le="+Inf"} 1' in text
+        assert "# TYPE fastmcp_requests_in_flight gauge" in text
+        assert "fastmcp_worker_pool_completed" in text
+        assert "result_bytes" not in text
+
+        [contents] = await server._mcp_read_resource("metrics://server")
+        assert 'fastmcp_requests_total{method="tools/call"} 1' in contents.content
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram([0.1, 1.0])
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [("0.1", 2), ("1.0", 3), ("+Inf", 4)]
+    assert histogram.count == 4
+
+
+def test_installed_by_setting():
+    with temporary_settings(metrics_enabled=True):
+        mcp = FastMCP("test", enable_task_management=False)
+    [metrics] = [mw for mw in mcp.middleware if isinstance(mw, MetricsMiddleware)]
+    assert not metrics.measure_result_bytes
+    assert FastMCP("test", enable_task_management=False).middleware == []
@@ -0,0 +1,97 @@
+from mcp.types import ListToolsRequest
+
+from fastmcp import FastMCP
+from fastmcp.server.middleware import Middleware
+
+
+class RecordingMiddleware(Middleware):
+    def __init__(self, name: str, log: list[str]):
+        self.name = name
+        self.log = log
+
+    async def on_message(self, context, call_next):
+        self.log.append(f"{self.name}:message:{context.method}")
+        return await call_next(context)
+
+    async def on_call_tool(self, context, call_next):
+        self.log.append(f"{self.name}:call_tool")
+        return await call_next(context)
+
+
+class ToolsOnlyMiddleware(RecordingMiddleware):
+    methods = frozenset({"tools/call"})
+
+
+def _server() -> FastMCP:
+    mcp = FastMCP("test", enable_task_management=False)
+
+    @mcp.tool()
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    return mcp
+
+
+class TestMiddlewareChain:
+    async def test_hooks_run_in_order(self):
+        log: list[str] = []
+        mcp = _server()
+        mcp.add_middleware(RecordingMiddleware("outer", log))
+        mcp.add_middleware(RecordingMiddleware("inner", log))
+
+        result = await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        assert result[0].text == "3"  # type: ignore[attr-defined]
+        assert log == [
+            "outer:message:tools/call",
+            "outer:call_tool",
+            "inner:message:tools/call",
+            "inner:call_tool",
+        ]
+
+    async def test_declared_methods_skip_other_methods(self):
+        log: list[str] = []
+        mcp = _server()
+        mcp.add_middleware(ToolsOnlyMiddleware("tools", log))
+
+        await mcp._mcp_list_tools(ListToolsRequest(method="tools/list"))
+        assert log == []
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        assert log == ["tools:message:tools/call", "tools:call_tool"]
+
+    async def test_chain_is_composed_once_per_method(self):
+        mcp = _server()
+        mcp.add_middleware(RecordingMiddleware("mw", []))
+
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        chain = mcp._middleware_chains[("tools/call", "request")]
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        assert mcp._middleware_chains[("tools/call", "request")] is chain
+
+        mcp.add_middleware(RecordingMiddleware("late", []))
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        assert mcp._middleware_chains[("tools/call", "request")] is not chain
+
+    async def test_edits_of_the_middleware_list_apply(self):
+        log: list[str] = []
+        mcp = _server()
+        mcp.add_middleware(RecordingMiddleware("first", log))
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+
+        mcp.middleware[0] = ToolsOnlyMiddleware("replaced", log)
+        mcp.middleware.append(ToolsOnlyMiddleware("appended", log))
+        log.clear()
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        assert [entry for entry in log if entry.endswith("call_tool")] == [
+            "replaced:call_tool",
+            "appended:call_tool",
+        ]
+
+        mcp.middleware.clear()
+        log.clear()
+        await mcp._mcp_call_tool("add", {"a": 1, "b": 2})
+        assert log == []
+
+    def test_only_overridden_hooks_are_chained(self):
+        hooks = RecordingMiddleware("mw", []).hooks_for("tools/list", "request")
+        assert [hook.__name__ for hook in hooks] == ["on_message"]
+        assert Middleware().hooks_for("tools/call", "request") == []
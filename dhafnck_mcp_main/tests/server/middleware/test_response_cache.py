@@ -0,0 +1,115 @@
+from mcp.server.auth.provider import AccessToken
+from mcp.types import ToolAnnotations
+
+from fastmcp import FastMCP
+from fastmcp.server import response_cache
+from fastmcp.server.batch import add_batch_tool
+from fastmcp.server.response_cache import ResponseCacheMiddleware, cache_key
+from fastmcp.task_management.interface.consolidated_mcp_tools import task_management_cache_policies
+
+
+def _server(calls: list[str]) -> FastMCP:
+    mcp = FastMCP("test", enable_task_management=False)
+
+    @mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+    def lookup(key: str, version: int = 0) -> str:
+        calls.append(key)
+        return key.upper()
+
+    @mcp.tool()
+    def write(key: str) -> str:
+        calls.append(f"write:{key}")
+        return key
+
+    @mcp.tool()
+    def manage_task(action: str, project_id: str, task_tree_id: str = "main") -> str:
+        calls.append(f"{action}:{project_id}/{task_tree_id}")
+        return action
+
+    return mcp
+
+
+class TestResponseCacheMiddleware:
+    async def test_read_only_tools_are_cached(self):
+        calls: list[str] = []
+        mcp = _server(calls)
+        cache = ResponseCacheMiddleware()
+        mcp.add_middleware(cache)
+
+        first = await mcp._mcp_call_tool("lookup", {"key": "a", "version": 1})
+        second = await mcp._mcp_call_tool("lookup", {"version": 1, "key": "a"})
+        await mcp._mcp_call_tool("write", {"key": "a"})
+        await mcp._mcp_call_tool("write", {"key": "a"})
+
+        assert first == second and calls == ["a", "write:a", "write:a"]
+        assert cache.stats()["hits"] == 1
+        assert cache_key("lookup", {"a": 1, "b": 2}) == cache_key("lookup", {"b": 2, "a": 1})
+
+    async def test_writes_evict_tagged_results(self):
+        calls: list[str] = []
+        mcp = _server(calls)
+        mcp.add_middleware(ResponseCacheMiddleware(policies=task_management_cache_policies()))
+
+        for action, tree in (("list", "main"), ("list", "main"), ("list", "other"), ("update", "main"), ("list", "main"), ("list", "other")):
+            await mcp._mcp_call_tool("manage_task", {"action": action, "project_id": "p", "task_tree_id": tree})
+
+        assert calls == ["list:p/main", "list:p/other", "update:p/main", "list:p/main"]
+
+    async def test_batched_writes_evict_tagged_results(self):
+        calls: list[str] = []
+        mcp = _server(calls)
+        add_batch_tool(mcp)
+        mcp.add_middleware(ResponseCacheMiddleware(policies=task_management_cache_policies()))
+
+        list_main = {"action": "list", "project_id": "p"}
+        await mcp._mcp_call_tool("manage_task", list_main)
+        await mcp._mcp_call_tool("batch", {"calls": [{"tool": "manage_task", "arguments": {"action": "update", "project_id": "p"}}]})
+        await mcp._mcp_call_tool("manage_task", list_main)
+
+        assert calls == ["list:p/main", "update:p/main", "list:p/main"]
+
+    async def test_callers_do_not_share_results(self, monkeypatch):
+        calls: list[str] = []
+        mcp = _server(calls)
+        mcp.add_middleware(ResponseCacheMiddleware())
+
+        for client_id in ("alice", "bob", "alice"):
+            token = AccessToken(token=client_id, client_id=client_id, scopes=[])
+            monkeypatch.setattr(response_cache, "get_access_token", lambda: token)
+            await mcp._mcp_call_tool("lookup", {"key": "a"})
+
+        assert calls == ["a", "a"]
+
+    def test_project_changes_outside_tool_calls_evict(self, tmp_project_manager):
+        manager = tmp_project_manager
+        manager.create_project("web", "Web")
+        cache = ResponseCacheMiddleware()
+        manager.add_change_listener(cache.invalidate_tags)
+
+        cache.put("tasks", ["listing"], {"project:web"}, ttl=10)
+        cache.put("other", ["listing"], {"project:api"}, ttl=10)
+        manager.create_task_tree("web", "ui", "UI")
+        assert cache.get("tasks") is None and cache.get("other") == ["listing"]
+
+    def test_results_invalidated_while_computed_are_not_cached(self):
+        cache = ResponseCacheMiddleware()
+        generation = cache._generation
+        cache.invalidate_tags("projects")
+        cache.put("stale", ["x"], {"projects"}, ttl=10, since=generation)
+        cache.put("fresh", ["x"], {"other"}, ttl=10, since=generation)
+        assert cache.get("stale") is None and cache.get("fresh") == ["x"]
+
+    def test_bounded_by_entries_bytes_and_ttl(self, monkeypatch):
+        cache = ResponseCacheMiddleware(max_entries=2, max_bytes=1000)
+        for key in ("a", "b", "c"):
+            cache.put(key, [key], {"tag"}, ttl=10)
+        assert cache.get("a") is None and cache.get("c") == ["c"]
+
+        cache.put("big", ["x" * 2000], set(), ttl=10)
+        assert cache.get("big") is None
+
+        now = response_cache.time.monotonic()
+        monkeypatch.setattr(response_cache.time, "monotonic", lambda: now + 11)
+        assert cache.get("c") is None and len(cache) == 1
+
+        assert cache.invalidate_tags("tag") == 1 and len(cache) == 0
@@ -0,0 +1,91 @@
+import json
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.server.batch import add_batch_tool
+from fastmcp.server.middleware import Middleware
+
+
+class CountingMiddleware(Middleware):
+    def __init__(self):
+        self.calls: list[str] = []
+
+    async def on_call_tool(self, context, call_next):
+        self.calls.append(context.message.name)
+        return await call_next(context)
+
+
+def _server() -> FastMCP:
+    mcp = FastMCP("test", enable_task_management=False)
+
+    @mcp.tool()
+    async def slow_echo(text: str, delay: float = 0) -> str:
+        await anyio.sleep(delay)
+        return text
+
+    @mcp.tool(enabled=False)
+    def hidden() -> str:
+        return "secret"
+
+    add_batch_tool(mcp, max_items=3)
+    return mcp
+
+
+class TestBatchTool:
+    async def test_results_in_order_with_item_errors(self):
+        mcp = _server()
+        middleware = CountingMiddleware()
+        mcp.add_middleware(middleware)
+
+        [content] = await mcp._mcp_call_tool(
+            "batch",
+            {
+                "calls": [
+                    {"tool": "slow_echo", "arguments": {"text": "first", "delay": 0.05}},
+                    {"tool": "slow_echo", "arguments": {"text": "second"}},
+                    {"tool": "hidden"},
+                ]
+            },
+        )
+        results = json.loads(content.text)  # type: ignore[attr-defined]
+
+        assert [result["isError"] for result in results] == [False, False, True]
+        assert [result["content"][0]["text"] for result in results[:2]] == ["first", "second"]
+        assert "Unknown tool" in results[2]["error"]
+        assert sorted(middleware.calls) == ["batch", "hidden", "slow_echo", "slow_echo"]
+
+    async def test_middleware_can_deny_items(self):
+        class DenySlowEcho(Middleware):
+            async def on_call_tool(self, context, call_next):
+                if context.message.name == "slow_echo":
+                    raise ToolError("Not allowed")
+                return await call_next(context)
+
+        mcp = _server()
+
+        @mcp.tool()
+        def allowed() -> str:
+            return "ok"
+
+        mcp.add_middleware(DenySlowEcho())
+        [content] = await mcp._mcp_call_tool(
+            "batch",
+            {"calls": [{"tool": "slow_echo", "arguments": {"text": "x"}}, {"tool": "allowed"}]},
+        )
+        denied, ok = json.loads(content.text)  # type: ignore[attr-defined]
+
+        assert denied == {"tool": "slow_echo", "isError": True, "error": "Not allowed"}
+        assert ok["content"][0]["text"] == "ok"
+
+    async def test_runs_concurrently_and_is_bounded(self):
+        mcp = _server()
+        calls = [{"tool": "slow_echo", "arguments": {"text": str(i), "delay": 0.2}} for i in range(3)]
+
+        with anyio.fail_after(0.5):
+            await mcp._mcp_call_tool("batch", {"calls": calls})
+
+        with pytest.raises(ToolError, match="at most 3 calls"):
+            await mcp._mcp_call_tool("batch", {"calls": calls + calls[:1]})
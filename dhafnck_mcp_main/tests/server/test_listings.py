@@ -0,0 +1,125 @@
+import anyio
+import mcp.types
+
+from fastmcp import FastMCP
+from fastmcp.server.listings import (
+    IF_NONE_MATCH_META_KEY,
+    LISTING_HASH_META_KEY,
+    NOT_MODIFIED_META_KEY,
+    ListChangedNotifier,
+)
+from fastmcp.server.middleware import Middleware
+
+
+class FakeSession:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send_tool_list_changed(self):
+        self.sent.append("tools")
+
+    async def send_resource_list_changed(self):
+        self.sent.append("resources")
+
+    async def send_prompt_list_changed(self):
+        self.sent.append("prompts")
+
+
+def _server() -> FastMCP:
+    mcp = FastMCP("test", enable_task_management=False)
+
+    @mcp.tool(tags={"public"})
+    def add(a: int, b: int) -> int:
+        return a + b
+
+    @mcp.tool(tags={"private"})
+    def secret() -> str:
+        return "secret"
+
+    return mcp
+
+
+async def _list_tools(server: FastMCP, **meta) -> mcp.types.ListToolsResult:
+    params = mcp.types.PaginatedRequestParams(_meta=meta) if meta else None
+    request = mcp.types.ListToolsRequest(method="tools/list", params=params)
+    result = await server._mcp_list_tools(request)
+    return result.root  # type: ignore[return-value]
+
+
+class TestListings:
+    async def test_cached_until_registry_changes(self):
+        server = _server()
+        first = await server._listing("tools")
+        assert await server._listing("tools") is first
+
+        tool = await server.get_tool("secret")
+        tool.disable()
+        disabled = await server._listing("tools")
+        assert disabled is not first
+        assert [t.name for t in disabled.items] == ["add"]
+
+        tool.enable()
+        assert (await server._listing("tools")).hash == first.hash
+
+        server.include_tags = {"public"}
+        assert [t.name for t in (await server._listing("tools")).items] == ["add"]
+
+    async def test_not_cached_while_middleware_handles_listing(self):
+        class Hide(Middleware):
+            async def on_list_tools(self, context, call_next):
+                return [tool for tool in await call_next(context) if tool.name != "secret"]
+
+        server = _server()
+        server.add_middleware(Hide())
+
+        assert [t.name for t in (await _list_tools(server)).tools] == ["add"]
+        assert "tools" not in server._listings
+
+    async def test_conditional_fetch(self):
+        server = _server()
+        listing_hash = (await _list_tools(server)).meta[LISTING_HASH_META_KEY]  # type: ignore[index]
+
+        unchanged = await _list_tools(server, **{IF_NONE_MATCH_META_KEY: listing_hash})
+        assert unchanged.tools == [] and unchanged.meta[NOT_MODIFIED_META_KEY]  # type: ignore[index]
+
+        @server.tool()
+        def multiply(a: int, b: int) -> int:
+            return a * b
+
+        changed = await _list_tools(server, **{IF_NONE_MATCH_META_KEY: listing_hash})
+        assert len(changed.tools) == 3 and NOT_MODIFIED_META_KEY not in changed.meta  # type: ignore[operator]
+
+    async def test_registry_changes_notify_listed_sessions(self):
+        server = _server()
+        session = FakeSession()
+        server._list_changed.served("tools", session, server._listing_key("tools"))  # type: ignore[arg-type]
+
+        async def sent(expected: list[str]) -> None:
+            with anyio.fail_after(1):
+                while session.sent != expected:
+                    await anyio.sleep(0.01)
+
+        @server.tool()
+        def multiply(a: int, b: int) -> int:
+            return a * b
+
+        await sent(["tools"])
+        # Changes made in worker threads are announced on the event loop
+        tool = await server.get_tool("secret")
+        await anyio.to_thread.run_sync(tool.disable)
+        await sent(["tools", "tools"])
+
+
+class TestListChangedNotifier:
+    async def test_notifies_sessions_served_a_stale_listing(self):
+        notifier = ListChangedNotifier()
+        listed, idle = FakeSession(), FakeSession()
+        assert not notifier
+
+        notifier.served("tools", listed, 1)  # type: ignore[arg-type]
+        await notifier.notify("tools", 1)
+        await notifier.notify("tools", 2)
+        await notifier.notify("tools", 2)
+        await notifier.notify("prompts", 2)
+
+        assert listed.sent == ["tools"] and idle.sent == []
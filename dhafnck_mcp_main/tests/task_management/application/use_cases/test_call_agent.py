@@ -0,0 +1,19 @@
+"""Tests for CallAgentUseCase"""
+
+from fastmcp.task_management.application.use_cases import call_agent
+from fastmcp.task_management.application.use_cases.call_agent import CallAgentUseCase
+
+
+def test_agent_info_is_a_mutable_copy(tmp_path, monkeypatch):
+    monkeypatch.setattr(call_agent, "generate_docs_for_assignees", lambda *args, **kwargs: None)
+    agent_dir = tmp_path / "coding_agent"
+    agent_dir.mkdir()
+    (agent_dir / "job_desc.yaml").write_text("name: Coder\ngroups:\n  - read\n  - edit\n")
+    use_case = CallAgentUseCase(tmp_path)
+
+    agent_info = use_case.execute("coding_agent")["agent_info"]
+    assert type(agent_info["groups"]) is list
+    agent_info["groups"].append("command")
+    agent_info["name"] = "Changed"
+
+    assert use_case.execute("coding_agent")["agent_info"] == {"name": "Coder", "groups": ["read", "edit"]}
@@ -0,0 +1,38 @@
+"""Tests for the change counter of tasks"""
+
+import pytest
+
+from fastmcp.task_management.domain.entities.task import Task
+from fastmcp.task_management.domain.value_objects.priority import Priority
+from fastmcp.task_management.domain.value_objects.task_id import TaskId
+from fastmcp.task_management.infrastructure import JsonTaskRepository
+
+
+class TestTaskVersion:
+    """Every mutation bumps Task.version, which is saved with the task"""
+
+    def test_version_survives_reload(self, tmp_path):
+        task = Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it")
+        assert task.version == 0
+        task.update_priority(Priority.high())
+        task.add_label("backend")
+        assert task.version == 2
+
+        repository = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+        repository.save(task)
+        reloaded = JsonTaskRepository(file_path=str(tmp_path / "tasks.json")).find_by_id(task.id)
+        assert reloaded.version == 2
+
+    def test_one_bump_per_mutation(self):
+        task = Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it")
+        task.add_subtask(title="Step")
+        task.update_details_legacy(title="Renamed", description="Do it now", details="All of it")
+        assert task.version == 2
+        task.complete_task()
+        assert task.version == 3
+
+    def test_get_events_is_deprecated(self):
+        task = Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it")
+        task.update_title("Renamed")
+        with pytest.warns(DeprecationWarning):
+            assert task.get_events() == []
@@ -0,0 +1,79 @@
+"""Tests for the unified role resolution index"""
+
+import os
+
+from fastmcp.task_management.domain.enums.agent_roles import (
+    get_role_folder_name,
+    get_yaml_lib_path,
+    resolve_legacy_role,
+)
+from fastmcp.task_management.domain.enums.role_resolution import (
+    RoleResolutionIndex,
+    get_role_resolution_index,
+)
+from fastmcp.task_management.infrastructure.services.legacy.role_manager import (
+    RoleManager,
+)
+
+
+class TestRoleResolutionIndex:
+    """Every spelling of a role resolves through one table"""
+
+    def test_spellings_resolve_to_same_slug(self):
+        index = get_role_resolution_index()
+        for spelling in ("@coding-agent", "coding_agent", "Senior Developer", "senior_developer", "Coding Agent"):
+            assert index.resolve(spelling).directory == "coding_agent", spelling
+
+    def test_legacy_role_resolution_is_unchanged(self):
+        for spelling in ("coding_agent", " @coding-agent", "senior_developer", "cli_engineer"):
+            assert resolve_legacy_role(spelling) == "coding_agent", spelling
+        # Display names, bare names and unknown spellings never resolved
+        for spelling in ("Senior Developer", "Coding Agent", "coding", "@qa-engineer", "nobody", ""):
+            assert resolve_legacy_role(spelling) is None, spelling
+
+    def test_folder_and_yaml_lib_path_take_slugs_only(self):
+        assert get_role_folder_name("coding_agent") == "coding_agent"
+        assert get_yaml_lib_path("coding_agent") == "cursor_agent/yaml-lib/coding_agent"
+        for spelling in ("task_planner", "@qa-engineer", "Coding Agent", "unknown_agent"):
+            assert get_role_folder_name(spelling) is None, spelling
+            assert get_yaml_lib_path(spelling) is None, spelling
+
+    def test_yaml_lib_directories_are_indexed(self, tmp_path):
+        (tmp_path / "coding_agent").mkdir()
+        (tmp_path / "brand_new_agent").mkdir()
+        index = RoleResolutionIndex.build(tmp_path)
+
+        resolution = index.resolve("Brand New Agent")
+        assert resolution.directory == "brand_new_agent"
+        assert resolution.slug is None
+        assert index.agent_directories == ("brand_new_agent", "coding_agent")
+
+    def test_shared_index_follows_yaml_lib_changes(self, tmp_path):
+        index = get_role_resolution_index(tmp_path)
+        assert get_role_resolution_index(tmp_path) is index
+        assert index.resolve("Brand New Agent") is None
+
+        (tmp_path / "brand_new_agent").mkdir()
+        stat = tmp_path.stat()
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert get_role_resolution_index(tmp_path).resolve("Brand New Agent").directory == "brand_new_agent"
+
+    def test_role_manager_reports_legacy_names(self, tmp_path):
+        role_manager = RoleManager(tmp_path)
+        expected = {
+            "QA Engineer": "qa_engineer",
+            "Lead Developer": "senior_developer",
+            "platform_engineer": "platform_engineer",
+            "Backend Developer": "coding_agent",
+            "backend developer": "coding_agent",
+            "DevOps Engineer": "coding_agent",
+            "Platform Engineer": "coding_agent",
+            "Technical Writer": "task_planning_agent",
+            "QA Lead": "functional_tester_agent",
+            "coding_agent": "coding_agent",
+            "documentation_agent": "documentation_agent",
+        }
+        for assignee, role in expected.items():
+            assert role_manager.get_role_from_assignee(assignee) == role, assignee
+        for assignee in ("@coding_agent", "coding", "Coding Agent", "System Architect", "nobody"):
+            assert role_manager.get_role_from_assignee(assignee) is None, assignee
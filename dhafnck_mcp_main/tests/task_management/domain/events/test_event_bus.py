@@ -0,0 +1,65 @@
+"""Tests for the in-process domain event bus"""
+
+import pytest
+
+from fastmcp.task_management.domain.entities.task import Task
+from fastmcp.task_management.domain.events import EventBus, TasksCommitted, get_event_bus
+from fastmcp.task_management.domain.value_objects.priority import Priority
+from fastmcp.task_management.domain.value_objects.task_id import TaskId
+from fastmcp.task_management.infrastructure import JsonTaskRepository
+from fastmcp.task_management.infrastructure.repositories import get_task_change_log, get_task_stats_view
+
+
+@pytest.fixture
+def committed():
+    events = []
+    get_event_bus().subscribe(TasksCommitted, events.append)
+    yield events
+    get_event_bus().unsubscribe(TasksCommitted, events.append)
+
+
+class TestEventBus:
+    """Every task store write is published once, to the views that subscribe to it"""
+
+    def test_save_and_delete_publish_the_changed_tasks(self, tmp_path, committed):
+        tasks_file = tmp_path / "tasks.json"
+        repository = JsonTaskRepository(file_path=str(tasks_file))
+        task = Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it")
+        repository.save(task)
+        task.update_priority(Priority.high())
+        repository.save(task)
+        repository.delete(task.id)
+
+        created, updated, deleted = (event.changes for event in committed[-3:])
+        assert [(c.task_id, c.version, c.before, c.after["title"]) for c in created] == [("20250101001", 0, None, "Task")]
+        assert [(c.version, c.before["priority"], c.after["priority"]) for c in updated] == [(1, "medium", "high")]
+        assert [(c.task_id, c.version, c.after) for c in deleted] == [("20250101001", 1, None)]
+        assert committed[-1].store == str(tasks_file) and committed[-1].tasks == []
+
+    def test_views_are_subscribers(self, tmp_path):
+        tasks_file = tmp_path / "tasks.json"
+        repository = JsonTaskRepository(file_path=str(tasks_file))
+        repository.save(Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it"))
+
+        stats_view = get_task_stats_view()
+        recomputes = stats_view.recomputes
+        assert stats_view.get(tasks_file).total_tasks == 1
+        assert stats_view.recomputes == recomputes
+        assert get_task_change_log().current_sequence(tasks_file) == 1
+
+    def test_failing_handler_does_not_stop_the_others(self):
+        bus = EventBus()
+        delivered = []
+
+        def fail(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(TasksCommitted, fail)
+        bus.subscribe(TasksCommitted, delivered.append)
+        event = TasksCommitted(store="tasks.json", tasks=[])
+        bus.publish(event)
+        assert delivered == [event]
+
+        bus.unsubscribe(TasksCommitted, delivered.append)
+        bus.publish(TasksCommitted(store="tasks.json", tasks=[]))
+        assert delivered == [event]
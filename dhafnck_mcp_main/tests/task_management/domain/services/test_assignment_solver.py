@@ -0,0 +1,94 @@
+"""Tests for the global agent-to-tree assignment solver"""
+
+import itertools
+import random
+from datetime import datetime
+
+import pytest
+
+from fastmcp.task_management.domain.entities.agent import Agent, AgentCapability
+from fastmcp.task_management.domain.entities.project import Project
+from fastmcp.task_management.domain.entities.task import Task
+from fastmcp.task_management.domain.entities.task_tree import TaskTree
+from fastmcp.task_management.domain.services import assignment_solver
+from fastmcp.task_management.domain.services.assignment_solver import assign_with_capacity, solve_assignment
+from fastmcp.task_management.domain.services.orchestrator import CapabilityBasedStrategy
+from fastmcp.task_management.domain.value_objects.task_id import TaskId
+
+
+def _brute_force(scores):
+    rows, columns = len(scores), len(scores[0])
+    if rows <= columns:
+        return max(sum(scores[r][c] for r, c in enumerate(perm)) for perm in itertools.permutations(range(columns), rows))
+    return max(sum(scores[r][c] for c, r in enumerate(perm)) for perm in itertools.permutations(range(rows), columns))
+
+
+def _agent(agent_id, capabilities, max_concurrent_tasks=1):
+    return Agent(
+        id=agent_id, name=agent_id, description="", created_at=datetime.now(), updated_at=datetime.now(),
+        capabilities=set(capabilities), max_concurrent_tasks=max_concurrent_tasks,
+    )
+
+
+def _tree(tree_id, title):
+    tree = TaskTree(id=tree_id, name=tree_id, description="", project_id="p", created_at=datetime.now())
+    tree.add_root_task(Task.create(id=TaskId.from_string(f"2025010100{len(tree_id)}"), title=title, description=title))
+    return tree
+
+
+class TestSolveAssignment:
+    """The Hungarian solver finds the maximum-score matching"""
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            scores = [[rng.randint(0, 9) for _ in range(rng.randint(1, 5))]]
+            scores += [[rng.randint(0, 9) for _ in scores[0]] for _ in range(rng.randint(0, 4))]
+            pairs = solve_assignment(scores)
+            assert len(pairs) == min(len(scores), len(scores[0]))
+            assert sum(scores[r][c] for r, c in pairs) == _brute_force(scores)
+
+    def test_numpy_matches_pure_python(self, monkeypatch):
+        pytest.importorskip("numpy")
+        rng = random.Random(11)
+        for rows, columns in ((3, 4), (6, 6), (9, 5), (40, 200)):
+            scores = [[rng.randint(0, 20) for _ in range(columns)] for _ in range(rows)]
+            monkeypatch.setattr(assignment_solver, "NUMPY_MIN_COLUMNS", 0)
+            vectorized = solve_assignment(scores)
+            monkeypatch.setattr(assignment_solver, "np", None)
+            assert vectorized == solve_assignment(scores)
+            monkeypatch.undo()
+
+    def test_capacity_and_min_score(self):
+        assert assign_with_capacity([[5, 1], [5, 1], [5, 1]], [2, 2]) == {0: 0, 1: 0, 2: 1}
+        assert assign_with_capacity([[5, 0], [5, 0], [5, 0]], [2, 2]) == {0: 0, 1: 0}
+        assert assign_with_capacity([[5, 4], [5, 4]], [2, 2], slot_penalties=[2.0, 0.0]) in ({0: 0, 1: 1}, {0: 1, 1: 0})
+
+
+class TestCapabilityBasedStrategy:
+    """Trees are assigned globally and requirement scans are cached per tree version"""
+
+    def test_global_assignment_respects_capacity(self):
+        project = Project(id="p", name="p", description="", created_at=datetime.now(), updated_at=datetime.now())
+        project.task_trees = {"ui": _tree("ui", "Build react frontend"), "api": _tree("api", "Backend api server")}
+        frontend = _agent("frontend", [AgentCapability.FRONTEND_DEVELOPMENT])
+        backend = _agent("backend", [AgentCapability.BACKEND_DEVELOPMENT])
+
+        assignments = CapabilityBasedStrategy().assign_work(project, [backend, frontend])
+        assert assignments == {"ui": "frontend", "api": "backend"}
+
+        only_one_slot = CapabilityBasedStrategy().assign_work(project, [frontend])
+        assert only_one_slot == {"ui": "frontend"}
+
+    def test_requirements_cached_until_tree_or_task_changes(self):
+        strategy = CapabilityBasedStrategy()
+        tree = _tree("ui", "Build react frontend")
+        first = strategy._analyze_tree_requirements(tree)
+        assert strategy._analyze_tree_requirements(tree) is first
+
+        tree.add_root_task(Task.create(id=TaskId.from_string("20250101099"), title="Docker deploy", description="Ship it"))
+        assert AgentCapability.DEVOPS in strategy._analyze_tree_requirements(tree)["capabilities"]
+
+        task = tree.get_task("20250101099")
+        task.update_title("Write the docs")
+        assert AgentCapability.DEVOPS not in strategy._analyze_tree_requirements(tree)["capabilities"]
@@ -0,0 +1,71 @@
+"""Tests for the Monte-Carlo completion forecast"""
+
+import json
+import random
+from datetime import datetime
+
+from fastmcp.task_management.domain.services import completion_forecast
+from fastmcp.task_management.domain.services.completion_forecast import (
+    ForecastTask,
+    max_simulations,
+    percentile,
+    simulate_completion_hours,
+    summarize_completion,
+    topological_order,
+)
+
+
+class TestSimulation:
+    """Simulated schedules follow the dependency DAG and the available parallelism"""
+
+    def test_chain_and_parallel_bounds(self):
+        chain = [ForecastTask("b", 4.0, ("a",)), ForecastTask("a", 4.0)]
+        assert [task.id for task in topological_order(chain)] == ["a", "b"]
+        hours = simulate_completion_hours(chain, parallelism=4, simulations=500, rng=random.Random(1))
+        assert all(4.0 <= h <= 16.0 for h in hours)
+        assert 8.0 < percentile(sorted(hours), 50) < 10.0
+
+        independent = [ForecastTask(str(i), 2.0) for i in range(8)]
+        serial = simulate_completion_hours(independent, parallelism=1, simulations=200, rng=random.Random(1))
+        wide = simulate_completion_hours(independent, parallelism=8, simulations=200, rng=random.Random(1))
+        assert min(serial) >= 8.0 and max(wide) <= 4.0
+
+    def test_samples_are_independent(self):
+        chain = [ForecastTask("a", 4.0), ForecastTask("b", 4.0, ("a",))]
+        hours = simulate_completion_hours(chain, parallelism=1, simulations=5000, rng=random.Random(1))
+        # More distinct schedules than the fallback has quantiles per task
+        assert len(set(hours)) > completion_forecast.QUANTILE_TABLE_SIZE
+
+    def test_fallback_simulations_capped_to_budget(self, monkeypatch):
+        monkeypatch.setattr(completion_forecast, "np", None)
+        assert max_simulations(10, 2000) == 2000
+        assert max_simulations(10_000, 5000) * 10_000 <= completion_forecast.FALLBACK_SAMPLE_BUDGET
+        assert max_simulations(10**9, 5000) == completion_forecast.MIN_SIMULATIONS
+
+        hours = simulate_completion_hours([ForecastTask("a", 4.0)], parallelism=1, simulations=300)
+        assert len(hours) == 300 and all(2.0 <= h <= 8.0 for h in hours)
+
+    def test_cycles_and_done_tasks(self):
+        tasks = [ForecastTask("a", 1.0, ("b",)), ForecastTask("b", 0.0, ("a",))]
+        assert len(topological_order(tasks)) == 2
+        assert simulate_completion_hours([ForecastTask("done", 0.0)], 1, 3) == [0.0, 0.0, 0.0]
+        summary = summarize_completion([8.0] * 10, datetime(2025, 1, 1))
+        assert summary == {"p50_hours": 8.0, "p50_date": "2025-01-02", "p90_hours": 8.0, "p90_date": "2025-01-02"}
+
+
+def test_project_forecast(tmp_project_manager):
+    manager = tmp_project_manager
+    manager.create_project("web", "Web")
+    manager.create_task_tree("web", "ui", "UI", "")
+    tasks = [
+        {"id": "20250101001", "title": "Design", "description": "d", "status": "done", "estimatedEffort": "large"},
+        {"id": "20250101002", "title": "Build", "description": "d", "status": "todo", "estimatedEffort": "xlarge",
+         "dependencies": ["20250101001"]},
+    ]
+    manager.path_resolver.get_tasks_json_path("web", "ui", "default_id").write_text(json.dumps({"tasks": tasks}))
+
+    forecast = manager.forecast("web", simulations=300, seed=3)
+    tree = forecast["trees"]["ui"]
+    assert tree["open_tasks"] == 1 and tree["estimated_hours"] == 8.0
+    assert 4.0 <= tree["p50_hours"] <= tree["p90_hours"] <= 16.0
+    assert forecast["project"]["p90_hours"] == tree["p90_hours"]
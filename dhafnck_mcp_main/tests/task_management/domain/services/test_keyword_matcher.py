@@ -0,0 +1,72 @@
+"""Tests for the shared single-pass KeywordMatcher"""
+
+import random
+import time
+
+import pytest
+
+from fastmcp.task_management.domain.enums.common_labels import CommonLabel
+from fastmcp.task_management.domain.services.keyword_matcher import KeywordMatcher
+
+
+def _naive_match(table, text):
+    """Reference implementation: the nested any(keyword in text) loops it replaces"""
+    text = text.lower()
+    return {key for key, keywords in table.items() if any(keyword in text for keyword in keywords)}
+
+
+def _task_corpus(size: int, seed: int = 42):
+    """Build a reproducible corpus of task texts from label keywords and filler words"""
+    rng = random.Random(seed)
+    vocabulary = [keyword for label in CommonLabel for keyword in label.get_keywords()]
+    vocabulary += ["the", "user", "page", "should", "handle", "payload", "when", "data", "guide", "rapid"]
+    return [" ".join(rng.choice(vocabulary) for _ in range(rng.randint(8, 40))) for _ in range(size)]
+
+
+class TestKeywordMatcher:
+    """KeywordMatcher keeps substring semantics while scanning once"""
+
+    def test_overlapping_and_nested_keywords(self):
+        matcher = KeywordMatcher({
+            "testing": ["test", "testing"],
+            "frontend": ["ui"],
+            "quality": ["qa"],
+        })
+        # "ui" only occurs inside "build"/"guide"; "test" is a prefix of "testing"
+        assert matcher.match("Build the testing GUIDE") == {"testing", "frontend"}
+        assert matcher.find_keywords("Build the testing GUIDE") == {"test", "testing", "ui"}
+        assert matcher.match("") == set()
+
+    def test_empty_table(self):
+        assert KeywordMatcher({}).match("anything") == set()
+
+    def test_matches_naive_loops_on_corpus(self):
+        table = {label: label.get_keywords() for label in CommonLabel}
+        matcher = KeywordMatcher(table)
+        for text in _task_corpus(500):
+            assert matcher.match(text) == _naive_match(table, text)
+
+    def test_suggest_labels_uses_label_keywords(self):
+        labels = CommonLabel.suggest_labels("Fix login bug in React frontend")
+        assert {"bug", "frontend", "auth"} <= set(labels)
+        assert len(labels) == len(set(labels))
+
+
+@pytest.mark.performance
+@pytest.mark.timeout(60)
+def test_keyword_matcher_benchmark_10k_tasks():
+    """Compare the single-pass matcher with nested loops over a 10k-task corpus"""
+    table = {label: label.get_keywords() for label in CommonLabel}
+    corpus = _task_corpus(10_000)
+    matcher = KeywordMatcher(table)
+
+    started = time.perf_counter()
+    naive_results = [_naive_match(table, text) for text in corpus]
+    naive_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    matcher_results = [matcher.match(text) for text in corpus]
+    matcher_elapsed = time.perf_counter() - started
+
+    print(f"\n10k tasks: nested loops {naive_elapsed:.3f}s, single-pass matcher {matcher_elapsed:.3f}s")
+    assert matcher_results == naive_results
@@ -0,0 +1,148 @@
+"""Tests for the coalescing, atomic projects store"""
+
+import json
+import os
+
+import pytest
+
+from fastmcp.task_management.infrastructure.repositories import project_store
+from fastmcp.task_management.infrastructure.repositories.project_store import (
+    JsonProjectStore,
+)
+
+
+def _touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+class TestJsonProjectStore:
+    """projects.json commits are coalesced, atomic and reloaded on external change"""
+
+    def test_burst_of_mutations_is_written_once(self, tmp_path):
+        projects_file = tmp_path / "projects.json"
+        store = JsonProjectStore(projects_file, flush_delay=60)
+        for index in range(10):
+            store.projects[f"p{index}"] = {"id": f"p{index}"}
+            store.mark_dirty(f"p{index}")
+
+        assert not projects_file.exists()
+        store.flush()
+        assert store.writes == 1
+        assert len(json.loads(projects_file.read_text())) == 10
+        assert sorted(path.name for path in tmp_path.iterdir()) == [".projects.json.lock", "projects.json"]
+
+    def test_reloads_changes_from_other_writers(self, tmp_path):
+        projects_file = tmp_path / "projects.json"
+        store = JsonProjectStore(projects_file, flush_delay=0)
+        store.projects["mine"] = {"id": "mine"}
+        store.mark_dirty("mine")
+
+        other = JsonProjectStore(projects_file, flush_delay=0)
+        other.projects["theirs"] = {"id": "theirs"}
+        other.mark_dirty("theirs")
+        _touch_later(projects_file)
+
+        assert store.refresh() is True
+        assert set(store.projects) == {"mine", "theirs"}
+        assert store.refresh() is False
+
+    def test_commit_keeps_projects_committed_by_other_writers(self, tmp_path):
+        projects_file = tmp_path / "projects.json"
+        store = JsonProjectStore(projects_file, flush_delay=0)
+        other = JsonProjectStore(projects_file, flush_delay=0)
+
+        store.projects["mine"] = {"id": "mine", "tags": ["a", "b"]}
+        store.mark_dirty("mine")
+        other.projects["theirs"] = {"id": "theirs"}
+        other.mark_dirty("theirs")
+
+        expected = {"mine": {"id": "mine", "tags": ["a", "b"]}, "theirs": {"id": "theirs"}}
+        assert projects_file.read_text() == json.dumps(expected, indent=2)
+        # other wrote over a file it had not read yet, so it reloads the merge
+        assert other.refresh() is True
+        assert other.projects == expected
+
+    def test_failed_commit_keeps_changes_pending(self, tmp_path, monkeypatch):
+        projects_file = tmp_path / "projects.json"
+        store = JsonProjectStore(projects_file, flush_delay=60)
+        store.projects["a"] = {"id": "a"}
+        store.mark_dirty("a")
+
+        def fail(path, content):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(project_store, "atomic_write_text", fail)
+            store.flush()
+        assert not projects_file.exists()
+        assert store.refresh() is False
+
+        store.flush()
+        assert json.loads(projects_file.read_text()) == {"a": {"id": "a"}}
+
+    def test_unserializable_project_fails_the_mutation(self, tmp_path):
+        store = JsonProjectStore(tmp_path / "projects.json", flush_delay=60)
+        store.projects["a"] = {"id": "a", "created": object()}
+        with pytest.raises(TypeError):
+            store.mark_dirty("a")
+
+        store.projects["b"] = {"id": "b"}
+        store.mark_dirty("b")
+        store.flush()
+        assert json.loads((tmp_path / "projects.json").read_text()) == {"b": {"id": "b"}}
+
+    def test_pending_changes_survive_refresh(self, tmp_path):
+        projects_file = tmp_path / "projects.json"
+        projects_file.write_text(json.dumps({"a": {"id": "a"}}))
+        store = JsonProjectStore(projects_file, flush_delay=60)
+        store.projects["b"] = {"id": "b"}
+        store.mark_dirty("b")
+        _touch_later(projects_file)
+
+        assert store.refresh() is False
+        assert set(store.projects) == {"a", "b"}
+        store.flush()
+
+    def test_per_project_files_rewrite_only_dirty_projects(self, tmp_path):
+        projects_file = tmp_path / "projects.json"
+        projects_file.write_text(json.dumps({"a": {"id": "a"}, "b": {"id": "b"}}))
+
+        store = JsonProjectStore(projects_file, per_project_files=True, flush_delay=0)
+        store.flush()
+        assert sorted(path.name for path in (tmp_path / "projects").iterdir()) == ["a.json", "b.json"]
+        assert store.writes == 2
+
+        store.projects["a"]["name"] = "renamed"
+        store.mark_dirty("a")
+        assert store.writes == 3
+
+        del store.projects["b"]
+        store.mark_dirty("b")
+        reloaded = JsonProjectStore(projects_file, per_project_files=True)
+        assert reloaded.projects == {"a": {"id": "a", "name": "renamed"}}
+
+    def test_per_project_ids_cannot_leave_the_directory(self, tmp_path):
+        store = JsonProjectStore(tmp_path / "projects.json", per_project_files=True, flush_delay=0)
+        for project_id in ("../../x", "a/b", ".hidden", ""):
+            store.projects[project_id] = {"id": project_id}
+            with pytest.raises(ValueError, match="Invalid project id"):
+                store.mark_dirty(project_id)
+            del store.projects[project_id]
+        assert not (tmp_path / "x.json").exists() and not (tmp_path / "projects").exists()
+
+    def test_reloads_only_when_no_project_lock_is_held(self, tmp_path):
+        projects_file = tmp_path / "projects.json"
+        store = JsonProjectStore(projects_file, flush_delay=0)
+        other = JsonProjectStore(projects_file, flush_delay=0)
+
+        with store.project_lock("a"):
+            projects = store.projects
+            other.projects["theirs"] = {"id": "theirs"}
+            other.mark_dirty("theirs")
+            _touch_later(projects_file)
+            with store.project_lock("b"):
+                assert store.projects is projects
+            assert store.refresh() is False
+        with store.project_lock("a"):
+            assert set(store.projects) == {"theirs"}
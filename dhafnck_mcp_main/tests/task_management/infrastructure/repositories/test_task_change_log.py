@@ -0,0 +1,93 @@
+"""Tests for the per-tree task change feed"""
+
+import json
+
+from fastmcp.task_management.domain.entities.task import Task
+from fastmcp.task_management.domain.value_objects.task_id import TaskId
+from fastmcp.task_management.infrastructure.repositories import task_change_log
+from fastmcp.task_management.infrastructure.repositories.json_task_repository import JsonTaskRepository
+from fastmcp.task_management.infrastructure.repositories.task_change_log import CHANGES_FILE_NAME, TaskChangeLog
+
+
+def _tasks(*titles):
+    return [{"id": str(i), "title": title} for i, title in enumerate(titles, 1)]
+
+
+class TestTaskChangeLog:
+    """Only tasks changed after the client's sequence are returned"""
+
+    def test_delta_and_tombstones(self, tmp_path):
+        tasks_file = tmp_path / "tasks.json"
+        log = TaskChangeLog()
+        for data in ({"tasks": _tasks("A", "B")}, {"tasks": _tasks("A", "B2", "C")}, {"tasks": _tasks("A", "B2")}):
+            tasks_file.write_text(json.dumps(data))
+            log.record(tasks_file, data)
+
+        assert log.current_sequence(tasks_file) == 3
+        delta = log.changes_since(tasks_file, 1)
+        assert [task["title"] for task in delta["changed"]] == ["B2"]
+        assert delta["deleted"] == [{"id": "3", "sequence": 3}]
+        assert log.changes_since(tasks_file, 3)["changed"] == []
+
+        # Edited outside a repository, persisted across restarts
+        tasks_file.write_text(json.dumps({"tasks": _tasks("A2", "B2")}))
+        restarted = TaskChangeLog()
+        delta = restarted.changes_since(tasks_file, 3)
+        assert delta["sequence"] == 4 and [task["id"] for task in delta["changed"]] == ["1"]
+        assert (tmp_path / CHANGES_FILE_NAME).exists()
+
+    def test_compacted_tombstones_force_reset(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(task_change_log, "MAX_TOMBSTONES", 1)
+        tasks_file = tmp_path / "tasks.json"
+        log = TaskChangeLog()
+        for data in ({"tasks": _tasks("A", "B", "C")}, {"tasks": _tasks("A", "B")}, {"tasks": _tasks("A")}):
+            tasks_file.write_text(json.dumps(data))
+            log.record(tasks_file, data)
+
+        assert log.changes_since(tasks_file, 2)["deleted"] == [{"id": "2", "sequence": 3}]
+        delta = log.changes_since(tasks_file, 1)
+        assert delta["reset"] and delta["deleted"] == [] and [task["id"] for task in delta["changed"]] == ["1"]
+        assert log.changes_since(tasks_file, 99)["reset"]
+
+    def test_logs_sharing_a_tree_never_reuse_a_sequence(self, tmp_path):
+        # Two logs stand in for two server processes writing the same tree
+        tasks_file = tmp_path / "tasks.json"
+        first, second = TaskChangeLog(), TaskChangeLog()
+        sequences = []
+        for i, log in enumerate([first, second, first, second]):
+            data = {"tasks": _tasks(*[f"T{n}" for n in range(i + 1)])}
+            tasks_file.write_text(json.dumps(data))
+            sequences.append(log.record(tasks_file, data))
+
+        assert sequences == [1, 2, 3, 4]
+        delta = first.changes_since(tasks_file, 3)
+        assert delta["sequence"] == 4 and [task["id"] for task in delta["changed"]] == ["4"]
+
+    def test_torn_reads_do_not_delete_tasks(self, tmp_path):
+        tasks_file = tmp_path / "tasks.json"
+        log = TaskChangeLog()
+        for data in ({"tasks": _tasks("A")}, {"tasks": _tasks("A", "B")}):
+            tasks_file.write_text(json.dumps(data))
+            log.record(tasks_file, data)
+
+        # A half-written file, as seen while another process rewrites it
+        text = json.dumps({"tasks": _tasks("A", "B")})
+        tasks_file.write_text(text[:len(text) // 2])
+        delta = log.changes_since(tasks_file, 1)
+        assert delta["sequence"] == 2 and delta["deleted"] == []
+
+        tasks_file.write_text(text + " ")
+        delta = log.changes_since(tasks_file, 2)
+        assert delta["sequence"] == 2 and delta["changed"] == [] and delta["deleted"] == []
+
+
+def test_repository_writes_advance_sequence(tmp_path):
+    repository = JsonTaskRepository(file_path=str(tmp_path / "tasks.json"))
+    start = repository.changes_since()["sequence"]
+    task = Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it")
+    repository.save(task)
+    repository.delete(task.id)
+
+    delta = repository.changes_since(start)
+    assert delta["sequence"] == start + 2
+    assert delta["changed"] == [] and delta["deleted"] == [{"id": "20250101001", "sequence": start + 2}]
@@ -0,0 +1,106 @@
+"""Tests for the materialized task tree statistics"""
+
+import json
+
+from fastmcp.task_management.domain import Priority, Task, TaskId, TaskStatus
+from fastmcp.task_management.infrastructure.repositories.json_task_repository import JsonTaskRepository
+from fastmcp.task_management.infrastructure.repositories.task_stats import (
+    STATS_FILE_NAME,
+    TaskStatsView,
+    TreeStats,
+    get_task_stats_view,
+)
+
+
+TASKS = [
+    {"id": "1", "title": "A", "status": "todo", "priority": "high", "assignees": ["@coding_agent"], "dueDate": "2000-01-01"},
+    {"id": "2", "title": "B", "status": "done", "assignees": ["@coding_agent"], "dependencies": ["1"]},
+    {"id": "3", "status": "blocked", "dependencies": ["99"]},
+    "not a task",
+]
+
+
+class TestTreeStats:
+    """A tree summary carries everything the project tools used to recompute"""
+
+    def test_summary(self):
+        stats = TreeStats.from_tasks(TASKS)
+        assert stats.total_tasks == 4
+        assert stats.count("todo") == 1 and stats.count("done") == 1 and stats.count("blocked") == 1
+        assert stats.todo_high_priority == 1
+        assert stats.overdue_tasks() == 1
+        assert stats.assignee_workloads == {"@coding_agent": 1}
+        assert stats.orphaned_dependencies == [{"task_id": "3", "dependency_id": "99"}]
+        assert stats.schema_violations == ["Task 3 missing required 'title' field", "Task 3 is not a valid object"]
+
+    def test_round_trip(self):
+        stats = TreeStats.from_tasks(TASKS, (1, 2))
+        assert TreeStats.from_dict(json.loads(json.dumps(stats.to_dict()))) == stats
+
+
+class TestTaskStatsView:
+    """Statistics are served from the view until tasks.json changes"""
+
+    def test_cached_until_file_changes(self, tmp_path):
+        tasks_file = tmp_path / "tasks.json"
+        tasks_file.write_text(json.dumps({"tasks": TASKS[:1]}))
+        view = TaskStatsView()
+
+        assert view.get(tasks_file).total_tasks == 1
+        assert view.get(tasks_file).total_tasks == 1
+        assert view.recomputes == 1
+        assert (tmp_path / STATS_FILE_NAME).exists()
+
+        tasks_file.write_text(json.dumps({"tasks": TASKS}))
+        assert view.get(tasks_file).total_tasks == 4
+        view.get(tasks_file, deep=True)
+        assert view.recomputes == 3
+
+    def test_persisted_stats_are_reused(self, tmp_path):
+        tasks_file = tmp_path / "tasks.json"
+        tasks_file.write_text(json.dumps({"tasks": TASKS}))
+        TaskStatsView().get(tasks_file)
+
+        fresh = TaskStatsView()
+        assert fresh.get(tasks_file).total_tasks == 4
+        assert fresh.recomputes == 0
+
+    def test_repository_writes_update_the_view(self, tmp_path):
+        tasks_file = tmp_path / "tree" / "tasks.json"
+        repository = JsonTaskRepository(file_path=str(tasks_file))
+        repository._save_data({"tasks": TASKS[:2]})
+
+        view = get_task_stats_view()
+        recomputes = view.recomputes
+        assert view.get(tasks_file).count("done") == 1
+        assert view.recomputes == recomputes
+
+    def test_repository_writes_apply_only_the_changed_tasks(self, tmp_path, monkeypatch):
+        tasks_file = tmp_path / "tree" / "tasks.json"
+        repository = JsonTaskRepository(file_path=str(tasks_file))
+        first = Task.create(id=TaskId.from_string("20250101001"), title="A", description="a")
+        second = Task.create(id=TaskId.from_string("20250101002"), title="B", description="b")
+        repository.save(first)
+
+        summaries = []
+        from_tasks = TreeStats.from_tasks.__func__
+        monkeypatch.setattr(TreeStats, "from_tasks", classmethod(
+            lambda cls, *args, **kwargs: summaries.append(args) or from_tasks(cls, *args, **kwargs)
+        ))
+        second.add_dependency(first.id)
+        second.update_assignees(["@coding_agent"])
+        repository.save(second)
+        first.update_priority(Priority.high())
+        first.update_due_date("2000-01-01")
+        repository.save(first)
+        second.update_status(TaskStatus.in_progress())
+        repository.save(second)
+        assert summaries == []
+
+        repository.delete(first.id)
+        stats = get_task_stats_view().get(tasks_file)
+        monkeypatch.undo()
+        expected = TreeStats.from_tasks(json.loads(tasks_file.read_text())["tasks"], stats.stamp)
+        assert stats == expected
+        assert stats.orphaned_dependencies == [{"task_id": "20250101002", "dependency_id": "20250101001"}]
+        assert stats.assignee_workloads == {"@coding_agent": 1} and stats.count("in_progress") == 1
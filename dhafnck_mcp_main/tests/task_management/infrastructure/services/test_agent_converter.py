@@ -0,0 +1,28 @@
+"""Tests for AgentConverter capability inference"""
+
+import pytest
+
+from fastmcp.task_management.domain.entities.agent import AgentCapability
+from fastmcp.task_management.infrastructure.services.agent_converter import AgentConverter
+
+
+class TestInferAgentMapping:
+    """Unmapped agent names are matched against whole words, not substrings"""
+
+    @pytest.mark.parametrize("call_agent, capabilities", [
+        ("@ui-designer-agent", {AgentCapability.FRONTEND_DEVELOPMENT}),
+        ("@api-test-agent", {AgentCapability.BACKEND_DEVELOPMENT, AgentCapability.TESTING}),
+        ("@qa_agent", {AgentCapability.TESTING}),
+        ("@build-agent", {AgentCapability.BACKEND_DEVELOPMENT}),
+        ("@user-guide-agent", {AgentCapability.BACKEND_DEVELOPMENT}),
+        ("@code-quality-reviewer-agent", {AgentCapability.TESTING}),
+        ("@equality-agent", {AgentCapability.BACKEND_DEVELOPMENT}),
+    ])
+    def test_capabilities_from_name_words(self, call_agent, capabilities):
+        inferred, _, _ = AgentConverter()._extract_agent_details(call_agent)
+        assert inferred == capabilities
+
+    def test_known_agents_keep_their_mapping(self):
+        capabilities, specializations, _ = AgentConverter()._extract_agent_details("@documentation-agent")
+        assert capabilities == {AgentCapability.DOCUMENTATION}
+        assert "technical_writing" in specializations
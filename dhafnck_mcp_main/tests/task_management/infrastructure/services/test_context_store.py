@@ -0,0 +1,115 @@
+"""Tests for the write-behind context file store"""
+
+import threading
+
+from fastmcp.task_management.domain.entities.task import Task
+from fastmcp.task_management.domain.value_objects.task_id import TaskId
+from fastmcp.task_management.domain.value_objects.task_status import TaskStatus
+from fastmcp.task_management.infrastructure.services import context_generate
+from fastmcp.task_management.infrastructure.services.context_generate import (
+    ContextFileStore,
+    ContextGenerator,
+    generate_task_context_if_needed,
+    update_task_context,
+)
+
+
+def _task() -> Task:
+    task = Task.create(id=TaskId.from_string("20250101001"), title="Context task", description="Write context")
+    task.project_id = "proj"
+    return task
+
+
+class TestContextFileStore:
+    """Context writes are coalesced, atomic and skipped when unchanged"""
+
+    def test_updates_are_coalesced_until_flush(self, tmp_path):
+        store = ContextFileStore(flush_delay=60)
+        generator = ContextGenerator(str(tmp_path), store=store)
+        task = _task()
+
+        assert generator.generate_context_file_if_not_exists(task) is True
+        assert generator.generate_context_file_if_not_exists(task) is False
+        task.update_status(TaskStatus.in_progress())
+        assert generator.update_context_file(task) is True
+
+        path = tmp_path / "default_id" / "proj" / "context_20250101001.md"
+        assert not path.exists()
+        store.flush()
+        assert "**Status**: `in_progress`" in path.read_text(encoding="utf-8")
+        assert store.writes == 1
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_unchanged_content_is_not_rewritten(self, tmp_path):
+        store = ContextFileStore(flush_delay=0)
+        generator = ContextGenerator(str(tmp_path), store=store)
+        task = _task()
+
+        generator.generate_context_file_if_not_exists(task)
+        assert generator.update_context_file(task) is True
+        assert store.writes == 1
+        assert store.skipped_writes == 1
+
+    def test_missing_file_is_not_updated(self, tmp_path):
+        generator = ContextGenerator(str(tmp_path), store=ContextFileStore(flush_delay=0))
+        assert generator.update_context_file(_task()) is False
+
+    def test_directory_recreated_after_removal(self, tmp_path):
+        store = ContextFileStore(flush_delay=0)
+        path = tmp_path / "a" / "context.md"
+        store.write(path, "one")
+        path.unlink()
+        path.parent.rmdir()
+        store.write(path, "two")
+        assert path.read_text(encoding="utf-8") == "two"
+
+    def test_flush_one_file_for_the_caller(self, tmp_path, monkeypatch):
+        store = ContextFileStore(flush_delay=60)
+        other = tmp_path / "other.md"
+        store.write(other, "queued")
+
+        generator = ContextGenerator(str(tmp_path), store=store)
+        monkeypatch.setattr(context_generate, "ContextGenerator", lambda: generator)
+        assert generate_task_context_if_needed(_task()) is True
+
+        assert (tmp_path / "default_id" / "proj" / "context_20250101001.md").exists()
+        assert not other.exists() and store.read(other) == "queued"
+        store.flush()
+        assert other.read_text(encoding="utf-8") == "queued"
+
+    def test_disk_writes_do_not_block_readers(self, tmp_path, monkeypatch):
+        store = ContextFileStore(flush_delay=60)
+        path = tmp_path / "context.md"
+        store.write(path, "in flight")
+        writing, release = threading.Event(), threading.Event()
+
+        def slow_write(target, content):
+            writing.set()
+            assert release.wait(2)
+            target.write_text(content, encoding="utf-8")
+
+        monkeypatch.setattr(context_generate, "atomic_write_text", slow_write)
+        flusher = threading.Thread(target=store.flush)
+        flusher.start()
+        assert writing.wait(2)
+
+        assert store.read(path) == "in flight" and store.exists(path)
+        assert store.write(tmp_path / "next.md", "next") is True
+        release.set()
+        flusher.join(2)
+        assert path.read_text(encoding="utf-8") == "in flight"
+
+    def test_context_updates_are_coalesced(self, tmp_path, monkeypatch):
+        store = ContextFileStore(flush_delay=60)
+        generator = ContextGenerator(str(tmp_path), store=store)
+        monkeypatch.setattr(context_generate, "ContextGenerator", lambda: generator)
+        task = _task()
+        assert generate_task_context_if_needed(task) is True
+        assert store.writes == 1
+
+        for status in (TaskStatus.in_progress(), TaskStatus.review()):
+            task.update_status(status)
+            assert update_task_context(task) is True
+        assert store.writes == 1
+        store.flush()
+        assert store.writes == 2
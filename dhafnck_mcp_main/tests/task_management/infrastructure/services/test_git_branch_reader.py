@@ -0,0 +1,62 @@
+"""Tests for the in-process git branch reader"""
+
+import subprocess
+
+import pytest
+
+from fastmcp.task_management.infrastructure.services.git_branch_reader import GitBranchReader
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q", "-b", "main")
+    _git(tmp_path, "-c", "user.email=t@example.com", "-c", "user.name=t", "commit", "-q", "--allow-empty", "-m", "init")
+    _git(tmp_path, "branch", "feature/login")
+    _git(tmp_path, "branch", "hotfix")
+    return tmp_path
+
+
+class TestGitBranchReader:
+    """Branches are read from .git without spawning git"""
+
+    def test_matches_git_cli(self, repo):
+        _git(repo, "pack-refs", "--all")
+        _git(repo, "branch", "loose-after-pack")
+        reader = GitBranchReader()
+
+        state = reader.read(str(repo))
+        assert state.current_branch == "main"
+        assert state.branches == {"main", "feature/login", "hotfix", "loose-after-pack"}
+        assert reader.cli_calls == 0
+
+    def test_cache_invalidated_by_branch_changes(self, repo):
+        reader = GitBranchReader()
+        first = reader.read(str(repo))
+        assert reader.read(str(repo)) is first
+
+        _git(repo, "branch", "-D", "hotfix")
+        _git(repo, "checkout", "-q", "feature/login")
+        state = reader.read(str(repo))
+        assert "hotfix" not in state.branches
+        assert state.current_branch == "feature/login"
+
+    def test_detached_head(self, repo):
+        _git(repo, "checkout", "-q", "--detach")
+        assert GitBranchReader().read(str(repo)).current_branch == ""
+
+    def test_worktree_falls_back_to_cli(self, repo, tmp_path_factory):
+        worktree = tmp_path_factory.mktemp("wt") / "tree"
+        _git(repo, "worktree", "add", "-q", str(worktree), "hotfix")
+        reader = GitBranchReader()
+
+        state = reader.read(str(worktree))
+        assert state.current_branch == "hotfix"
+        assert "main" in state.branches
+        assert reader.cli_calls == 1
+
+    def test_outside_repository(self, tmp_path):
+        assert GitBranchReader().read(str(tmp_path)) is None
@@ -0,0 +1,51 @@
+"""Tests for compiled templates in the legacy rules TemplateEngine"""
+
+import os
+from pathlib import Path
+
+from fastmcp.task_management.infrastructure.services.legacy.rules_generator import (
+    CompiledTemplate,
+    TemplateCache,
+    TemplateEngine,
+)
+
+
+class TestCompiledTemplates:
+    """Templates are split into segments once and rendered by joining them"""
+
+    def test_render_matches_substitution(self):
+        template = CompiledTemplate("# {{role}}\n{{missing}} - {{task}}{{none}}")
+        rendered = template.render({"role": "Coding Agent", "task": 42, "none": None})
+        assert rendered == "# Coding Agent\n{{missing}} - 42None"
+        assert template.variable_names == ("role", "missing", "task", "none")
+
+    def test_compile_template_reuses_cached_segments(self, tmp_path):
+        engine = TemplateEngine(tmp_path, template_cache=TemplateCache())
+        assert engine.compile_template("{{a}}") is engine.compile_template("{{a}}")
+
+    def test_role_template_invalidated_on_file_change(self, tmp_path: Path):
+        template_file = tmp_path / "coding_agent" / "template.md"
+        template_file.parent.mkdir()
+        template_file.write_text("v1 {{task_title}}")
+
+        engine = TemplateEngine(tmp_path, template_cache=TemplateCache())
+        first = engine.load_compiled_role_template("coding_agent")
+        assert first is engine.load_compiled_role_template("coding_agent")
+
+        template_file.write_text("version 2 {{task_title}}")
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert engine.load_role_template("coding_agent") == "version 2 {{task_title}}"
+
+    def test_cache_is_bounded(self):
+        cache = TemplateCache(max_entries=2)
+        for name in ("a", "b", "c"):
+            cache.put(name, CompiledTemplate(name))
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("c").source == "c"
+
+    def test_render_many(self, tmp_path):
+        engine = TemplateEngine(tmp_path, template_cache=TemplateCache())
+        rendered = engine.render_many("task {{id}}", [{"id": 1}, {"id": 2}])
+        assert rendered == ["task 1", "task 2"]
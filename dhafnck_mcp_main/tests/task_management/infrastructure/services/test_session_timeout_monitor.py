@@ -0,0 +1,139 @@
+"""Tests for deadline-driven work session timeouts"""
+
+import asyncio
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from fastmcp.task_management.domain.entities.project import Project
+from fastmcp.task_management.domain.entities.task import Task
+from fastmcp.task_management.domain.entities.work_session import SessionStatus, WorkSession
+from fastmcp.task_management.domain.value_objects.task_id import TaskId
+from fastmcp.task_management.infrastructure import JsonTaskRepository
+from fastmcp.task_management.infrastructure.repositories.task_repository_factory import TaskRepositoryFactory
+from fastmcp.task_management.infrastructure.services.session_timeout_monitor import SessionTimeoutMonitor
+from fastmcp.task_management.interface.consolidated_mcp_tools import ProjectManager, TaskOperationHandler
+
+
+def _session(session_id, minutes, started_minutes_ago=0):
+    return WorkSession(
+        id=session_id, agent_id="coder", task_id="20250101001", tree_id="ui",
+        started_at=datetime.now() - timedelta(minutes=started_minutes_ago),
+        max_duration=timedelta(minutes=minutes),
+    )
+
+
+@pytest.fixture
+def manager(tmp_project_manager):
+    manager = tmp_project_manager
+    manager.create_project("web", "Web")
+    manager.create_task_tree("web", "ui", "UI", "")
+    return manager
+
+
+class TestSessionDeadlines:
+    """Sessions expire from the deadline heap and release their locks"""
+
+    def test_expires_due_sessions_only(self):
+        project = Project(id="p", name="p", description="", created_at=datetime.now(), updated_at=datetime.now())
+        due, later, extended = _session("due", 5, 10), _session("later", 60), _session("extended", 5, 10)
+        due.lock_resource("db")
+        for session in (due, later, extended):
+            project.restore_work_session(session)
+        extended.extend_session(timedelta(hours=1))
+
+        expired = project.expire_timed_out_sessions()
+        assert [session.id for session in expired] == ["due"]
+        assert due.status == SessionStatus.TIMEOUT and due.resources_locked == []
+        assert "db" not in project.resource_locks
+        assert set(project.active_work_sessions) == {"later", "extended"}
+        assert project.next_session_deadline() == min(later.get_deadline(), extended.get_deadline())
+
+    def test_resumed_session_times_out_again(self):
+        project = Project(id="p", name="p", description="", created_at=datetime.now(), updated_at=datetime.now())
+        session = _session("paused", 5, 10)
+        project.restore_work_session(session)
+        project.pause_work_session("paused")
+        assert project.expire_timed_out_sessions() == []
+        assert project.next_session_deadline() is None
+
+        project.resume_work_session("paused")
+        assert project.next_session_deadline() == session.get_deadline()
+        assert project.expire_timed_out_sessions() == [session]
+        assert session.status == SessionStatus.TIMEOUT
+
+    def test_round_trips_through_dict(self):
+        session = _session("s", 5)
+        session.lock_resource("db")
+        restored = WorkSession.from_dict(json.loads(json.dumps(session.to_dict())))
+        assert restored.to_dict() == session.to_dict()
+
+
+class TestSessionPersistence:
+    """Persisted sessions time out after a restart"""
+
+    def test_timeout_survives_restart(self, manager):
+        project = manager._convert_to_project_entity("web")
+        project.restore_work_session(_session("due", 5, 10))
+        project.restore_work_session(_session("later", 60))
+        manager._update_project_from_entity("web", project)
+        manager._project_store.flush()
+
+        restarted = ProjectManager(manager.path_resolver)
+        next_deadline = restarted.expire_work_sessions()
+        assert set(restarted._convert_to_project_entity("web").active_work_sessions) == {"later"}
+        assert next_deadline is not None and next_deadline > datetime.now()
+
+        again = ProjectManager(manager.path_resolver)
+        assert set(again._convert_to_project_entity("web").active_work_sessions) == {"later"}
+
+    async def test_monitor_fires_at_deadline(self, manager):
+        project = manager._convert_to_project_entity("web")
+        session = _session("soon", 0.002)
+        project.restore_work_session(session)
+        manager._update_project_from_entity("web", project)
+
+        monitor = SessionTimeoutMonitor(manager, max_sleep=1.0)
+        async with monitor.running():
+            await asyncio.sleep(0.3)
+        assert manager._convert_to_project_entity("web").active_work_sessions == {}
+        assert monitor._task is None
+
+
+class TestTaskStatusSessions:
+    """Task status changes made through the task tools start and end work sessions"""
+
+    def test_in_progress_starts_and_done_ends_a_session(self, manager):
+        manager.register_agent("web", "coder", "Coder")
+        manager.assign_agent_to_tree("web", "coder", "ui")
+        tasks_file = manager.path_resolver.get_tasks_json_path("web", "ui", "default_id")
+        JsonTaskRepository(file_path=str(tasks_file)).save(
+            Task.create(id=TaskId.from_string("20250101001"), title="Task", description="Do it")
+        )
+        factory = TaskRepositoryFactory(base_path=str(tasks_file.parents[3]))
+        handler = TaskOperationHandler(factory, None, manager)
+
+        def update(status):
+            result = handler.handle_core_operations(
+                "update", "web", "ui", "default_id", "20250101001",
+                None, None, status, None, None, None, None, None, None,
+            )
+            assert result["success"], result
+
+        update("in_progress")
+        [session] = manager._session_store.load("web")
+        assert (session.agent_id, session.task_id, session.tree_id) == ("coder", "20250101001", "ui")
+        assert manager.expire_work_sessions() == session.get_deadline()
+
+        manager.track_work_session("web", "ui", "20250101001", "in_progress")
+        assert [s.id for s in manager._session_store.load("web")] == [session.id]
+
+        update("done")
+        assert manager._session_store.load("web") == []
+        assert manager._convert_to_project_entity("web").active_work_sessions == {}
+        assert manager.expire_work_sessions() is None
+
+    def test_trees_without_an_agent_get_no_session(self, manager):
+        manager.track_work_session("web", "ui", "20250101001", "in_progress")
+        assert manager._session_store.load("web") == []
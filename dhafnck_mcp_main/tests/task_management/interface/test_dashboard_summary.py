@@ -0,0 +1,51 @@
+"""Tests for the multi-project dashboard summary"""
+
+import json
+
+import pytest
+
+
+
+@pytest.fixture
+def manager(tmp_project_manager):
+    manager = tmp_project_manager
+    for project_id in ("web", "api"):
+        manager.create_project(project_id, project_id.upper())
+        for tree_id in ("main", "feature"):
+            manager.create_task_tree(project_id, tree_id, tree_id, "")
+    manager.register_agent("web", "coder", "Coder")
+    manager.assign_agent_to_tree("web", "coder", "feature")
+    return manager
+
+
+def _write_tasks(manager, project_id, tree_id, statuses):
+    tasks_file = manager.path_resolver.get_tasks_json_path(project_id, tree_id, "default_id")
+    tasks = [
+        {"id": f"2025010100{i}", "title": f"Task {i}", "status": status, "priority": "high"}
+        for i, status in enumerate(statuses, 1)
+    ]
+    tasks_file.write_text(json.dumps({"tasks": tasks}))
+
+
+class TestDashboardSummary:
+    """Every tree of every project is summarized concurrently"""
+
+    async def test_consolidated_payload_and_progress(self, manager):
+        _write_tasks(manager, "web", "feature", ["done", "todo", "in_progress"])
+        _write_tasks(manager, "api", "main", ["done"])
+        progress = []
+
+        async def report_progress(done, total, message):
+            progress.append((done, total, message))
+
+        summary = await manager.dashboard_summary(report_progress=report_progress, max_workers=2)
+
+        assert summary["totals"] == {
+            "projects": 2, "trees": 4, "total_tasks": 4, "completed_tasks": 2, "overdue_tasks": 0,
+        }
+        feature = summary["projects"]["web"]["trees"]["feature"]
+        assert feature["total_tasks"] == 3 and feature["todo_high_priority"] == 1
+        assert feature["assigned_agents"] == ["coder"]
+        assert summary["projects"]["api"]["completion_rate"] == 100.0
+        assert [done for done, _, _ in progress] == [1, 2, 3, 4]
+        assert {message for _, _, message in progress} == {"web/main", "web/feature", "api/main", "api/feature"}
@@ -0,0 +1,73 @@
+"""Tests for the cached Project aggregate built by ProjectManager"""
+
+import json
+
+import pytest
+
+
+
+@pytest.fixture
+def manager(tmp_project_manager):
+    manager = tmp_project_manager
+    manager.create_project("web", "Web")
+    manager.create_task_tree("web", "ui", "UI", "")
+    return manager
+
+
+def _write_tasks(manager, tasks):
+    tasks_file = manager.path_resolver.get_tasks_json_path("web", "ui", "default_id")
+    tasks_file.write_text(json.dumps({"tasks": tasks}))
+
+
+def _task(task_id, **extra):
+    return {"id": task_id, "title": f"Task {task_id}", "description": "Do it", "status": "todo", **extra}
+
+
+class TestProjectAggregate:
+    """The aggregate is reused until the project or a tree's tasks change"""
+
+    def test_trees_hydrated_from_tasks_file(self, manager):
+        _write_tasks(manager, [
+            _task("20250101001", subtasks=[{"id": "20250101001.001", "title": "Sub", "completed": True}]),
+            _task("20250101002"),
+        ])
+        tree = manager._convert_to_project_entity("web").task_trees["ui"]
+        assert set(tree.root_tasks) == {"20250101001", "20250101002"}
+
+        dashboard = manager.get_orchestration_dashboard("web")["dashboard"]
+        assert dashboard["trees"]["ui"]["root_tasks"] == 2
+
+    def test_reused_until_tasks_change(self, manager):
+        _write_tasks(manager, [_task("20250101001")])
+        project = manager._convert_to_project_entity("web")
+        tree = project.task_trees["ui"]
+        version = tree.version
+        assert manager._convert_to_project_entity("web") is project
+        assert tree.version == version
+
+        _write_tasks(manager, [_task("20250101001"), _task("20250101002")])
+        assert manager._convert_to_project_entity("web") is project
+        assert tree.get_task_count() == 2
+        assert tree.version > version
+
+    def test_rebuilt_after_project_change(self, manager):
+        project = manager._convert_to_project_entity("web")
+        manager.register_agent("web", "coder", "Coder")
+        manager.assign_agent_to_tree("web", "coder", "ui")
+
+        rebuilt = manager._convert_to_project_entity("web")
+        assert rebuilt is not project
+        assert rebuilt.agent_assignments == {"ui": "coder"}
+
+    def test_reused_after_orchestration(self, manager):
+        manager.register_agent("web", "coder", "Coder")
+        project = manager._convert_to_project_entity("web")
+        version = manager._project_store.version("web")
+
+        assert manager.orchestrate_project("web")["success"]
+        assert manager._convert_to_project_entity("web") is project
+        assert manager._project_store.version("web") != version
+
+        version = manager._project_store.version("web")
+        assert manager.orchestrate_project("web")["success"]
+        assert manager._project_store.version("web") == version
@@ -0,0 +1,98 @@
+"""Tests for the per-project serialization of ProjectManager calls"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.server.context import Context
+from fastmcp.task_management.infrastructure.services.rule_files import RULE_FILES_LOCK
+from fastmcp.task_management.interface.consolidated_mcp_tools import ConsolidatedMCPTools
+from fastmcp.utilities.tests import temporary_settings
+
+
+@pytest.fixture
+def manager(tmp_project_manager):
+    manager = tmp_project_manager
+    manager.create_project("web", "Web")
+    manager.create_project("api", "API")
+    return manager
+
+
+class TestProjectLocking:
+    """Calls for one project are serialized, calls for different projects are not"""
+
+    def test_only_the_same_project_waits(self, manager):
+        results = {}
+
+        def get(project_id):
+            results[project_id] = manager.get_project(project_id)["success"]
+
+        with manager.project_lock("web"):
+            other = threading.Thread(target=get, args=("api",))
+            same = threading.Thread(target=get, args=("web",))
+            other.start()
+            same.start()
+            other.join(1)
+            same.join(0.1)
+            assert results == {"api": True}
+        same.join(1)
+        assert results == {"api": True, "web": True}
+
+    def test_results_do_not_share_project_data(self, manager):
+        project = manager.get_project("web")["project"]
+        project["registered_agents"]["ghost"] = {"id": "ghost"}
+        manager.register_agent("web", "coder", "Coder")
+
+        assert set(manager.get_project("web")["project"]["registered_agents"]) == {"coder"}
+        assert [p["id"] for p in manager.list_projects()["projects"]] == ["web", "api"]
+
+    async def test_write_past_its_timeout_is_waited_for(self, tmp_path):
+        tools = ConsolidatedMCPTools(projects_file_path=str(tmp_path / "projects.json"))
+        manager = tools._project_manager
+        manager.create_project("web", "Web")
+        server = FastMCP("test", enable_task_management=False)
+        tools.register_tools(server)
+        released = threading.Event()
+
+        lock = manager.project_lock("web")
+        with _held(lock, released), Context(server), temporary_settings(tool_timeout=0.05):
+            [content] = await server._tool_manager.call_tool(
+                "manage_project", {"action": "update", "project_id": "web", "name": "Renamed"}
+            )
+        # The caller only hears back once the write is done, and hears what it did
+        assert released.is_set() and json.loads(content.text)["success"]  # type: ignore[attr-defined]
+        assert manager.get_project("web")["project"]["name"] == "Renamed"
+
+    async def test_rule_files_are_changed_one_call_at_a_time(self, tmp_path):
+        tools = ConsolidatedMCPTools(projects_file_path=str(tmp_path / "projects.json"))
+        server = FastMCP("test", enable_task_management=False)
+        tools.register_tools(server)
+        released = threading.Event()
+
+        with _held(RULE_FILES_LOCK, released), Context(server):
+            await server._tool_manager.call_tool("manage_rule", {"action": "info"})
+        assert released.is_set()
+
+
+@contextmanager
+def _held(lock, released, seconds=0.2):
+    """Hold lock in another thread for seconds, setting released just before letting go"""
+    locked = threading.Event()
+
+    def hold():
+        with lock:
+            locked.set()
+            time.sleep(seconds)
+            released.set()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    locked.wait(1)
+    try:
+        yield
+    finally:
+        holder.join(1)
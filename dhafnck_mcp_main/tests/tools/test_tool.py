@@ -0,0 +1,84 @@
+"""Tests for the precomputed FunctionTool call plan"""
+
+import inspect
+import time
+
+import pytest
+
+import fastmcp.tools.tool as tool_module
+from fastmcp.server.context import Context
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.tests import temporary_settings
+from fastmcp.utilities.types import find_kwarg_by_type, get_cached_typeadapter
+
+
+def noop() -> None:
+    return None
+
+
+class TestCallPlan:
+    """The context slot and JSON-coercible parameters are resolved at construction"""
+
+    async def test_plan_survives_copies_and_decodes_json(self):
+        def count(items: list[int], limit: int = 0, ctx: Context | None = None) -> int:
+            return len(items) + limit
+
+        tool = Tool.from_function(count).with_key("prefixed_count")
+        assert tool._context_kwarg == "ctx"
+        assert tool._json_params == {"items"}
+
+        with temporary_settings(tool_attempt_parse_json_args=True):
+            arguments = {"items": "[1, 2, 3]", "ctx": None}
+            content = await tool.run(arguments)
+        assert content[0].text == "3"
+        assert arguments["items"] == "[1, 2, 3]"
+
+    async def test_run_does_not_inspect_the_function(self, monkeypatch):
+        def count(items: list[int], ctx: Context | None = None) -> int:
+            return len(items)
+
+        tool = Tool.from_function(count, worker_pool=None)
+
+        def inspected(*args, **kwargs):
+            raise AssertionError("signature inspected per call")
+
+        monkeypatch.setattr(inspect, "signature", inspected)
+        monkeypatch.setattr(tool_module, "find_kwarg_by_type", inspected)
+        monkeypatch.setattr(tool_module, "get_cached_typeadapter", inspected)
+
+        content = await tool.run({"items": [1, 2], "ctx": None})
+        assert content[0].text == "2"
+
+
+@pytest.mark.performance
+async def test_noop_tool_call_overhead():
+    """Report run() next to the per-call signature inspection it replaced (timings only)"""
+    tool = Tool.from_function(noop, worker_pool=None)
+    calls = 2000
+
+    async def inspect_per_call(arguments):
+        arguments = arguments.copy()
+        find_kwarg_by_type(tool.fn, kwarg_type=Context)
+        inspect.signature(tool.fn)
+        return get_cached_typeadapter(tool.fn).validate_python(arguments)
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        await inspect_per_call({})
+    inspected = (time.perf_counter() - started) / calls
+
+    started = time.perf_counter()
+    for _ in range(calls):
+        await tool.run({})
+    planned = (time.perf_counter() - started) / calls
+
+    offloaded_tool = Tool.from_function(noop)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await offloaded_tool.run({})
+    offloaded = (time.perf_counter() - started) / calls
+
+    print(
+        f"\nno-op tool call: inspected {inspected * 1e6:.1f}us, planned {planned * 1e6:.1f}us, "
+        f"on the worker pool {offloaded * 1e6:.1f}us"
+    )
@@ -0,0 +1,141 @@
+"""Tests for the versioned tool registry and per-tool call limits"""
+
+import threading
+
+import anyio
+import pytest
+
+from fastmcp import FastMCP
+from fastmcp.exceptions import ToolError
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.tests import temporary_settings
+
+
+def _server(name):
+    return FastMCP(name, enable_task_management=False)
+
+
+def _add(server, name):
+    def fn() -> str:
+        return name
+
+    server.add_tool(Tool.from_function(fn, name=name))
+
+
+class TestToolRegistry:
+    """Lookups are served from a cache rebuilt only when the version changes"""
+
+    async def test_cached_until_registry_changes(self):
+        parent, child, grandchild = _server("parent"), _server("child"), _server("grandchild")
+        child.mount(grandchild, prefix="g")
+        parent.mount(child, prefix="c")
+        _add(grandchild, "deep")
+        manager = parent._tool_manager
+
+        tool = await manager.get_tool("c_g_deep")
+        assert await manager.get_tool("c_g_deep") is tool
+        version = manager.version
+
+        _add(grandchild, "deeper")
+        assert manager.version > version
+        assert await manager.has_tool("c_g_deeper")
+
+        deep = grandchild._tool_manager._tools["deep"]
+        deep.disable()
+        assert not await manager.has_tool("c_g_deep")
+        deep.enable()
+        assert await manager.has_tool("c_g_deep")
+
+        grandchild.remove_tool("deeper")
+        assert not await manager.has_tool("c_g_deeper")
+
+    async def test_get_tools_returns_a_copy(self):
+        server = _server("server")
+        _add(server, "one")
+        tools = await server._tool_manager.get_tools()
+        tools.clear()
+        assert await server._tool_manager.has_tool("one")
+
+
+class TestCallLimits:
+    """timeout, max_concurrency and queue_timeout fail calls with a ToolError"""
+
+    async def test_timeout(self):
+        server = _server("limits")
+        release = threading.Event()
+
+        @server.tool(timeout=0.05)
+        async def slow() -> str:
+            await anyio.sleep(10)
+            return "done"
+
+        # Only read-only tools are abandoned when they time out
+        @server.tool(timeout=0.05, annotations={"readOnlyHint": True})
+        def blocking() -> str:
+            release.wait(5)
+            return "done"
+
+        with pytest.raises(ToolError, match="timed out"):
+            await server._tool_manager.call_tool("slow", {})
+        with anyio.fail_after(1):
+            with pytest.raises(ToolError, match="timed out"):
+                await server._tool_manager.call_tool("blocking", {})
+        release.set()
+
+    async def test_max_concurrency_and_cancellation_free_slots(self):
+        server = _server("limits")
+        started = anyio.Event()
+
+        @server.tool(max_concurrency=1, queue_timeout=0.05)
+        async def single() -> str:
+            started.set()
+            await anyio.sleep(10)
+            return "done"
+
+        manager = server._tool_manager
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(manager.call_tool, "single", {})
+            await started.wait()
+            with pytest.raises(ToolError, match="busy"):
+                await manager.call_tool("single", {})
+            # A cancelled call, as after notifications/cancelled, frees its slot
+            tg.cancel_scope.cancel()
+
+        assert manager._call_slots["single"][1].value == 1
+
+    async def test_timed_out_thread_keeps_its_slot(self):
+        server = _server("limits")
+        release = threading.Event()
+
+        @server.tool(
+            timeout=0.05, max_concurrency=1, queue_timeout=0.05, annotations={"readOnlyHint": True}
+        )
+        def blocking() -> str:
+            release.wait(5)
+            return "done"
+
+        manager = server._tool_manager
+        with pytest.raises(ToolError, match="timed out"):
+            await manager.call_tool("blocking", {})
+        # The abandoned thread is still running, so the tool is still busy
+        with pytest.raises(ToolError, match="busy"):
+            await manager.call_tool("blocking", {})
+
+        release.set()
+        with anyio.fail_after(1):
+            while manager._call_slots["blocking"][1].value == 0:
+                await anyio.sleep(0.01)
+        assert (await manager.call_tool("blocking", {}))[0].text == "done"  # type: ignore[attr-defined]
+
+    async def test_proxied_calls_use_the_default_limits(self):
+        backend = _server("backend")
+
+        @backend.tool()
+        async def slow() -> str:
+            await anyio.sleep(10)
+            return "done"
+
+        proxy = FastMCP.as_proxy(backend)
+        with temporary_settings(tool_timeout=0.05), anyio.fail_after(1):
+            with pytest.raises(ToolError, match="timed out"):
+                await proxy._tool_manager.call_tool("slow", {})
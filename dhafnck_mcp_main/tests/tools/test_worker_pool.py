@@ -0,0 +1,100 @@
+import threading
+
+import anyio
+
+from fastmcp.tools.tool import Tool
+from fastmcp.utilities.worker_pool import (
+    CallAbandoned,
+    WorkerPool,
+    configure_worker_pool,
+    raise_if_abandoned,
+    worker_pool_stats,
+)
+
+
+class TestWorkerPool:
+    async def test_sync_tool_runs_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+
+        def where() -> int:
+            return threading.get_ident()
+
+        offloaded = Tool.from_function(where)
+        inline = Tool.from_function(where, worker_pool=None)
+
+        assert (await offloaded.run({}))[0].text != str(loop_thread)
+        assert (await inline.run({}))[0].text == str(loop_thread)
+
+    async def test_bounded_and_counts_saturation(self):
+        pool = WorkerPool("test", max_workers=2)
+        release = threading.Event()
+
+        async with anyio.create_task_group() as tg:
+            for _ in range(5):
+                tg.start_soon(pool.run_sync, release.wait)
+            await anyio.wait_all_tasks_blocked()
+            while pool.running < 2:
+                await anyio.sleep(0.01)
+            assert pool.stats()["running"] == 2 and pool.stats()["waiting"] == 3
+            release.set()
+
+        stats = pool.stats()
+        assert stats["peak_running"] == 2
+        assert stats["completed"] == stats["submitted"] == 5
+        assert stats["saturated"] == 3
+        assert stats["running"] == stats["waiting"] == 0
+
+    async def test_abandoned_calls_keep_their_worker(self):
+        pool = WorkerPool("test", max_workers=2, abandon_on_cancel=True)
+        release = threading.Event()
+        outcomes = []
+
+        def wait_then_check() -> None:
+            release.wait(5)
+            try:
+                raise_if_abandoned()
+            except CallAbandoned:
+                outcomes.append("abandoned")
+                raise
+
+        for _ in range(6):
+            with anyio.move_on_after(0.02):
+                await pool.run_sync(wait_then_check)
+        stats = pool.stats()
+        assert stats["running"] == stats["abandoned"] == 2
+        assert stats["peak_running"] == 2 and stats["waiting"] == 0
+
+        release.set()
+        with anyio.fail_after(1):
+            assert await pool.run_sync(lambda: "free") == "free"
+        assert outcomes == ["abandoned", "abandoned"]
+        assert pool.stats()["abandoned"] == 0
+
+    async def test_running_calls_are_waited_for_by_default(self):
+        pool = WorkerPool("test", max_workers=1)
+        started, release = threading.Event(), threading.Event()
+
+        def write() -> str:
+            started.set()
+            release.wait(5)
+            return "written"
+
+        async def cancel_once_started(scope: anyio.CancelScope) -> None:
+            await anyio.to_thread.run_sync(started.wait)
+            threading.Timer(0.05, release.set).start()
+            scope.cancel()
+
+        async with anyio.create_task_group() as tg:
+            with anyio.CancelScope() as scope:
+                tg.start_soon(cancel_once_started, scope)
+                await pool.run_sync(write)
+            assert release.is_set() and pool.stats()["running"] == 0
+
+    async def test_named_pool_is_shared(self):
+        def one() -> int:
+            return 1
+
+        tool = Tool.from_function(one, worker_pool="test-named")
+        configure_worker_pool("test-named", 1)
+        await tool.run({})
+        assert worker_pool_stats()["test-named"]["completed"] == 1
@@ -0,0 +1,31 @@
+"""Tests for the atomic file write helper"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+from fastmcp.utilities.files import atomic_write_text
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+class TestAtomicWriteText:
+    """Replaced files keep their mode, new files get the usual one"""
+
+    def test_keeps_the_mode_of_the_replaced_file(self, tmp_path):
+        path = tmp_path / "shared.json"
+        path.write_text("old")
+        os.chmod(path, 0o664)
+
+        atomic_write_text(path, "new")
+        assert path.read_text() == "new"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o664
+
+    def test_new_file_gets_the_umask_mode(self, tmp_path):
+        opened = tmp_path / "opened.txt"
+        opened.write_text("")
+        expected = stat.S_IMODE(opened.stat().st_mode)
+
+        atomic_write_text(tmp_path / "new.txt", "new")
+        assert stat.S_IMODE((tmp_path / "new.txt").stat().st_mode) == expected